@@ -0,0 +1,124 @@
+"""
+InMemoryBroker pub/sub benchmark.
+
+Publishes N messages across many topics to a broker with many pattern
+subscriptions and waits until every matching handler ran. Compares the
+previous broker (fnmatch against every subscription per publish, one
+task per delivery) with the topic trie and per-subscription mailboxes,
+and reports how much work piles up behind a slow subscriber.
+
+Usage:
+    python benchmarks/benchmark_broker.py [--messages 20000] [--subscriptions 500]
+"""
+
+import argparse
+import asyncio
+import fnmatch
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from jdev_core.messaging import InMemoryBroker, Message, OverflowPolicy  # noqa: E402
+
+
+class LegacyBroker:
+    """The direct-dispatch logic this replaced."""
+
+    def __init__(self):
+        self._subscriptions = {}
+        self._lock = asyncio.Lock()
+
+    async def subscribe(self, topic, handler):
+        self._subscriptions[len(self._subscriptions)] = (topic, handler)
+
+    async def publish(self, topic, payload):
+        message = Message(topic=topic, payload=payload)
+        async with self._lock:
+            for pattern, handler in self._subscriptions.values():
+                if pattern == topic or fnmatch.fnmatch(
+                    topic, pattern.replace('+', '*').replace('#', '**')
+                ):
+                    asyncio.create_task(self._invoke_handler(handler, message))
+        return message.id
+
+    async def _invoke_handler(self, handler, message):
+        try:
+            result = handler(message)
+            if asyncio.iscoroutine(result):
+                await result
+        except Exception:
+            pass
+
+
+def topics(count: int) -> list:
+    return [f"svc{i % 50}.events.{i % 7}" for i in range(count)]
+
+
+async def run_fanout(broker, messages: int, subscriptions: int) -> float:
+    """Time to publish and deliver with one matching handler per message."""
+    delivered = 0
+    done = asyncio.Event()
+
+    def handler(message):
+        nonlocal delivered
+        delivered += 1
+        if delivered == messages:
+            done.set()
+
+    for i in range(subscriptions):
+        # Only the svcN.* patterns ever match
+        pattern = f"svc{i}.events.*" if i < 50 else f"other{i}.#"
+        await broker.subscribe(pattern, handler)
+
+    start = time.perf_counter()
+    for topic in topics(messages):
+        await broker.publish(topic, None)
+    await done.wait()
+    return time.perf_counter() - start
+
+
+async def run_slow_subscriber(broker, messages: int) -> int:
+    """Peak number of outstanding deliveries behind a subscriber that stalls."""
+    gate = asyncio.Event()
+
+    async def slow(message):
+        await gate.wait()
+
+    if isinstance(broker, InMemoryBroker):
+        sub_id = await broker.subscribe("slow.#", slow, max_pending=1000,
+                                        overflow=OverflowPolicy.DROP_OLDEST)
+    else:
+        await broker.subscribe("slow.#", slow)
+
+    for i in range(messages):
+        await broker.publish("slow.events", i)
+    await asyncio.sleep(0)
+    peak = len(asyncio.all_tasks()) - 1
+    if isinstance(broker, InMemoryBroker):
+        peak += broker.pending(sub_id)
+    gate.set()
+    return peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--messages", type=int, default=20_000)
+    parser.add_argument("--subscriptions", type=int, default=500)
+    args = parser.parse_args()
+
+    legacy = asyncio.run(run_fanout(LegacyBroker(), args.messages, args.subscriptions))
+    trie = asyncio.run(run_fanout(InMemoryBroker(), args.messages, args.subscriptions))
+    print(f"{args.messages} messages, {args.subscriptions} subscriptions\n")
+    print(f"{'':>16} {'legacy msg/s':>13} {'broker msg/s':>13}")
+    print(f"{'fan-out':>16} {args.messages / legacy:>13,.0f} {args.messages / trie:>13,.0f}"
+          f"  ({legacy / trie:.1f}x)")
+
+    legacy_backlog = asyncio.run(run_slow_subscriber(LegacyBroker(), args.messages))
+    broker_backlog = asyncio.run(run_slow_subscriber(InMemoryBroker(), args.messages))
+    print(f"{'slow backlog':>16} {legacy_backlog:>13,} {broker_backlog:>13,}")
+
+
+if __name__ == "__main__":
+    main()
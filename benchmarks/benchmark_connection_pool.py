@@ -0,0 +1,125 @@
+"""
+ConnectionPool acquire benchmark.
+
+Runs many workers that acquire, hold briefly and release connections
+from a pool smaller than the worker count, with a factory and validator
+that take real time. Compares the previous pool (one lock held across
+connect and validation) with the lock-free pool, reporting throughput
+and acquire latency percentiles.
+
+Usage:
+    python benchmarks/benchmark_connection_pool.py [--workers 64] [--ops 20]
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from jdev_core.connections import ConnectionPool, PoolConfig, PoolExhaustedError  # noqa: E402
+from jdev_core.connections.pool import PooledConnection, PoolStats  # noqa: E402
+
+
+CONNECT_TIME = 0.02
+VALIDATE_TIME = 0.001
+HOLD_TIME = 0.002
+
+
+class LegacyPool(ConnectionPool):
+    """The single-lock acquire path this replaced."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._available = asyncio.Queue()
+        self._lock = asyncio.Lock()
+
+    async def initialize(self):
+        for _ in range(self._config.min_size):
+            await self._available.put((await self._create_connection(), time.time()))
+
+    async def acquire(self, timeout=None):
+        start = time.perf_counter()
+        async with self._lock:
+            while not self._available.empty():
+                conn, _ = await self._available.get()
+                if self._config.validate_on_acquire and not await self._validate_connection(conn):
+                    continue
+                self._in_use.add(conn)
+                self._stats.record_acquire((time.perf_counter() - start) * 1000)
+                return PooledConnection(self, conn)
+            if self._available.qsize() + len(self._in_use) < self._config.max_size:
+                conn = await self._create_connection()
+                self._in_use.add(conn)
+                self._stats.record_acquire((time.perf_counter() - start) * 1000)
+                return PooledConnection(self, conn)
+        try:
+            conn, _ = await asyncio.wait_for(self._available.get(), self._config.acquire_timeout)
+        except asyncio.TimeoutError:
+            raise PoolExhaustedError("timeout")
+        async with self._lock:
+            self._in_use.add(conn)
+        self._stats.record_acquire((time.perf_counter() - start) * 1000)
+        return PooledConnection(self, conn)
+
+    async def release(self, conn):
+        async with self._lock:
+            self._in_use.discard(conn)
+            await self._available.put((conn, time.time()))
+
+    async def close(self):
+        pass
+
+
+async def factory():
+    await asyncio.sleep(CONNECT_TIME)
+    return object()
+
+
+async def validator(conn):
+    await asyncio.sleep(VALIDATE_TIME)
+    return True
+
+
+async def run(pool_cls, workers: int, ops: int, max_size: int) -> tuple:
+    pool = pool_cls(factory=factory, validator=validator,
+                    config=PoolConfig(min_size=2, max_size=max_size))
+    await pool.initialize()
+
+    async def worker():
+        for _ in range(ops):
+            async with await pool.acquire():
+                await asyncio.sleep(HOLD_TIME)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(workers)))
+    elapsed = time.perf_counter() - start
+    stats: PoolStats = pool.stats
+    await pool.close()
+    return elapsed, stats
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--workers", type=int, default=64)
+    parser.add_argument("--ops", type=int, default=20)
+    parser.add_argument("--max-size", type=int, default=16)
+    args = parser.parse_args()
+
+    total = args.workers * args.ops
+    print(f"{args.workers} workers x {args.ops} acquires, max_size={args.max_size}, "
+          f"connect {CONNECT_TIME * 1000:.0f}ms, validate {VALIDATE_TIME * 1000:.0f}ms\n")
+    print(f"{'pool':<10} {'wall':>8} {'acq/s':>8} {'p50':>8} {'p95':>8} {'p99':>8}")
+    baseline = None
+    for name, pool_cls in [("locked", LegacyPool), ("lock-free", ConnectionPool)]:
+        elapsed, stats = asyncio.run(run(pool_cls, args.workers, args.ops, args.max_size))
+        baseline = baseline or elapsed
+        print(f"{name:<10} {elapsed * 1000:>6.0f}ms {total / elapsed:>8.0f} "
+              f"{stats.p50_acquire_time_ms:>6.1f}ms {stats.p95_acquire_time_ms:>6.1f}ms "
+              f"{stats.p99_acquire_time_ms:>6.1f}ms  ({baseline / elapsed:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+DiskCache (L2) benchmark.
+
+Compares the previous connection-per-operation cache (JSON text, one
+commit per set) with the pooled WAL connection and group-committed
+writes, in get/set operations per second.
+
+Usage:
+    python benchmarks/benchmark_disk_cache.py [--ops 2000]
+"""
+
+import argparse
+import json
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from jdev_cli.core.cache import DiskCache  # noqa: E402
+
+
+class LegacyDiskCache:
+    """The connection-per-operation cache this replaced."""
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        conn = sqlite3.connect(self.db_path)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache "
+            "(key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+            "timestamp REAL NOT NULL, ttl REAL NOT NULL)"
+        )
+        conn.commit()
+        conn.close()
+
+    def get(self, key):
+        conn = sqlite3.connect(self.db_path)
+        row = conn.execute(
+            "SELECT value, timestamp, ttl FROM cache WHERE key = ?", (key,)
+        ).fetchone()
+        conn.close()
+        if row and time.time() - row[1] < row[2]:
+            return json.loads(row[0])
+        return None
+
+    def set(self, key, value, ttl=3600):
+        conn = sqlite3.connect(self.db_path)
+        conn.execute(
+            "INSERT OR REPLACE INTO cache (key, value, timestamp, ttl) VALUES (?, ?, ?, ?)",
+            (key, json.dumps(value), time.time(), ttl)
+        )
+        conn.commit()
+        conn.close()
+
+    def flush(self):
+        pass
+
+    def close(self):
+        pass
+
+
+def value_for(i: int) -> dict:
+    return {"tool": "read_file", "path": f"src/module_{i}.py", "lines": list(range(20))}
+
+
+def measure(cache, ops: int):
+    start = time.perf_counter()
+    for i in range(ops):
+        cache.set(f"key{i}", value_for(i))
+    cache.flush()
+    set_rate = ops / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for i in range(ops):
+        assert cache.get(f"key{i}") is not None
+    get_rate = ops / (time.perf_counter() - start)
+
+    cache.close()
+    return set_rate, get_rate
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--ops", type=int, default=2000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        legacy = measure(LegacyDiskCache(f"{tmpdir}/legacy.db"), args.ops)
+        pooled = measure(DiskCache(f"{tmpdir}/pooled.db"), args.ops)
+
+    print(f"{'cache':>8} {'set ops/s':>12} {'get ops/s':>12}")
+    print(f"{'legacy':>8} {legacy[0]:>12,.0f} {legacy[1]:>12,.0f}")
+    print(f"{'pooled':>8} {pooled[0]:>12,.0f} {pooled[1]:>12,.0f}")
+    print(f"{'speedup':>8} {pooled[0] / legacy[0]:>11.1f}x {pooled[1] / legacy[1]:>11.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+EpisodicMemory recall benchmark.
+
+Compares the original full-scan recall (re-tokenize every entry, Jaccard
+against all of them) with the inverted index, at 1k / 10k / 100k
+stored episodes, plus store cost at capacity (every store prunes)
+for the original sort-everything prune versus batch eviction.
+
+Usage:
+    python benchmarks/benchmark_episodic_memory.py [--sizes 1000 10000 100000]
+"""
+
+import argparse
+import random
+import re
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from prometheus.memory import EpisodicMemory  # noqa: E402
+
+
+VOCAB = [f"term{i}" for i in range(5000)]
+ACTIONS = ["fixed", "refactored", "tested", "deployed", "profiled", "documented"]
+OUTCOMES = ["success: tests passed", "failed with timeout", "completed", "error in build"]
+QUERIES = 50
+
+
+def make_experience(rng: random.Random) -> str:
+    words = rng.choices(VOCAB, k=rng.randint(8, 20))
+    return f"{rng.choice(ACTIONS)} {' '.join(words)}"
+
+
+def legacy_recall(memory: EpisodicMemory, query: str, top_k: int = 5) -> list:
+    query_words = set(re.findall(r'\b\w+\b', query.lower()))
+    scored = []
+    for entry in memory.entries:
+        entry_words = set(re.findall(r'\b\w+\b', entry.content.lower()))
+        overlap = len(query_words & entry_words)
+        if overlap > 0:
+            similarity = overlap / len(query_words | entry_words)
+            scored.append((0.6 * similarity + 0.4 * entry.compute_relevance(), entry))
+    scored.sort(key=lambda x: x[0], reverse=True)
+    return [e for _, e in scored[:top_k]]
+
+
+class LegacyPruneMemory(EpisodicMemory):
+    """Prune as before: full relevance sort on every overflow."""
+
+    def _prune_if_needed(self):
+        if len(self._entries) > self.max_entries:
+            ranked = sorted(self._entries.values(), key=lambda e: e.compute_relevance(),
+                            reverse=True)
+            for entry in ranked[self.max_entries:]:
+                del self._entries[entry.id]
+                self._unindex_terms(entry.id)
+
+
+def steady_store_us(memory_cls, size: int, stores: int) -> float:
+    rng = random.Random(0)
+    memory = memory_cls(max_entries=size)
+    for _ in range(size):
+        memory.store(make_experience(rng), rng.choice(OUTCOMES), {})
+
+    start = time.perf_counter()
+    for _ in range(stores):
+        memory.store(make_experience(rng), rng.choice(OUTCOMES), {})
+    return (time.perf_counter() - start) / stores * 1e6
+
+
+def median_ms(fn, queries: list) -> float:
+    samples = []
+    for query in queries:
+        start = time.perf_counter()
+        fn(query)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    args = parser.parse_args()
+
+    print(f"{'episodes':>9} {'store/op':>10} {'legacy':>10} {'jaccard':>10} {'bm25':>10}")
+    for size in args.sizes:
+        rng = random.Random(size)
+        memory = EpisodicMemory(max_entries=size)
+
+        start = time.perf_counter()
+        for _ in range(size):
+            memory.store(make_experience(rng), rng.choice(OUTCOMES), {})
+        store_us = (time.perf_counter() - start) / size * 1e6
+
+        queries = [" ".join(rng.choices(VOCAB, k=4)) for _ in range(QUERIES)]
+        legacy_queries = queries[:max(3, QUERIES * 1000 // size)]
+
+        legacy = median_ms(lambda q: legacy_recall(memory, q), legacy_queries)
+        jaccard = median_ms(lambda q: memory.recall_similar(q, scoring="jaccard"), queries)
+        bm25 = median_ms(lambda q: memory.recall_similar(q, scoring="bm25"), queries)
+
+        print(f"{size:>9} {store_us:>8.1f}us {legacy:>8.2f}ms {jaccard:>8.2f}ms {bm25:>8.2f}ms")
+
+    print(f"\n{'episodes':>9} {'legacy prune':>14} {'batch prune':>13}  (store/op at capacity)")
+    for size in args.sizes:
+        # Cover several prune batches so the amortized cost shows
+        batched = steady_store_us(EpisodicMemory, size, 3 * max(1, size // 20))
+        legacy = steady_store_us(LegacyPruneMemory, size, max(5, min(500, 500_000 // size)))
+        print(f"{size:>9} {legacy:>12.1f}us {batched:>11.1f}us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+CoEvolutionLoop throughput benchmark.
+
+Runs evolution iterations against a stubbed LLM with a fixed per-call
+latency, comparing the original one-task-at-a-time loop with batched
+task generation and concurrent attempts.
+
+Usage:
+    python benchmarks/benchmark_evolution.py [--iterations 40] [--latency 0.02]
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import re
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from prometheus.core.evolution import CoEvolutionLoop  # noqa: E402
+
+
+class StubLLM:
+    """Fixed-latency LLM; every fourth task fails its evaluation."""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.generated = 0
+        self.calls = 0
+
+    async def generate(self, prompt: str) -> str:
+        self.calls += 1
+        if prompt.startswith("Generate"):
+            self.generated += 1
+            number = self.generated
+        await asyncio.sleep(self.latency)
+
+        if prompt.startswith("Generate"):
+            return json.dumps({"description": f"task {number}", "expected_skills": ["planning"]})
+        number = int(re.search(r"TASK: task (\d+)", prompt).group(1))
+        if prompt.startswith("Evaluate"):
+            score = 0.3 if number % 4 == 0 else 0.9
+            return json.dumps({"overall_score": score, "errors": [] if score > 0.5 else ["wrong"]})
+        return "First plan, then solve step by step."
+
+
+class StubMemory:
+
+    def get_context_for_task(self, description):
+        return {}
+
+    def remember_experience(self, **kwargs):
+        pass
+
+    def learn_procedure(self, **kwargs):
+        pass
+
+
+class StubReflection:
+
+    def __init__(self, latency: float):
+        self.latency = latency
+
+    async def critique_action(self, **kwargs):
+        await asyncio.sleep(self.latency)
+        return SimpleNamespace(critique="", improvements=[], lessons_learned=["check edge cases"])
+
+
+async def run(iterations: int, latency: float, **options) -> tuple:
+    random.seed(0)
+    llm = StubLLM(latency)
+    loop = CoEvolutionLoop(
+        llm,
+        SimpleNamespace(list_tools=lambda: []),
+        StubMemory(),
+        StubReflection(latency),
+        sandbox_executor=None,
+    )
+    start = time.perf_counter()
+    await loop.evolve(num_iterations=iterations, **options)
+    return time.perf_counter() - start, llm.calls, loop.stats.success_rate
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=40)
+    parser.add_argument("--latency", type=float, default=0.02)
+    args = parser.parse_args()
+
+    modes = [
+        ("sequential", dict()),
+        ("batch 8, 1 in flight", dict(batch_size=8, max_concurrency=1)),
+        ("batch 8, 4 in flight", dict(batch_size=8, max_concurrency=4)),
+        ("batch 8, 8 in flight", dict(batch_size=8, max_concurrency=8)),
+    ]
+
+    print(f"{args.iterations} iterations, {args.latency * 1000:.0f}ms per LLM call\n")
+    print(f"{'mode':<22} {'wall':>9} {'iter/s':>8} {'llm calls':>10} {'success':>8}")
+    baseline = None
+    for name, options in modes:
+        elapsed, calls, success_rate = asyncio.run(run(args.iterations, args.latency, **options))
+        baseline = baseline or elapsed
+        print(f"{name:<22} {elapsed * 1000:>7.0f}ms {args.iterations / elapsed:>8.1f} "
+              f"{calls:>10} {success_rate:>8.2f}  ({baseline / elapsed:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+FileWatcher idle cost and event latency benchmark.
+
+Builds a synthetic tree (default 50k files) and reports, per backend:
+- idle CPU per check_updates() tick (nothing changed)
+- latency from a write to the event being delivered
+
+The legacy row re-implements the previous poller (os.walk + MD5 of the
+first 8KB of every file) for comparison.
+
+Usage:
+    python benchmarks/benchmark_file_watcher.py [--files 50000] [--ticks 5]
+"""
+
+import argparse
+import hashlib
+import os
+import select
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from jdev_cli.core.file_watcher import FileWatcher, _InotifyBackend  # noqa: E402
+
+
+def build_tree(root: Path, files: int) -> list:
+    paths = []
+    for i in range(files):
+        directory = root / f"pkg_{i // 500}" / f"sub_{(i // 50) % 10}"
+        directory.mkdir(parents=True, exist_ok=True)
+        path = directory / f"mod_{i}.py"
+        path.write_text(f"VALUE = {i}\n")
+        paths.append(path)
+    return paths
+
+
+def legacy_tick(root: Path) -> None:
+    for dirpath, dirs, names in os.walk(root):
+        dirs[:] = [d for d in dirs if not d.startswith('.')]
+        for name in names:
+            if name.endswith('.py'):
+                with open(os.path.join(dirpath, name), 'rb') as f:
+                    hashlib.md5(f.read(8192)).hexdigest()
+
+
+def idle_cpu_ms(tick, ticks: int) -> float:
+    samples = []
+    for _ in range(ticks):
+        start = time.process_time()
+        tick()
+        samples.append((time.process_time() - start) * 1000)
+    return statistics.median(samples)
+
+
+def event_latency_ms(watcher: FileWatcher, target: Path, rounds: int) -> float:
+    samples = []
+    for i in range(rounds):
+        before = len(watcher.recent_events)
+        start = time.perf_counter()
+        target.write_text(f"VALUE = {-i}\n")
+
+        fd = watcher.fileno()
+        while len(watcher.recent_events) == before:
+            if fd is not None:
+                select.select([fd], [], [], 5.0)
+            watcher.check_updates()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--files", type=int, default=50_000)
+    parser.add_argument("--ticks", type=int, default=5)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        print(f"Building {args.files} files...")
+        paths = build_tree(root, args.files)
+        target = paths[len(paths) // 2]
+
+        print(f"\n{'backend':<10} {'start':>9} {'idle cpu/tick':>14} {'event latency':>14}")
+        legacy_cpu = idle_cpu_ms(lambda: legacy_tick(root), args.ticks)
+        print(f"{'legacy':<10} {'-':>9} {legacy_cpu:>12.1f}ms {'(1 tick)':>14}")
+
+        backends = ['polling'] + (['inotify'] if _InotifyBackend.available() else [])
+        for backend in backends:
+            watcher = FileWatcher(str(root), watch_extensions={'.py'}, backend=backend)
+            start = time.perf_counter()
+            watcher.start()
+            start_s = time.perf_counter() - start
+
+            idle = idle_cpu_ms(watcher.check_updates, args.ticks)
+            latency = event_latency_ms(watcher, target, args.rounds)
+            watcher.stop()
+
+            print(f"{backend:<10} {start_s:>8.2f}s {idle:>12.2f}ms {latency:>12.2f}ms")
+
+        print("\nPolling latency is bounded by the tick interval in real use "
+              "(shell polls every 1s); inotify can be driven by fileno().")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+"""
+Async HTTP client benchmark.
+
+Runs against a local keep-alive stub server that adds a fixed latency
+per request. Compares a throwaway client per call (what the module-level
+get() used to do) with the shared pooled client, and measures
+in-flight GET deduplication, ETag revalidation of a large body and peak
+memory of a buffered vs streamed download.
+
+Usage:
+    python benchmarks/benchmark_http_client.py [--requests 200] [--latency 0.005]
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from jdev_core.async_utils.http import HttpClient, close_clients, get  # noqa: E402
+
+
+BIG = 20_000_000
+
+
+class StubServer:
+    """Keep-alive HTTP/1.1 server with a fixed per-request latency."""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.connections = 0
+        self.requests = 0
+
+    async def start(self) -> str:
+        self._server = await asyncio.start_server(self._serve, '127.0.0.1', 0)
+        host, port = self._server.sockets[0].getsockname()[:2]
+        return f"http://{host}:{port}"
+
+    async def stop(self) -> None:
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _serve(self, reader, writer) -> None:
+        self.connections += 1
+        try:
+            while True:
+                head = (await reader.readuntil(b'\r\n\r\n')).decode().lower()
+                self.requests += 1
+                await asyncio.sleep(self.latency)
+                path = head.split(' ')[1]
+                if path == '/big':
+                    if 'if-none-match: "big"' in head:
+                        writer.write(b'HTTP/1.1 304 Not Modified\r\nETag: "big"\r\n'
+                                     b'Content-Length: 0\r\n\r\n')
+                    else:
+                        writer.write(b'HTTP/1.1 200 OK\r\nETag: "big"\r\n'
+                                     b'Content-Length: %d\r\n\r\n' % BIG)
+                        for _ in range(BIG // 1_000_000):
+                            writer.write(b'x' * 1_000_000)
+                            await writer.drain()
+                else:
+                    writer.write(b'HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\nok')
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+async def timed(server: StubServer, coro) -> tuple:
+    server.connections = server.requests = 0
+    start = time.perf_counter()
+    await coro
+    return time.perf_counter() - start, server.requests, server.connections
+
+
+async def throwaway(url: str, count: int, concurrency: int) -> None:
+    async def one(i):
+        async with HttpClient() as client:
+            await client.get(f"{url}/item/{i % concurrency}")
+    for start in range(0, count, concurrency):
+        await asyncio.gather(*(one(i) for i in range(start, min(start + concurrency, count))))
+
+
+async def shared(url: str, count: int, concurrency: int) -> None:
+    for start in range(0, count, concurrency):
+        batch = range(start, min(start + concurrency, count))
+        await asyncio.gather(*(get(f"{url}/item/{i % concurrency}") for i in batch))
+
+
+async def identical(client: HttpClient, count: int) -> None:
+    await asyncio.gather(*(client.get('/hot') for _ in range(count)))
+
+
+async def big_twice(client: HttpClient) -> None:
+    await client.get('/big')
+    await client.get('/big')
+
+
+async def peak_memory(coro) -> float:
+    tracemalloc.start()
+    await coro
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak / 1e6
+
+
+async def buffered(client: HttpClient) -> None:
+    (await client.get('/big')).content
+
+
+async def streamed(client: HttpClient) -> None:
+    async with client.stream('GET', '/big') as response:
+        async for _ in response.aiter_bytes():
+            pass
+
+
+async def main_async(count: int, latency: float) -> None:
+    server = StubServer(latency)
+    url = await server.start()
+
+    print(f"{count} requests, {latency * 1000:.0f}ms server latency\n")
+    print(f"{'scenario':<34} {'wall':>8} {'requests':>9} {'connections':>12}")
+
+    rows = [("throwaway client, 10 in flight", throwaway(url, count, 10)),
+            ("shared pool, 10 in flight", shared(url, count, 10))]
+    for name, coro in rows:
+        elapsed, requests, connections = await timed(server, coro)
+        print(f"{name:<34} {elapsed * 1000:>6.0f}ms {requests:>9} {connections:>12}")
+    await close_clients()
+
+    for dedupe in (False, True):
+        options = dict(dedupe_gets=dedupe, max_connections_per_host=0)
+        async with HttpClient(base_url=url, **options) as client:
+            elapsed, requests, connections = await timed(server, identical(client, count))
+        print(f"{'identical GETs, dedupe ' + ('on' if dedupe else 'off'):<34} "
+              f"{elapsed * 1000:>6.0f}ms {requests:>9} {connections:>12}")
+
+    for cache_size in (0, 256):
+        async with HttpClient(base_url=url, cache_size=cache_size) as client:
+            elapsed, requests, connections = await timed(server, big_twice(client))
+        print(f"{'20MB GET twice, etag cache ' + ('on' if cache_size else 'off'):<34} "
+              f"{elapsed * 1000:>6.0f}ms {requests:>9} {connections:>12}")
+
+    print(f"\n{'20MB download':<34} {'peak MB':>8}")
+    downloads = [("buffered HttpResponse.content", buffered), ("streamed aiter_bytes()", streamed)]
+    for name, fn in downloads:
+        async with HttpClient(base_url=url, cache_size=0) as client:
+            print(f"{name:<34} {await peak_memory(fn(client)):>8.1f}")
+
+    await server.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.005)
+    args = parser.parse_args()
+    asyncio.run(main_async(args.requests, args.latency))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+SemanticIndexer throughput benchmark.
+
+Generates a synthetic package tree and reports files/sec for:
+- legacy parse (ast.walk parent lookup per function, quadratic per file)
+- single-pass visitor, serial
+- single-pass visitor, process pool
+- warm start: no-change re-index (stat fast path), eager and lazy cache load
+
+Usage:
+    python benchmarks/benchmark_indexer.py [--files 2000] [--workers 0]
+"""
+
+import argparse
+import ast
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from jdev_cli.intelligence.indexer import SemanticIndexer  # noqa: E402
+
+
+def _module_source(i: int, classes: int = 8, methods: int = 12) -> str:
+    lines = ["import os", "import json", f"from pkg import mod_{max(0, i - 1)}", ""]
+    for c in range(classes):
+        lines.append(f"class Service{i}_{c}:")
+        lines.append(f'    """Service {c}."""')
+        for m in range(methods):
+            lines.append(f"    def handle_{m}(self, request, context=None):")
+            lines.append(f"        value = request.get('k{m}')")
+            lines.append("        return json.dumps(value)")
+        lines.append("")
+    for f in range(10):
+        lines.append(f"def util_{f}(a, b):")
+        lines.append("    return os.path.join(a, b)")
+        lines.append("")
+    return "\n".join(lines)
+
+
+def build_tree(root: Path, files: int) -> None:
+    for i in range(files):
+        pkg = root / "pkg" / f"sub_{i // 200}"
+        pkg.mkdir(parents=True, exist_ok=True)
+        (pkg / f"mod_{i}.py").write_text(_module_source(i))
+
+
+def legacy_parse(path: Path) -> int:
+    """Parent lookup as done before the single-pass visitor."""
+    tree = ast.parse(path.read_text(encoding="utf-8"))
+    count = 0
+    for node in ast.walk(tree):
+        if isinstance(node, ast.FunctionDef):
+            for parent_node in ast.walk(tree):
+                if isinstance(parent_node, ast.ClassDef) and node in ast.walk(parent_node):
+                    break
+            count += 1
+        elif isinstance(node, ast.ClassDef):
+            count += 1
+    return count
+
+
+def _timed(label: str, files: int, fn) -> float:
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<30} {elapsed:8.2f}s  {files / elapsed:10.0f} files/sec")
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--files", type=int, default=2000)
+    parser.add_argument("--workers", type=int, default=0, help="0 = one per CPU")
+    parser.add_argument("--legacy-sample", type=int, default=200,
+                        help="files to time with the legacy parser (it is slow)")
+    args = parser.parse_args()
+
+    workers = args.workers or os.cpu_count() or 1
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp) / "repo"
+        build_tree(root, args.files)
+        paths = sorted(root.rglob("*.py"))
+
+        print(f"Indexing {len(paths)} files ({workers} workers)\n")
+
+        sample = paths[:args.legacy_sample]
+        _timed("legacy (parse only, sample)", len(sample),
+               lambda: [legacy_parse(p) for p in sample])
+
+        serial = SemanticIndexer(str(root), cache_dir=str(Path(tmp) / "c1"))
+        _timed("single-pass (parse only)", len(paths),
+               lambda: [serial.parse_file(p) for p in paths])
+        _timed("single-pass, serial", len(paths), lambda: serial.index_codebase(force=True))
+
+        parallel = SemanticIndexer(str(root), cache_dir=str(Path(tmp) / "c2"))
+        _timed(f"single-pass, {workers} procs", len(paths),
+               lambda: parallel.index_codebase(force=True, workers=workers))
+
+        assert serial.get_stats() == parallel.get_stats()
+        print(f"\n{serial.get_stats()['total_symbols']} symbols indexed\n")
+
+        _timed("re-index, nothing changed", len(paths), serial.index_codebase)
+        serial.close()
+
+        for lazy in (False, True):
+            warm = SemanticIndexer(str(root), cache_dir=str(Path(tmp) / "c1"))
+            _timed(f"load_cache(lazy={lazy})", len(paths), lambda: warm.load_cache(lazy=lazy))
+            warm.close()
+
+
+if __name__ == "__main__":
+    main()
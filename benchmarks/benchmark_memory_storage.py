@@ -0,0 +1,81 @@
+"""
+MemorySystem persistence benchmark.
+
+Compares restarting from a whole-state JSON blob (export_state ->
+json -> import_state) with reopening a SQLiteMemoryStorage database, at
+growing numbers of stored episodes. Reports per-write cost, startup
+time and the first recall after startup.
+
+Usage:
+    python benchmarks/benchmark_memory_storage.py [--sizes 1000 10000 50000]
+"""
+
+import argparse
+import json
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from prometheus.memory import MemorySystem  # noqa: E402
+
+
+VOCAB = [f"term{i}" for i in range(5000)]
+OUTCOMES = ["success: tests passed", "failed with timeout", "completed", "error in build"]
+
+
+def make_experience(rng: random.Random) -> str:
+    return " ".join(rng.choices(VOCAB, k=rng.randint(8, 20)))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 50_000])
+    args = parser.parse_args()
+
+    print(f"{'episodes':>9} {'write/op':>10} {'json start':>11} {'db start':>10} "
+          f"{'json recall':>12} {'db recall':>10}")
+
+    for size in args.sizes:
+        rng = random.Random(size)
+        query = " ".join(rng.choices(VOCAB, k=4))
+
+        with tempfile.TemporaryDirectory() as tmp:
+            db_path = Path(tmp) / "memory.db"
+            json_path = Path(tmp) / "memory.json"
+
+            memory = MemorySystem(max_episodic=size, storage=db_path)
+            start = time.perf_counter()
+            for _ in range(size):
+                memory.remember_experience(make_experience(rng), rng.choice(OUTCOMES))
+            write_us = (time.perf_counter() - start) / size * 1e6
+            json_path.write_text(json.dumps(memory.export_state()))
+            memory.close()
+
+            start = time.perf_counter()
+            legacy = MemorySystem(max_episodic=size)
+            legacy.import_state(json.loads(json_path.read_text()))
+            json_start = (time.perf_counter() - start) * 1000
+
+            start = time.perf_counter()
+            legacy.recall_experiences(query)
+            json_recall = (time.perf_counter() - start) * 1000
+
+            start = time.perf_counter()
+            reopened = MemorySystem(max_episodic=size, storage=db_path)
+            db_start = (time.perf_counter() - start) * 1000
+
+            start = time.perf_counter()
+            reopened.recall_experiences(query)
+            db_recall = (time.perf_counter() - start) * 1000
+            reopened.close()
+
+        print(f"{size:>9} {write_us:>8.1f}us {json_start:>9.1f}ms {db_start:>8.2f}ms "
+              f"{json_recall:>10.2f}ms {db_recall:>8.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""
+InMemoryQueue throughput benchmark.
+
+Publishes N messages, a share of them with a short random delay, and
+consumes them all. Compares the previous sorted-list delay queue
+(re-sort per publish, pop(0), promotion only inside consume) with the
+heap + timer queue and its batch APIs.
+
+Usage:
+    python benchmarks/benchmark_message_queue.py [--messages 20000]
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from jdev_core.messaging import InMemoryQueue, Message, QueueConfig  # noqa: E402
+
+
+MAX_DELAY = 0.2
+
+
+class LegacyQueue:
+    """The delayed-delivery logic this replaced."""
+
+    def __init__(self, config: QueueConfig):
+        self._messages = asyncio.Queue(maxsize=config.max_size)
+        self._processing = {}
+        self._delayed = []
+        self._lock = asyncio.Lock()
+
+    async def publish(self, message, delay=0.0):
+        if delay > 0:
+            async with self._lock:
+                self._delayed.append((time.time() + delay, message))
+                self._delayed.sort(key=lambda x: x[0])
+            return message.id
+        self._messages.put_nowait(message)
+        return message.id
+
+    async def consume(self, count=1):
+        async with self._lock:
+            now = time.time()
+            while self._delayed and self._delayed[0][0] <= now:
+                _, message = self._delayed.pop(0)
+                self._messages.put_nowait(message)
+
+        messages = []
+        for _ in range(count):
+            try:
+                message = self._messages.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+            message.mark_processing()
+            async with self._lock:
+                self._processing[message.id] = message
+            messages.append(message)
+        return messages
+
+    async def ack(self, message_id):
+        async with self._lock:
+            return self._processing.pop(message_id, None) is not None
+
+
+def make_workload(count: int, delayed_share: float) -> list:
+    rng = random.Random(0)
+    return [
+        (Message(payload=i), rng.uniform(0.01, MAX_DELAY) if rng.random() < delayed_share else 0.0)
+        for i in range(count)
+    ]
+
+
+async def run_legacy(workload: list) -> float:
+    queue = LegacyQueue(QueueConfig(name="bench", max_size=0))
+    start = time.perf_counter()
+    for message, delay in workload:
+        await queue.publish(message, delay=delay)
+
+    received = 0
+    while received < len(workload):
+        messages = await queue.consume(count=100)
+        for message in messages:
+            await queue.ack(message.id)
+        received += len(messages)
+        if not messages:
+            await asyncio.sleep(0.001)  # Delayed messages only surface on poll
+    return time.perf_counter() - start
+
+
+async def run_heap(workload: list) -> float:
+    queue = InMemoryQueue(QueueConfig(name="bench", max_size=0))
+    start = time.perf_counter()
+    ready = [message for message, delay in workload if delay == 0]
+    await queue.publish_batch(ready)
+    for message, delay in workload:
+        if delay:
+            await queue.publish(message, delay=delay)
+
+    received = 0
+    while received < len(workload):
+        messages = await queue.consume_batch(max_count=100, timeout=1.0)
+        await queue.ack_many([message.id for message in messages])
+        received += len(messages)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--messages", type=int, default=20_000)
+    args = parser.parse_args()
+
+    print(f"{args.messages} messages, delays up to {MAX_DELAY * 1000:.0f}ms\n")
+    print(f"{'delayed':>8} {'legacy msg/s':>13} {'heap msg/s':>11}")
+    for share in (0.0, 0.5, 1.0):
+        legacy = asyncio.run(run_legacy(make_workload(args.messages, share)))
+        heap = asyncio.run(run_heap(make_workload(args.messages, share)))
+        print(f"{share:>8.0%} {args.messages / legacy:>13,.0f} {args.messages / heap:>11,.0f}"
+              f"  ({legacy / heap:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
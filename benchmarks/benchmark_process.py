@@ -0,0 +1,92 @@
+"""
+Async process execution benchmark.
+
+Runs 200 short commands through the previous run_many (one process per
+command, all started at once) and the CPU-bounded scheduler, then runs
+a command writing 1 GB of output through the streaming runner under a
+fixed memory ceiling. The previous communicate()-based runner is run
+on a tenth of that output for comparison; it buffers everything.
+
+Usage:
+    python benchmarks/benchmark_process.py [--commands 200] [--output-mb 1000]
+"""
+
+import argparse
+import asyncio
+import shlex
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from jdev_core.async_utils.process import cpu_count, run_command, run_many  # noqa: E402
+
+
+async def legacy_run_command(command: str) -> tuple:
+    """The communicate()-based runner this replaced."""
+    process = await asyncio.create_subprocess_exec(
+        *shlex.split(command),
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    stdout, stderr = await process.communicate()
+    return process.returncode, stdout.decode('utf-8', errors='replace').strip()
+
+
+async def legacy_run_many(commands: list) -> list:
+    return await asyncio.gather(*(legacy_run_command(c) for c in commands))
+
+
+def big_output(megabytes: int) -> str:
+    line = 'x' * 999
+    return f"sh -c 'yes {line} | head -c {megabytes * 1_000_000}'"
+
+
+async def measure(coro) -> tuple:
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = await coro
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1] / 1e6
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+async def main_async(count: int, output_mb: int, ceiling_mb: float) -> None:
+    commands = [f"sh -c 'echo {i}; sleep 0.01'" for i in range(count)]
+
+    print(f"{count} short commands, {cpu_count()} CPUs\n")
+    print(f"{'runner':<28} {'wall':>8} {'peak MB':>8}")
+    _, elapsed, peak = await measure(legacy_run_many(commands))
+    print(f"{'legacy, all at once':<28} {elapsed * 1000:>6.0f}ms {peak:>8.1f}")
+    for limit in (cpu_count(), cpu_count() * 4):
+        results, elapsed, peak = await measure(run_many(commands, max_concurrency=limit))
+        assert all(r.success for r in results)
+        print(f"{f'scheduled, {limit} at a time':<28} {elapsed * 1000:>6.0f}ms {peak:>8.1f}")
+
+    print(f"\n{'large output':<28} {'wall':>8} {'peak MB':>8} {'MB/s':>7}")
+    small = max(1, output_mb // 10)
+    _, elapsed, peak = await measure(legacy_run_command(big_output(small)))
+    label = f"legacy, {small} MB"
+    print(f"{label:<28} {elapsed * 1000:>6.0f}ms {peak:>8.1f} {small / elapsed:>7.0f}")
+
+    result, elapsed, peak = await measure(run_command(big_output(output_mb), max_output_lines=100))
+    print(f"{f'streamed, {output_mb} MB':<28} {elapsed * 1000:>6.0f}ms {peak:>8.1f} "
+          f"{output_mb / elapsed:>7.0f}")
+    print(f"\n{result.dropped_lines:,} lines dropped from the retained buffer; "
+          f"peak {'within' if peak <= ceiling_mb else 'OVER'} the {ceiling_mb:.0f} MB ceiling")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--commands", type=int, default=200)
+    parser.add_argument("--output-mb", type=int, default=1000)
+    parser.add_argument("--ceiling-mb", type=float, default=16)
+    args = parser.parse_args()
+    asyncio.run(main_async(args.commands, args.output_mb, args.ceiling_mb))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""
+ResponseParser corpus benchmark.
+
+Parses a corpus of model outputs with the previous strategy cascade
+(strict JSON, markdown JSON, regex and partial JSON tried in turn, each
+re-scanning the response, then a secondary LLM pass for anything left)
+and with the pre-classified fast path. Reports parse time and how many
+secondary LLM passes each would have requested.
+
+The corpus is the parser's own response logs (--corpus ~/.qwen_logs)
+or, by default, a built-in set shaped like recorded outputs: prose
+answers, answers with code blocks, tool-call JSON (bare, fenced,
+single-quoted, truncated).
+
+Usage:
+    python benchmarks/benchmark_response_parser.py [--corpus DIR] [--rounds 20]
+"""
+
+import argparse
+import json
+import logging
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from jdev_cli.core.parser import ParseResult, ParseStrategy, ResponseParser  # noqa: E402
+
+
+class LegacyResponseParser(ResponseParser):
+    """The strategy cascade parse() ran before pre-classification."""
+
+    def parse(self, response: str, attempt: int = 0) -> ParseResult:
+        if not response or not response.strip():
+            return ParseResult(success=False, error="Empty response", raw_response=response)
+        response = response.strip()
+        result = None
+        for strategy, method in self._STRATEGIES.items():
+            result = getattr(self, method)(response)
+            if result.success:
+                self.stats[strategy] += 1
+                return self._sanitize_tool_calls(result)
+            if self.strict_mode:
+                break
+        if self.enable_retry and attempt < self.max_retries:
+            return self._maybe_retry(response, result, attempt)
+        self.stats[ParseStrategy.PLAIN_TEXT] += 1
+        return ParseResult(success=True, text_response=response,
+                           strategy=ParseStrategy.PLAIN_TEXT, raw_response=response)
+
+
+def builtin_corpus() -> list:
+    code = "\n".join(f"    value_{i} = compute(items[{i}], {{'k': {i}}})" for i in range(60))
+    prose = ("The cache is keyed on the request, so repeated planner prompts are "
+             "answered without a provider call. ") * 20
+    call = {"tool": "write_file", "args": {"path": "src/app.py", "content": "print('hi')\n" * 20}}
+    return [
+        prose,
+        "Sure! Here is the refactored function:\n\n```python\ndef run(items):\n"
+        + code + "\n```\n\n" + prose,
+        "Let me check the docs [1] and the changelog [2] before answering.\n\n" + prose,
+        json.dumps(call),
+        json.dumps([call, {"tool": "bash_command", "args": {"command": "pytest -q"}}]),
+        "I'll read it first.\n```json\n" + json.dumps(call) + "\n```",
+        "{'tool': 'read_file', 'args': {'path': 'main.py'}}",
+        '[{"tool": "read_file", "args": {"path": "main.py"}',
+        "Running it now: "
+        + json.dumps({"tool": "ls", "args": {"path": "."}})
+        + " then summarising.",
+        "Use `git status` then `git diff --stat` to review; nothing to run here.",
+    ]
+
+
+def load_corpus(directory: Path) -> list:
+    """Responses from ResponseParser._log_response files."""
+    responses = []
+    for path in sorted(directory.glob("response_*.txt")):
+        text = path.read_text(encoding="utf-8", errors="replace")
+        _, sep, body = text.partition("-" * 80 + "\n")
+        responses.append(body if sep else text)
+    return responses
+
+
+def run(parser_cls, corpus: list, rounds: int):
+    """Best-of-rounds time to parse the corpus, and secondary passes requested."""
+    retries = 0
+
+    def fix(response: str, error: str) -> str:
+        nonlocal retries
+        retries += 1
+        return response  # The model repeats itself
+
+    best = float("inf")
+    for _ in range(rounds):
+        parser = parser_cls(enable_retry=True, max_retries=1, enable_logging=False)
+        parser.set_retry_callback(fix)
+        retries = 0
+        start = time.perf_counter()
+        for response in corpus:
+            parser.parse(response)
+        best = min(best, time.perf_counter() - start)
+    return best, retries, parser
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--corpus", type=Path, help="Directory of response_*.txt logs")
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+
+    corpus = load_corpus(args.corpus) if args.corpus else builtin_corpus()
+    if not corpus:
+        parser.error(f"No response_*.txt files in {args.corpus}")
+
+    legacy, legacy_retries, _ = run(LegacyResponseParser, corpus, args.rounds)
+    tiered, tiered_retries, fast = run(ResponseParser, corpus, args.rounds)
+
+    size = sum(len(response) for response in corpus)
+    print(f"{len(corpus)} responses, {size:,} chars\n")
+    print(f"{'':>16} {'parse ms':>9} {'LLM retries':>12}")
+    print(f"{'cascade':>16} {legacy * 1000:>9.2f} {legacy_retries:>12}")
+    print(f"{'classified':>16} {tiered * 1000:>9.2f} {tiered_retries:>12}"
+          f"  ({legacy / tiered:.1f}x)")
+
+    print("\nPer-strategy latency (classified, last round)")
+    for name, entry in fast.get_statistics()["latency"].items():
+        print(f"{name:>16} {entry['attempts']:>4} attempts {entry['avg_ms']:>8.3f} ms avg")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+SandboxExecutor throughput benchmark.
+
+Runs small test-case style snippets through the original path (temp
+file + fresh interpreter per snippet) and the warm worker pool,
+sequentially and with several snippets in flight.
+
+Usage:
+    python benchmarks/benchmark_sandbox.py [--snippets 200] [--concurrency 4]
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from prometheus.sandbox.executor import SandboxConfig, SandboxExecutor  # noqa: E402
+
+
+CODE = """
+def test_function(n):
+    return sum(i * i for i in range(n))
+"""
+
+
+async def throughput(pool_size: int, snippets: int, concurrency: int) -> float:
+    sandbox = SandboxExecutor(SandboxConfig(pool_size=pool_size))
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(i: int):
+        async with semaphore:
+            result = await sandbox.execute_function(CODE, "test_function", args=(i,))
+            assert result.success and result.return_value == sum(j * j for j in range(i))
+
+    try:
+        await sandbox.execute("1")  # warm-up (starts the pool)
+        start = time.perf_counter()
+        await asyncio.gather(*(run(i) for i in range(snippets)))
+        return snippets / (time.perf_counter() - start)
+    finally:
+        sandbox.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--snippets", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=4)
+    args = parser.parse_args()
+
+    print(f"{'mode':<12} {'in flight':>9} {'snippets/s':>11}")
+    for concurrency in (1, args.concurrency):
+        legacy = asyncio.run(throughput(0, args.snippets, concurrency))
+        pooled = asyncio.run(throughput(args.concurrency, args.snippets, concurrency))
+        print(f"{'subprocess':<12} {concurrency:>9} {legacy:>11.1f}")
+        print(f"{'pool':<12} {concurrency:>9} {pooled:>11.1f}  ({pooled / legacy:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
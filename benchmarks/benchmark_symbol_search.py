@@ -0,0 +1,97 @@
+"""
+Symbol search latency benchmark.
+
+Compares the linear scan search_symbols used to do against
+SymbolSearchIndex at 10k / 100k / 1M synthetic symbol names.
+
+Usage:
+    python benchmarks/benchmark_symbol_search.py [--sizes 10000 100000 1000000]
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from jdev_cli.intelligence.symbol_search import SymbolSearchIndex  # noqa: E402
+
+
+WORDS = [
+    "get", "set", "parse", "load", "save", "index", "symbol", "search", "file",
+    "cache", "request", "response", "handler", "manager", "client", "server",
+    "build", "render", "stream", "token", "agent", "tool", "context", "event",
+]
+QUERIES = ["parse", "handler", "ParseFile", "dlerman", "sym", "gs", "x", "tokenstream"]
+
+
+def make_names(count: int, seed: int = 7) -> list:
+    rng = random.Random(seed)
+    names = set()
+    while len(names) < count:
+        parts = rng.sample(WORDS, rng.randint(2, 4))
+        if rng.random() < 0.5:
+            name = "_".join(parts) + f"_{rng.randint(0, 999)}"
+        else:
+            name = "".join(p.title() for p in parts) + str(rng.randint(0, 999))
+        names.add(name)
+    return list(names)
+
+
+def linear_search(names: list, query: str, limit: int) -> list:
+    """search_symbols before the index: scan + full sort."""
+    q = query.lower()
+    hits = [n for n in names if q in n.lower()]
+    hits.sort(key=lambda n: (0 if n.lower() == q else 1 if n.lower().startswith(q) else 2, n))
+    return hits[:limit]
+
+
+def indexed_search(index: SymbolSearchIndex, query: str, limit: int) -> list:
+    results = []
+    for name in index.search(query):
+        results.append(name)
+        if len(results) >= limit:
+            break
+    return results
+
+
+def time_queries(fn, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        for query in QUERIES:
+            start = time.perf_counter()
+            fn(query)
+            samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples), max(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'symbols':>10} {'build':>9} {'linear p50':>11} {'index p50':>10} {'index max':>10}")
+    for size in args.sizes:
+        names = make_names(size)
+
+        start = time.perf_counter()
+        index = SymbolSearchIndex()
+        index.build(names)
+        build_s = time.perf_counter() - start
+
+        linear_p50, _ = time_queries(lambda q: linear_search(names, q, args.limit), 1)
+        index_p50, index_max = time_queries(
+            lambda q: indexed_search(index, q, args.limit), args.repeat
+        )
+
+        print(f"{size:>10} {build_s:>8.2f}s {linear_p50:>9.2f}ms "
+              f"{index_p50:>8.3f}ms {index_max:>8.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
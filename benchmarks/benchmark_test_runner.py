@@ -0,0 +1,99 @@
+"""
+ExecutorAgent test-case runner benchmark.
+
+Runs a code task's test cases one sandbox process per case (the
+original runner) and all in a single process (batched), with and
+without the warm worker pool, at growing numbers of test cases.
+
+Usage:
+    python benchmarks/benchmark_test_runner.py [--cases 5 20 50]
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from prometheus.agents.curriculum_agent import (  # noqa: E402
+    EvolutionTask,
+    TaskDifficulty,
+    TaskDomain,
+)
+from prometheus.agents.executor_agent import ExecutorAgent  # noqa: E402
+from prometheus.sandbox import SandboxExecutor  # noqa: E402
+from prometheus.sandbox.executor import SandboxConfig  # noqa: E402
+
+
+SOLUTION = """```python
+import json
+import statistics
+
+
+def summarize(values):
+    return json.dumps({"mean": statistics.mean(values), "max": max(values)})
+```"""
+
+
+def make_task(count: int) -> EvolutionTask:
+    cases = []
+    for i in range(count):
+        values = [i, i + 1, i + 2]
+        cases.append({
+            "input": values,
+            "expected_output": '{"mean": %d, "max": %d}' % (i + 1, i + 2),
+        })
+    return EvolutionTask(
+        id="bench",
+        description="summarize values",
+        difficulty=TaskDifficulty.EASY,
+        domain=TaskDomain.CODE,
+        expected_skills=[],
+        success_criteria=[],
+        test_cases=cases,
+    )
+
+
+async def run(task: EvolutionTask, pool_size: int, batch: bool) -> tuple:
+    sandbox = SandboxExecutor(SandboxConfig(pool_size=pool_size))
+    agent = ExecutorAgent(None, None, None, None, sandbox, batch_test_cases=batch)
+    if pool_size:
+        # Exclude worker start-up from the timing
+        await asyncio.gather(*(sandbox.execute("1") for _ in range(pool_size)))
+        sandbox.clear_history()
+
+    start = time.perf_counter()
+    score, _ = await agent._run_test_cases(task, SOLUTION)
+    elapsed = time.perf_counter() - start
+
+    sandbox.close()
+    return elapsed, score, len(sandbox.execution_history)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--cases", type=int, nargs="+", default=[5, 20, 50])
+    args = parser.parse_args()
+
+    modes = [
+        ("per case, fresh", 0, False),
+        ("per case, pooled", 4, False),
+        ("batched, fresh", 0, True),
+        ("batched, pooled", 4, True),
+    ]
+
+    print(f"{'cases':>6} {'mode':<18} {'wall':>9} {'cases/s':>9} {'runs':>5} {'score':>6}")
+    for count in args.cases:
+        task = make_task(count)
+        baseline = None
+        for name, pool_size, batch in modes:
+            elapsed, score, runs = asyncio.run(run(task, pool_size, batch))
+            baseline = baseline or elapsed
+            print(f"{count:>6} {name:<18} {elapsed * 1000:>7.1f}ms {count / elapsed:>9.0f} "
+                  f"{runs:>5} {score:>6.2f}  ({baseline / elapsed:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
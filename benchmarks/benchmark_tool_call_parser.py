@@ -0,0 +1,162 @@
+"""
+Streaming tool-call parsing benchmark.
+
+Streams ~100 KB LLM responses in small chunks through the display filter
+and tool-call extraction, the way Bridge.chat consumes them. Compares
+the previous pipeline (StreamFilter re-scanning its whole buffer on every
+chunk, then six regex passes of ToolCallParser.extract over the full
+text) with the single-pass StreamFilter + IncrementalToolCallParser.
+
+Usage:
+    python benchmarks/benchmark_tool_call_parser.py [--size 100000] [--chunk 40]
+"""
+
+import argparse
+import json
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from jdev_tui.core.parsing.stream_filter import StreamFilter  # noqa: E402
+from jdev_tui.core.parsing.tool_call_parser import ToolCallParser  # noqa: E402
+
+
+class LegacyStreamFilter:
+    """The filter this replaced (buffer re-scanned on every chunk)."""
+
+    def __init__(self):
+        self._buffer = ""
+        self._in_potential_json = False
+        self._in_tool_marker = False
+        self._json_start_pattern = re.compile(r'\{\s*"tool"')
+        self._tool_arg_patterns = re.compile(
+            r'\{\s*"(query|path|command|file|url|pattern|search|prompt|message|data|content)"'
+        )
+        self._tool_marker_pattern = re.compile(r'\[TOOL_CALL:\w+:\{.*?\}\]', re.DOTALL)
+        self._tool_marker_start = re.compile(r'\[TOOL_CALL:')
+
+    def process_chunk(self, chunk):
+        chunk = self._tool_marker_pattern.sub('', chunk)
+        if self._in_tool_marker:
+            self._buffer += chunk
+            if ']' in self._buffer:
+                cleaned = self._tool_marker_pattern.sub('', self._buffer)
+                if self._tool_marker_start.search(cleaned):
+                    idx = cleaned.rfind('[TOOL_CALL:')
+                    self._buffer = cleaned[idx:]
+                    return cleaned[:idx]
+                self._buffer = ""
+                self._in_tool_marker = False
+                return cleaned
+            return ""
+        if '[TOOL_CALL:' in chunk:
+            idx = chunk.find('[TOOL_CALL:')
+            if ']' not in chunk[idx:]:
+                self._in_tool_marker = True
+                self._buffer = chunk[idx:]
+                return chunk[:idx]
+        if self._in_potential_json:
+            self._buffer += chunk
+            return self._check_buffer()
+        if '{' in chunk:
+            pre_json, post_json = chunk.split('{', 1)
+            potential_start = '{' + post_json
+            if (self._json_start_pattern.match(potential_start) or
+                    self._tool_arg_patterns.match(potential_start)):
+                self._in_potential_json = True
+                self._buffer = potential_start
+                return pre_json
+        return chunk
+
+    def _check_buffer(self):
+        if self._buffer.count('{') - self._buffer.count('}') <= 0:
+            self._buffer = ""
+            self._in_potential_json = False
+        return ""
+
+    def flush(self):
+        content, self._buffer = self._buffer, ""
+        return content
+
+
+CODE = "def handler(event):\n    return {'status': [200, 'ok'], 'body': event}\n"
+
+
+def make_response(size: int) -> str:
+    """Prose, code blocks and tool calls whose content is mostly code."""
+    code = CODE * 40
+    parts = []
+    length = 0
+    i = 0
+    while length < size:
+        parts.append(f"Step {i}: updating the handler module as discussed.\n")
+        parts.append(f"```python\nread_file(path='src/module_{i}.py')\n```\n")
+        parts.append(ToolCallParser.format_marker(
+            "write_file", {"path": f"src/module_{i}.py", "content": code}) + "\n")
+        legacy = {"tool": "bash", "args": {"command": f"pytest -k case_{i}"}}
+        parts.append(json.dumps(legacy) + "\n")
+        length = sum(len(p) for p in parts)
+        i += 1
+    return "".join(parts)
+
+
+def make_single_call(size: int) -> str:
+    """One write_file call carrying a whole generated file."""
+    code = CODE * (size // len(CODE))
+    return "Writing the module now.\n" + ToolCallParser.format_marker(
+        "write_file", {"path": "src/generated.py", "content": code}
+    ) + "\nDone."
+
+
+def run_legacy(chunks):
+    stream_filter = LegacyStreamFilter()
+    for chunk in chunks:
+        stream_filter.process_chunk(chunk)
+    stream_filter.flush()
+    return ToolCallParser.extract("".join(chunks))
+
+
+def run_incremental(chunks):
+    stream_filter = StreamFilter()
+    for chunk in chunks:
+        stream_filter.process_chunk(chunk)
+    stream_filter.flush()
+    stream_filter.parser.finish()
+    return stream_filter.tool_calls
+
+
+def best_of(fn, chunks, rounds: int = 3) -> float:
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn(chunks)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size", type=int, default=100_000)
+    parser.add_argument("--chunk", type=int, default=40)
+    args = parser.parse_args()
+
+    print(f"{args.chunk}-char chunks\n")
+    for title, make in (("many calls", make_response), ("one large call", make_single_call)):
+        print(f"{title:<16} {'size':>9} {'calls':>6} {'legacy ms':>10} {'stream ms':>10}")
+        for size in (args.size // 4, args.size // 2, args.size, args.size * 2):
+            text = make(size)
+            chunks = [text[i:i + args.chunk] for i in range(0, len(text), args.chunk)]
+            calls = run_incremental(chunks)
+            assert sorted(map(repr, calls)) == sorted(map(repr, run_legacy(chunks)))
+
+            legacy = best_of(run_legacy, chunks)
+            incremental = best_of(run_incremental, chunks)
+            print(f"{'':<16} {len(text):>9,} {len(calls):>6} {legacy * 1000:>10.1f}"
+                  f" {incremental * 1000:>10.1f}  ({legacy / incremental:.1f}x)")
+        print()
+
+if __name__ == "__main__":
+    main()
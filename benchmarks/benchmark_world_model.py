@@ -0,0 +1,98 @@
+"""
+WorldModel.find_best_plan benchmark.
+
+Simulates N candidate plans of M steps against a stubbed LLM with a
+fixed per-call latency, comparing the original sequential simulation
+with bounded concurrency, pruning, and batched step prediction.
+
+Usage:
+    python benchmarks/benchmark_world_model.py [--plans 5] [--steps 6] [--latency 0.05]
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from prometheus.core.world_model import WorldModel  # noqa: E402
+
+
+class StubLLM:
+    """Fixed-latency LLM; step success probabilities come from params["p"]."""
+
+    def __init__(self, plans: list, latency: float):
+        self.plans = plans
+        self.latency = latency
+        self.calls = 0
+
+    @staticmethod
+    def _prediction(p: str) -> dict:
+        return {"predicted_outcome": "ok", "success_probability": float(p), "risks": []}
+
+    async def generate(self, prompt: str) -> str:
+        self.calls += 1
+        await asyncio.sleep(self.latency)
+        if prompt.startswith("Generate"):
+            return "\n\n".join(json.dumps(plan) for plan in self.plans)
+        if "ACTIONS TO SIMULATE" in prompt:
+            steps = prompt.split("ACTIONS TO SIMULATE")[1]
+            return json.dumps([self._prediction(p) for p in re.findall(r'"p": ([\d.]+)', steps)])
+        step = prompt.split("ACTION TO SIMULATE")[1]
+        return json.dumps(self._prediction(re.search(r'"p": ([\d.]+)', step).group(1)))
+
+
+def make_plans(count: int, steps: int) -> list:
+    rng = random.Random(0)
+    return [
+        [
+            {
+                "action": "think",
+                "params": {"plan": i, "step": j, "p": round(rng.uniform(0.5, 0.99), 2)},
+            }
+            for j in range(steps)
+        ]
+        for i in range(count)
+    ]
+
+
+async def run(plans: list, latency: float, **options) -> tuple:
+    llm = StubLLM(plans, latency)
+    model = WorldModel(llm)
+    start = time.perf_counter()
+    results = await model.find_best_plan("goal", num_candidates=len(plans), **options)
+    return time.perf_counter() - start, llm.calls, results[0].overall_success_probability
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--plans", type=int, default=5)
+    parser.add_argument("--steps", type=int, default=6)
+    parser.add_argument("--latency", type=float, default=0.05)
+    args = parser.parse_args()
+
+    plans = make_plans(args.plans, args.steps)
+    modes = [
+        ("sequential", dict(max_concurrency=1, prune=False)),
+        ("sequential + prune", dict(max_concurrency=1, prune=True)),
+        ("concurrent", dict(max_concurrency=args.plans, prune=False)),
+        ("concurrent + batch", dict(max_concurrency=args.plans, prune=False, batch=True)),
+    ]
+
+    print(f"{args.plans} plans x {args.steps} steps, {args.latency * 1000:.0f}ms per LLM call\n")
+    print(f"{'mode':<20} {'wall':>9} {'llm calls':>10} {'best p':>8}")
+    baseline = None
+    for name, options in modes:
+        elapsed, calls, best = asyncio.run(run(plans, args.latency, **options))
+        baseline = baseline or elapsed
+        speedup = baseline / elapsed
+        print(f"{name:<20} {elapsed * 1000:>7.0f}ms {calls:>10} {best:>8.3f}  ({speedup:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
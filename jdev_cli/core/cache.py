@@ -4,12 +4,20 @@
 Boris Cherny: Simple, measurable, no magic.
 """
 
+import asyncio
+import atexit
+import concurrent.futures
+import functools
 import hashlib
+import inspect
 import json
+import os
 import time
 import sqlite3
+import threading
+import weakref
 from pathlib import Path
-from typing import Optional, Any
+from typing import Any, Callable, Dict, Iterable, Optional, Set, Tuple
 from collections import OrderedDict
 from dataclasses import dataclass
 
@@ -22,6 +30,8 @@ class CacheStats:
     misses: int = 0
     memory_hits: int = 0
     disk_hits: int = 0
+    stale_hits: int = 0  # @cached: served stale while refreshing
+    coalesced: int = 0  # @cached: calls that joined an in-flight execution
 
     @property
     def hit_rate(self) -> float:
@@ -39,20 +49,26 @@ class LRUCache:
 
     def get(self, key: str) -> Optional[Any]:
         """Get value, update LRU order."""
-        if key in self._cache:
+        try:
             self._cache.move_to_end(key)
-            return self._cache[key]
-        return None
+        except KeyError:
+            return None
+        return self._cache[key]
 
     def set(self, key: str, value: Any) -> None:
         """Set value, evict if needed."""
         if key in self._cache:
             self._cache.move_to_end(key)
+            self._cache[key] = value
         else:
             self._cache[key] = value
             if len(self._cache) > self._maxsize:
                 self._cache.popitem(last=False)
 
+    def delete(self, key: str) -> None:
+        """Remove a cached item."""
+        self._cache.pop(key, None)
+
     def clear(self) -> None:
         """Clear all cached items."""
         self._cache.clear()
@@ -64,73 +80,193 @@ class LRUCache:
 
 
 class DiskCache:
-    """SQLite-based disk cache (Cursor L2 cache)."""
+    """SQLite-based disk cache (Cursor L2 cache).
+
+    One long-lived WAL connection shared across threads. Writes are
+    queued and group-committed (batch full, flush_interval elapsed, or
+    flush()/close()); reads see queued writes first. Expired rows are
+    skipped by an indexed expires_at column and swept in the background
+    flush, which also evicts the soonest-to-expire rows once the stored
+    values exceed max_size_mb. Values are stored as JSON (UTF-8); set()
+    raises TypeError/ValueError for values JSON cannot encode.
+    """
+
+    SCHEMA_VERSION = 3
 
-    def __init__(self, db_path: str = "~/.qwen-dev-cli/cache.db"):
+    def __init__(
+        self,
+        db_path: str = "~/.qwen-dev-cli/cache.db",
+        max_size_mb: float = 256,
+        batch_size: int = 128,
+        flush_interval: float = 0.05,
+        sweep_interval: float = 60.0,
+    ):
         self.db_path = Path(db_path).expanduser()
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = int(max_size_mb * 1024 * 1024)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.sweep_interval = sweep_interval
+
+        self._lock = threading.RLock()
+        # key -> (encoded value, expires_at), or None for a pending delete
+        self._pending: Dict[str, Optional[Tuple[bytes, float]]] = {}
+        self._timer: Optional[threading.Timer] = None
+        self._last_sweep = time.time()
+        self._closed = False
+
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
         self._init_db()
+        _open_disk_caches.add(self)
 
     def _init_db(self):
         """Initialize SQLite database."""
-        conn = sqlite3.connect(str(self.db_path))
-        conn.execute("""
+        version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        if version != self.SCHEMA_VERSION:
+            # Earlier layout or encoding: it's a cache, start over
+            self._conn.execute("DROP TABLE IF EXISTS cache")
+
+        self._conn.executescript(f"""
             CREATE TABLE IF NOT EXISTS cache (
                 key TEXT PRIMARY KEY,
-                value TEXT NOT NULL,
-                timestamp REAL NOT NULL,
-                ttl REAL NOT NULL
-            )
+                value BLOB NOT NULL,
+                expires_at REAL NOT NULL,
+                size INTEGER NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_cache_expires ON cache(expires_at);
+            PRAGMA user_version = {self.SCHEMA_VERSION};
         """)
-        conn.commit()
-        conn.close()
+        self._conn.commit()
+
+    @staticmethod
+    def _encode(value: Any) -> bytes:
+        return json.dumps(value, separators=(",", ":")).encode("utf-8")
+
+    @staticmethod
+    def _decode(data: bytes) -> Any:
+        return json.loads(data)
 
     def get(self, key: str) -> Optional[Any]:
         """Get value if not expired."""
-        conn = sqlite3.connect(str(self.db_path))
-        cursor = conn.execute(
-            "SELECT value, timestamp, ttl FROM cache WHERE key = ?",
-            (key,)
-        )
-        row = cursor.fetchone()
-        conn.close()
-
-        if row:
-            value_json, timestamp, ttl = row
-            if time.time() - timestamp < ttl:
-                return json.loads(value_json)
+        now = time.time()
+        with self._lock:
+            if key in self._pending:
+                entry = self._pending[key]
+                if entry is None or entry[1] <= now:
+                    return None
+                data = entry[0]
             else:
-                # Expired, remove
-                self.delete(key)
-
-        return None
+                row = self._conn.execute(
+                    "SELECT value FROM cache WHERE key = ? AND expires_at > ?",
+                    (key, now)
+                ).fetchone()
+                if row is None:
+                    return None
+                data = row[0]
+
+        try:
+            return self._decode(data)
+        except (ValueError, TypeError):
+            # Corrupt row
+            self.delete(key)
+            return None
 
     def set(self, key: str, value: Any, ttl: float = 3600) -> None:
         """Set value with TTL (default 1 hour)."""
-        conn = sqlite3.connect(str(self.db_path))
-        conn.execute(
-            "INSERT OR REPLACE INTO cache (key, value, timestamp, ttl) VALUES (?, ?, ?, ?)",
-            (key, json.dumps(value), time.time(), ttl)
-        )
-        conn.commit()
-        conn.close()
+        data = self._encode(value)
+        self._queue(key, (data, time.time() + ttl))
 
     def delete(self, key: str):
         """Delete cached value."""
-        conn = sqlite3.connect(str(self.db_path))
-        conn.execute("DELETE FROM cache WHERE key = ?", (key,))
-        conn.commit()
-        conn.close()
+        self._queue(key, None)
+
+    def _queue(self, key: str, entry: Optional[Tuple[bytes, float]]):
+        with self._lock:
+            self._pending[key] = entry
+            if len(self._pending) >= self.batch_size:
+                self.flush()
+            elif self._timer is None and not self._closed:
+                self._timer = threading.Timer(self.flush_interval, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self):
+        """Commit queued writes (and sweep if due) in one transaction."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if self._closed:
+                return
+
+            pending, self._pending = self._pending, {}
+            now = time.time()
+            sweep = now - self._last_sweep >= self.sweep_interval
+            if not pending and not sweep:
+                return
+
+            with self._conn:
+                upserts = [
+                    (key, entry[0], entry[1], len(entry[0]))
+                    for key, entry in pending.items() if entry is not None
+                ]
+                deletes = [(key,) for key, entry in pending.items() if entry is None]
+                if upserts:
+                    self._conn.executemany(
+                        "INSERT OR REPLACE INTO cache (key, value, expires_at, size) "
+                        "VALUES (?, ?, ?, ?)",
+                        upserts
+                    )
+                if deletes:
+                    self._conn.executemany("DELETE FROM cache WHERE key = ?", deletes)
+                if sweep:
+                    self._sweep(now)
+
+    def _sweep(self, now: float):
+        """Drop expired rows and enforce the size limit (lock held)."""
+        self._last_sweep = now
+        self._conn.execute("DELETE FROM cache WHERE expires_at <= ?", (now,))
+
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM cache").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        # Evict soonest-to-expire first, down to 90% of the limit
+        excess = total - int(self.max_bytes * 0.9)
+        victims = []
+        for key, size in self._conn.execute("SELECT key, size FROM cache ORDER BY expires_at"):
+            victims.append((key,))
+            excess -= size
+            if excess <= 0:
+                break
+        self._conn.executemany("DELETE FROM cache WHERE key = ?", victims)
 
     def clear_expired(self):
-        """Remove expired entries."""
-        conn = sqlite3.connect(str(self.db_path))
-        conn.execute(
-            "DELETE FROM cache WHERE (? - timestamp) > ttl",
-            (time.time(),)
-        )
-        conn.commit()
-        conn.close()
+        """Remove expired entries (and evict down to the size limit)."""
+        self._last_sweep = 0.0
+        self.flush()
+
+    def close(self):
+        """Flush queued writes and close the connection."""
+        with self._lock:
+            if self._closed:
+                return
+            self.flush()
+            self._closed = True
+            self._conn.close()
+        _open_disk_caches.discard(self)
+
+
+# Flush queued disk writes on interpreter exit
+_open_disk_caches: "weakref.WeakSet[DiskCache]" = weakref.WeakSet()
+
+
+@atexit.register
+def _close_disk_caches():
+    for disk_cache in list(_open_disk_caches):
+        disk_cache.close()
 
 
 class PerformanceCache:
@@ -149,37 +285,84 @@ class PerformanceCache:
         self._memory = LRUCache(memory_size)
         self._disk = DiskCache(disk_path)
         self._stats = CacheStats()
+        self._tags: Dict[str, Set[str]] = {}
+        self._tags_lock = threading.Lock()
 
-    def get(self, key: str) -> Optional[Any]:
-        """Get from cache (L1 → L2 → Miss)."""
+    def _lookup(self, key: str) -> Tuple[Optional[Any], Optional[str]]:
+        """Find key without counting stats; returns (value, tier)."""
         # Try L1 (memory)
         value = self._memory.get(key)
         if value is not None:
-            self._stats.hits += 1
-            self._stats.memory_hits += 1
-            return value
+            return value, "memory"
 
         # Try L2 (disk)
         value = self._disk.get(key)
         if value is not None:
-            self._stats.hits += 1
-            self._stats.disk_hits += 1
             # Promote to L1
             self._memory.set(key, value)
-            return value
+            return value, "disk"
 
-        # Miss
-        self._stats.misses += 1
-        return None
+        return None, None
+
+    def _record(self, tier: Optional[str]) -> None:
+        if tier is None:
+            self._stats.misses += 1
+            return
+        self._stats.hits += 1
+        if tier == "memory":
+            self._stats.memory_hits += 1
+        else:
+            self._stats.disk_hits += 1
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get from cache (L1 → L2 → Miss)."""
+        value, tier = self._lookup(key)
+        self._record(tier)
+        return value
 
     def set(self, key: str, value: Any, ttl: float = 3600) -> None:
-        """Set value in all tiers."""
+        """Set value in all tiers (L1 only if it isn't JSON-serializable)."""
         self._memory.set(key, value)
-        self._disk.set(key, value, ttl)
+        try:
+            self._disk.set(key, value, ttl)
+        except (TypeError, ValueError):
+            # Don't let an older L2 value resurface after L1 eviction
+            self._disk.delete(key)
+
+    def delete(self, key: str) -> None:
+        """Remove key from all tiers."""
+        self._memory.delete(key)
+        self._disk.delete(key)
+
+    def tag(self, key: str, tags: Iterable[str]) -> None:
+        """Associate key with tags for invalidate_tag().
+
+        Tags are tracked in-process; entries tagged before a restart
+        simply run out their TTL.
+        """
+        with self._tags_lock:
+            for tag in tags:
+                self._tags.setdefault(tag, set()).add(key)
+
+    def invalidate_tag(self, *tags: str) -> int:
+        """Remove every entry carrying any of the tags. Returns the count."""
+        keys: Set[str] = set()
+        with self._tags_lock:
+            for tag in tags:
+                keys |= self._tags.pop(tag, set())
+        for key in keys:
+            self.delete(key)
+        return len(keys)
+
+    def watch(self, file_watcher) -> None:
+        """Invalidate path_tag(path) entries when file_watcher reports a change."""
+        file_watcher.add_callback(lambda event: self.invalidate_tag(path_tag(event.path)))
 
     def clear(self) -> None:
         """Clear all caches."""
         self._memory.clear()
+        with self._tags_lock:
+            self._tags.clear()
         # Don't clear disk by default (persistent)
 
     @property
@@ -187,17 +370,39 @@ class PerformanceCache:
         """Get cache statistics."""
         return self._stats
 
+    def get_stats(self) -> dict:
+        """Get cache statistics as a dict."""
+        return {
+            "hits": self._stats.hits,
+            "misses": self._stats.misses,
+            "hit_rate": self._stats.hit_rate,
+            "memory_hits": self._stats.memory_hits,
+            "disk_hits": self._stats.disk_hits,
+            "stale_hits": self._stats.stale_hits,
+            "coalesced": self._stats.coalesced,
+            "size": self._memory.size,
+        }
+
     def cleanup(self):
         """Cleanup expired disk entries."""
         self._disk.clear_expired()
 
+    def flush(self):
+        """Write queued disk entries now."""
+        self._disk.flush()
+
+    def close(self):
+        """Flush and close the disk tier."""
+        self._disk.close()
+
 
 def cache_key(*args, **kwargs) -> str:
     """Generate cache key from arguments.
     
-    Uses SHA256 hash of JSON-serialized args.
+    Uses SHA256 hash of JSON-serialized args (repr() for anything
+    JSON can't encode).
     """
-    data = json.dumps({"args": args, "kwargs": kwargs}, sort_keys=True)
+    data = json.dumps({"args": args, "kwargs": kwargs}, sort_keys=True, default=repr)
     return hashlib.sha256(data.encode()).hexdigest()
 
 
@@ -211,3 +416,175 @@ def get_cache() -> PerformanceCache:
     if _cache is None:
         _cache = PerformanceCache()
     return _cache
+
+
+def path_tag(path: str) -> str:
+    """Tag for entries derived from a file (see PerformanceCache.watch)."""
+    return "path:" + os.path.abspath(path)
+
+
+def cached(
+    ttl: float = 3600,
+    key: Optional[Callable[..., str]] = None,
+    tags: Optional[Callable[..., Iterable[str]]] = None,
+    negative_ttl: float = 0,
+    stale_ttl: float = 0,
+    cache: Optional[PerformanceCache] = None,
+) -> Callable:
+    """Memoize a sync or async callable in a PerformanceCache.
+
+    Concurrent misses on the same key share one execution (single
+    flight); its exception, if any, is raised to every caller and
+    nothing is cached.
+
+    Args:
+        ttl: Seconds a result stays fresh
+        key: Builds the key from the call arguments (default: cache_key
+            of all arguments); prefixed with the function name
+        tags: Returns tags for a call, for invalidate_tag()/watch()
+        negative_ttl: Seconds to cache a None result (0 = don't)
+        stale_ttl: After ttl, serve the old result for this long while
+            one background call refreshes it
+        cache: Cache to use (default: get_cache() at call time)
+
+    Example:
+        @cached(ttl=60, tags=lambda path: [path_tag(path)])
+        async def read_file(path): ...
+    """
+    def decorator(func: Callable) -> Callable:
+        name = f"{func.__module__}.{func.__qualname__}"
+        is_async = inspect.iscoroutinefunction(func)
+        inflight: Dict[str, Any] = {}
+        inflight_lock = threading.Lock()
+        refreshes: Set[asyncio.Task] = set()
+
+        def make_key(args, kwargs) -> str:
+            if key is not None:
+                return f"{name}:{key(*args, **kwargs)}"
+            return cache_key(name, *args, **kwargs)
+
+        def lookup(store: PerformanceCache, k: str):
+            """Returns (state, value) with state 'fresh', 'stale' or None."""
+            entry, tier = store._lookup(k)
+            now = time.time()
+            if entry is not None:
+                value, fresh_until, stale_until = entry
+                if now < fresh_until:
+                    store._record(tier)
+                    return "fresh", value
+                if now < stale_until:
+                    store._record(tier)
+                    store._stats.stale_hits += 1
+                    return "stale", value
+            return None, None  # Counted as a miss only if this call executes
+
+        def save(store: PerformanceCache, k: str, value, args, kwargs):
+            lifetime = ttl if value is not None else negative_ttl
+            if lifetime <= 0:
+                return
+            now = time.time()
+            entry = (value, now + lifetime, now + lifetime + stale_ttl)
+            store.set(k, entry, ttl=lifetime + stale_ttl)
+            if tags is not None:
+                store.tag(k, tags(*args, **kwargs))
+
+        if is_async:
+            async def lead(store, k, flight, args, kwargs):
+                try:
+                    value = await func(*args, **kwargs)
+                    save(store, k, value, args, kwargs)
+                except BaseException as e:
+                    if isinstance(e, asyncio.CancelledError):
+                        flight.cancel()  # Waiters retry
+                    else:
+                        flight.set_exception(e)
+                        flight.exception()  # Don't warn if nobody waits
+                    raise
+                else:
+                    flight.set_result(value)
+                    return value
+                finally:
+                    inflight.pop(k, None)
+
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs):
+                store = cache or get_cache()
+                k = make_key(args, kwargs)
+                state, value = lookup(store, k)
+                if state == "fresh":
+                    return value
+
+                while True:
+                    flight = inflight.get(k)
+                    if flight is None:
+                        flight = asyncio.get_running_loop().create_future()
+                        inflight[k] = flight
+                        if state == "stale":
+                            task = asyncio.ensure_future(lead(store, k, flight, args, kwargs))
+                            refreshes.add(task)
+                            task.add_done_callback(refreshes.discard)
+                            task.add_done_callback(lambda t: t.cancelled() or t.exception())
+                            return value
+                        store._stats.misses += 1
+                        return await lead(store, k, flight, args, kwargs)
+
+                    if state == "stale":
+                        return value  # Refresh already running
+                    store._stats.coalesced += 1
+                    try:
+                        return await asyncio.shield(flight)
+                    except asyncio.CancelledError:
+                        if not flight.cancelled():
+                            raise  # We were cancelled, not the leader
+        else:
+            def lead(store, k, flight, args, kwargs):
+                try:
+                    value = func(*args, **kwargs)
+                    save(store, k, value, args, kwargs)
+                except BaseException as e:
+                    flight.set_exception(e)
+                    raise
+                else:
+                    flight.set_result(value)
+                    return value
+                finally:
+                    with inflight_lock:
+                        inflight.pop(k, None)
+
+            def refresh(store, k, flight, args, kwargs):
+                try:
+                    lead(store, k, flight, args, kwargs)
+                except Exception:
+                    pass  # Stale entry stays; the next caller retries
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                store = cache or get_cache()
+                k = make_key(args, kwargs)
+                state, value = lookup(store, k)
+                if state == "fresh":
+                    return value
+
+                with inflight_lock:
+                    flight = inflight.get(k)
+                    leader = flight is None
+                    if leader:
+                        flight = concurrent.futures.Future()
+                        inflight[k] = flight
+
+                if state == "stale":
+                    if leader:
+                        threading.Thread(
+                            target=refresh, args=(store, k, flight, args, kwargs), daemon=True
+                        ).start()
+                    return value
+                if leader:
+                    store._stats.misses += 1
+                    return lead(store, k, flight, args, kwargs)
+                store._stats.coalesced += 1
+                return flight.result()
+
+        wrapper.cache_key = lambda *args, **kwargs: make_key(args, kwargs)
+        return wrapper
+
+    return decorator
@@ -3,11 +3,16 @@
 Boris Cherny: Event-driven, incremental updates only.
 """
 
+import ctypes
+import ctypes.util
+import errno
+import hashlib
 import os
+import struct
+import sys
 import time
-import hashlib
 from pathlib import Path
-from typing import Dict, Set, Optional, Callable
+from typing import Any, Dict, Set, Optional, Callable, Tuple
 from collections import deque
 from dataclasses import dataclass
 import logging
@@ -25,24 +30,306 @@ class FileEvent:
     file_hash: Optional[str] = None
 
 
+# Directories never worth watching
+_EXCLUDED_DIRS = {'node_modules', '__pycache__', 'venv'}
+
+# Coalesced change kinds (resolved to created/modified/deleted on emit)
+_CHANGED = 'changed'
+_DELETED = 'deleted'
+
+
+def _is_excluded_dir(name: str) -> bool:
+    return name.startswith('.') or name in _EXCLUDED_DIRS
+
+
+def _join(directory: str, name: str) -> str:
+    """Path of name in directory, spelled like str(Path(directory) / name)."""
+    return name if directory == '.' else os.path.join(directory, name)
+
+
+class _PollingBackend:
+    """Stat-based poller (mtime + size): no file reads, any platform."""
+
+    name = 'polling'
+
+    def __init__(self, watcher: "FileWatcher"):
+        self._watcher = watcher
+        self._snapshot: Dict[str, Tuple[int, int]] = {}
+
+    def _scan(self) -> Dict[str, Tuple[int, int]]:
+        snapshot = {}
+        stack = [str(self._watcher.root_path)]
+        extensions = self._watcher._watch_extensions
+
+        while stack:
+            directory = stack.pop()
+            try:
+                entries = os.scandir(directory)
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if not _is_excluded_dir(entry.name):
+                                stack.append(_join(directory, entry.name))
+                        elif os.path.splitext(entry.name)[1] in extensions:
+                            st = entry.stat()
+                            snapshot[_join(directory, entry.name)] = (st.st_mtime_ns, st.st_size)
+                    except OSError:
+                        continue
+
+        return snapshot
+
+    def start(self) -> Set[str]:
+        self._snapshot = self._scan()
+        return set(self._snapshot)
+
+    def poll(self) -> Dict[str, str]:
+        current = self._scan()
+        previous = self._snapshot
+        self._snapshot = current
+
+        changes = {path: _DELETED for path in previous.keys() - current.keys()}
+        for path, sig in current.items():
+            if previous.get(path) != sig:
+                changes[path] = _CHANGED
+        return changes
+
+    def fileno(self) -> Optional[int]:
+        return None
+
+    def close(self) -> None:
+        self._snapshot = {}
+
+
+class _InotifyBackend:
+    """
+    Linux inotify backend (ctypes, no extra dependency).
+
+    One watch per directory; events are drained non-blockingly on poll(),
+    so an idle tick costs a single read() instead of a tree walk.
+    """
+
+    name = 'inotify'
+
+    IN_MODIFY = 0x00000002
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_DELETE_SELF = 0x00000400
+    IN_MOVE_SELF = 0x00000800
+    IN_Q_OVERFLOW = 0x00004000
+    IN_IGNORED = 0x00008000
+    IN_ONLYDIR = 0x01000000
+    IN_ISDIR = 0x40000000
+    IN_NONBLOCK = 0o4000
+    IN_CLOEXEC = 0o2000000
+
+    WATCH_MASK = (
+        IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO
+        | IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF | IN_ONLYDIR
+    )
+    _HEADER = struct.Struct('iIII')
+
+    _libc = None
+
+    @classmethod
+    def available(cls) -> bool:
+        if not sys.platform.startswith('linux'):
+            return False
+        if cls._libc is None:
+            try:
+                libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+                libc.inotify_init1.argtypes = [ctypes.c_int]
+                libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+                libc.inotify_rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+            except (OSError, AttributeError):
+                return False
+            cls._libc = libc
+        return True
+
+    def __init__(self, watcher: "FileWatcher"):
+        self._watcher = watcher
+        self._fd = -1
+        self._wd_to_dir: Dict[int, str] = {}
+        self._dir_to_wd: Dict[str, int] = {}
+
+    def _add_watch(self, directory: str) -> None:
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), self.WATCH_MASK)
+        if wd < 0:
+            err = ctypes.get_errno()
+            if err == errno.ENOSPC:
+                raise OSError(err, "inotify watch limit reached")
+            return  # Vanished or unreadable directory
+        self._wd_to_dir[wd] = directory
+        self._dir_to_wd[directory] = wd
+
+    def _watch_tree(self, top: str) -> Set[str]:
+        """Watch top and its subdirectories; return the watched files found."""
+        files = set()
+        extensions = self._watcher._watch_extensions
+
+        stack = [top]
+        while stack:
+            directory = stack.pop()
+            try:
+                entries = os.scandir(directory)
+            except OSError:
+                continue
+            self._add_watch(directory)
+            with entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if not _is_excluded_dir(entry.name):
+                                stack.append(_join(directory, entry.name))
+                        elif os.path.splitext(entry.name)[1] in extensions:
+                            files.add(_join(directory, entry.name))
+                    except OSError:
+                        continue
+
+        return files
+
+    def _forget_tree(self, top: str) -> None:
+        prefix = top + os.sep
+        for directory in [d for d in self._dir_to_wd if d == top or d.startswith(prefix)]:
+            self._wd_to_dir.pop(self._dir_to_wd.pop(directory), None)
+
+    def start(self) -> Set[str]:
+        fd = self._libc.inotify_init1(self.IN_NONBLOCK | self.IN_CLOEXEC)
+        if fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._fd = fd
+
+        try:
+            return self._watch_tree(str(self._watcher.root_path))
+        except OSError:
+            self.close()
+            raise
+
+    def _read_events(self):
+        while True:
+            try:
+                buf = os.read(self._fd, 65536)
+            except BlockingIOError:
+                return
+            except OSError:
+                return
+
+            offset = 0
+            while offset < len(buf):
+                wd, mask, _cookie, length = self._HEADER.unpack_from(buf, offset)
+                offset += self._HEADER.size
+                name = os.fsdecode(buf[offset:offset + length].rstrip(b'\0'))
+                offset += length
+                yield wd, mask, name
+
+    def poll(self) -> Dict[str, str]:
+        changes: Dict[str, str] = {}
+        tracked = self._watcher._tracked
+        extensions = self._watcher._watch_extensions
+
+        for wd, mask, name in self._read_events():
+            if mask & self.IN_Q_OVERFLOW:
+                # Kernel dropped events - resynchronise with a full rescan
+                return self._resync()
+
+            directory = self._wd_to_dir.get(wd)
+            if directory is None:
+                continue
+
+            if mask & (self.IN_IGNORED | self.IN_DELETE_SELF | self.IN_MOVE_SELF):
+                if not name:
+                    self._forget_tree(directory)
+                continue
+
+            path = _join(directory, name)
+
+            if mask & self.IN_ISDIR:
+                if _is_excluded_dir(name):
+                    continue
+                if mask & (self.IN_CREATE | self.IN_MOVED_TO):
+                    # Files may land before the watch exists - pick them up now
+                    for file_path in self._watch_tree(path):
+                        changes[file_path] = _CHANGED
+                elif mask & (self.IN_DELETE | self.IN_MOVED_FROM):
+                    self._forget_tree(path)
+                    prefix = path + os.sep
+                    for file_path in tracked:
+                        if file_path.startswith(prefix):
+                            changes[file_path] = _DELETED
+                continue
+
+            if os.path.splitext(name)[1] not in extensions:
+                continue
+
+            if mask & (self.IN_DELETE | self.IN_MOVED_FROM):
+                changes[path] = _DELETED
+            else:
+                changes[path] = _CHANGED
+
+        return changes
+
+    def _resync(self) -> Dict[str, str]:
+        for _ in self._read_events():
+            pass
+        for wd in list(self._wd_to_dir):
+            self._libc.inotify_rm_watch(self._fd, wd)
+        self._wd_to_dir.clear()
+        self._dir_to_wd.clear()
+
+        current = self._watch_tree(str(self._watcher.root_path))
+        changes = {path: _DELETED for path in self._watcher._tracked - current}
+        # Content of surviving files is unknown after an overflow
+        changes.update((path, _CHANGED) for path in current)
+        return changes
+
+    def fileno(self) -> Optional[int]:
+        return self._fd if self._fd >= 0 else None
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+        self._fd = -1
+        self._wd_to_dir.clear()
+        self._dir_to_wd.clear()
+
+
 class FileWatcher:
     """File system watcher with incremental updates (Claude pattern).
-    
-    Uses polling for simplicity (watchdog adds dependency).
-    Updates every 1s, only processes changed files.
+
+    Backends:
+    - inotify (Linux): kernel events, no tree walk per tick
+    - polling: stat (mtime + size) walk, used elsewhere or when inotify
+      is unavailable (e.g. watch limit reached)
+
+    Events are coalesced per check_updates() call: a burst of writes to
+    one file yields a single event, create+delete yields none.
     """
 
+    BACKENDS = ('auto', 'inotify', 'polling')
+
     def __init__(
         self,
         root_path: str = ".",
-        watch_extensions: Set[str] = None
+        watch_extensions: Set[str] = None,
+        backend: str = 'auto'
     ):
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Unknown backend '{backend}', expected one of {self.BACKENDS}")
+
         self.root_path = Path(root_path)
         self._watch_extensions = watch_extensions or {'.py', '.js', '.ts', '.go', '.rs'}
-        self._file_hashes: Dict[str, str] = {}
+        self._requested_backend = backend
+        self._backend = None
+        self._tracked: Set[str] = set()
         self._recent_events: deque = deque(maxlen=100)
         self._callbacks: list[Callable] = []
         self._running = False
+        self._event_count = 0
 
     def add_callback(self, callback: Callable[[FileEvent], None]) -> None:
         """Register callback for file events."""
@@ -56,65 +343,67 @@ class FileWatcher:
     def stop(self):
         """Stop watching."""
         self._running = False
+        if self._backend is not None:
+            self._backend.close()
+            self._backend = None
 
     def _initial_scan(self):
         """Initial scan to establish baseline."""
-        for file_path in self._get_watched_files():
-            file_hash = self._hash_file(file_path)
-            self._file_hashes[str(file_path)] = file_hash
+        if self._backend is not None:
+            self._backend.close()
+
+        if self._requested_backend != 'polling' and _InotifyBackend.available():
+            backend = _InotifyBackend(self)
+            try:
+                self._tracked = backend.start()
+                self._backend = backend
+                return
+            except OSError as e:
+                if self._requested_backend == 'inotify':
+                    raise
+                logger.debug(f"inotify unavailable ({e}), falling back to polling")
+        elif self._requested_backend == 'inotify':
+            raise OSError("inotify is not available on this platform")
+
+        self._backend = _PollingBackend(self)
+        self._tracked = self._backend.start()
 
     def check_updates(self):
         """Check for file updates (call periodically)."""
-        if not self._running:
+        if not self._running or self._backend is None:
             return
 
-        current_files = set(str(p) for p in self._get_watched_files())
-        tracked_files = set(self._file_hashes.keys())
-
-        # Detect new files
-        for file_path in current_files - tracked_files:
-            event = FileEvent(
+        for file_path, change in self._poll_backend().items():
+            if change == _DELETED:
+                if file_path not in self._tracked:
+                    continue  # Created and removed between checks
+                self._tracked.discard(file_path)
+                event_type = 'deleted'
+            else:
+                event_type = 'modified' if file_path in self._tracked else 'created'
+                self._tracked.add(file_path)
+
+            self._handle_event(FileEvent(
                 path=file_path,
-                event_type='created',
+                event_type=event_type,
                 timestamp=time.time(),
-                file_hash=self._hash_file(file_path)
-            )
-            self._handle_event(event)
-            self._file_hashes[file_path] = event.file_hash
-
-        # Detect deleted files
-        for file_path in tracked_files - current_files:
-            event = FileEvent(
-                path=file_path,
-                event_type='deleted',
-                timestamp=time.time()
-            )
-            self._handle_event(event)
-            del self._file_hashes[file_path]
-
-        # Detect modified files
-        for file_path in current_files & tracked_files:
-            new_hash = self._hash_file(file_path)
-            if new_hash != self._file_hashes[file_path]:
-                event = FileEvent(
-                    path=file_path,
-                    event_type='modified',
-                    timestamp=time.time(),
-                    file_hash=new_hash
-                )
-                self._handle_event(event)
-                self._file_hashes[file_path] = new_hash
-
-    def _get_watched_files(self):
-        """Get all files to watch."""
-        for root, dirs, files in os.walk(self.root_path):
-            # Skip hidden dirs and common excludes
-            dirs[:] = [d for d in dirs if not d.startswith('.') and d not in ['node_modules', '__pycache__', 'venv']]
-
-            for file in files:
-                file_path = Path(root) / file
-                if file_path.suffix in self._watch_extensions:
-                    yield file_path
+                file_hash=self._hash_file(file_path) if event_type != 'deleted' else None
+            ))
+
+    def _poll_backend(self) -> Dict[str, str]:
+        try:
+            return self._backend.poll()
+        except OSError as e:
+            # inotify hit the watch limit on a new directory mid-run
+            logger.warning(f"inotify failed ({e}), falling back to polling")
+
+        self._backend.close()
+        self._backend = _PollingBackend(self)
+        current = self._backend.start()
+        changes = {path: _DELETED for path in self._tracked - current}
+        # Events consumed by the failed poll are lost, as after an overflow
+        changes.update((path, _CHANGED) for path in current)
+        return changes
 
     def _hash_file(self, file_path: str) -> str:
         """Fast file hash (first 8KB only for speed)."""
@@ -126,9 +415,22 @@ class FileWatcher:
         except (IOError, OSError):
             return ""
 
+    def fileno(self) -> Optional[int]:
+        """Readable fd when events are pending (inotify only), else None.
+
+        Lets an event loop call check_updates() on demand instead of polling.
+        """
+        return self._backend.fileno() if self._backend is not None else None
+
+    @property
+    def backend(self) -> Optional[str]:
+        """Name of the active backend ('inotify' or 'polling')."""
+        return self._backend.name if self._backend is not None else None
+
     def _handle_event(self, event: FileEvent):
         """Handle file event."""
         self._recent_events.append(event)
+        self._event_count += 1
 
         for callback in self._callbacks:
             try:
@@ -144,7 +446,15 @@ class FileWatcher:
     @property
     def tracked_files(self) -> int:
         """Get number of tracked files."""
-        return len(self._file_hashes)
+        return len(self._tracked)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get watcher statistics."""
+        return {
+            'backend': self.backend,
+            'tracked_count': len(self._tracked),
+            'event_count': self._event_count,
+        }
 
 
 class RecentFilesTracker:
@@ -32,11 +32,24 @@ from typing import AsyncGenerator, Optional, Dict, Any, List
 from dataclasses import dataclass, field
 from enum import Enum
 from collections import deque
+from contextlib import aclosing
+
+from jdev_core.response_cache import ResponseCache
 
 from .config import config
+from .thread_bridge import iterate_in_thread
 
 logger = logging.getLogger(__name__)
 
+LATENCY_WINDOW = 100  # Recent streams kept per provider for percentiles
+ROUTING_REFERENCE_TOKENS = 256  # Response length routing estimates are made for
+MIN_HEDGE_SAMPLES = 5  # TTFT samples needed before p95 sets the hedge delay
+DEFAULT_HEDGE_DELAY = 2.0  # Seconds before hedging when p95 is unknown
+DEFAULT_PROVIDER_CONCURRENCY = 8  # Concurrent streams per provider
+HEDGE_BUFFER_CHUNKS = 64  # Chunks a racing provider may read ahead
+
+_CHUNK, _END, _FAIL = range(3)
+
 # REMOVED top-level import: from huggingface_hub import InferenceClient
 
 
@@ -144,6 +157,51 @@ class RateLimiter:
             self.token_counts.append((now, tokens))
 
 
+def _percentile(samples: deque, percentile: float) -> Optional[float]:
+    """Nearest-rank percentile of samples, None if there are none."""
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    index = int(len(ordered) * (percentile / 100))
+    return ordered[min(index, len(ordered) - 1)]
+
+
+@dataclass
+class ProviderLatency:
+    """Rolling time-to-first-token and tokens/sec of one provider."""
+
+    ttft: deque = field(default_factory=lambda: deque(maxlen=LATENCY_WINDOW))
+    tokens_per_second: deque = field(default_factory=lambda: deque(maxlen=LATENCY_WINDOW))
+
+    def ttft_percentile(self, percentile: float) -> Optional[float]:
+        """TTFT percentile in seconds over the last LATENCY_WINDOW streams."""
+        return _percentile(self.ttft, percentile)
+
+    def tps_percentile(self, percentile: float) -> Optional[float]:
+        """Tokens/sec percentile over the last LATENCY_WINDOW streams."""
+        return _percentile(self.tokens_per_second, percentile)
+
+    def expected_seconds(self, tokens: int = ROUTING_REFERENCE_TOKENS) -> Optional[float]:
+        """Median time to stream a response of `tokens` tokens."""
+        ttft = self.ttft_percentile(50)
+        if ttft is None:
+            return None
+        tps = self.tps_percentile(50)
+        return ttft + (tokens / tps if tps else 0.0)
+
+    def to_dict(self) -> Dict[str, Any]:
+        def ms(value: Optional[float]) -> Optional[float]:
+            return None if value is None else round(value * 1000, 1)
+
+        tps = self.tps_percentile(50)
+        return {
+            "samples": len(self.ttft),
+            "ttft_p50_ms": ms(self.ttft_percentile(50)),
+            "ttft_p95_ms": ms(self.ttft_percentile(95)),
+            "tokens_per_sec_p50": None if tps is None else round(tps, 1),
+        }
+
+
 @dataclass
 class RequestMetrics:
     """Telemetry and observability (Codex strategy)."""
@@ -160,6 +218,25 @@ class RequestMetrics:
 
     provider_stats: Dict[str, Dict[str, int]] = field(default_factory=dict)
 
+    hedged_requests: int = 0
+    hedges_won: int = 0
+    provider_latency: Dict[str, ProviderLatency] = field(default_factory=dict)
+
+    def latency(self, provider: str) -> ProviderLatency:
+        """Rolling latency samples for a provider."""
+        if provider not in self.provider_latency:
+            self.provider_latency[provider] = ProviderLatency()
+        return self.provider_latency[provider]
+
+    def record_first_token(self, provider: str, ttft: float) -> None:
+        """Record time to first token (seconds) of a stream."""
+        self.latency(provider).ttft.append(ttft)
+
+    def record_throughput(self, provider: str, tokens: int, seconds: float) -> None:
+        """Record tokens streamed after the first one and how long they took."""
+        if tokens > 0 and seconds > 0:
+            self.latency(provider).tokens_per_second.append(tokens / seconds)
+
     def record_success(self, provider: str, latency: float, tokens: int = 0) -> None:
         """Record successful request."""
         self.total_requests += 1
@@ -193,7 +270,13 @@ class RequestMetrics:
             "retries": self.retried_requests,
             "rate_limited": self.rate_limited_requests,
             "circuit_breaker_blocks": self.circuit_breaker_blocks,
-            "providers": self.provider_stats
+            "hedged_requests": self.hedged_requests,
+            "hedges_won": self.hedges_won,
+            "providers": self.provider_stats,
+            "latency": {
+                provider: latency.to_dict()
+                for provider, latency in self.provider_latency.items()
+            },
         }
 
 
@@ -209,12 +292,23 @@ class LLMClient:
         enable_circuit_breaker: bool = True,
         enable_rate_limiting: bool = True,
         enable_telemetry: bool = True,
-        token_callback: Optional[Any] = None
+        token_callback: Optional[Any] = None,
+        enable_hedging: bool = False,
+        hedge_delay: float = DEFAULT_HEDGE_DELAY,
+        provider_concurrency: Optional[Dict[str, int]] = None,
+        response_cache: Optional[ResponseCache] = None
     ):
         """Initialize resilient LLM client.
         
         Args:
             token_callback: Optional callback(input_tokens, output_tokens) for tracking
+            enable_hedging: Start the next provider when the first has not
+                produced a token within its p95 TTFT; the slower one is cancelled
+            hedge_delay: Hedge delay (seconds) while a provider has too few
+                TTFT samples for a p95
+            provider_concurrency: Max concurrent streams per provider
+                (default DEFAULT_PROVIDER_CONCURRENCY each)
+            response_cache: Opt-in cache for identical requests (see stream_chat)
         """
         self.max_retries = max_retries
         self.base_delay = base_delay
@@ -227,6 +321,14 @@ class LLMClient:
         self.rate_limiter = RateLimiter() if enable_rate_limiting else None
         self.metrics = RequestMetrics() if enable_telemetry else None
 
+        # Routing
+        self.enable_hedging = enable_hedging
+        self.hedge_delay = hedge_delay
+        self.provider_concurrency = dict(provider_concurrency or {})
+        self._provider_slots: Dict[str, asyncio.Semaphore] = {}
+        self._in_flight: Dict[str, int] = {}
+        self.response_cache = response_cache
+
         # Lazy providers
         self._hf_client = None
         self._nebius_client = None
@@ -314,9 +416,23 @@ class LLMClient:
         max_tokens: Optional[int] = None,
         temperature: Optional[float] = None,
         provider: Optional[str] = None,
-        enable_failover: bool = True
+        enable_failover: bool = True,
+        hedge: Optional[bool] = None,
+        use_cache: bool = True,
+        replay_delay: Optional[float] = None
     ) -> AsyncGenerator[str, None]:
-        """Stream chat completion with full resilience."""
+        """Stream chat completion with full resilience.
+
+        With hedging (per call, or enable_hedging by default) the first two
+        providers race: the second starts only if the first has no token
+        within its p95 TTFT, and whichever produces a token first is kept.
+
+        With a response_cache, identical requests (same provider, model,
+        messages, max_tokens and temperature) are replayed from the cache
+        (replay_delay seconds between chunks, default: the cache's) or
+        share the stream of an identical request already in flight.
+        use_cache=False bypasses the cache.
+        """
         # Validate prompt
         if not prompt or not prompt.strip():
             raise ValueError("Prompt cannot be empty")
@@ -334,6 +450,50 @@ class LLMClient:
             })
         messages.append({"role": "user", "content": prompt})
 
+        def route() -> AsyncGenerator[str, None]:
+            return self._route(messages, max_tokens, temperature, provider, enable_failover, hedge)
+
+        if self.response_cache is None or not use_cache:
+            stream = route()
+        else:
+            key = self._response_key(provider, messages, max_tokens, temperature)
+            stream = self.response_cache.stream(key, route, replay_delay=replay_delay)
+
+        async with aclosing(stream):
+            async for chunk in stream:
+                yield chunk
+
+    def _response_key(
+        self,
+        provider: str,
+        messages: List[Dict[str, str]],
+        max_tokens: int,
+        temperature: float
+    ) -> str:
+        """Response cache key; includes the model when the provider has one."""
+        if provider == "hf":
+            model = config.hf_model
+        else:
+            client = getattr(self, f"_{provider}_client", None)
+            model = getattr(client, "model_name", None) or getattr(client, "model", None)
+        return ResponseCache.make_key(
+            provider=provider,
+            model=model,
+            messages=messages,
+            max_tokens=max_tokens,
+            temperature=temperature,
+        )
+
+    async def _route(
+        self,
+        messages: List[Dict[str, str]],
+        max_tokens: int,
+        temperature: float,
+        provider: str,
+        enable_failover: bool,
+        hedge: Optional[bool]
+    ) -> AsyncGenerator[str, None]:
+        """Stream from the selected provider(s) with hedging and failover."""
         # Select provider(s)
         if provider == "auto":
             providers_to_try = self._get_failover_providers()
@@ -342,8 +502,22 @@ class LLMClient:
             if enable_failover:
                 providers_to_try.extend([p for p in self.provider_priority if p != provider])
 
-        # Try providers with failover
         last_error = None
+        hedge = self.enable_hedging if hedge is None else hedge
+        if hedge and len(providers_to_try) >= 2:
+            primary, backup = providers_to_try[:2]
+            providers_to_try = providers_to_try[2:]
+            try:
+                async for chunk in self._stream_hedged(
+                    primary, backup, messages, max_tokens, temperature
+                ):
+                    yield chunk
+                return
+            except Exception as e:
+                last_error = e
+                logger.error(f"❌ Hedged {primary}/{backup} failed: {str(e)[:100]}")
+
+        # Try providers with failover
         for current_provider in providers_to_try:
             try:
                 logger.info(f"🔌 Attempting provider: {current_provider}")
@@ -382,10 +556,17 @@ class LLMClient:
         raise RuntimeError(f"All providers failed. Last error: {last_error}")
 
     def _get_failover_providers(self) -> List[str]:
-        """Get list of providers for failover - GEMINI FIRST ALWAYS."""
+        """Get list of providers for failover, fastest expected first.
+
+        Providers are ranked by rolling median TTFT plus the time to stream
+        ROUTING_REFERENCE_TOKENS at their median tokens/sec, divided by
+        success rate. Providers never measured are tried first, in the
+        hard-coded preference order (Gemini first), so each gets sampled;
+        providers at their concurrency limit go last.
+        """
         available = []
 
-        # FORCE GEMINI FIRST (fastest and most powerful)
+        # Preference order (Gemini first - fastest and most powerful)
         if self.gemini_client:
             available.append("gemini")
         if self.nebius_client:
@@ -396,17 +577,135 @@ class LLMClient:
         if self.ollama_client:
             available.append("ollama")
 
-        # Sort by success rate if telemetry enabled
-        if self.metrics and self.metrics.provider_stats:
-            def success_rate(provider: str) -> float:
-                stats = self.metrics.provider_stats.get(provider, {"success": 0, "failure": 1})
-                total = stats["success"] + stats["failure"]
-                return stats["success"] / max(total, 1)
-
-            available.sort(key=success_rate, reverse=True)
+        if self.metrics:
+            available.sort(key=self._routing_score)
+        available.sort(key=lambda provider: self._saturated(provider))
 
         return available or ["hf"]
 
+    def _routing_score(self, provider: str) -> float:
+        """Expected seconds to answer, inflated by failure rate. Lower is better."""
+        stats = self.metrics.provider_stats.get(provider, {"success": 0, "failure": 0})
+        latency = self.metrics.provider_latency.get(provider)
+        expected = latency.expected_seconds() if latency else None
+
+        if expected is None:
+            # Unmeasured: explore, unless it has only ever failed
+            return float("inf") if stats["failure"] else -1.0
+
+        total = stats["success"] + stats["failure"]
+        success_rate = stats["success"] / total if total else 1.0
+        return expected / max(success_rate, 0.05)
+
+    def _concurrency_limit(self, provider: str) -> int:
+        return self.provider_concurrency.get(provider, DEFAULT_PROVIDER_CONCURRENCY)
+
+    def _saturated(self, provider: str) -> bool:
+        return self._in_flight.get(provider, 0) >= self._concurrency_limit(provider)
+
+    def _provider_slot(self, provider: str) -> asyncio.Semaphore:
+        if provider not in self._provider_slots:
+            self._provider_slots[provider] = asyncio.Semaphore(self._concurrency_limit(provider))
+        return self._provider_slots[provider]
+
+    def _hedge_delay(self, provider: str) -> float:
+        """Seconds to wait for a first token before hedging: the provider's p95 TTFT."""
+        latency = self.metrics.provider_latency.get(provider) if self.metrics else None
+        if latency is None or len(latency.ttft) < MIN_HEDGE_SAMPLES:
+            return self.hedge_delay
+        return latency.ttft_percentile(95)
+
+    async def _stream_hedged(
+        self,
+        primary: str,
+        backup: str,
+        messages: List[Dict[str, str]],
+        max_tokens: int,
+        temperature: float
+    ) -> AsyncGenerator[str, None]:
+        """Race two providers; stream from whichever produces a token first.
+
+        The backup starts when the primary has no token after its hedge
+        delay, or as soon as the primary fails. The losing stream is
+        cancelled. Raises the last error if neither produces a token.
+        """
+        queues: Dict[str, asyncio.Queue] = {}
+        pumps: Dict[str, asyncio.Task] = {}
+        getters: Dict[asyncio.Task, str] = {}
+
+        async def pump(provider: str, queue: asyncio.Queue) -> None:
+            try:
+                async for chunk in self._stream_with_provider(
+                    provider, messages, max_tokens, temperature
+                ):
+                    await queue.put((_CHUNK, chunk))
+                await queue.put((_END, None))
+            except Exception as e:
+                await queue.put((_FAIL, e))
+
+        def start(provider: str) -> None:
+            queues[provider] = asyncio.Queue(maxsize=HEDGE_BUFFER_CHUNKS)
+            pumps[provider] = asyncio.create_task(pump(provider, queues[provider]))
+            getters[asyncio.create_task(queues[provider].get())] = provider
+
+        winner = first = None
+        hedged = False
+        last_error: Optional[Exception] = None
+        try:
+            start(primary)
+            timeout: Optional[float] = self._hedge_delay(primary)
+
+            while winner is None and getters:
+                done, _ = await asyncio.wait(
+                    getters, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    # Primary is slower than its p95: hedge
+                    logger.info(
+                        f"⏱️  {primary} has no token after {timeout:.2f}s, hedging with {backup}"
+                    )
+                    if self.metrics:
+                        self.metrics.hedged_requests += 1
+                    hedged = True
+                    start(backup)
+                    timeout = None
+                    continue
+
+                for getter in done:
+                    provider = getters.pop(getter)
+                    kind, value = getter.result()
+                    if kind == _FAIL:
+                        last_error = value
+                        if backup not in pumps:
+                            start(backup)
+                            timeout = None
+                    elif winner is None:
+                        winner, first = provider, (kind, value)
+
+            if winner is None:
+                raise last_error or RuntimeError("Hedged providers produced nothing")
+
+            if hedged and winner == backup and self.metrics:
+                self.metrics.hedges_won += 1
+            for provider, task in pumps.items():
+                if provider != winner:
+                    task.cancel()
+            for getter in getters:
+                getter.cancel()
+
+            kind, value = first
+            queue = queues[winner]
+            while kind == _CHUNK:
+                yield value
+                kind, value = await queue.get()
+            if kind == _FAIL:
+                raise value
+        finally:
+            pending = list(getters) + list(pumps.values())
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
     async def _stream_with_provider(
         self,
         provider: str,
@@ -432,11 +731,29 @@ class LLMClient:
                     self.metrics.rate_limited_requests += 1
                 await asyncio.sleep(wait_time)
 
-        # Stream with retry logic
+        async with self._provider_slot(provider):
+            self._in_flight[provider] = self._in_flight.get(provider, 0) + 1
+            try:
+                async for chunk in self._stream_with_retries(
+                    provider, messages, max_tokens, temperature
+                ):
+                    yield chunk
+            finally:
+                self._in_flight[provider] -= 1
+
+    async def _stream_with_retries(
+        self,
+        provider: str,
+        messages: List[Dict[str, str]],
+        max_tokens: int,
+        temperature: float
+    ) -> AsyncGenerator[str, None]:
+        """Stream from a provider, retrying retryable errors with backoff."""
         last_error = None
         for attempt in range(self.max_retries + 1):
             try:
                 start_time = time.time()
+                first_token_time = None
                 chunks_received = 0
 
                 # Select provider stream method
@@ -458,14 +775,26 @@ class LLMClient:
                     stream_gen = self._stream_hf(messages, max_tokens, temperature)
 
                 # Stream chunks
-                async for chunk in stream_gen:
-                    chunks_received += 1
-                    yield chunk
+                async with aclosing(stream_gen):
+                    async for chunk in stream_gen:
+                        if first_token_time is None:
+                            first_token_time = time.time()
+                            if self.metrics:
+                                self.metrics.record_first_token(
+                                    provider, first_token_time - start_time
+                                )
+                        chunks_received += 1
+                        yield chunk
 
                 # Success
-                latency = time.time() - start_time
+                end_time = time.time()
+                latency = end_time - start_time
                 if self.metrics:
                     self.metrics.record_success(provider, latency, tokens=chunks_received)
+                    if first_token_time is not None:
+                        self.metrics.record_throughput(
+                            provider, chunks_received - 1, end_time - first_token_time
+                        )
                 if self.circuit_breaker:
                     self.circuit_breaker.record_success()
                 if self.rate_limiter:
@@ -523,10 +852,13 @@ class LLMClient:
         max_tokens: int,
         temperature: float
     ) -> AsyncGenerator[str, None]:
-        """Stream from HuggingFace."""
-        try:
-            loop = asyncio.get_event_loop()
+        """Stream from HuggingFace.
 
+        huggingface_hub is synchronous: both the request and the chunk
+        iteration run on a worker thread so the event loop keeps serving
+        other coroutines for the whole generation.
+        """
+        try:
             def _generate():
                 return self.hf_client.chat_completion(
                     messages=messages,
@@ -536,11 +868,11 @@ class LLMClient:
                     stream=True
                 )
 
-            stream = await loop.run_in_executor(None, _generate)
-
-            for chunk in stream:
-                if chunk.choices and chunk.choices[0].delta.content:
-                    yield chunk.choices[0].delta.content
+            # aclosing: stopping this generator closes the HTTP stream now
+            async with aclosing(iterate_in_thread(_generate, name="hf-stream")) as stream:
+                async for chunk in stream:
+                    if chunk.choices and chunk.choices[0].delta.content:
+                        yield chunk.choices[0].delta.content
 
         except Exception as e:
             logger.error(f"HuggingFace provider error: {type(e).__name__}: {e}", exc_info=True)
@@ -611,7 +943,9 @@ class LLMClient:
     ) -> str:
         """Generate complete response (non-streaming)."""
         chunks = []
-        async for chunk in self.stream_chat(prompt, context, max_tokens, temperature, provider):
+        async for chunk in self.stream_chat(
+            prompt, context, max_tokens, temperature, provider, replay_delay=0.0
+        ):
             chunks.append(chunk)
         return "".join(chunks)
 
@@ -646,12 +980,19 @@ class LLMClient:
 
         stats = self.metrics.get_stats()
 
+        if self.response_cache is not None:
+            stats["response_cache"] = self.response_cache.stats.to_dict()
+
         if self.circuit_breaker:
             stats["circuit_breaker"] = {
                 "state": self.circuit_breaker.state.value,
                 "failures": self.circuit_breaker.failures
             }
 
+        stats["in_flight"] = {
+            provider: count for provider, count in self._in_flight.items() if count
+        }
+
         if self.rate_limiter:
             stats["rate_limiter"] = {
                 "requests_last_minute": len(self.rate_limiter.request_times),
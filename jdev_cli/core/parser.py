@@ -19,6 +19,7 @@ Designed for high reliability (95%+ parse success) even with malformed LLM respo
 import json
 import re
 import logging
+import time
 from typing import List, Dict, Any, Optional, Tuple, Callable
 from enum import Enum
 from pathlib import Path
@@ -37,6 +38,54 @@ class ParseStrategy(Enum):
     PLAIN_TEXT = "plain_text"
 
 
+# Compiled once: parse() runs on every LLM turn
+MARKDOWN_PATTERNS = (
+    re.compile(r'```json\s*\n(.*?)\n```', re.DOTALL),
+    re.compile(r'```\s*\n(.*?)\n```', re.DOTALL),
+    re.compile(r'```json\s*(.*?)```', re.DOTALL),
+    re.compile(r'```(.*?)```', re.DOTALL),
+)
+TOOL_CALL_PATTERN = re.compile(
+    r'\{\s*["\']?tool["\']?\s*:\s*["\'](\w+)["\']\s*,\s*["\']?args["\']?\s*:\s*(\{[^}]*\})\s*\}'
+)
+ARG_PATTERN = re.compile(r'["\']?(\w+)["\']?\s*:\s*["\']([^"\']*)["\']')
+DANGEROUS_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r'\.\./\.\.',  # Path traversal
+    r'~/\.',        # Home directory traversal
+    r';.*rm\s',     # Command chaining with rm
+    r'\|.*rm\s',    # Pipe to rm
+    r'&&.*rm\s',    # And operator with rm
+    r'`.*`',        # Command substitution
+    r'\$\(',        # Command substitution
+))
+
+
+def classify_response(response: str) -> Tuple[ParseStrategy, ...]:
+    """Pick the parsing strategies that can succeed on a response.
+
+    One cheap look at its shape (first/last char, code fences, a "tool"
+    key, brackets) rules out strategies whose patterns cannot match, so
+    parse() goes straight to the first one that can.
+
+    Args:
+        response: Stripped, non-empty response text
+
+    Returns:
+        Candidate strategies in cascade order (empty for plain text)
+    """
+    has_tool = "tool" in response
+    candidates = []
+    if response[0] in "[{" and response[-1] in "]}":
+        candidates.append(ParseStrategy.STRICT_JSON)
+    if "```" in response:
+        candidates.append(ParseStrategy.MARKDOWN_JSON)
+    if has_tool and "{" in response:
+        candidates.append(ParseStrategy.REGEX_EXTRACTION)
+    if has_tool and "[" in response:
+        candidates.append(ParseStrategy.PARTIAL_JSON)
+    return tuple(candidates)
+
+
 class ParseResult:
     """Result of parsing attempt with metadata."""
 
@@ -77,6 +126,14 @@ class ParseResult:
 class ResponseParser:
     """Multi-strategy parser for LLM responses with retry and security."""
 
+    # Strategy -> method implementing it
+    _STRATEGIES = {
+        ParseStrategy.STRICT_JSON: "_try_strict_json",
+        ParseStrategy.MARKDOWN_JSON: "_try_markdown_json",
+        ParseStrategy.REGEX_EXTRACTION: "_try_regex_extraction",
+        ParseStrategy.PARTIAL_JSON: "_try_partial_json",
+    }
+
     def __init__(
         self,
         strict_mode: bool = False,
@@ -115,8 +172,13 @@ class ResponseParser:
             ParseStrategy.PLAIN_TEXT: 0,
             "failures": 0,
             "retries": 0,
+            "retries_avoided": 0,
             "security_blocks": 0
         }
+        # Per-strategy [attempts, seconds]
+        self._timings: Dict[ParseStrategy, List[float]] = {
+            strategy: [0, 0.0] for strategy in self._STRATEGIES
+        }
 
         # Retry callback for secondary LLM pass (can be sync or async)
         self.retry_callback: Optional[Callable[[str, str], str]] = None
@@ -145,50 +207,36 @@ class ResponseParser:
         if self.enable_logging:
             self._log_response(response, attempt)
 
-        # Strategy 1: Strict JSON parsing
-        result = self._try_strict_json(response)
-        if result.success:
-            self.stats[ParseStrategy.STRICT_JSON] += 1
-            logger.debug(f"Parsed with {ParseStrategy.STRICT_JSON.value}")
-            # Sanitize tool arguments for security (Codex strategy)
-            if self.sanitize_args:
-                result = self._sanitize_tool_calls(result)
-            return result
+        candidates = classify_response(response)
+        if self.strict_mode:
+            candidates = (ParseStrategy.STRICT_JSON,)
+
+        # Strategies 1-4: only those the response's shape allows
+        result = ParseResult(
+            success=False,
+            error="No tool call format detected",
+            raw_response=response
+        )
+        for strategy in candidates:
+            result = self._run_strategy(strategy, response)
+            if result.success:
+                self.stats[strategy] += 1
+                logger.debug(f"Parsed with {strategy.value}")
+                # Sanitize tool arguments for security (Codex strategy)
+                if self.sanitize_args:
+                    result = self._sanitize_tool_calls(result)
+                return result
 
         if self.strict_mode:
             self.stats["failures"] += 1
             return self._maybe_retry(response, result, attempt)
 
-        # Strategy 2: Extract JSON from markdown code blocks
-        result = self._try_markdown_json(response)
-        if result.success:
-            self.stats[ParseStrategy.MARKDOWN_JSON] += 1
-            logger.debug(f"Parsed with {ParseStrategy.MARKDOWN_JSON.value}")
-            if self.sanitize_args:
-                result = self._sanitize_tool_calls(result)
-            return result
-
-        # Strategy 3: Regex extraction of tool calls
-        result = self._try_regex_extraction(response)
-        if result.success:
-            self.stats[ParseStrategy.REGEX_EXTRACTION] += 1
-            logger.debug(f"Parsed with {ParseStrategy.REGEX_EXTRACTION.value}")
-            if self.sanitize_args:
-                result = self._sanitize_tool_calls(result)
-            return result
-
-        # Strategy 4: Partial JSON recovery
-        result = self._try_partial_json(response)
-        if result.success:
-            self.stats[ParseStrategy.PARTIAL_JSON] += 1
-            logger.debug(f"Parsed with {ParseStrategy.PARTIAL_JSON.value}")
-            if self.sanitize_args:
-                result = self._sanitize_tool_calls(result)
-            return result
-
-        # Strategy 5: Retry with secondary LLM pass (Gemini strategy)
+        # Strategy 5: Retry with secondary LLM pass (Gemini strategy),
+        # unless the response is prose that never attempted a tool call
         if self.enable_retry and attempt < self.max_retries:
-            return self._maybe_retry(response, result, attempt)
+            if candidates or "{" in response:
+                return self._maybe_retry(response, result, attempt)
+            self.stats["retries_avoided"] += 1
 
         # Strategy 6: Plain text fallback
         self.stats[ParseStrategy.PLAIN_TEXT] += 1
@@ -200,6 +248,23 @@ class ResponseParser:
             raw_response=response
         )
 
+    def _run_strategy(self, strategy: ParseStrategy, response: str) -> ParseResult:
+        """Run one parsing strategy, recording its latency.
+
+        Args:
+            strategy: Strategy to run (not PLAIN_TEXT)
+            response: Raw response text
+
+        Returns:
+            ParseResult of the strategy
+        """
+        start = time.perf_counter()
+        result = getattr(self, self._STRATEGIES[strategy])(response)
+        timing = self._timings[strategy]
+        timing[0] += 1
+        timing[1] += time.perf_counter() - start
+        return result
+
     def _try_strict_json(self, response: str) -> ParseResult:
         """Attempt strict JSON parsing.
         
@@ -287,15 +352,8 @@ class ResponseParser:
             ParseResult with tool calls if successful
         """
         # Pattern: ```json ... ``` or ``` ... ```
-        patterns = [
-            r'```json\s*\n(.*?)\n```',
-            r'```\s*\n(.*?)\n```',
-            r'```json\s*(.*?)```',
-            r'```(.*?)```'
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, response, re.DOTALL)
+        for pattern in MARKDOWN_PATTERNS:
+            match = pattern.search(response)
             if match:
                 json_str = match.group(1).strip()
                 result = self._try_strict_json(json_str)
@@ -325,10 +383,8 @@ class ResponseParser:
             ParseResult with tool calls if successful
         """
         # Pattern: {"tool": "name", "args": {...}}
-        # More permissive matching
-        pattern = r'\{\s*["\']?tool["\']?\s*:\s*["\'](\w+)["\']\s*,\s*["\']?args["\']?\s*:\s*(\{[^}]*\})\s*\}'
-
-        matches = re.finditer(pattern, response)
+        # More permissive matching (TOOL_CALL_PATTERN)
+        matches = TOOL_CALL_PATTERN.finditer(response)
         tool_calls = []
 
         for match in matches:
@@ -425,9 +481,7 @@ class ResponseParser:
         args = {}
 
         # Pattern: "key": "value" or 'key': 'value'
-        pattern = r'["\']?(\w+)["\']?\s*:\s*["\']([^"\']*)["\']'
-
-        matches = re.finditer(pattern, args_str)
+        matches = ARG_PATTERN.finditer(args_str)
         for match in matches:
             key = match.group(1)
             value = match.group(2)
@@ -492,13 +546,20 @@ class ResponseParser:
 
         return True, None
 
-    def get_statistics(self) -> Dict[str, int]:
+    def get_statistics(self) -> Dict[str, Any]:
         """Get parsing statistics.
         
         Returns:
-            Dict with strategy usage counts
+            Dict with strategy usage counts and per-strategy latency
         """
         total = sum(self.stats.values())
+        latency = {}
+        for strategy, (attempts, seconds) in self._timings.items():
+            latency[strategy.value] = {
+                "attempts": attempts,
+                "total_ms": round(seconds * 1000, 3),
+                "avg_ms": round(seconds * 1000 / attempts, 3) if attempts else 0.0,
+            }
         return {
             "total": total,
             "strict_json": self.stats[ParseStrategy.STRICT_JSON],
@@ -508,13 +569,17 @@ class ResponseParser:
             "plain_text": self.stats[ParseStrategy.PLAIN_TEXT],
             "failures": self.stats["failures"],
             "retries": self.stats.get("retries", 0),
-            "security_blocks": self.stats.get("security_blocks", 0)
+            "retries_avoided": self.stats.get("retries_avoided", 0),
+            "security_blocks": self.stats.get("security_blocks", 0),
+            "latency": latency
         }
 
     def reset_statistics(self) -> None:
         """Reset parsing statistics."""
         for key in self.stats:
             self.stats[key] = 0
+        for timing in self._timings.values():
+            timing[0], timing[1] = 0, 0.0
 
     def set_retry_callback(self, callback: Callable[[str, str], str], is_async: bool = False) -> None:
         """Set callback for secondary LLM pass during retry.
@@ -592,19 +657,9 @@ class ResponseParser:
                     continue
 
                 # Check for dangerous patterns
-                dangerous_patterns = [
-                    r'\.\./\.\.',  # Path traversal
-                    r'~/\.',        # Home directory traversal
-                    r';.*rm\s',     # Command chaining with rm
-                    r'\|.*rm\s',    # Pipe to rm
-                    r'&&.*rm\s',    # And operator with rm
-                    r'`.*`',        # Command substitution
-                    r'\$\(',        # Command substitution
-                ]
-
-                for pattern in dangerous_patterns:
-                    if re.search(pattern, value):
-                        logger.error(f"Blocked dangerous pattern in tool call: {pattern}")
+                for pattern in DANGEROUS_PATTERNS:
+                    if pattern.search(value):
+                        logger.error(f"Blocked dangerous pattern in tool call: {pattern.pattern}")
                         self.stats["security_blocks"] += 1
                         blocked = True
                         break
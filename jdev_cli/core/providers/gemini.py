@@ -2,9 +2,12 @@
 
 import os
 import asyncio
+from contextlib import aclosing
 from typing import Dict, List, Optional, AsyncGenerator
 import logging
 
+from ..thread_bridge import iterate_in_thread
+
 logger = logging.getLogger(__name__)
 
 # REMOVED top-level import: import google.generativeai as genai
@@ -211,16 +214,11 @@ class GeminiProvider:
                 finally:
                     sys.stderr = _original_stderr
 
-            # Run streaming in thread pool and yield chunks
-            loop = asyncio.get_event_loop()
-            response_iterator = await loop.run_in_executor(None, _stream)
-
-            # Yield chunks (run iteration in thread pool to avoid blocking)
-            for chunk in response_iterator:
-                if chunk.text:
-                    yield chunk.text
-                    # Small delay to allow other tasks
-                    await asyncio.sleep(0)
+            # Request and chunk iteration both run on a worker thread
+            async with aclosing(iterate_in_thread(_stream, name="gemini-stream")) as chunks:
+                async for chunk in chunks:
+                    if chunk.text:
+                        yield chunk.text
 
         except Exception as e:
             logger.error(f"Gemini streaming failed: {e}")
@@ -291,49 +289,28 @@ class GeminiProvider:
                     stream=True
                 )
 
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(None, _send)
-
-            # FIX: Convert iterable response to iterator
-            response_iterator = iter(response)
-
             # 6. Stream Response
-            # We iterate manually to avoid blocking the event loop
-            def _next_chunk():
-                try:
-                    return next(response_iterator)
-                except StopIteration:
-                    return None
-                except Exception as e:
-                    return e
-
-            while True:
-                chunk = await loop.run_in_executor(None, _next_chunk)
-
-                if chunk is None:
-                    break
-                if isinstance(chunk, Exception):
-                    raise chunk
-
-                try:
-                    # Handle Code Execution Parts
-                    if hasattr(chunk, 'parts'):
-                        for part in chunk.parts:
-                            if hasattr(part, 'executable_code'):
-                                # Notify user about code execution (optional, or yield a marker)
-                                pass
-                            if hasattr(part, 'code_execution_result'):
-                                # Notify user about result
-                                pass
-                            if hasattr(part, 'text') and part.text:
-                                yield part.text
-                    elif hasattr(chunk, 'text') and chunk.text:
-                        yield chunk.text
-                except Exception as chunk_error:
-                    # Some chunks might be pure metadata or function calls without text
-                    continue
-
-                await asyncio.sleep(0)
+            # Sending and iterating run on a worker thread so the event loop
+            # is never blocked; closing this generator closes the response
+            async with aclosing(iterate_in_thread(_send, name="gemini-chat")) as response:
+                async for chunk in response:
+                    try:
+                        # Handle Code Execution Parts
+                        if hasattr(chunk, 'parts'):
+                            for part in chunk.parts:
+                                if hasattr(part, 'executable_code'):
+                                    # Notify user about code execution (optional, or yield a marker)
+                                    pass
+                                if hasattr(part, 'code_execution_result'):
+                                    # Notify user about result
+                                    pass
+                                if hasattr(part, 'text') and part.text:
+                                    yield part.text
+                        elif hasattr(chunk, 'text') and chunk.text:
+                            yield chunk.text
+                    except Exception as chunk_error:
+                        # Some chunks might be pure metadata or function calls without text
+                        continue
 
 
         except Exception as e:
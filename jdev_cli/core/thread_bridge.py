@@ -0,0 +1,106 @@
+"""Async bridge for blocking iterators (sync provider SDK streams).
+
+Sync SDKs (huggingface_hub, google-generativeai) return streams whose
+``for chunk in stream`` blocks on network reads. Iterating one inside an
+async generator freezes the event loop for the whole generation.
+
+iterate_in_thread() runs the blocking iteration on a dedicated daemon
+thread and hands items to the async consumer through a bounded buffer:
+- The producer stops reading ahead once max_buffered items are waiting
+- Exceptions raised by the stream are re-raised in the consumer
+- Closing or cancelling the consumer stops the producer and closes the
+  underlying stream (immediately if possible, otherwise after the read
+  in progress returns)
+"""
+
+import asyncio
+import logging
+import threading
+from typing import AsyncGenerator, Callable, Iterable, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+DEFAULT_MAX_BUFFERED = 64
+
+_ITEM, _ERROR, _DONE = range(3)
+
+
+def _close_stream(stream: Optional[Iterable]) -> None:
+    """Best-effort close of a sync stream (generator or HTTP response)."""
+    close = getattr(stream, "close", None)
+    if close is None:
+        return
+    try:
+        close()
+    except ValueError:
+        # Generator is mid-read on the producer thread; it closes it itself
+        pass
+    except Exception as e:
+        logger.debug(f"Closing stream failed: {type(e).__name__}: {e}")
+
+
+async def iterate_in_thread(
+    open_stream: Callable[[], Iterable[T]],
+    max_buffered: int = DEFAULT_MAX_BUFFERED,
+    name: str = "sync-stream",
+) -> AsyncGenerator[T, None]:
+    """Iterate a blocking stream without blocking the event loop.
+
+    Args:
+        open_stream: Called on the worker thread to create the stream, so
+            connection setup does not block the loop either
+        max_buffered: Items read ahead before the producer waits
+        name: Worker thread name
+
+    Yields:
+        Items of the stream, in order
+    """
+    loop = asyncio.get_running_loop()
+    items: asyncio.Queue = asyncio.Queue()
+    slots = threading.Semaphore(max_buffered)
+    stopped = threading.Event()
+    opened: list = []
+
+    def send(kind: int, value=None) -> None:
+        try:
+            loop.call_soon_threadsafe(items.put_nowait, (kind, value))
+        except RuntimeError:
+            stopped.set()  # Loop closed under us
+
+    def produce() -> None:
+        stream = None
+        try:
+            stream = open_stream()
+            opened.append(stream)
+            for item in stream:
+                slots.acquire()
+                if stopped.is_set():
+                    return
+                send(_ITEM, item)
+                if stopped.is_set():
+                    return
+            send(_DONE)
+        except BaseException as e:
+            send(_ERROR, e)
+        finally:
+            _close_stream(stream)
+
+    threading.Thread(target=produce, name=name, daemon=True).start()
+
+    try:
+        while True:
+            kind, value = await items.get()
+            if kind == _ITEM:
+                slots.release()
+                yield value
+            elif kind == _ERROR:
+                raise value
+            else:
+                return
+    finally:
+        stopped.set()
+        slots.release()  # Wake a producer waiting for room
+        if opened:
+            _close_stream(opened[0])
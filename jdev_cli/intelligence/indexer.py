@@ -6,12 +6,19 @@ Provides blazing-fast semantic search and context awareness.
 
 import ast
 import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import Dict, List, Set, Optional, Tuple
+from typing import Dict, List, Set, Optional, Tuple, Union
 from dataclasses import dataclass, field
 from collections import defaultdict
 import hashlib
 import re
+import sqlite3
+import threading
+
+from .symbol_search import SymbolSearchIndex
 
 
 @dataclass
@@ -36,6 +43,256 @@ class FileIndex:
     imports: List[str]
     dependencies: Set[str] = field(default_factory=set)
     last_modified: float = 0.0
+    size: int = 0
+    inode: int = 0
+
+    def stat_matches(self, st: os.stat_result) -> bool:
+        """True if mtime, size and inode are unchanged since indexing."""
+        return (
+            self.last_modified == st.st_mtime
+            and self.size == st.st_size
+            and self.inode == st.st_ino
+        )
+
+
+class _SymbolVisitor(ast.NodeVisitor):
+    """Single-pass symbol extractor that tracks the enclosing class scope."""
+
+    # Definitions and imports only live in statement blocks, never in expressions
+    _BLOCK_FIELDS = ('body', 'orelse', 'finalbody', 'handlers', 'cases')
+
+    def __init__(self, rel_path: str):
+        self.rel_path = rel_path
+        self.symbols: List[Symbol] = []
+        self.imports: List[str] = []
+        self._class_stack: List[str] = []
+
+    def generic_visit(self, node: ast.AST) -> None:
+        for field_name in self._BLOCK_FIELDS:
+            block = getattr(node, field_name, None)
+            if isinstance(block, list):
+                for child in block:
+                    self.visit(child)
+
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:
+        self.symbols.append(Symbol(
+            name=node.name,
+            type='class',
+            file_path=self.rel_path,
+            line_number=node.lineno,
+            docstring=ast.get_docstring(node)
+        ))
+
+        self._class_stack.append(node.name)
+        self.generic_visit(node)
+        self._class_stack.pop()
+
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
+        # Anything defined inside a class body (directly or nested) is a method
+        parent = self._class_stack[-1] if self._class_stack else None
+
+        # Build signature
+        args = [arg.arg for arg in node.args.args]
+        signature = f"{node.name}({', '.join(args)})"
+
+        self.symbols.append(Symbol(
+            name=node.name,
+            type='method' if parent else 'function',
+            file_path=self.rel_path,
+            line_number=node.lineno,
+            docstring=ast.get_docstring(node),
+            signature=signature,
+            parent=parent
+        ))
+
+        self.generic_visit(node)
+
+    def visit_Import(self, node: ast.Import) -> None:
+        for alias in node.names:
+            self.imports.append(alias.name)
+
+    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
+        if node.module:
+            self.imports.append(node.module)
+
+
+def _parse_path(path: Path, root_path: Path) -> Optional[FileIndex]:
+    """Parse a single Python file into a FileIndex (None if unparseable)."""
+    try:
+        with open(path, 'rb') as f:
+            st = os.fstat(f.fileno())
+            raw = f.read()
+
+        rel_path = str(path.relative_to(root_path))
+        tree = ast.parse(raw.decode('utf-8'), filename=str(path))
+
+        visitor = _SymbolVisitor(rel_path)
+        visitor.visit(tree)
+
+        return FileIndex(
+            path=rel_path,
+            hash=hashlib.sha256(raw).hexdigest()[:16],
+            symbols=visitor.symbols,
+            imports=visitor.imports,
+            last_modified=st.st_mtime,
+            size=st.st_size,
+            inode=st.st_ino
+        )
+
+    except Exception:
+        # Silently skip files that can't be parsed
+        return None
+
+
+def _parse_batch(paths: List[str], root_path: Union[str, Path]) -> List[FileIndex]:
+    """Process-pool entry point: parse one shard of files."""
+    root = Path(root_path)
+    results = []
+    for path in paths:
+        file_idx = _parse_path(Path(path), root)
+        if file_idx:
+            results.append(file_idx)
+    return results
+
+
+class _IndexStore:
+    """
+    SQLite-backed index cache.
+
+    One row per file (hash + stat metadata + imports) and one row per
+    symbol, so files can be rewritten individually and symbols loaded
+    per file or per name without parsing the whole cache.
+    """
+
+    SCHEMA_VERSION = 1
+
+    def __init__(self, db_path: Path):
+        self.db_path = db_path
+        # Shell indexes from a worker thread (asyncio.to_thread)
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        self._lock = threading.Lock()
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._init_schema()
+
+    def _init_schema(self) -> None:
+        version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        if version not in (0, self.SCHEMA_VERSION):
+            self._conn.executescript("DROP TABLE IF EXISTS files; DROP TABLE IF EXISTS symbols;")
+
+        self._conn.executescript(f"""
+            CREATE TABLE IF NOT EXISTS files (
+                path TEXT PRIMARY KEY,
+                hash TEXT NOT NULL,
+                mtime REAL NOT NULL,
+                size INTEGER NOT NULL,
+                inode INTEGER NOT NULL,
+                imports TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS symbols (
+                file_path TEXT NOT NULL,
+                name TEXT NOT NULL,
+                type TEXT NOT NULL,
+                line_number INTEGER NOT NULL,
+                docstring TEXT,
+                signature TEXT,
+                parent TEXT
+            );
+            CREATE INDEX IF NOT EXISTS idx_symbols_name ON symbols(name);
+            CREATE INDEX IF NOT EXISTS idx_symbols_file ON symbols(file_path);
+            PRAGMA user_version = {self.SCHEMA_VERSION};
+        """)
+
+    def is_empty(self) -> bool:
+        with self._lock:
+            return self._conn.execute("SELECT 1 FROM files LIMIT 1").fetchone() is None
+
+    def load_files(self) -> List[FileIndex]:
+        """Load file metadata and imports (no symbols)."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT path, hash, mtime, size, inode, imports FROM files"
+            ).fetchall()
+        return [
+            FileIndex(
+                path=path,
+                hash=file_hash,
+                symbols=[],
+                imports=imports.split('\n') if imports else [],
+                last_modified=mtime,
+                size=size,
+                inode=inode
+            )
+            for path, file_hash, mtime, size, inode, imports in rows
+        ]
+
+    def _symbols(self, where: str = "", params: Tuple = ()) -> List[Symbol]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT name, type, file_path, line_number, docstring, signature, parent "
+                f"FROM symbols {where} ORDER BY rowid",
+                params
+            ).fetchall()
+        return [Symbol(*row) for row in rows]
+
+    def load_symbols(self, rel_path: Optional[str] = None) -> List[Symbol]:
+        """Load symbols for one file, or for every file when rel_path is None."""
+        if rel_path is None:
+            return self._symbols()
+        return self._symbols("WHERE file_path = ?", (rel_path,))
+
+    def symbol_names(self, paths: Optional[Set[str]] = None) -> Set[str]:
+        """Distinct symbol names across all files, or only those defined in paths."""
+        with self._lock:
+            if paths is None:
+                return {row[0] for row in self._conn.execute("SELECT DISTINCT name FROM symbols")}
+            rows = self._conn.execute("SELECT DISTINCT name, file_path FROM symbols").fetchall()
+        return {name for name, file_path in rows if file_path in paths}
+
+    def files_defining(self, name: str) -> Set[str]:
+        """Files that define a symbol with this exact name."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT DISTINCT file_path FROM symbols WHERE name = ?", (name,)
+            ).fetchall()
+        return {row[0] for row in rows}
+
+    def write(self, files: List[FileIndex], removed: Tuple[str, ...] = ()) -> None:
+        """Replace the given files (and drop removed ones) in one transaction."""
+        with self._lock, self._conn:
+            for rel_path in removed:
+                self._conn.execute("DELETE FROM files WHERE path = ?", (rel_path,))
+                self._conn.execute("DELETE FROM symbols WHERE file_path = ?", (rel_path,))
+
+            for idx in files:
+                self._conn.execute("DELETE FROM symbols WHERE file_path = ?", (idx.path,))
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO files (path, hash, mtime, size, inode, imports) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (idx.path, idx.hash, idx.last_modified, idx.size, idx.inode,
+                     '\n'.join(idx.imports))
+                )
+                self._conn.executemany(
+                    "INSERT INTO symbols (file_path, name, type, line_number, docstring, "
+                    "signature, parent) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    [
+                        (idx.path, s.name, s.type, s.line_number, s.docstring,
+                         s.signature, s.parent)
+                        for s in idx.symbols
+                    ]
+                )
+
+    def update_stat(self, files: List[FileIndex]) -> None:
+        """Refresh stat metadata for files whose content hash is unchanged."""
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "UPDATE files SET mtime = ?, size = ?, inode = ? WHERE path = ?",
+                [(f.last_modified, f.size, f.inode, f.path) for f in files]
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
 
 
 class SemanticIndexer:
@@ -49,6 +306,11 @@ class SemanticIndexer:
     - Smart context collection
     """
 
+    # Below this many changed files a process pool costs more than it saves
+    PARALLEL_MIN_FILES = 64
+    # Upper bound on files per worker task
+    PARALLEL_CHUNK_SIZE = 256
+
     def __init__(self, root_path: str, cache_dir: Optional[str] = None):
         self.root_path = Path(root_path).resolve()
         self.cache_dir = Path(cache_dir or self.root_path / ".qwen" / "index")
@@ -58,6 +320,15 @@ class SemanticIndexer:
         self.file_index: Dict[str, FileIndex] = {}
         self.symbol_index: Dict[str, List[Symbol]] = defaultdict(list)
         self.import_graph: Dict[str, Set[str]] = defaultdict(set)
+        # Name lookup structure backing search_symbols
+        self.search_index = SymbolSearchIndex()
+
+        # On-disk cache, opened on first use
+        self._store: Optional[_IndexStore] = None
+        # Files loaded lazily from cache whose symbols are not in memory yet
+        self._unhydrated: Set[str] = set()
+        # False after a lazy load until the first search builds search_index
+        self._search_built = True
 
         # Exclude patterns
         self.exclude_patterns = {
@@ -91,117 +362,207 @@ class SemanticIndexer:
 
     def parse_file(self, path: Path) -> Optional[FileIndex]:
         """Parse Python file and extract symbols."""
-        try:
-            with open(path, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            tree = ast.parse(content, filename=str(path))
-
-            symbols = []
-            imports = []
-
-            for node in ast.walk(tree):
-                # Classes
-                if isinstance(node, ast.ClassDef):
-                    symbols.append(Symbol(
-                        name=node.name,
-                        type='class',
-                        file_path=str(path.relative_to(self.root_path)),
-                        line_number=node.lineno,
-                        docstring=ast.get_docstring(node)
-                    ))
-
-                # Functions
-                elif isinstance(node, ast.FunctionDef):
-                    parent = None
-                    # Check if it's a method
-                    for parent_node in ast.walk(tree):
-                        if isinstance(parent_node, ast.ClassDef):
-                            if node in ast.walk(parent_node):
-                                parent = parent_node.name
-                                break
-
-                    # Build signature
-                    args = [arg.arg for arg in node.args.args]
-                    signature = f"{node.name}({', '.join(args)})"
-
-                    symbols.append(Symbol(
-                        name=node.name,
-                        type='method' if parent else 'function',
-                        file_path=str(path.relative_to(self.root_path)),
-                        line_number=node.lineno,
-                        docstring=ast.get_docstring(node),
-                        signature=signature,
-                        parent=parent
-                    ))
-
-                # Imports
-                elif isinstance(node, ast.Import):
-                    for alias in node.names:
-                        imports.append(alias.name)
-
-                elif isinstance(node, ast.ImportFrom):
-                    if node.module:
-                        imports.append(node.module)
-
-            file_hash = self.compute_file_hash(path)
-
-            return FileIndex(
-                path=str(path.relative_to(self.root_path)),
-                hash=file_hash,
-                symbols=symbols,
-                imports=imports,
-                last_modified=path.stat().st_mtime
-            )
+        return _parse_path(path, self.root_path)
 
-        except Exception as e:
-            # Silently skip files that can't be parsed
-            return None
+    def _iter_source_files(self) -> List[Path]:
+        """List indexable source files under the root."""
+        return [p for p in self.root_path.rglob('*.py') if self.should_index(p)]
 
-    def index_codebase(self, force: bool = False) -> int:
-        """
-        Index entire codebase.
-        
-        Returns number of files indexed.
+    def _files_to_parse(self, force: bool) -> Tuple[List[Path], List[FileIndex], List[str]]:
         """
-        indexed_count = 0
+        Select files that are new or changed since the last index.
 
-        for path in self.root_path.rglob('*.py'):
-            if not self.should_index(path):
-                continue
+        Unchanged stat metadata (mtime, size, inode) skips the file without
+        reading it; otherwise the content hash decides.
 
-            # Check if file needs reindexing
+        Returns (paths to parse, entries whose stat was refreshed, removed paths).
+        """
+        pending = []
+        touched = []
+        seen = set()
+
+        for path in self._iter_source_files():
             rel_path = str(path.relative_to(self.root_path))
+            seen.add(rel_path)
+
+            existing = self.file_index.get(rel_path)
+            if not force and existing is not None:
+                try:
+                    st = path.stat()
+                except OSError:
+                    continue
+
+                if existing.stat_matches(st):
+                    continue  # Fast path: untouched since last index
+
+                if existing.hash == self.compute_file_hash(path):
+                    # Touched but identical content - just remember the new stat
+                    existing.last_modified = st.st_mtime
+                    existing.size = st.st_size
+                    existing.inode = st.st_ino
+                    touched.append(existing)
+                    continue
+
+            pending.append(path)
+
+        removed = [p for p in self.file_index if p not in seen]
+        return pending, touched, removed
+
+    def _add_file_index(self, file_idx: FileIndex) -> None:
+        """Insert (or replace) a parsed file in the in-memory indexes."""
+        rel_path = file_idx.path
+        self._remove_file_index(rel_path)
+
+        self.file_index[rel_path] = file_idx
+
+        # Update symbol index
+        for symbol in file_idx.symbols:
+            self._index_symbol(symbol)
+
+        # Update import graph
+        for imp in file_idx.imports:
+            self.import_graph[rel_path].add(imp)
+
+    def _index_symbol(self, symbol: Symbol) -> None:
+        bucket = self.symbol_index[symbol.name]
+        if not bucket and self._search_built:
+            self.search_index.add(symbol.name)
+        bucket.append(symbol)
+
+    def _remove_file_index(self, rel_path: str) -> None:
+        """Drop a file's symbols and imports from the in-memory indexes."""
+        previous = self.file_index.pop(rel_path, None)
+        if previous is None:
+            return
+
+        loaded = {symbol.name for symbol in previous.symbols}
+        names = set(loaded)
+        if rel_path in self._unhydrated:
+            self._unhydrated.discard(rel_path)
+            if self._search_built:
+                # Its names are searchable even though its symbols never loaded
+                names.update(s.name for s in self._get_store().load_symbols(rel_path))
+
+        for name in loaded:
+            remaining = [s for s in self.symbol_index.get(name, []) if s.file_path != rel_path]
+            if remaining:
+                self.symbol_index[name] = remaining
+            else:
+                self.symbol_index.pop(name, None)
+
+        for name in names:
+            self._unindex_name(name)
+
+        self.import_graph.pop(rel_path, None)
+
+    def _unindex_name(self, name: str) -> None:
+        """Remove a name from search_index once no file defines it."""
+        if not self._search_built or name in self.symbol_index:
+            return
+        if self._unhydrated and self._get_store().files_defining(name) & self._unhydrated:
+            return  # A lazily-loaded file still defines it
+        self.search_index.remove(name)
+
+    def _build_search_index(self) -> None:
+        """Index names deferred by a lazy load (in memory + not yet hydrated)."""
+        if self._search_built:
+            return
+        names = set(self.symbol_index)
+        if self._unhydrated:
+            names |= self._get_store().symbol_names(self._unhydrated)
+        for name in names:
+            self.search_index.add(name)
+        self._search_built = True
+
+    def _hydrate(self, paths: Set[str]) -> None:
+        """Load symbols for lazily-loaded files into symbol_index."""
+        paths = paths & self._unhydrated
+        if not paths:
+            return
+
+        if paths == self._unhydrated and len(paths) > 1:
+            by_file: Dict[str, List[Symbol]] = defaultdict(list)
+            for symbol in self._get_store().load_symbols():
+                by_file[symbol.file_path].append(symbol)
+        else:
+            by_file = {p: self._get_store().load_symbols(p) for p in paths}
+
+        for rel_path in paths:
+            symbols = by_file.get(rel_path, [])
+            self.file_index[rel_path].symbols = symbols
+            for symbol in symbols:
+                self._index_symbol(symbol)
 
-            if not force and rel_path in self.file_index:
-                existing = self.file_index[rel_path]
-                current_hash = self.compute_file_hash(path)
+        self._unhydrated -= paths
 
-                if existing.hash == current_hash:
-                    continue  # Skip unchanged files
+    def _hydrate_all(self) -> None:
+        """Load every pending file's symbols (needed for full scans)."""
+        self._hydrate(set(self._unhydrated))
 
-            # Parse and index
-            file_idx = self.parse_file(path)
-            if file_idx:
-                self.file_index[rel_path] = file_idx
+    def get_file_symbols(self, file_path: str) -> List[Symbol]:
+        """Get symbols defined in one file, loading them from cache if needed."""
+        if file_path not in self.file_index:
+            return []
+        self._hydrate({file_path})
+        return self.file_index[file_path].symbols
+
+    def _parse_parallel(self, paths: List[Path], workers: int) -> List[FileIndex]:
+        """Parse files across a process pool, one shard per task."""
+        chunk_size = max(1, min(self.PARALLEL_CHUNK_SIZE, len(paths) // (workers * 4) or 1))
+        shards = [
+            [str(p) for p in paths[i:i + chunk_size]]
+            for i in range(0, len(paths), chunk_size)
+        ]
+
+        results: List[FileIndex] = []
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for batch in pool.map(_parse_batch, shards, [str(self.root_path)] * len(shards)):
+                results.extend(batch)
+
+        return results
+
+    def index_codebase(self, force: bool = False, workers: int = 1) -> int:
+        """
+        Index entire codebase.
+
+        Args:
+            force: Re-parse every file even if its hash is unchanged
+            workers: Number of parser processes. Values above 1 shard
+                parsing across a process pool (0 = one per CPU); small
+                batches are always parsed in-process.
+
+        Returns number of files indexed.
+        """
+        if workers == 0:
+            workers = os.cpu_count() or 1
+
+        pending, touched, removed = self._files_to_parse(force)
 
-                # Update symbol index
-                for symbol in file_idx.symbols:
-                    self.symbol_index[symbol.name].append(symbol)
+        for rel_path in removed:
+            self._remove_file_index(rel_path)
 
-                # Update import graph
-                for imp in file_idx.imports:
-                    self.import_graph[rel_path].add(imp)
+        if workers > 1 and len(pending) >= self.PARALLEL_MIN_FILES:
+            try:
+                parsed = self._parse_parallel(pending, workers)
+            except (OSError, BrokenProcessPool):
+                # Pool unavailable (sandboxed env, fork limits) - parse in-process
+                parsed = [idx for idx in map(self.parse_file, pending) if idx]
+        else:
+            parsed = [idx for idx in map(self.parse_file, pending) if idx]
 
-                indexed_count += 1
+        for file_idx in parsed:
+            self._add_file_index(file_idx)
 
-        # Save to cache
-        self._save_cache()
+        # Persist only what changed
+        self._save_cache(parsed, removed=removed, touched=touched)
 
-        return indexed_count
+        return len(parsed)
 
     def find_symbol(self, name: str, type: Optional[str] = None) -> List[Symbol]:
         """Find symbols by name and optional type."""
+        if self._unhydrated:
+            self._hydrate(self._get_store().files_defining(name))
+
         symbols = self.symbol_index.get(name, [])
 
         if type:
@@ -303,30 +664,25 @@ class SemanticIndexer:
         return None
 
     def search_symbols(self, query: str, limit: int = 10) -> List[Symbol]:
-        """Fuzzy search symbols."""
-        query_lower = query.lower()
-        results = []
-
-        for name, symbols in self.symbol_index.items():
-            if query_lower in name.lower():
-                results.extend(symbols)
-
-        # Sort by relevance (exact match first, then prefix, then contains)
-        def sort_key(symbol: Symbol) -> Tuple[int, str]:
-            name_lower = symbol.name.lower()
-            if name_lower == query_lower:
-                return (0, symbol.name)
-            elif name_lower.startswith(query_lower):
-                return (1, symbol.name)
-            else:
-                return (2, symbol.name)
+        """
+        Fuzzy search symbols.
 
-        results.sort(key=sort_key)
+        Ranked: exact match, prefix, substring, then camelCase/snake_case
+        initials ("si" -> SemanticIndexer); alphabetical within each tier.
+        """
+        self._build_search_index()
+        results: List[Symbol] = []
+
+        for name in self.search_index.search(query):
+            results.extend(self.find_symbol(name))
+            if len(results) >= limit:
+                break
 
         return results[:limit]
 
     def get_stats(self) -> Dict:
         """Get indexer statistics."""
+        self._hydrate_all()
         total_symbols = sum(len(syms) for syms in self.symbol_index.values())
 
         symbol_types = defaultdict(int)
@@ -341,43 +697,46 @@ class SemanticIndexer:
             'unique_symbols': len(self.symbol_index)
         }
 
-    def _save_cache(self):
-        """Save index to cache."""
-        cache_file = self.cache_dir / "index.json"
+    def _get_store(self) -> _IndexStore:
+        if self._store is None:
+            self._store = _IndexStore(self.cache_dir / "index.db")
+        return self._store
+
+    def close(self) -> None:
+        """Close the on-disk cache."""
+        if self._store is not None:
+            self._store.close()
+            self._store = None
+
+    def _save_cache(
+        self,
+        files: Optional[List[FileIndex]] = None,
+        removed: Optional[List[str]] = None,
+        touched: Optional[List[FileIndex]] = None
+    ):
+        """
+        Save index to cache.
+
+        Writes only the given files (all in-memory files when None) and
+        deletes removed ones, instead of rewriting the whole cache.
+        """
+        if files is None:
+            files = [
+                idx for path, idx in self.file_index.items()
+                if path not in self._unhydrated
+            ]
 
         try:
-            data = {
-                'file_index': {
-                    path: {
-                        'path': idx.path,
-                        'hash': idx.hash,
-                        'symbols': [
-                            {
-                                'name': s.name,
-                                'type': s.type,
-                                'file_path': s.file_path,
-                                'line_number': s.line_number,
-                                'docstring': s.docstring,
-                                'signature': s.signature,
-                                'parent': s.parent
-                            }
-                            for s in idx.symbols
-                        ],
-                        'imports': idx.imports,
-                        'last_modified': idx.last_modified
-                    }
-                    for path, idx in self.file_index.items()
-                }
-            }
-
-            with open(cache_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            store = self._get_store()
+            store.write(files, removed=tuple(removed or ()))
+            if touched:
+                store.update_stat(touched)
 
         except Exception:
             pass  # Silently fail cache save
 
-    def load_cache(self) -> bool:
-        """Load index from cache."""
+    def _load_legacy_json(self) -> bool:
+        """Import a pre-SQLite index.json cache, then drop it."""
         cache_file = self.cache_dir / "index.json"
 
         if not cache_file.exists():
@@ -387,29 +746,52 @@ class SemanticIndexer:
             with open(cache_file, 'r') as f:
                 data = json.load(f)
 
-            # Reconstruct indexes
-            for path, idx_data in data['file_index'].items():
-                symbols = [
-                    Symbol(**s) for s in idx_data['symbols']
-                ]
-
-                file_idx = FileIndex(
+            for idx_data in data['file_index'].values():
+                self._add_file_index(FileIndex(
                     path=idx_data['path'],
                     hash=idx_data['hash'],
-                    symbols=symbols,
+                    symbols=[Symbol(**s) for s in idx_data['symbols']],
                     imports=idx_data['imports'],
                     last_modified=idx_data['last_modified']
-                )
+                ))
+
+            self._save_cache()
+            cache_file.unlink()
+            return True
+
+        except Exception:
+            return False
+
+    def load_cache(self, lazy: bool = False) -> bool:
+        """
+        Load index from cache.
+
+        Args:
+            lazy: Only load file metadata and imports; symbols are read
+                per file on first lookup and the name search index is
+                built on the first search_symbols() call. Keeps warm
+                startup cheap on large repositories.
+        """
+        try:
+            store = self._get_store()
+
+            if store.is_empty():
+                return self._load_legacy_json()
 
-                self.file_index[path] = file_idx
+            files = store.load_files()
+            symbols_by_file: Dict[str, List[Symbol]] = defaultdict(list)
+            if not lazy:
+                for symbol in store.load_symbols():
+                    symbols_by_file[symbol.file_path].append(symbol)
 
-                # Rebuild symbol index
-                for symbol in symbols:
-                    self.symbol_index[symbol.name].append(symbol)
+            for file_idx in files:
+                file_idx.symbols = symbols_by_file.get(file_idx.path, [])
+                self._add_file_index(file_idx)
+                if lazy:
+                    self._unhydrated.add(file_idx.path)
 
-                # Rebuild import graph
-                for imp in file_idx.imports:
-                    self.import_graph[path].add(imp)
+            if lazy and files:
+                self._search_built = False
 
             return True
 
@@ -0,0 +1,223 @@
+"""
+Symbol search index - fast name lookup for SemanticIndexer.
+
+Replaces the linear scan over symbol_index on every query with:
+- a sorted array of lowercase names (exact + prefix via bisect)
+- a trigram index of name ids (substring matches)
+- a sorted array of word initials (camelCase / snake_case abbreviations,
+  e.g. "si" -> SemanticIndexer, "ss" -> search_symbols)
+
+Results are produced tier by tier (exact, prefix, substring, initials),
+each tier ordered by name, so a query stops as soon as it has enough
+matches.
+"""
+
+import re
+from array import array
+from bisect import bisect_left
+from collections import defaultdict
+from typing import Dict, Iterable, Iterator, List, Optional, Set
+
+
+_WORD_RE = re.compile(r'[A-Z]+(?![a-z])|[A-Z]?[a-z]+\d*|\d+')
+_SEP = '\x00'
+
+
+def name_initials(name: str) -> str:
+    """First letter of each camelCase/snake_case word, lowercased."""
+    return ''.join(word[0] for word in _WORD_RE.findall(name)).lower()
+
+
+def _trigrams(key: str) -> Set[str]:
+    return {key[i:i + 3] for i in range(len(key) - 2)}
+
+
+class SymbolSearchIndex:
+    """
+    Incrementally maintained name index.
+
+    Names are added/removed as symbols enter and leave the indexer.
+    Sorted arrays are merged lazily on the next query; removed names are
+    tombstoned in the trigram postings and compacted once they pile up.
+    """
+
+    # Rebuild trigram postings when this fraction of ids is dead
+    COMPACT_RATIO = 0.5
+
+    def __init__(self) -> None:
+        self._reset()
+
+    def _reset(self) -> None:
+        # lowercase key -> original spellings
+        self._by_lower: Dict[str, Set[str]] = {}
+        # lowercase key -> numeric id (trigram postings store ids)
+        self._ids: Dict[str, int] = {}
+        self._names: List[Optional[str]] = []
+        self._postings: Dict[str, array] = defaultdict(lambda: array('I'))
+        self._dead = 0
+
+        self._keys: List[str] = []
+        self._initials: List[str] = []
+        # Keys added/removed since the sorted arrays were last merged
+        self._pending: List[str] = []
+        self._stale: Set[str] = set()
+
+    def __len__(self) -> int:
+        return len(self._by_lower)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._by_lower.get(name.lower(), ())
+
+    def build(self, names) -> None:
+        """Bulk (re)build from an iterable of symbol names."""
+        self._reset()
+        for name in names:
+            self.add(name)
+        self._flush()
+
+    def add(self, name: str) -> None:
+        """Register a symbol name."""
+        key = name.lower()
+        spellings = self._by_lower.get(key)
+        if spellings is not None:
+            spellings.add(name)
+            return
+
+        self._by_lower[key] = {name}
+
+        key_id = len(self._names)
+        self._names.append(key)
+        self._ids[key] = key_id
+        for gram in _trigrams(key):
+            self._postings[gram].append(key_id)
+
+        if key in self._stale:
+            self._stale.discard(key)  # still present in the sorted arrays
+        else:
+            self._pending.append(key)
+
+    def remove(self, name: str) -> None:
+        """Unregister a symbol name (no-op if unknown)."""
+        key = name.lower()
+        spellings = self._by_lower.get(key)
+        if spellings is None:
+            return
+
+        spellings.discard(name)
+        if spellings:
+            return
+
+        del self._by_lower[key]
+        self._names[self._ids.pop(key)] = None
+        self._dead += 1
+        self._stale.add(key)
+
+        if self._dead > len(self._names) * self.COMPACT_RATIO:
+            self._compact()
+
+    def _compact(self) -> None:
+        """Drop tombstoned ids from the trigram postings."""
+        live = [key for key in self._names if key is not None]
+        self._names = []
+        self._ids = {}
+        self._postings = defaultdict(lambda: array('I'))
+        self._dead = 0
+
+        for key in live:
+            key_id = len(self._names)
+            self._names.append(key)
+            self._ids[key] = key_id
+            for gram in _trigrams(key):
+                self._postings[gram].append(key_id)
+
+    def _flush(self) -> None:
+        """Merge pending additions/removals into the sorted arrays."""
+        if self._stale:
+            stale = self._stale
+            self._keys = [k for k in self._keys if k not in stale]
+            self._initials = [
+                entry for entry in self._initials
+                if entry.partition(_SEP)[2] not in stale
+            ]
+            self._pending = [k for k in self._pending if k in self._by_lower]
+            self._stale = set()
+
+        if self._pending:
+            # Appended run + timsort = linear merge
+            self._keys.extend(self._pending)
+            self._keys.sort()
+            self._initials.extend(
+                f"{initials}{_SEP}{key}"
+                for key in self._pending
+                if len(initials := name_initials(next(iter(self._by_lower[key])))) > 1
+            )
+            self._initials.sort()
+            self._pending = []
+
+    def _prefix_keys(self, prefix: str) -> Iterator[str]:
+        keys = self._keys
+        i = bisect_left(keys, prefix)
+        while i < len(keys) and keys[i].startswith(prefix):
+            yield keys[i]
+            i += 1
+
+    def _substring_keys(self, query: str) -> Iterable[str]:
+        """Keys containing query (but not starting with it), sorted."""
+        if len(query) < 3:
+            # No trigram to narrow with: filter the already-sorted keys lazily
+            return (k for k in self._keys if query in k and not k.startswith(query))
+
+        postings = []
+        for gram in _trigrams(query):
+            posting = self._postings.get(gram)
+            if not posting:
+                return []
+            postings.append(posting)
+        rarest = min(postings, key=len)
+        candidates = {self._names[i] for i in rarest}
+        candidates.discard(None)
+
+        return sorted(
+            key for key in candidates
+            if query in key and not key.startswith(query)
+        )
+
+    def _initials_keys(self, query: str) -> List[str]:
+        """Keys whose word initials start with query (and don't contain it)."""
+        if len(query) < 2 or not query.isalnum():
+            return []
+
+        found = []
+        i = bisect_left(self._initials, query)
+        while i < len(self._initials) and self._initials[i].startswith(query):
+            key = self._initials[i].partition(_SEP)[2]
+            if query not in key:
+                found.append(key)
+            i += 1
+        return sorted(found)
+
+    def search(self, query: str) -> Iterator[str]:
+        """
+        Yield matching symbol names in rank order.
+
+        Tiers: exact (case-insensitive), prefix, substring, initials.
+        Later tiers are only computed if the caller keeps iterating.
+        """
+        self._flush()
+        query = query.lower()
+
+        def spellings(key: str) -> List[str]:
+            return sorted(self._by_lower.get(key, ()))
+
+        if query in self._by_lower:
+            yield from spellings(query)
+
+        for key in self._prefix_keys(query):
+            if key != query:
+                yield from spellings(key)
+
+        for key in self._substring_keys(query):
+            yield from spellings(key)
+
+        for key in self._initials_keys(query):
+            yield from spellings(key)
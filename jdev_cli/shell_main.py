@@ -307,7 +307,7 @@ class InteractiveShell:
         if self._indexer is None:
             SemanticIndexer = _get_semantic_indexer()
             self._indexer = SemanticIndexer(root_path=os.getcwd())
-            self._indexer.load_cache()
+            self._indexer.load_cache(lazy=True)
             self.console.print("[dim]📚 Loaded semantic index[/dim]")
         return self._indexer
 
@@ -29,15 +29,21 @@ from .process import (
     run_command,
     run_shell,
     run_many,
+    stream_command,
     ProcessResult,
+    ProcessStream,
+    OutputLine,
 )
 
 from .http import (
     HttpClient,
     HttpResponse,
+    HttpStream,
     HttpError,
     get,
     post,
+    get_client,
+    close_clients,
     HTTP_CLIENT,
 )
 
@@ -69,13 +75,19 @@ __all__ = [
     'run_command',
     'run_shell',
     'run_many',
+    'stream_command',
     'ProcessResult',
+    'ProcessStream',
+    'OutputLine',
     # HTTP
     'HttpClient',
     'HttpResponse',
+    'HttpStream',
     'HttpError',
     'get',
     'post',
+    'get_client',
+    'close_clients',
     'HTTP_CLIENT',
     # Utils
     'run_sync',
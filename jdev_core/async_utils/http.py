@@ -6,13 +6,25 @@ SCALE & SUSTAIN Phase 3.1 - Async Everywhere.
 Async HTTP client using httpx with connection pooling.
 Falls back to aiohttp or requests in thread pool if httpx not available.
 
+Clients keep connections alive (HTTP/2 when the h2 package is
+installed), limit concurrent requests per host, share one request among
+identical in-flight GETs and revalidate cached GET responses with
+ETag/Last-Modified. get_client() hands out one pooled client per base
+URL for the running event loop; the module-level helpers use it.
+
 Author: JuanCS Dev
 Date: 2025-11-26
 """
 
 import asyncio
+import contextlib
+import dataclasses
+import time
+import weakref
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import Any, Dict, Optional, Union
+from typing import Any, AsyncIterator, Callable, Dict, Optional, Tuple, Union
+from urllib.parse import urlsplit
 
 # Try to import httpx (preferred), fallback options
 try:
@@ -27,6 +39,21 @@ except ImportError:
         aiohttp = None
         HTTP_CLIENT = 'requests'
 
+try:
+    import h2  # noqa: F401  (enables HTTP/2 in httpx)
+    H2_AVAILABLE = True
+except ImportError:
+    H2_AVAILABLE = False
+
+
+def _header(headers: Dict[str, str], name: str) -> Optional[str]:
+    """Case-insensitive header lookup."""
+    name = name.lower()
+    for key, value in headers.items():
+        if key.lower() == name:
+            return value
+    return None
+
 
 @dataclass
 class HttpResponse:
@@ -37,6 +64,7 @@ class HttpResponse:
     content: bytes
     url: str
     elapsed_ms: float = 0.0
+    from_cache: bool = False  # Served from cache after a 304 revalidation
 
     @property
     def text(self) -> str:
@@ -63,6 +91,47 @@ class HttpResponse:
             )
 
 
+@dataclass
+class HttpStream:
+    """
+    HTTP response whose body is read incrementally.
+
+    Usage:
+        async with client.stream('GET', '/large.bin') as response:
+            response.raise_for_status()
+            async for chunk in response.aiter_bytes():
+                sink.write(chunk)
+    """
+
+    status_code: int
+    headers: Dict[str, str]
+    url: str
+    _chunks: Callable[[int], AsyncIterator[bytes]] = field(repr=False)
+
+    @property
+    def ok(self) -> bool:
+        """Check if request succeeded (2xx status)."""
+        return 200 <= self.status_code < 300
+
+    async def aiter_bytes(self, chunk_size: int = 65536) -> AsyncIterator[bytes]:
+        """Iterate over the body in chunks of up to chunk_size bytes."""
+        async for chunk in self._chunks(chunk_size):
+            if chunk:
+                yield chunk
+
+    async def read(self) -> bytes:
+        """Read the rest of the body into memory."""
+        return b''.join([chunk async for chunk in self.aiter_bytes()])
+
+    def raise_for_status(self) -> None:
+        """Raise exception for 4xx/5xx status codes."""
+        if not self.ok:
+            raise HttpError(
+                f"HTTP {self.status_code} for {self.url}",
+                status_code=self.status_code
+            )
+
+
 class HttpError(Exception):
     """HTTP request error."""
 
@@ -82,6 +151,9 @@ class HttpClient:
     """
     Async HTTP client with connection pooling.
 
+    The underlying client is created on first use, so a client held for
+    the life of the process keeps its connections alive between calls.
+
     Usage:
         async with HttpClient() as client:
             response = await client.get('https://api.example.com/data')
@@ -92,7 +164,14 @@ class HttpClient:
     headers: Dict[str, str] = field(default_factory=dict)
     timeout: float = 30.0
     max_connections: int = 100
+    max_connections_per_host: int = 20  # 0 = only max_connections applies
+    http2: bool = True  # Used when the h2 package is installed (httpx only)
+    dedupe_gets: bool = True  # Identical concurrent GETs share one request
+    cache_size: int = 256  # GET responses kept for ETag/Last-Modified revalidation
     _client: Any = field(default=None, repr=False)
+    _host_limits: Dict[str, asyncio.Semaphore] = field(default_factory=dict, repr=False)
+    _inflight: Dict[Tuple, asyncio.Future] = field(default_factory=dict, repr=False)
+    _cache: 'OrderedDict[Tuple, HttpResponse]' = field(default_factory=OrderedDict, repr=False)
 
     async def __aenter__(self) -> 'HttpClient':
         """Enter async context."""
@@ -105,15 +184,24 @@ class HttpClient:
 
     async def _init_client(self) -> None:
         """Initialize the underlying HTTP client."""
+        if self._client is not None:
+            return
         if HTTP_CLIENT == 'httpx' and httpx:
             self._client = httpx.AsyncClient(
                 base_url=self.base_url,
                 headers=self.headers,
                 timeout=self.timeout,
-                limits=httpx.Limits(max_connections=self.max_connections)
+                http2=self.http2 and H2_AVAILABLE,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections
+                )
             )
         elif HTTP_CLIENT == 'aiohttp' and aiohttp:
-            connector = aiohttp.TCPConnector(limit=self.max_connections)
+            connector = aiohttp.TCPConnector(
+                limit=self.max_connections,
+                limit_per_host=self.max_connections_per_host
+            )
             timeout_obj = aiohttp.ClientTimeout(total=self.timeout)
             self._client = aiohttp.ClientSession(
                 base_url=self.base_url if self.base_url else None,
@@ -121,6 +209,16 @@ class HttpClient:
                 connector=connector,
                 timeout=timeout_obj
             )
+        else:
+            # A Session keeps connections alive across calls
+            import requests as req
+            from requests.adapters import HTTPAdapter
+
+            session = req.Session()
+            adapter = HTTPAdapter(pool_maxsize=self.max_connections)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            self._client = session
 
     async def close(self) -> None:
         """Close the client and release connections."""
@@ -129,7 +227,26 @@ class HttpClient:
                 await self._client.aclose()
             elif HTTP_CLIENT == 'aiohttp':
                 await self._client.close()
+            else:
+                self._client.close()
             self._client = None
+        self._cache.clear()
+
+    def _full_url(self, url: str) -> str:
+        """Resolve url against base_url."""
+        if self.base_url and not url.startswith(('http://', 'https://')):
+            return f"{self.base_url}{url}"
+        return url
+
+    def _host_limit(self, url: str) -> Any:
+        """Async context manager holding a per-host request slot."""
+        if self.max_connections_per_host <= 0:
+            return contextlib.nullcontext()
+        host = urlsplit(self._full_url(url)).netloc
+        limit = self._host_limits.get(host)
+        if limit is None:
+            limit = self._host_limits[host] = asyncio.Semaphore(self.max_connections_per_host)
+        return limit
 
     async def request(
         self,
@@ -156,77 +273,232 @@ class HttpClient:
         Returns:
             HttpResponse object
         """
-        import time
-        start = time.monotonic()
+        await self._init_client()
+        merged_headers = {**self.headers, **(headers or {})}
 
+        if method.upper() != 'GET' or json is not None or data is not None:
+            return await self._send(method, url, merged_headers, params, json, data, timeout)
+
+        key = (
+            self._full_url(url),
+            tuple(sorted((params or {}).items())),
+            tuple(sorted(merged_headers.items())),
+        )
+        if not self.dedupe_gets:
+            return await self._get(key, url, merged_headers, params, timeout)
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._get(key, url, merged_headers, params, timeout))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shielded so one caller giving up does not fail the others
+        return await asyncio.shield(task)
+
+    async def _get(
+        self,
+        key: Tuple,
+        url: str,
+        headers: Dict[str, str],
+        params: Optional[Dict[str, str]],
+        timeout: Optional[float]
+    ) -> HttpResponse:
+        """GET, revalidating a cached response if there is one."""
+        cached = self._cache.get(key) if self.cache_size > 0 else None
+        if cached is not None:
+            headers = dict(headers)
+            etag = _header(cached.headers, 'ETag')
+            last_modified = _header(cached.headers, 'Last-Modified')
+            if etag:
+                headers.setdefault('If-None-Match', etag)
+            if last_modified:
+                headers.setdefault('If-Modified-Since', last_modified)
+
+        response = await self._send('GET', url, headers, params, None, None, timeout)
+
+        if cached is not None and response.status_code == 304:
+            self._cache.move_to_end(key)
+            return dataclasses.replace(cached, elapsed_ms=response.elapsed_ms, from_cache=True)
+
+        if (
+            self.cache_size > 0
+            and response.status_code == 200
+            and (_header(response.headers, 'ETag') or _header(response.headers, 'Last-Modified'))
+            and 'no-store' not in (_header(response.headers, 'Cache-Control') or '')
+        ):
+            self._cache[key] = response
+            self._cache.move_to_end(key)
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return response
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        params: Optional[Dict[str, str]],
+        json: Optional[Any],
+        data: Optional[Union[bytes, str, Dict]],
+        timeout: Optional[float]
+    ) -> HttpResponse:
+        """Send one request over the pooled client."""
         timeout = timeout or self.timeout
-        merged_headers = {**self.headers, **(headers or {})}
 
-        if HTTP_CLIENT == 'httpx' and self._client:
-            response = await self._client.request(
-                method,
-                url,
-                headers=merged_headers,
-                params=params,
-                json=json,
-                data=data,
-                timeout=timeout
-            )
-            elapsed_ms = (time.monotonic() - start) * 1000
-            return HttpResponse(
-                status_code=response.status_code,
-                headers=dict(response.headers),
-                content=response.content,
-                url=str(response.url),
-                elapsed_ms=elapsed_ms
-            )
+        async with self._host_limit(url):
+            start = time.monotonic()
 
-        elif HTTP_CLIENT == 'aiohttp' and self._client:
-            full_url = f"{self.base_url}{url}" if self.base_url and not url.startswith('http') else url
-            async with self._client.request(
-                method,
-                full_url,
-                headers=merged_headers,
-                params=params,
-                json=json,
-                data=data
-            ) as response:
-                content = await response.read()
+            if HTTP_CLIENT == 'httpx':
+                response = await self._client.request(
+                    method,
+                    url,
+                    headers=headers,
+                    params=params,
+                    json=json,
+                    data=data,
+                    timeout=timeout
+                )
                 elapsed_ms = (time.monotonic() - start) * 1000
                 return HttpResponse(
-                    status_code=response.status,
+                    status_code=response.status_code,
                     headers=dict(response.headers),
-                    content=content,
+                    content=response.content,
                     url=str(response.url),
                     elapsed_ms=elapsed_ms
                 )
 
-        else:
-            # Fallback to requests in thread pool
-            import requests as req
-            loop = asyncio.get_event_loop()
+            elif HTTP_CLIENT == 'aiohttp':
+                async with self._client.request(
+                    method,
+                    self._full_url(url),
+                    headers=headers,
+                    params=params,
+                    json=json,
+                    data=data
+                ) as response:
+                    content = await response.read()
+                    elapsed_ms = (time.monotonic() - start) * 1000
+                    return HttpResponse(
+                        status_code=response.status,
+                        headers=dict(response.headers),
+                        content=content,
+                        url=str(response.url),
+                        elapsed_ms=elapsed_ms
+                    )
+
+            else:
+                # Fallback to requests in thread pool
+                loop = asyncio.get_event_loop()
+
+                def sync_request():
+                    return self._client.request(
+                        method,
+                        self._full_url(url),
+                        headers=headers,
+                        params=params,
+                        json=json,
+                        data=data,
+                        timeout=timeout
+                    )
+
+                response = await loop.run_in_executor(None, sync_request)
+                elapsed_ms = (time.monotonic() - start) * 1000
+                return HttpResponse(
+                    status_code=response.status_code,
+                    headers=dict(response.headers),
+                    content=response.content,
+                    url=response.url,
+                    elapsed_ms=elapsed_ms
+                )
 
-            def sync_request():
-                full_url = f"{self.base_url}{url}" if self.base_url else url
-                return req.request(
+    @contextlib.asynccontextmanager
+    async def stream(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, str]] = None,
+        json: Optional[Any] = None,
+        data: Optional[Union[bytes, str, Dict]] = None,
+        timeout: Optional[float] = None
+    ) -> AsyncIterator[HttpStream]:
+        """
+        Make an HTTP request and stream the response body.
+
+        The connection and per-host slot are held until the block exits.
+        Streamed requests bypass GET deduplication and the response cache.
+
+        Yields:
+            HttpStream whose body is read with aiter_bytes()
+        """
+        await self._init_client()
+        timeout = timeout or self.timeout
+        merged_headers = {**self.headers, **(headers or {})}
+
+        async with self._host_limit(url):
+            if HTTP_CLIENT == 'httpx':
+                async with self._client.stream(
                     method,
-                    full_url,
+                    url,
                     headers=merged_headers,
                     params=params,
                     json=json,
                     data=data,
                     timeout=timeout
-                )
+                ) as response:
+                    yield HttpStream(
+                        status_code=response.status_code,
+                        headers=dict(response.headers),
+                        url=str(response.url),
+                        _chunks=response.aiter_bytes
+                    )
 
-            response = await loop.run_in_executor(None, sync_request)
-            elapsed_ms = (time.monotonic() - start) * 1000
-            return HttpResponse(
-                status_code=response.status_code,
-                headers=dict(response.headers),
-                content=response.content,
-                url=response.url,
-                elapsed_ms=elapsed_ms
-            )
+            elif HTTP_CLIENT == 'aiohttp':
+                async with self._client.request(
+                    method,
+                    self._full_url(url),
+                    headers=merged_headers,
+                    params=params,
+                    json=json,
+                    data=data
+                ) as response:
+                    yield HttpStream(
+                        status_code=response.status,
+                        headers=dict(response.headers),
+                        url=str(response.url),
+                        _chunks=response.content.iter_chunked
+                    )
+
+            else:
+                loop = asyncio.get_event_loop()
+                response = await loop.run_in_executor(None, lambda: self._client.request(
+                    method,
+                    self._full_url(url),
+                    headers=merged_headers,
+                    params=params,
+                    json=json,
+                    data=data,
+                    timeout=timeout,
+                    stream=True
+                ))
+
+                async def chunks(chunk_size: int) -> AsyncIterator[bytes]:
+                    iterator = response.iter_content(chunk_size)
+                    while True:
+                        chunk = await loop.run_in_executor(None, next, iterator, None)
+                        if chunk is None:
+                            return
+                        yield chunk
+
+                try:
+                    yield HttpStream(
+                        status_code=response.status_code,
+                        headers=dict(response.headers),
+                        url=response.url,
+                        _chunks=chunks
+                    )
+                finally:
+                    response.close()
 
     async def get(
         self,
@@ -281,7 +553,37 @@ class HttpClient:
         return await self.request('PATCH', url, headers=headers, json=json, data=data, timeout=timeout)
 
 
-# Convenience functions for one-off requests
+# Pooled clients per event loop (connections cannot cross loops), by base URL
+_shared_clients: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, HttpClient]]' = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_client(base_url: str = '', **kwargs: Any) -> HttpClient:
+    """
+    Get the shared pooled client for base_url on the running event loop.
+
+    Args:
+        base_url: Base URL the client resolves relative URLs against
+        **kwargs: HttpClient options, applied only when the client is created
+
+    Returns:
+        HttpClient reused by every caller on this loop
+    """
+    clients = _shared_clients.setdefault(asyncio.get_running_loop(), {})
+    client = clients.get(base_url)
+    if client is None:
+        client = clients[base_url] = HttpClient(base_url=base_url, **kwargs)
+    return client
+
+
+async def close_clients() -> None:
+    """Close the shared clients of the running event loop."""
+    clients = _shared_clients.pop(asyncio.get_running_loop(), {})
+    await asyncio.gather(*(client.close() for client in clients.values()))
+
+
+# Convenience functions for one-off requests, over the shared client
 async def get(
     url: str,
     headers: Optional[Dict[str, str]] = None,
@@ -289,8 +591,7 @@ async def get(
     timeout: float = 30.0
 ) -> HttpResponse:
     """Make a GET request."""
-    async with HttpClient(timeout=timeout) as client:
-        return await client.get(url, headers=headers, params=params)
+    return await get_client().get(url, headers=headers, params=params, timeout=timeout)
 
 
 async def post(
@@ -301,15 +602,18 @@ async def post(
     timeout: float = 30.0
 ) -> HttpResponse:
     """Make a POST request."""
-    async with HttpClient(timeout=timeout) as client:
-        return await client.post(url, headers=headers, json=json, data=data)
+    return await get_client().post(url, headers=headers, json=json, data=data, timeout=timeout)
 
 
 __all__ = [
     'HttpClient',
     'HttpResponse',
+    'HttpStream',
     'HttpError',
     'get',
     'post',
+    'get_client',
+    'close_clients',
     'HTTP_CLIENT',
+    'H2_AVAILABLE',
 ]
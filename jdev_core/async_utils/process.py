@@ -10,9 +10,22 @@ Date: 2025-11-26
 """
 
 import asyncio
+import os
 import shlex
+import signal
+from collections import deque
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Union
+from typing import (
+    Any, AsyncIterator, Callable, Deque, Dict, List, Optional, Sequence, Union,
+)
+
+DEFAULT_MAX_OUTPUT_LINES = 10000  # Retained per stream; older lines are dropped
+READ_CHUNK_SIZE = 65536
+MAX_LINE_LENGTH = 65536  # Longer lines are split
+LINE_QUEUE_SIZE = 1024  # Lines buffered ahead of a slow consumer
+
+# Each child leads its own process group so cleanup reaches grandchildren
+_NEW_SESSION = hasattr(os, 'killpg')
 
 
 @dataclass
@@ -23,6 +36,7 @@ class ProcessResult:
     stdout: str
     stderr: str
     command: str
+    dropped_lines: int = 0  # Output lines that did not fit the retained buffer
 
     @property
     def success(self) -> bool:
@@ -40,13 +54,234 @@ class ProcessResult:
         return '\n'.join(parts)
 
 
+@dataclass
+class OutputLine:
+    """One line of process output."""
+
+    stream: str  # 'stdout' or 'stderr'
+    text: str
+
+
+class ProcessStream:
+    """
+    A running process whose output is consumed as it arrives.
+
+    Only the last max_lines lines of each stream are retained for the
+    final ProcessResult, so memory stays flat however much the process
+    writes. Leaving the context early, timing out or being cancelled
+    kills the process's whole process group.
+
+    Usage:
+        async with ProcessStream("pytest -x") as proc:
+            async for line in proc:
+                print(line.stream, line.text)
+            result = await proc.wait()
+    """
+
+    def __init__(
+        self,
+        command: Union[str, List[str]],
+        cwd: Optional[str] = None,
+        env: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+        shell: bool = False,
+        capture_output: bool = True,
+        max_lines: Optional[int] = DEFAULT_MAX_OUTPUT_LINES
+    ):
+        """
+        Prepare a process; it starts when the context is entered.
+
+        Args:
+            command: Command string or list of arguments
+            cwd: Working directory
+            env: Environment variables
+            timeout: Timeout in seconds for the whole run
+            shell: Run through shell
+            capture_output: Capture stdout/stderr
+            max_lines: Lines retained per stream (None keeps everything)
+        """
+        if isinstance(command, str) and not shell:
+            self._args = shlex.split(command)
+        elif isinstance(command, list):
+            self._args = command
+            command = ' '.join(command)
+        else:
+            self._args = command
+        self.command = command if isinstance(command, str) else ' '.join(self._args)
+
+        self._cwd = cwd
+        self._env = env
+        self._timeout = timeout
+        self._shell = shell
+        self._capture = capture_output
+        self._retained: Dict[str, Deque[str]] = {
+            'stdout': deque(maxlen=max_lines),
+            'stderr': deque(maxlen=max_lines),
+        }
+        self._line_count = 0
+        self._process: Optional[asyncio.subprocess.Process] = None
+        self._reader: Optional[asyncio.Task] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._timed_out = False
+
+    @property
+    def pid(self) -> Optional[int]:
+        """Process id once started."""
+        return self._process.pid if self._process else None
+
+    async def __aenter__(self) -> 'ProcessStream':
+        pipe = asyncio.subprocess.PIPE if self._capture else None
+        kwargs = dict(stdout=pipe, stderr=pipe, cwd=self._cwd, env=self._env,
+                      start_new_session=_NEW_SESSION)
+        if self._shell:
+            self._process = await asyncio.create_subprocess_shell(self.command, **kwargs)
+        else:
+            self._process = await asyncio.create_subprocess_exec(*self._args, **kwargs)
+
+        if self._timeout is not None:
+            self._timer = asyncio.get_running_loop().call_later(
+                self._timeout, self._on_timeout
+            )
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        if self._timer:
+            self._timer.cancel()
+        if self._process.returncode is None:
+            self._kill()
+        if self._reader and not self._reader.done():
+            self._reader.cancel()
+            await asyncio.gather(self._reader, return_exceptions=True)
+        await self._process.wait()
+
+    async def __aiter__(self) -> AsyncIterator[OutputLine]:
+        """Yield output lines from both streams in arrival order.
+
+        Yields nothing when output is not captured.
+        """
+        if self._reader is not None:
+            raise RuntimeError("Process output is already being read")
+        if not self._capture:
+            return
+        self._queue = queue = asyncio.Queue(maxsize=LINE_QUEUE_SIZE)
+        self._start_reader()
+        while True:
+            line = await queue.get()
+            if line is None:
+                return
+            yield line
+
+    async def wait(self) -> ProcessResult:
+        """Read the remaining output and wait for the process to exit."""
+        self._start_reader()
+        queue, self._queue = self._queue, None
+        while queue is not None and not queue.empty():
+            queue.get_nowait()  # Unblock a reader stuck on a full queue
+
+        if self._reader:
+            await self._reader
+        returncode = await self._process.wait()
+
+        stdout = '\n'.join(self._retained['stdout']).strip()
+        stderr = '\n'.join(self._retained['stderr']).strip()
+        if self._timed_out:
+            returncode = -1
+            message = f'Process timed out after {self._timeout} seconds'
+            stderr = f'{stderr}\n{message}' if stderr else message
+        retained = len(self._retained['stdout']) + len(self._retained['stderr'])
+        return ProcessResult(
+            returncode=returncode,
+            stdout=stdout,
+            stderr=stderr,
+            command=self.command,
+            dropped_lines=self._line_count - retained
+        )
+
+    def _start_reader(self) -> None:
+        if self._reader is None and self._capture:
+            self._reader = asyncio.create_task(self._read_output())
+
+    async def _read_output(self) -> None:
+        await asyncio.gather(
+            self._pump(self._process.stdout, 'stdout'),
+            self._pump(self._process.stderr, 'stderr'),
+        )
+        if self._queue is not None:
+            await self._queue.put(None)
+
+    async def _pump(self, reader: asyncio.StreamReader, name: str) -> None:
+        """Split a pipe into lines without buffering more than one line."""
+        partial = b''
+        while True:
+            chunk = await reader.read(READ_CHUNK_SIZE)
+            if not chunk:
+                break
+            *lines, partial = (partial + chunk).split(b'\n')
+            if len(partial) > MAX_LINE_LENGTH:
+                lines.append(partial)
+                partial = b''
+            if lines:
+                await self._emit(name, lines)
+        if partial:
+            await self._emit(name, [partial])
+
+    async def _emit(self, name: str, lines: List[bytes]) -> None:
+        self._line_count += len(lines)
+        retained = self._retained[name]
+        if self._queue is None and retained.maxlen is not None:
+            lines = lines[-retained.maxlen:]  # Skip decoding what would be dropped
+
+        for raw in lines:
+            text = raw.decode('utf-8', errors='replace').rstrip('\r')
+            retained.append(text)
+            if self._queue is not None:
+                await self._queue.put(OutputLine(name, text))
+
+    def _on_timeout(self) -> None:
+        if self._process.returncode is None:
+            self._timed_out = True
+            self._kill()
+
+    def _kill(self) -> None:
+        """Kill the process and everything in its process group."""
+        try:
+            if _NEW_SESSION:
+                os.killpg(self._process.pid, signal.SIGKILL)
+            else:
+                self._process.kill()
+        except ProcessLookupError:
+            pass
+
+
+def stream_command(
+    command: Union[str, List[str]],
+    cwd: Optional[str] = None,
+    env: Optional[Dict[str, str]] = None,
+    timeout: Optional[float] = None,
+    shell: bool = False,
+    max_lines: Optional[int] = DEFAULT_MAX_OUTPUT_LINES
+) -> ProcessStream:
+    """
+    Run a command, consuming its output line by line.
+
+    Returns:
+        ProcessStream to use as an async context manager and iterator
+    """
+    return ProcessStream(
+        command, cwd=cwd, env=env, timeout=timeout, shell=shell, max_lines=max_lines
+    )
+
+
 async def run_command(
     command: Union[str, List[str]],
     cwd: Optional[str] = None,
     env: Optional[Dict[str, str]] = None,
     timeout: Optional[float] = None,
     shell: bool = False,
-    capture_output: bool = True
+    capture_output: bool = True,
+    on_output: Optional[Callable[[OutputLine], Any]] = None,
+    max_output_lines: Optional[int] = DEFAULT_MAX_OUTPUT_LINES
 ) -> ProcessResult:
     """
     Run a command asynchronously.
@@ -58,59 +293,27 @@ async def run_command(
         timeout: Timeout in seconds
         shell: Run through shell
         capture_output: Capture stdout/stderr
+        on_output: Called (or awaited) with each output line as it arrives
+        max_output_lines: Lines retained per stream (None keeps everything)
 
     Returns:
         ProcessResult with output and return code
     """
-    if isinstance(command, str) and not shell:
-        args = shlex.split(command)
-    elif isinstance(command, list):
-        args = command
-        command = ' '.join(command)
-    else:
-        args = command
-
-    if shell:
-        process = await asyncio.create_subprocess_shell(
-            command if isinstance(command, str) else ' '.join(args),
-            stdout=asyncio.subprocess.PIPE if capture_output else None,
-            stderr=asyncio.subprocess.PIPE if capture_output else None,
-            cwd=cwd,
-            env=env
-        )
-    else:
-        process = await asyncio.create_subprocess_exec(
-            *args,
-            stdout=asyncio.subprocess.PIPE if capture_output else None,
-            stderr=asyncio.subprocess.PIPE if capture_output else None,
-            cwd=cwd,
-            env=env
-        )
-
-    try:
-        stdout_bytes, stderr_bytes = await asyncio.wait_for(
-            process.communicate(),
-            timeout=timeout
-        )
-    except asyncio.TimeoutError:
-        process.kill()
-        await process.wait()
-        return ProcessResult(
-            returncode=-1,
-            stdout='',
-            stderr=f'Process timed out after {timeout} seconds',
-            command=command if isinstance(command, str) else ' '.join(args)
-        )
-
-    stdout = stdout_bytes.decode('utf-8', errors='replace') if stdout_bytes else ''
-    stderr = stderr_bytes.decode('utf-8', errors='replace') if stderr_bytes else ''
-
-    return ProcessResult(
-        returncode=process.returncode or 0,
-        stdout=stdout.strip(),
-        stderr=stderr.strip(),
-        command=command if isinstance(command, str) else ' '.join(args)
-    )
+    async with ProcessStream(
+        command,
+        cwd=cwd,
+        env=env,
+        timeout=timeout,
+        shell=shell,
+        capture_output=capture_output,
+        max_lines=max_output_lines
+    ) as proc:
+        if on_output is not None and capture_output:
+            async for line in proc:
+                outcome = on_output(line)
+                if asyncio.iscoroutine(outcome):
+                    await outcome
+        return await proc.wait()
 
 
 async def run_shell(
@@ -140,45 +343,98 @@ async def run_shell(
     )
 
 
+def cpu_count() -> int:
+    """CPUs this process may run on."""
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0)) or 1
+    return os.cpu_count() or 1
+
+
 async def run_many(
     commands: List[Union[str, List[str]]],
     cwd: Optional[str] = None,
     env: Optional[Dict[str, str]] = None,
     timeout: Optional[float] = None,
-    fail_fast: bool = False
+    fail_fast: bool = False,
+    max_concurrency: Optional[int] = None,
+    priorities: Optional[Sequence[int]] = None,
+    max_output_lines: Optional[int] = DEFAULT_MAX_OUTPUT_LINES
 ) -> List[ProcessResult]:
     """
     Run multiple commands concurrently.
 
+    At most max_concurrency commands run at once. Higher-priority
+    commands start first; ties start in list order. Results are
+    returned in list order.
+
     Args:
         commands: List of commands to run
         cwd: Working directory for all commands
         env: Environment variables
         timeout: Timeout per command
-        fail_fast: Stop on first failure
+        fail_fast: Stop on first failure: later commands are killed or
+            never started, and results end at the first failed command
+        max_concurrency: Commands running at once (default: CPU count, or
+            1 with fail_fast so nothing runs past a failure)
+        priorities: One priority per command (default: all equal)
+        max_output_lines: Lines retained per stream of each command
 
     Returns:
         List of ProcessResults
     """
-    if fail_fast:
-        results = []
-        for cmd in commands:
-            result = await run_command(cmd, cwd=cwd, env=env, timeout=timeout)
-            results.append(result)
-            if not result.success:
+    if max_concurrency is None:
+        max_concurrency = 1 if fail_fast else cpu_count()
+    limit = max(1, max_concurrency)
+    pending = deque(sorted(
+        range(len(commands)),
+        key=lambda i: (-priorities[i] if priorities else 0, i)
+    ))
+    results: List[Optional[ProcessResult]] = [None] * len(commands)
+    cutoff = len(commands)  # With fail_fast: index of the first failure
+    running: Dict[asyncio.Task, int] = {}
+    abandoned: List[asyncio.Task] = []
+
+    try:
+        while pending or running:
+            while pending and len(running) < limit:
+                index = pending.popleft()
+                if index < cutoff:
+                    task = asyncio.create_task(run_command(
+                        commands[index], cwd=cwd, env=env, timeout=timeout,
+                        max_output_lines=max_output_lines
+                    ))
+                    running[task] = index
+            if not running:
                 break
-        return results
-    else:
-        tasks = [
-            run_command(cmd, cwd=cwd, env=env, timeout=timeout)
-            for cmd in commands
-        ]
-        return await asyncio.gather(*tasks)
+
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                index = running.pop(task)
+                results[index] = task.result()
+                if fail_fast and not results[index].success and index < cutoff:
+                    cutoff = index
+                    for other, other_index in list(running.items()):
+                        if other_index > cutoff:
+                            other.cancel()  # Kills its process group
+                            del running[other]
+                            abandoned.append(other)
+    finally:
+        for task in running:
+            task.cancel()
+        await asyncio.gather(*running, *abandoned, return_exceptions=True)
+
+    if fail_fast:
+        return results[:cutoff + 1]
+    return results
 
 
 __all__ = [
     'ProcessResult',
+    'ProcessStream',
+    'OutputLine',
     'run_command',
     'run_shell',
     'run_many',
+    'stream_command',
+    'cpu_count',
 ]
@@ -11,11 +11,19 @@ Date: 2025-11-26
 
 import asyncio
 import time
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Callable, Generic, Optional, TypeVar
+from typing import Any, Callable, Coroutine, Deque, Generic, Optional, TypeVar
 
 T = TypeVar('T')
 
+ACQUIRE_SAMPLE_SIZE = 1024  # Acquire latencies kept for percentiles
+CLEANUP_INTERVAL = 60.0
+
+# Handed to a waiter instead of a connection: a slot under max_size has
+# been reserved for it and it should open its own connection.
+_SLOT = object()
+
 
 class PoolExhaustedError(Exception):
     """Raised when pool has no available connections."""
@@ -41,22 +49,68 @@ class PoolStats:
     total_connections: int = 0
     available_connections: int = 0
     in_use_connections: int = 0
+    waiting_acquirers: int = 0
     total_acquires: int = 0
     total_releases: int = 0
+    total_waits: int = 0
     total_timeouts: int = 0
     total_errors: int = 0
     avg_acquire_time_ms: float = 0.0
     created_at: float = field(default_factory=time.time)
+    acquire_samples_ms: Deque[float] = field(
+        default_factory=lambda: deque(maxlen=ACQUIRE_SAMPLE_SIZE), repr=False
+    )
 
     @property
     def uptime_seconds(self) -> float:
         return time.time() - self.created_at
 
+    @property
+    def p50_acquire_time_ms(self) -> float:
+        return self.percentile_acquire_time_ms(50)
+
+    @property
+    def p95_acquire_time_ms(self) -> float:
+        return self.percentile_acquire_time_ms(95)
+
+    @property
+    def p99_acquire_time_ms(self) -> float:
+        return self.percentile_acquire_time_ms(99)
+
+    def record_acquire(self, elapsed_ms: float) -> None:
+        """Count an acquire and add its latency to the average and samples."""
+        self.total_acquires += 1
+        self.avg_acquire_time_ms += (
+            (elapsed_ms - self.avg_acquire_time_ms) / self.total_acquires
+        )
+        self.acquire_samples_ms.append(elapsed_ms)
+
+    def percentile_acquire_time_ms(self, percentile: float) -> float:
+        """
+        Acquire latency percentile over the last ACQUIRE_SAMPLE_SIZE acquires.
+
+        Args:
+            percentile: Percentile to calculate (0-100)
+        """
+        if not self.acquire_samples_ms:
+            return 0.0
+        samples = sorted(self.acquire_samples_ms)
+        index = int(len(samples) * (percentile / 100))
+        return samples[min(index, len(samples) - 1)]
+
 
 class ConnectionPool(Generic[T]):
     """
     Generic async connection pool.
 
+    No lock is held across an await: slots under max_size are reserved
+    synchronously, and connecting, validating and closing all run outside
+    any critical section. Idle connections are reused LIFO so hot
+    connections stay hot and cold ones age out through max_idle_time.
+    When the pool is at max_size, acquirers queue FIFO, each with its own
+    deadline; a released connection (or freed slot) goes straight to the
+    oldest waiter, so later callers cannot barge in ahead of it.
+
     Usage:
         pool = ConnectionPool(
             factory=create_connection,
@@ -66,7 +120,7 @@ class ConnectionPool(Generic[T]):
         )
         await pool.initialize()
 
-        async with pool.acquire() as conn:
+        async with await pool.acquire() as conn:
             # use connection
             pass
 
@@ -94,33 +148,77 @@ class ConnectionPool(Generic[T]):
         self._closer = closer or (lambda c: None)
         self._config = config or PoolConfig()
 
-        self._available: asyncio.Queue[tuple[T, float]] = asyncio.Queue()
+        # Stack of (connection, idle_since); the top is the most recently
+        # released, so the list is also ordered oldest-idle first.
+        self._idle: list[tuple[T, float]] = []
         self._in_use: set[T] = set()
-        self._lock = asyncio.Lock()
+        self._pending = 0  # Slots held by connects/validations in flight
+        self._waiters: Deque[asyncio.Future] = deque()
         self._stats = PoolStats()
         self._closed = False
         self._cleanup_task: Optional[asyncio.Task] = None
+        self._warm_task: Optional[asyncio.Task] = None
+        self._background: set[asyncio.Task] = set()
 
     @property
     def stats(self) -> PoolStats:
         """Get pool statistics."""
-        self._stats.available_connections = self._available.qsize()
+        self._stats.available_connections = len(self._idle)
         self._stats.in_use_connections = len(self._in_use)
         self._stats.total_connections = (
             self._stats.available_connections + self._stats.in_use_connections
         )
+        self._stats.waiting_acquirers = sum(not w.done() for w in self._waiters)
         return self._stats
 
+    @property
+    def _size(self) -> int:
+        """Connections open or being opened, counted against max_size."""
+        return len(self._idle) + len(self._in_use) + self._pending
+
     async def initialize(self) -> None:
         """Initialize pool with minimum connections."""
-        for _ in range(self._config.min_size):
-            conn = await self._create_connection()
-            if conn:
-                await self._available.put((conn, time.time()))
+        await self._warm_up()
 
         # Start cleanup task
         self._cleanup_task = asyncio.create_task(self._cleanup_loop())
 
+    async def _warm_up(self) -> None:
+        """Open connections concurrently until the pool holds min_size."""
+        missing = self._config.min_size - self._size
+        if missing <= 0 or self._closed:
+            return
+
+        self._pending += missing
+        try:
+            conns = await asyncio.gather(
+                *(self._create_connection() for _ in range(missing))
+            )
+        finally:
+            self._pending -= missing
+
+        for conn in conns:
+            if conn is None:
+                continue
+            if self._closed:
+                await self._close_connection(conn)
+            else:
+                self._check_in(conn)
+        self._on_capacity_freed(warm_up=False)
+
+    def _schedule_warm_up(self) -> None:
+        """Top the pool back up to min_size in the background."""
+        if self._closed or self._size >= self._config.min_size:
+            return
+        if self._warm_task is None or self._warm_task.done():
+            self._warm_task = self._spawn(self._warm_up())
+
+    def _spawn(self, coro: Coroutine[Any, Any, None]) -> asyncio.Task:
+        task = asyncio.create_task(coro)
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+        return task
+
     async def _create_connection(self) -> Optional[T]:
         """Create a new connection."""
         try:
@@ -156,120 +254,194 @@ class ConnectionPool(Generic[T]):
         except Exception:
             pass
 
-    async def acquire(self) -> 'PooledConnection[T]':
+    async def _close_all(self, conns: list[T]) -> None:
+        await asyncio.gather(*(self._close_connection(conn) for conn in conns))
+
+    async def acquire(self, timeout: Optional[float] = None) -> 'PooledConnection[T]':
         """
         Acquire a connection from the pool.
 
+        Args:
+            timeout: Seconds to wait for a connection (default: acquire_timeout)
+
         Returns:
             PooledConnection context manager
 
         Raises:
-            PoolExhaustedError: If no connection available within timeout
+            PoolExhaustedError: If no connection available within timeout,
+                or a new connection could not be created
         """
         if self._closed:
             raise PoolExhaustedError("Pool is closed")
 
-        start_time = time.time()
-
-        async with self._lock:
-            # Try to get from available pool
-            while not self._available.empty():
-                conn, created_at = await self._available.get()
-
-                # Check if connection is stale
-                if time.time() - created_at > self._config.max_idle_time:
-                    await self._close_connection(conn)
-                    continue
-
-                # Validate if required
-                if self._config.validate_on_acquire:
-                    if not await self._validate_connection(conn):
-                        await self._close_connection(conn)
-                        continue
-
-                self._in_use.add(conn)
-                self._stats.total_acquires += 1
-                elapsed = (time.time() - start_time) * 1000
-                self._update_avg_acquire_time(elapsed)
-                return PooledConnection(self, conn)
-
-            # Create new if under max
-            total = self._available.qsize() + len(self._in_use)
-            if total < self._config.max_size:
-                conn = await self._create_connection()
-                if conn:
-                    self._in_use.add(conn)
-                    self._stats.total_acquires += 1
-                    elapsed = (time.time() - start_time) * 1000
-                    self._update_avg_acquire_time(elapsed)
-                    return PooledConnection(self, conn)
-
-        # Wait for available connection
+        if timeout is None:
+            timeout = self._config.acquire_timeout
+        start_time = time.perf_counter()
+        deadline = start_time + timeout
+
+        while True:
+            conn = self._take_idle()
+            if conn is None:
+                if self._size < self._config.max_size:
+                    self._pending += 1
+                    conn = _SLOT
+                else:
+                    conn = await self._wait(deadline, timeout)
+                if conn is _SLOT:
+                    conn = await self._open_reserved()
+                    break
+            if await self._check_out(conn):
+                break
+
+        self._stats.record_acquire((time.perf_counter() - start_time) * 1000)
+        return PooledConnection(self, conn)
+
+    def _take_idle(self) -> Optional[T]:
+        """Pop the most recently released idle connection, if any."""
+        self._evict_stale()
+        if not self._idle:
+            return None
+        conn, _ = self._idle.pop()
+        self._in_use.add(conn)
+        return conn
+
+    async def _wait(self, deadline: float, timeout: float) -> Any:
+        """Queue behind earlier waiters until handed a connection or a slot."""
+        self._stats.total_waits += 1
+        loop = asyncio.get_running_loop()
+        waiter = loop.create_future()
+        timer = loop.call_later(
+            max(deadline - time.perf_counter(), 0), self._expire, waiter
+        )
+        self._waiters.append(waiter)
         try:
-            conn, _ = await asyncio.wait_for(
-                self._available.get(),
-                timeout=self._config.acquire_timeout
-            )
-            async with self._lock:
-                self._in_use.add(conn)
-            self._stats.total_acquires += 1
-            elapsed = (time.time() - start_time) * 1000
-            self._update_avg_acquire_time(elapsed)
-            return PooledConnection(self, conn)
+            return await waiter
         except asyncio.TimeoutError:
             self._stats.total_timeouts += 1
             raise PoolExhaustedError(
-                f"No connection available within {self._config.acquire_timeout}s"
-            )
+                f"No connection available within {timeout}s"
+            ) from None
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Cancelled after the hand-off: pass it on to the next waiter
+                self._give_back(waiter.result())
+            raise
+        finally:
+            timer.cancel()
+
+    @staticmethod
+    def _expire(waiter: asyncio.Future) -> None:
+        if not waiter.done():
+            waiter.set_exception(asyncio.TimeoutError())
+
+    async def _open_reserved(self) -> T:
+        """Open a connection in a slot the caller already reserved."""
+        conn = None
+        try:
+            conn = await self._create_connection()
+        finally:
+            self._pending -= 1
+            if conn is None:
+                self._on_capacity_freed()
 
-    def _update_avg_acquire_time(self, elapsed_ms: float) -> None:
-        """Update average acquire time."""
-        count = self._stats.total_acquires
-        current_avg = self._stats.avg_acquire_time_ms
-        self._stats.avg_acquire_time_ms = (
-            (current_avg * (count - 1) + elapsed_ms) / count
-        )
+        if conn is None:
+            raise PoolExhaustedError("Failed to create connection")
+        if self._closed:
+            await self._close_connection(conn)
+            raise PoolExhaustedError("Pool is closed")
+        self._in_use.add(conn)
+        return conn
+
+    async def _check_out(self, conn: T) -> bool:
+        """Validate a reused connection; close it and free its slot if bad."""
+        if not self._config.validate_on_acquire:
+            return True
+        try:
+            valid = await self._validate_connection(conn)
+        except BaseException:
+            self._give_back(conn)
+            raise
+        if valid:
+            return True
+        self._in_use.discard(conn)
+        self._on_capacity_freed()
+        await self._close_connection(conn)
+        return False
+
+    def _give_back(self, conn: Any) -> None:
+        """Return a connection or reserved slot an acquirer will not use."""
+        if conn is _SLOT:
+            self._pending -= 1
+            self._on_capacity_freed()
+        else:
+            self._in_use.discard(conn)
+            self._check_in(conn)
+
+    def _check_in(self, conn: T) -> None:
+        """Hand a connection to the oldest waiter, else push it on the stack."""
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self._in_use.add(conn)
+                waiter.set_result(conn)
+                return
+        self._idle.append((conn, time.monotonic()))
+
+    def _on_capacity_freed(self, warm_up: bool = True) -> None:
+        """Reserve freed slots for waiters in FIFO order."""
+        while self._waiters and self._size < self._config.max_size:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self._pending += 1
+                waiter.set_result(_SLOT)
+        if warm_up:
+            self._schedule_warm_up()
+
+    def _evict_stale(self) -> None:
+        """Close connections idle longer than max_idle_time in the background."""
+        cutoff = time.monotonic() - self._config.max_idle_time
+        count = 0
+        while count < len(self._idle) and self._idle[count][1] < cutoff:
+            count += 1
+        if not count:
+            return
+
+        stale = [conn for conn, _ in self._idle[:count]]
+        del self._idle[:count]
+        self._spawn(self._close_all(stale))
+        self._on_capacity_freed()
 
     async def release(self, conn: T) -> None:
         """Release a connection back to the pool."""
-        async with self._lock:
-            if conn in self._in_use:
-                self._in_use.remove(conn)
+        if conn not in self._in_use:
+            return
+        self._in_use.remove(conn)
+        self._stats.total_releases += 1
 
-                # Validate before returning to pool
-                if self._config.validate_on_release:
-                    if not await self._validate_connection(conn):
-                        await self._close_connection(conn)
-                        self._stats.total_releases += 1
-                        return
+        if self._closed:
+            await self._close_connection(conn)
+            return
 
-                await self._available.put((conn, time.time()))
-                self._stats.total_releases += 1
+        # Validate before returning to pool
+        if self._config.validate_on_release:
+            self._pending += 1
+            try:
+                valid = await self._validate_connection(conn)
+            finally:
+                self._pending -= 1
+            if not valid or self._closed:
+                self._on_capacity_freed()
+                await self._close_connection(conn)
+                return
+
+        self._check_in(conn)
 
     async def _cleanup_loop(self) -> None:
         """Periodically clean up idle connections."""
         while not self._closed:
-            await asyncio.sleep(60)  # Check every minute
-
-            async with self._lock:
-                # Remove stale connections
-                temp_connections = []
-                while not self._available.empty():
-                    conn, created_at = await self._available.get()
-                    if time.time() - created_at > self._config.max_idle_time:
-                        await self._close_connection(conn)
-                    else:
-                        temp_connections.append((conn, created_at))
-
-                # Keep at least min_size connections
-                while len(temp_connections) < self._config.min_size:
-                    conn = await self._create_connection()
-                    if conn:
-                        temp_connections.append((conn, time.time()))
-
-                # Return to queue
-                for item in temp_connections:
-                    await self._available.put(item)
+            await asyncio.sleep(CLEANUP_INTERVAL)
+            self._evict_stale()
+            await self._warm_up()
 
     async def close(self) -> None:
         """Close all connections and the pool."""
@@ -282,14 +454,20 @@ class ConnectionPool(Generic[T]):
             except asyncio.CancelledError:
                 pass
 
-        # Close all connections
-        while not self._available.empty():
-            conn, _ = await self._available.get()
-            await self._close_connection(conn)
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_exception(PoolExhaustedError("Pool is closed"))
 
-        for conn in list(self._in_use):
-            await self._close_connection(conn)
-            self._in_use.remove(conn)
+        # Background warm-ups close what they open once they see _closed
+        await asyncio.gather(*self._background, return_exceptions=True)
+
+        # Close all connections
+        idle = [conn for conn, _ in self._idle]
+        self._idle.clear()
+        in_use = list(self._in_use)
+        self._in_use.clear()
+        await self._close_all(idle + in_use)
 
 
 class PooledConnection(Generic[T]):
@@ -23,6 +23,8 @@ from .interface import (
 from .memory import (
     InMemoryQueue,
     InMemoryBroker,
+    OverflowPolicy,
+    TopicMetrics,
 )
 
 from .redis import (
@@ -49,6 +51,8 @@ __all__ = [
     # Memory
     'InMemoryQueue',
     'InMemoryBroker',
+    'OverflowPolicy',
+    'TopicMetrics',
     # Redis
     'RedisQueue',
     'RedisBroker',
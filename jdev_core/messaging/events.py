@@ -10,10 +10,15 @@ Date: 2025-11-26
 """
 
 import asyncio
+import itertools
 import time
 import uuid
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Any, Callable, Dict, List, Optional, Type, TypeVar
+from typing import Any, Callable, Deque, Dict, List, Optional, Set, Type, TypeVar
+
+
+DEFAULT_MAX_PENDING = 1000  # Fire-and-forget handler calls in flight
 
 
 @dataclass
@@ -57,14 +62,21 @@ class EventBus:
             print(f"User created: {event.data['username']}")
 
         await bus.emit(UserCreatedEvent(data={'username': 'john'}))
+
+    Handler calls started by emit(wait=False) are tracked and bounded by
+    max_pending: once that many are in flight, emit waits for one to
+    finish instead of piling up unbounded work. The exception is an emit
+    from inside such a handler call, which starts its handlers over the
+    bound rather than wait on a slot that may never free up.
     """
 
-    def __init__(self):
+    def __init__(self, max_pending: int = DEFAULT_MAX_PENDING, max_history: int = 1000):
         self._handlers: Dict[str, List[EventHandler]] = {}
         self._wildcard_handlers: List[EventHandler] = []
-        self._lock = asyncio.Lock()
-        self._event_history: List[Event] = []
-        self._max_history: int = 1000
+        self._max_history = max_history
+        self._event_history: Deque[Event] = deque(maxlen=max_history)
+        self._capacity = asyncio.Semaphore(max_pending)
+        self._pending: Set[asyncio.Task] = set()
 
     def on(
         self,
@@ -150,11 +162,7 @@ class EventBus:
         Returns:
             List of handler results (if wait=True)
         """
-        # Store in history
-        async with self._lock:
-            self._event_history.append(event)
-            if len(self._event_history) > self._max_history:
-                self._event_history = self._event_history[-self._max_history:]
+        self._event_history.append(event)
 
         # Get handlers for this event type
         type_name = event.event_type
@@ -163,18 +171,36 @@ class EventBus:
         if not handlers:
             return []
 
-        # Create tasks for all handlers
-        tasks = []
+        if wait:
+            return await asyncio.gather(
+                *(self._invoke_handler(handler, event) for handler in handlers),
+                return_exceptions=True
+            )
+
+        # A handler holds a slot itself; waiting for another could deadlock
+        in_handler = asyncio.current_task() in self._pending
         for handler in handlers:
-            task = self._invoke_handler(handler, event)
-            tasks.append(task)
+            bounded = not (in_handler and self._capacity.locked())
+            if bounded:
+                await self._capacity.acquire()
+            task = asyncio.create_task(self._invoke_handler(handler, event))
+            self._pending.add(task)
+            task.add_done_callback(self._on_handler_done if bounded else self._pending.discard)
+        return []
+
+    def _on_handler_done(self, task: asyncio.Task) -> None:
+        self._pending.discard(task)
+        self._capacity.release()
 
-        if wait:
-            return await asyncio.gather(*tasks, return_exceptions=True)
-        else:
-            for task in tasks:
-                asyncio.create_task(task)
-            return []
+    @property
+    def pending_count(self) -> int:
+        """Number of fire-and-forget handler calls still running."""
+        return len(self._pending)
+
+    async def drain(self) -> None:
+        """Wait for all fire-and-forget handler calls to finish."""
+        while self._pending:
+            await asyncio.gather(*self._pending, return_exceptions=True)
 
     async def _invoke_handler(
         self,
@@ -218,10 +244,10 @@ class EventBus:
         if event_type:
             type_name = event_type.__name__
             events = [e for e in self._event_history if e.event_type == type_name]
-        else:
-            events = self._event_history
+            return events[-limit:]
 
-        return events[-limit:]
+        start = max(0, len(self._event_history) - limit)
+        return list(itertools.islice(self._event_history, start, None))
 
     def clear_history(self) -> None:
         """Clear event history."""
@@ -35,6 +35,7 @@ class Message:
     topic: str = ""
     payload: Any = None
     headers: Dict[str, str] = field(default_factory=dict)
+    priority: int = 0
     status: MessageStatus = MessageStatus.PENDING
     created_at: float = field(default_factory=time.time)
     processed_at: Optional[float] = None
@@ -72,6 +73,7 @@ class Message:
             'topic': self.topic,
             'payload': self.payload,
             'headers': self.headers,
+            'priority': self.priority,
             'status': self.status.value,
             'created_at': self.created_at,
             'processed_at': self.processed_at,
@@ -88,6 +90,7 @@ class Message:
             topic=data.get('topic', ''),
             payload=data.get('payload'),
             headers=data.get('headers', {}),
+            priority=data.get('priority', 0),
             created_at=data.get('created_at', time.time()),
             processed_at=data.get('processed_at'),
             retry_count=data.get('retry_count', 0),
@@ -10,10 +10,16 @@ Date: 2025-11-26
 """
 
 import asyncio
+import bisect
 import fnmatch
+import heapq
+import itertools
 import time
 import uuid
-from typing import Any, Callable, Dict, List, Optional
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Callable, Deque, Dict, List, Optional, Set, Tuple
 
 from .interface import (
     IMessageQueue,
@@ -24,19 +30,33 @@ from .interface import (
 )
 
 
+DEFAULT_MAX_PENDING = 1000  # Per-subscription mailbox bound
+LATENCY_SAMPLE_SIZE = 1024  # Deliveries kept per topic for percentiles
+TOPIC_CACHE_SIZE = 4096  # Topics whose subscriber matches are memoised
+METRICS_TOPIC_LIMIT = 1024  # Topics with metrics kept (least recently used evicted)
+QUEUE_POLL_TIMEOUT = 1.0  # Queue workers re-check their queue this often
+
+
 class InMemoryQueue(IMessageQueue):
     """
     In-memory message queue implementation.
 
     Suitable for development, testing, and single-process applications.
+
+    Delayed and retried messages wait in a heap ordered by visibility
+    time; a loop timer armed for the earliest one promotes them to the
+    ready queue when due, so consumers already waiting receive them.
     """
 
     def __init__(self, config: QueueConfig):
         self._config = config
         self._messages: asyncio.Queue[Message] = asyncio.Queue(maxsize=config.max_size)
         self._processing: Dict[str, Message] = {}
-        self._delayed: List[tuple[float, Message]] = []
-        self._lock = asyncio.Lock()
+        # Heap of (visible_at, sequence, message); sequence keeps FIFO on ties
+        self._delayed: List[tuple[float, int, Message]] = []
+        self._sequence = itertools.count()
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._timer_at = 0.0
 
     async def publish(
         self,
@@ -47,10 +67,7 @@ class InMemoryQueue(IMessageQueue):
         message.max_retries = self._config.max_retries
 
         if delay > 0:
-            async with self._lock:
-                visible_at = time.time() + delay
-                self._delayed.append((visible_at, message))
-                self._delayed.sort(key=lambda x: x[0])
+            self._delay(message, time.time() + delay)
             return message.id
 
         try:
@@ -59,14 +76,41 @@ class InMemoryQueue(IMessageQueue):
         except asyncio.QueueFull:
             raise Exception(f"Queue {self._config.name} is full")
 
+    async def publish_batch(
+        self,
+        messages: List[Message],
+        delay: float = 0.0
+    ) -> List[str]:
+        """
+        Publish several messages.
+
+        Immediate messages are all-or-nothing: if they don't fit, none
+        is published.
+        """
+        if delay <= 0 and self._config.max_size > 0:
+            free = self._config.max_size - self._messages.qsize()
+            if len(messages) > free:
+                raise Exception(f"Queue {self._config.name} is full")
+
+        visible_at = time.time() + delay
+        for message in messages:
+            message.max_retries = self._config.max_retries
+            if delay > 0:
+                self._push_delayed(message, visible_at)
+            else:
+                self._messages.put_nowait(message)
+
+        if delay > 0:
+            self._schedule()
+        return [message.id for message in messages]
+
     async def consume(
         self,
         count: int = 1,
         timeout: float = 0.0
     ) -> List[Message]:
         """Consume messages from the queue."""
-        # First, move any delayed messages that are now visible
-        await self._process_delayed()
+        self._promote_due()
 
         messages = []
         deadline = time.time() + timeout if timeout > 0 else 0
@@ -84,37 +128,114 @@ class InMemoryQueue(IMessageQueue):
                 else:
                     message = self._messages.get_nowait()
 
-                message.mark_processing()
-                async with self._lock:
-                    self._processing[message.id] = message
+                self._start_processing(message)
                 messages.append(message)
 
             except (asyncio.QueueEmpty, asyncio.TimeoutError):
                 break
 
+        # Freed slots may let due messages in
+        self._promote_due()
         return messages
 
-    async def _process_delayed(self) -> None:
-        """Move delayed messages to main queue if visible."""
-        async with self._lock:
-            now = time.time()
-            while self._delayed and self._delayed[0][0] <= now:
-                _, message = self._delayed.pop(0)
-                try:
-                    self._messages.put_nowait(message)
-                except asyncio.QueueFull:
-                    # Put back in delayed queue
-                    self._delayed.insert(0, (now, message))
-                    break
+    async def consume_batch(
+        self,
+        max_count: int = 100,
+        timeout: float = 0.0
+    ) -> List[Message]:
+        """
+        Consume up to max_count messages.
+
+        Waits up to timeout for the first message, then takes whatever
+        else is ready without waiting.
+        """
+        self._promote_due()
+
+        messages = []
+        if self._messages.empty() and timeout > 0:
+            try:
+                message = await asyncio.wait_for(self._messages.get(), timeout=timeout)
+            except asyncio.TimeoutError:
+                return messages
+            self._start_processing(message)
+            messages.append(message)
+
+        while len(messages) < max_count:
+            try:
+                message = self._messages.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+            self._start_processing(message)
+            messages.append(message)
+
+        self._promote_due()
+        return messages
+
+    def _start_processing(self, message: Message) -> None:
+        message.mark_processing()
+        self._processing[message.id] = message
+
+    def _push_delayed(self, message: Message, visible_at: float) -> None:
+        heapq.heappush(self._delayed, (visible_at, next(self._sequence), message))
+
+    def _delay(self, message: Message, visible_at: float) -> None:
+        self._push_delayed(message, visible_at)
+        self._schedule()
+
+    def _schedule(self) -> None:
+        """Arm the timer for the earliest delayed message."""
+        if not self._delayed:
+            self._cancel_timer()
+            return
+
+        visible_at = self._delayed[0][0]
+        if self._timer is not None and self._timer_at <= visible_at:
+            return  # Already armed early enough
+
+        self._cancel_timer()
+        loop = asyncio.get_running_loop()
+        self._timer = loop.call_later(max(0.0, visible_at - time.time()), self._on_timer)
+        self._timer_at = visible_at
+
+    def _cancel_timer(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _on_timer(self) -> None:
+        self._timer = None
+        self._promote_due()
+
+    def _promote_due(self) -> None:
+        """Move delayed messages that are now visible to the main queue."""
+        now = time.time()
+        while self._delayed and self._delayed[0][0] <= now:
+            if self._messages.full():
+                # Retried when a consumer frees a slot
+                return
+            _, _, message = heapq.heappop(self._delayed)
+            self._messages.put_nowait(message)
+
+        if self._delayed and self._timer is None:
+            self._schedule()
 
     async def ack(self, message_id: str) -> bool:
         """Acknowledge message processing."""
-        async with self._lock:
-            if message_id in self._processing:
-                message = self._processing.pop(message_id)
-                message.mark_completed()
-                return True
+        message = self._processing.pop(message_id, None)
+        if message is None:
             return False
+        message.mark_completed()
+        return True
+
+    async def ack_many(self, message_ids: List[str]) -> int:
+        """Acknowledge several messages. Returns how many were acknowledged."""
+        acked = 0
+        for message_id in message_ids:
+            message = self._processing.pop(message_id, None)
+            if message is not None:
+                message.mark_completed()
+                acked += 1
+        return acked
 
     async def nack(
         self,
@@ -122,23 +243,20 @@ class InMemoryQueue(IMessageQueue):
         requeue: bool = True
     ) -> bool:
         """Negative acknowledge message."""
-        async with self._lock:
-            if message_id not in self._processing:
-                return False
+        message = self._processing.pop(message_id, None)
+        if message is None:
+            return False
 
-            message = self._processing.pop(message_id)
-            message.mark_failed("Negative acknowledgement")
+        message.mark_failed("Negative acknowledgement")
 
-            if requeue and message.status != MessageStatus.DEAD_LETTER:
-                # Requeue with delay
-                visible_at = time.time() + self._config.retry_delay
-                self._delayed.append((visible_at, message))
-                self._delayed.sort(key=lambda x: x[0])
-            elif self._config.dead_letter_queue:
-                # Would send to dead letter queue in production
-                pass
+        if requeue and message.status != MessageStatus.DEAD_LETTER:
+            # Requeue with delay
+            self._delay(message, time.time() + self._config.retry_delay)
+        elif self._config.dead_letter_queue:
+            # Would send to dead letter queue in production
+            pass
 
-            return True
+        return True
 
     async def size(self) -> int:
         """Get current queue size."""
@@ -146,20 +264,277 @@ class InMemoryQueue(IMessageQueue):
 
     async def purge(self) -> int:
         """Purge all messages."""
-        async with self._lock:
-            count = self._messages.qsize() + len(self._delayed)
+        count = self._messages.qsize() + len(self._delayed)
+
+        # Clear main queue
+        while not self._messages.empty():
+            try:
+                self._messages.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+
+        # Clear delayed
+        self._delayed.clear()
+        self._cancel_timer()
+
+        return count
+
+
+class OverflowPolicy(Enum):
+    """What a subscription does with a message when its mailbox is full."""
+
+    BLOCK = "block"              # Publisher waits for room (its own handler does not)
+    DROP_OLDEST = "drop_oldest"  # Oldest lowest-priority message is discarded
+    DEAD_LETTER = "dead_letter"  # New message goes to the dead letter queue
+
+
+@dataclass
+class TopicMetrics:
+    """Delivery metrics for one topic."""
+
+    published: int = 0
+    delivered: int = 0
+    failed: int = 0
+    dropped: int = 0
+    dead_lettered: int = 0
+    avg_latency_ms: float = 0.0
+    max_latency_ms: float = 0.0
+    first_published_at: float = field(default_factory=time.time)
+    latency_samples_ms: Deque[float] = field(
+        default_factory=lambda: deque(maxlen=LATENCY_SAMPLE_SIZE), repr=False
+    )
+
+    @property
+    def throughput(self) -> float:
+        """Handled messages per second since the topic was first published to."""
+        elapsed = time.time() - self.first_published_at
+        return (self.delivered + self.failed) / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def p95_latency_ms(self) -> float:
+        return self.percentile_latency_ms(95)
+
+    @property
+    def p99_latency_ms(self) -> float:
+        return self.percentile_latency_ms(99)
+
+    def record_delivery(self, latency_ms: float, ok: bool) -> None:
+        """Count a handled message and add its publish-to-handled latency."""
+        if ok:
+            self.delivered += 1
+        else:
+            self.failed += 1
+        handled = self.delivered + self.failed
+        self.avg_latency_ms += (latency_ms - self.avg_latency_ms) / handled
+        self.max_latency_ms = max(self.max_latency_ms, latency_ms)
+        self.latency_samples_ms.append(latency_ms)
+
+    def percentile_latency_ms(self, percentile: float) -> float:
+        """
+        Latency percentile over the last LATENCY_SAMPLE_SIZE deliveries.
+
+        Args:
+            percentile: Percentile to calculate (0-100)
+        """
+        if not self.latency_samples_ms:
+            return 0.0
+        samples = sorted(self.latency_samples_ms)
+        index = int(len(samples) * (percentile / 100))
+        return samples[min(index, len(samples) - 1)]
+
+
+class _Mailbox:
+    """
+    Bounded priority buffer in front of a subscription's workers.
+
+    Higher priorities are taken first, FIFO within a priority.
+    """
+
+    def __init__(self, max_pending: int):
+        self.max_pending = max_pending
+        self._levels: Dict[int, Deque[Message]] = {}
+        self._priorities: List[int] = []  # Negated, ascending
+        self._size = 0
+        self._not_empty = asyncio.Event()
+        self._not_full = asyncio.Event()
+        self._not_full.set()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def full(self) -> bool:
+        return 0 < self.max_pending <= self._size
+
+    def put_nowait(self, message: Message) -> None:
+        level = self._levels.get(message.priority)
+        if level is None:
+            level = self._levels[message.priority] = deque()
+            bisect.insort(self._priorities, -message.priority)
+        level.append(message)
+        self._size += 1
+        self._not_empty.set()
+        if self.full():
+            self._not_full.clear()
+
+    async def put(self, message: Message) -> None:
+        while self.full():
+            await self._not_full.wait()
+        self.put_nowait(message)
+
+    async def get(self) -> Message:
+        while not self._size:
+            await self._not_empty.wait()
+        return self._take(self._priorities[0])
+
+    def drop_oldest(self) -> Message:
+        """Remove the oldest message of the lowest priority."""
+        return self._take(self._priorities[-1])
+
+    def clear(self) -> None:
+        self._levels.clear()
+        self._priorities.clear()
+        self._size = 0
+        self._not_empty.clear()
+        self._not_full.set()
+
+    def _take(self, negated: int) -> Message:
+        level = self._levels[-negated]
+        message = level.popleft()
+        if not level:
+            del self._levels[-negated]
+            self._priorities.remove(negated)
+        self._size -= 1
+        if not self._size:
+            self._not_empty.clear()
+        if not self.full():
+            self._not_full.set()
+        return message
+
+
+class _TopicNode:
+    __slots__ = ('children', 'single', 'rest', 'globs', 'subscribers')
+
+    def __init__(self):
+        self.children: Dict[str, '_TopicNode'] = {}
+        self.single: Optional['_TopicNode'] = None        # '*' or '+'
+        self.rest: Set[str] = set()                       # '#' here
+        self.globs: Dict[str, '_TopicNode'] = {}          # e.g. 'user-*'
+        self.subscribers: Set[str] = set()
+
+    def empty(self) -> bool:
+        return not (self.children or self.single or self.rest or self.globs or self.subscribers)
 
-            # Clear main queue
-            while not self._messages.empty():
-                try:
-                    self._messages.get_nowait()
-                except asyncio.QueueEmpty:
-                    break
 
-            # Clear delayed
-            self._delayed.clear()
+class _TopicTrie:
+    """
+    Subscription patterns indexed by dot-separated segment.
+
+    '*' and '+' match exactly one segment, '#' matches all remaining
+    segments (including none), and other wildcard segments match one
+    segment with fnmatch rules. Results are cached per topic until the
+    subscriptions change.
+    """
 
-            return count
+    def __init__(self):
+        self._root = _TopicNode()
+        self._cache: Dict[str, Tuple[str, ...]] = {}
+
+    def add(self, pattern: str, subscription_id: str) -> None:
+        segments = pattern.split('.')
+        if '#' in segments[:-1]:
+            raise ValueError(f"'#' must be the last segment of {pattern!r}")
+
+        node = self._root
+        for segment in segments:
+            if segment == '#':
+                node.rest.add(subscription_id)
+                break
+            node = self._child(node, segment, create=True)
+        else:
+            node.subscribers.add(subscription_id)
+        self._cache.clear()
+
+    def remove(self, pattern: str, subscription_id: str) -> None:
+        path = [self._root]
+        for segment in pattern.split('.'):
+            if segment == '#':
+                path[-1].rest.discard(subscription_id)
+                break
+            node = self._child(path[-1], segment, create=False)
+            if node is None:
+                return
+            path.append(node)
+        else:
+            path[-1].subscribers.discard(subscription_id)
+        self._cache.clear()
+        self._prune(path, pattern.split('.'))
+
+    def match(self, topic: str) -> Tuple[str, ...]:
+        matched = self._cache.get(topic)
+        if matched is not None:
+            return matched
+
+        found: Set[str] = set()
+        segments = topic.split('.')
+        stack = [(self._root, 0)]
+        while stack:
+            node, depth = stack.pop()
+            found.update(node.rest)
+            if depth == len(segments):
+                found.update(node.subscribers)
+                continue
+            segment = segments[depth]
+            child = node.children.get(segment)
+            if child is not None:
+                stack.append((child, depth + 1))
+            if node.single is not None:
+                stack.append((node.single, depth + 1))
+            for glob, child in node.globs.items():
+                if fnmatch.fnmatchcase(segment, glob):
+                    stack.append((child, depth + 1))
+
+        matched = tuple(found)
+        if len(self._cache) >= TOPIC_CACHE_SIZE:
+            self._cache.clear()
+        self._cache[topic] = matched
+        return matched
+
+    @staticmethod
+    def _child(node: _TopicNode, segment: str, create: bool) -> Optional[_TopicNode]:
+        if segment in ('*', '+'):
+            if node.single is None and create:
+                node.single = _TopicNode()
+            return node.single
+        table = node.globs if any(c in segment for c in '*?[') else node.children
+        child = table.get(segment)
+        if child is None and create:
+            child = table[segment] = _TopicNode()
+        return child
+
+    @staticmethod
+    def _prune(path: List[_TopicNode], segments: List[str]) -> None:
+        """Drop nodes left empty by a removal, deepest first."""
+        for depth in range(len(path) - 1, 0, -1):
+            node, parent, segment = path[depth], path[depth - 1], segments[depth - 1]
+            if not node.empty():
+                return
+            if parent.single is node:
+                parent.single = None
+            else:
+                parent.children.pop(segment, None)
+                parent.globs.pop(segment, None)
+
+
+@dataclass
+class _Subscription:
+    id: str
+    topic: str
+    handler: Callable[[Message], Any]
+    queue_name: Optional[str]
+    mailbox: Optional[_Mailbox]
+    overflow: OverflowPolicy
+    dead_letter_queue: Optional[str]
+    workers: List[asyncio.Task] = field(default_factory=list)
 
 
 class InMemoryBroker(IMessageBroker):
@@ -167,21 +542,33 @@ class InMemoryBroker(IMessageBroker):
     In-memory message broker implementation.
 
     Provides queue management and pub/sub functionality.
+
+    Every direct subscription has its own bounded mailbox drained by
+    its own worker tasks, so a slow handler only backs up its own
+    subscription. Queue-backed subscriptions are drained by workers
+    that wait on the queue, ack on success and nack on failure; once the
+    queue gives up retrying, the message goes to the dead letter queue.
+
+    Metrics are kept for the METRICS_TOPIC_LIMIT most recently used
+    topics, so dynamic topic names cannot grow them without bound.
     """
 
     def __init__(self):
         self._queues: Dict[str, InMemoryQueue] = {}
-        self._subscriptions: Dict[str, tuple[str, Callable, Optional[str]]] = {}
-        self._running = False
-        self._dispatch_task: Optional[asyncio.Task] = None
+        self._subscriptions: Dict[str, _Subscription] = {}
+        self._topics = _TopicTrie()
+        self._metrics: OrderedDict[str, TopicMetrics] = OrderedDict()
         self._lock = asyncio.Lock()
 
     async def create_queue(self, config: QueueConfig) -> IMessageQueue:
         """Create or get a queue."""
         async with self._lock:
-            if config.name not in self._queues:
-                self._queues[config.name] = InMemoryQueue(config)
-            return self._queues[config.name]
+            return self._ensure_queue(config)
+
+    def _ensure_queue(self, config: QueueConfig) -> InMemoryQueue:
+        if config.name not in self._queues:
+            self._queues[config.name] = InMemoryQueue(config)
+        return self._queues[config.name]
 
     async def delete_queue(self, name: str) -> bool:
         """Delete a queue."""
@@ -204,127 +591,217 @@ class InMemoryBroker(IMessageBroker):
         self,
         topic: str,
         handler: Callable[[Message], Any],
-        queue_name: Optional[str] = None
+        queue_name: Optional[str] = None,
+        *,
+        max_pending: int = DEFAULT_MAX_PENDING,
+        overflow: OverflowPolicy = OverflowPolicy.BLOCK,
+        concurrency: int = 1,
+        dead_letter_queue: Optional[str] = None
     ) -> str:
-        """Subscribe to a topic."""
-        subscription_id = str(uuid.uuid4())
+        """
+        Subscribe to a topic.
+
+        Args:
+            topic: Topic pattern; '*'/'+' match one segment, '#' the rest
+            handler: Message handler function
+            queue_name: Optional queue name for persistence
+            max_pending: Mailbox bound for direct subscriptions (0 = unbounded)
+            overflow: What to do when the mailbox is full
+            concurrency: Number of workers running the handler
+            dead_letter_queue: Queue receiving overflowed and failed messages
+                (queue-backed: once the queue's retries are exhausted)
+
+        Returns:
+            Subscription ID
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        if overflow == OverflowPolicy.DEAD_LETTER and not dead_letter_queue:
+            raise ValueError("OverflowPolicy.DEAD_LETTER requires dead_letter_queue")
+
+        subscription = _Subscription(
+            id=str(uuid.uuid4()),
+            topic=topic,
+            handler=handler,
+            queue_name=queue_name,
+            mailbox=None if queue_name else _Mailbox(max_pending),
+            overflow=overflow,
+            dead_letter_queue=dead_letter_queue,
+        )
 
         async with self._lock:
-            self._subscriptions[subscription_id] = (topic, handler, queue_name)
-
-            # Create queue if specified
-            if queue_name and queue_name not in self._queues:
-                await self.create_queue(QueueConfig(name=queue_name))
-
-        # Start dispatcher if not running
-        if not self._running:
-            await self._start_dispatcher()
+            self._topics.add(topic, subscription.id)
+            self._subscriptions[subscription.id] = subscription
+            if queue_name:
+                self._ensure_queue(QueueConfig(name=queue_name))
 
-        return subscription_id
+        run = self._drain_queue if queue_name else self._drain_mailbox
+        subscription.workers = [
+            asyncio.create_task(run(subscription)) for _ in range(concurrency)
+        ]
+        return subscription.id
 
     async def unsubscribe(self, subscription_id: str) -> bool:
-        """Unsubscribe from a topic."""
+        """Unsubscribe from a topic. Messages still in its mailbox are dropped."""
         async with self._lock:
-            if subscription_id in self._subscriptions:
-                del self._subscriptions[subscription_id]
-                return True
-            return False
+            subscription = self._subscriptions.pop(subscription_id, None)
+            if subscription is None:
+                return False
+            self._topics.remove(subscription.topic, subscription_id)
+
+        await self._stop(subscription)
+        return True
 
     async def publish(
         self,
         topic: str,
         payload: Any,
-        headers: Optional[Dict[str, str]] = None
+        headers: Optional[Dict[str, str]] = None,
+        priority: int = 0
     ) -> str:
-        """Publish to a topic."""
+        """
+        Publish to a topic.
+
+        Higher priority messages are handled first by each subscriber.
+        With OverflowPolicy.BLOCK this waits while a subscriber's mailbox
+        is full, unless it is called from that subscriber's own handler:
+        waiting on its own mailbox could deadlock, so the message is queued
+        over the bound instead.
+        """
         message = Message(
             topic=topic,
             payload=payload,
-            headers=headers or {}
+            headers=headers or {},
+            priority=priority,
         )
-
-        # Dispatch to matching subscribers
-        async with self._lock:
-            for sub_id, (pattern, handler, queue_name) in self._subscriptions.items():
-                if self._matches_topic(topic, pattern):
-                    if queue_name:
-                        # Queue for later processing
-                        queue = self._queues.get(queue_name)
-                        if queue:
-                            await queue.publish(message)
-                    else:
-                        # Direct dispatch
-                        asyncio.create_task(self._invoke_handler(handler, message))
+        metrics = self._topic_metrics(topic)
+        metrics.published += 1
+
+        for subscription_id in self._topics.match(topic):
+            subscription = self._subscriptions.get(subscription_id)
+            if subscription is None:
+                continue
+            if subscription.queue_name:
+                queue = self._queues.get(subscription.queue_name)
+                if queue:
+                    await queue.publish(message)
+                continue
+
+            mailbox = subscription.mailbox
+            if mailbox.full():
+                if subscription.overflow == OverflowPolicy.DROP_OLDEST:
+                    dropped = mailbox.drop_oldest()
+                    self._topic_metrics(dropped.topic).dropped += 1
+                elif subscription.overflow == OverflowPolicy.DEAD_LETTER:
+                    await self._dead_letter(subscription, message)
+                    continue
+                elif asyncio.current_task() in subscription.workers:
+                    mailbox.put_nowait(message)
+                    continue
+            await mailbox.put(message)
 
         return message.id
 
-    def _matches_topic(self, topic: str, pattern: str) -> bool:
-        """Check if topic matches subscription pattern."""
-        # Support wildcards: * matches one segment, # matches all remaining
-        if pattern == topic:
-            return True
-
-        # Convert MQTT-style wildcards to fnmatch patterns
-        fnmatch_pattern = pattern.replace('+', '*').replace('#', '**')
-        return fnmatch.fnmatch(topic, fnmatch_pattern)
+    def get_metrics(self, topic: Optional[str] = None) -> Dict[str, TopicMetrics]:
+        """
+        Get delivery metrics per recently used topic.
+
+        Args:
+            topic: Only return this topic's metrics
+        """
+        if topic is not None:
+            return {topic: self._metrics[topic]} if topic in self._metrics else {}
+        return dict(self._metrics)
+
+    def pending(self, subscription_id: str) -> int:
+        """Number of messages waiting in a direct subscription's mailbox."""
+        subscription = self._subscriptions.get(subscription_id)
+        if subscription is None or subscription.mailbox is None:
+            return 0
+        return len(subscription.mailbox)
+
+    def _topic_metrics(self, topic: str) -> TopicMetrics:
+        metrics = self._metrics.get(topic)
+        if metrics is None:
+            if len(self._metrics) >= METRICS_TOPIC_LIMIT:
+                self._metrics.popitem(last=False)
+            metrics = self._metrics[topic] = TopicMetrics()
+        else:
+            self._metrics.move_to_end(topic)
+        return metrics
+
+    async def _drain_mailbox(self, subscription: _Subscription) -> None:
+        """Worker loop for a direct subscription."""
+        while True:
+            message = await subscription.mailbox.get()
+            if not await self._invoke_handler(subscription.handler, message):
+                if subscription.dead_letter_queue:
+                    await self._dead_letter(subscription, message)
+
+    async def _drain_queue(self, subscription: _Subscription) -> None:
+        """Worker loop for a queue-backed subscription."""
+        while True:
+            queue = self._queues.get(subscription.queue_name)
+            if queue is None:
+                return
+            for message in await queue.consume(count=1, timeout=QUEUE_POLL_TIMEOUT):
+                if await self._invoke_handler(subscription.handler, message):
+                    await queue.ack(message.id)
+                    continue
+                await queue.nack(message.id)
+                if message.status == MessageStatus.DEAD_LETTER and subscription.dead_letter_queue:
+                    await self._dead_letter(subscription, message)
+
+    async def _dead_letter(self, subscription: _Subscription, message: Message) -> None:
+        queue = self._ensure_queue(QueueConfig(name=subscription.dead_letter_queue))
+        metrics = self._topic_metrics(message.topic)
+        try:
+            await queue.publish(message)
+        except Exception:
+            metrics.dropped += 1
+        else:
+            metrics.dead_lettered += 1
 
     async def _invoke_handler(
         self,
         handler: Callable[[Message], Any],
         message: Message
-    ) -> None:
-        """Invoke a message handler safely."""
+    ) -> bool:
+        """Invoke a message handler safely. Returns whether it succeeded."""
+        ok = True
         try:
             result = handler(message)
             if asyncio.iscoroutine(result):
                 await result
         except Exception:
             # Log error in production
-            pass
+            ok = False
 
-    async def _start_dispatcher(self) -> None:
-        """Start the message dispatcher."""
-        if self._running:
-            return
+        latency_ms = (time.time() - message.created_at) * 1000
+        self._topic_metrics(message.topic).record_delivery(latency_ms, ok)
+        return ok
 
-        self._running = True
-        self._dispatch_task = asyncio.create_task(self._dispatch_loop())
-
-    async def _dispatch_loop(self) -> None:
-        """Continuous message dispatch loop."""
-        while self._running:
-            # Process messages from subscriber queues
-            async with self._lock:
-                for sub_id, (pattern, handler, queue_name) in list(self._subscriptions.items()):
-                    if queue_name and queue_name in self._queues:
-                        queue = self._queues[queue_name]
-                        messages = await queue.consume(count=10, timeout=0)
-                        for message in messages:
-                            try:
-                                await self._invoke_handler(handler, message)
-                                await queue.ack(message.id)
-                            except Exception:
-                                await queue.nack(message.id)
-
-            await asyncio.sleep(0.1)  # Small delay between dispatch cycles
+    @staticmethod
+    async def _stop(subscription: _Subscription) -> None:
+        for worker in subscription.workers:
+            worker.cancel()
+        await asyncio.gather(*subscription.workers, return_exceptions=True)
+        if subscription.mailbox is not None:
+            subscription.mailbox.clear()
 
     async def close(self) -> None:
         """Close the broker."""
-        self._running = False
-
-        if self._dispatch_task:
-            self._dispatch_task.cancel()
-            try:
-                await self._dispatch_task
-            except asyncio.CancelledError:
-                pass
+        subscriptions = list(self._subscriptions.values())
+        self._subscriptions.clear()
+        self._topics = _TopicTrie()
+        for subscription in subscriptions:
+            await self._stop(subscription)
 
         # Purge all queues
         for queue in self._queues.values():
             await queue.purge()
 
         self._queues.clear()
-        self._subscriptions.clear()
 
 
 # Global broker instance
@@ -342,5 +819,7 @@ def get_message_broker() -> InMemoryBroker:
 __all__ = [
     'InMemoryQueue',
     'InMemoryBroker',
+    'OverflowPolicy',
+    'TopicMetrics',
     'get_message_broker',
 ]
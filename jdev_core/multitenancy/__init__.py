@@ -38,6 +38,10 @@ from .quotas import (
     Quota,
     QuotaUsage,
     QuotaExceededError,
+    QuotaAlgorithm,
+    QuotaBackend,
+    InMemoryQuotaBackend,
+    RedisQuotaBackend,
 )
 
 __all__ = [
@@ -60,4 +64,8 @@ __all__ = [
     'Quota',
     'QuotaUsage',
     'QuotaExceededError',
+    'QuotaAlgorithm',
+    'QuotaBackend',
+    'InMemoryQuotaBackend',
+    'RedisQuotaBackend',
 ]
@@ -9,11 +9,14 @@ Author: JuanCS Dev
 Date: 2025-11-26
 """
 
-import asyncio
+import math
+import threading
 import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict, deque
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, List, Optional
+from typing import Any, Deque, Dict, List, Optional, Sequence, Tuple, Union
 
 from .context import get_current_tenant
 from .tenant import Tenant, TenantConfig
@@ -46,6 +49,15 @@ class QuotaPeriod(Enum):
     MONTH = 2592000  # 30 days
 
 
+class QuotaAlgorithm(Enum):
+    """How usage within a period is counted."""
+
+    FIXED_WINDOW = "fixed_window"  # Resets each period; allows 2x bursts at the edge
+    SLIDING_WINDOW = "sliding_window"  # Previous window weighted by overlap
+    SLIDING_LOG = "sliding_log"  # Exact, keeps one entry per increment
+    TOKEN_BUCKET = "token_bucket"  # Refills limit/period per second, bursts up to limit
+
+
 @dataclass
 class Quota:
     """Quota definition."""
@@ -94,10 +106,10 @@ class QuotaBucket:
     count: int = 0
     window_start: float = field(default_factory=time.time)
 
-    def check(self) -> bool:
+    def check(self, amount: int = 1) -> bool:
         """Check if within quota."""
         self._maybe_reset()
-        return self.count < self.limit
+        return self.count + amount <= self.limit
 
     def increment(self, amount: int = 1) -> bool:
         """
@@ -132,6 +144,392 @@ class QuotaBucket:
         )
 
 
+@dataclass
+class SlidingWindowBucket:
+    """
+    Sliding-window counter.
+
+    Usage is the current window's count plus the previous window's,
+    weighted by how much of it the sliding period still covers. Two
+    integers per quota, and no burst of 2x limit across a window edge.
+    """
+
+    limit: int
+    period: float
+    count: int = 0
+    previous: int = 0
+    window_start: float = field(default_factory=time.time)
+
+    def check(self, amount: int = 1) -> bool:
+        """Check if amount fits in the quota."""
+        return self._estimate(time.time()) + amount <= self.limit
+
+    def increment(self, amount: int = 1) -> bool:
+        """Add usage if it fits; return False otherwise."""
+        if self._estimate(time.time()) + amount > self.limit:
+            return False
+        self.count += amount
+        return True
+
+    def _estimate(self, now: float) -> float:
+        elapsed = now - self.window_start
+        if elapsed >= self.period:
+            windows = int(elapsed // self.period)
+            self.previous = self.count if windows == 1 else 0
+            self.count = 0
+            self.window_start += windows * self.period
+            elapsed -= windows * self.period
+        return self.previous * (1 - elapsed / self.period) + self.count
+
+    def get_usage(self) -> QuotaUsage:
+        """Get current usage stats."""
+        now = time.time()
+        used = math.ceil(self._estimate(now))
+        return QuotaUsage(
+            quota_name="",
+            limit=self.limit,
+            used=used,
+            remaining=max(0, self.limit - used),
+            period_start=now - self.period,
+            period_end=self.window_start + self.period
+        )
+
+
+@dataclass
+class SlidingLogBucket:
+    """Exact sliding window: a log of (timestamp, amount) increments."""
+
+    limit: int
+    period: float
+    total: int = 0
+    log: Deque[Tuple[float, int]] = field(default_factory=deque)
+
+    def check(self, amount: int = 1) -> bool:
+        """Check if amount fits in the quota."""
+        self._expire(time.time())
+        return self.total + amount <= self.limit
+
+    def increment(self, amount: int = 1) -> bool:
+        """Add usage if it fits; return False otherwise."""
+        now = time.time()
+        self._expire(now)
+        if self.total + amount > self.limit:
+            return False
+        self.log.append((now, amount))
+        self.total += amount
+        return True
+
+    def _expire(self, now: float) -> None:
+        cutoff = now - self.period
+        while self.log and self.log[0][0] <= cutoff:
+            self.total -= self.log.popleft()[1]
+
+    def get_usage(self) -> QuotaUsage:
+        """Get current usage stats."""
+        now = time.time()
+        self._expire(now)
+        return QuotaUsage(
+            quota_name="",
+            limit=self.limit,
+            used=self.total,
+            remaining=max(0, self.limit - self.total),
+            period_start=now - self.period,
+            period_end=self.log[0][0] + self.period if self.log else now
+        )
+
+
+@dataclass
+class TokenBucket:
+    """Token bucket holding up to limit tokens, refilled at limit/period per second."""
+
+    limit: int
+    period: float
+    tokens: float = -1.0  # Starts full
+    updated_at: float = field(default_factory=time.time)
+
+    def __post_init__(self) -> None:
+        if self.tokens < 0:
+            self.tokens = float(self.limit)
+
+    def check(self, amount: int = 1) -> bool:
+        """Check if amount tokens are available."""
+        self._refill(time.time())
+        return self.tokens >= amount
+
+    def increment(self, amount: int = 1) -> bool:
+        """Take amount tokens if available; return False otherwise."""
+        self._refill(time.time())
+        if self.tokens < amount:
+            return False
+        self.tokens -= amount
+        return True
+
+    def _refill(self, now: float) -> None:
+        rate = self.limit / self.period
+        self.tokens = min(float(self.limit), self.tokens + (now - self.updated_at) * rate)
+        self.updated_at = now
+
+    def get_usage(self) -> QuotaUsage:
+        """Get current usage stats; period_end is when the bucket is full again."""
+        now = time.time()
+        self._refill(now)
+        used = math.ceil(self.limit - self.tokens)
+        return QuotaUsage(
+            quota_name="",
+            limit=self.limit,
+            used=used,
+            remaining=self.limit - used,
+            period_start=now - self.period,
+            period_end=now + (self.limit - self.tokens) * self.period / max(self.limit, 1)
+        )
+
+
+Bucket = Union[QuotaBucket, SlidingWindowBucket, SlidingLogBucket, TokenBucket]
+
+_BUCKET_TYPES = {
+    QuotaAlgorithm.FIXED_WINDOW: QuotaBucket,
+    QuotaAlgorithm.SLIDING_WINDOW: SlidingWindowBucket,
+    QuotaAlgorithm.SLIDING_LOG: SlidingLogBucket,
+    QuotaAlgorithm.TOKEN_BUCKET: TokenBucket,
+}
+
+
+@dataclass
+class QuotaCharge:
+    """One of a tenant's quota counters to check or increment."""
+
+    key: str  # "<quota_name>:<period>"
+    limit: int
+    period: float
+    amount: int = 1
+
+
+class QuotaBackend(ABC):
+    """Storage for quota counters."""
+
+    @abstractmethod
+    async def check(self, tenant_id: str, charge: QuotaCharge) -> bool:
+        """Check whether charge.amount fits without consuming it."""
+        pass
+
+    @abstractmethod
+    async def increment(self, tenant_id: str, charges: Sequence[QuotaCharge]) -> bool:
+        """
+        Apply all charges, or none if any of them would exceed its limit.
+
+        Returns:
+            True if every charge was within quota
+        """
+        pass
+
+    @abstractmethod
+    async def get_usage(self, tenant_id: str, charge: QuotaCharge) -> QuotaUsage:
+        """Get usage for one counter (quota_name is filled in by the caller)."""
+        pass
+
+    @abstractmethod
+    async def reset(self, tenant_id: str) -> None:
+        """Drop all counters for a tenant."""
+        pass
+
+
+class InMemoryQuotaBackend(QuotaBackend):
+    """
+    Process-local quota counters.
+
+    Tenants are hashed over shards, each an LRU of tenant -> buckets
+    behind its own lock, so a manager shared across threads does not
+    serialize on one lock. A tenant's batch touches a single shard.
+    Buckets are created on first use, and once a shard holds more than
+    its share of max_tenants the least recently used tenant is dropped
+    (its counters start again from zero).
+    """
+
+    def __init__(
+        self,
+        algorithm: QuotaAlgorithm = QuotaAlgorithm.SLIDING_WINDOW,
+        max_tenants: int = 10000,
+        shards: int = 16
+    ):
+        self._bucket_type = _BUCKET_TYPES[algorithm]
+        self._shard_capacity = max(1, max_tenants // shards)
+        self._shards: List[OrderedDict[str, Dict[str, Bucket]]] = [
+            OrderedDict() for _ in range(shards)
+        ]
+        self._locks = [threading.Lock() for _ in range(shards)]
+
+    def __len__(self) -> int:
+        return sum(len(shard) for shard in self._shards)
+
+    def _shard(self, tenant_id: str) -> int:
+        return hash(tenant_id) % len(self._shards)
+
+    def _tenant(self, shard: OrderedDict, tenant_id: str) -> Dict[str, Bucket]:
+        """Get or create a tenant's buckets; caller holds the shard lock."""
+        buckets = shard.get(tenant_id)
+        if buckets is None:
+            buckets = shard[tenant_id] = {}
+            if len(shard) > self._shard_capacity:
+                shard.popitem(last=False)
+        else:
+            shard.move_to_end(tenant_id)
+        return buckets
+
+    def _bucket(self, buckets: Dict[str, Bucket], charge: QuotaCharge) -> Bucket:
+        bucket = buckets.get(charge.key)
+        if bucket is None:
+            bucket = buckets[charge.key] = self._bucket_type(
+                limit=charge.limit, period=charge.period
+            )
+        bucket.limit = charge.limit  # Follow tenant config changes
+        return bucket
+
+    async def check(self, tenant_id: str, charge: QuotaCharge) -> bool:
+        index = self._shard(tenant_id)
+        with self._locks[index]:
+            buckets = self._tenant(self._shards[index], tenant_id)
+            return self._bucket(buckets, charge).check(charge.amount)
+
+    async def increment(self, tenant_id: str, charges: Sequence[QuotaCharge]) -> bool:
+        index = self._shard(tenant_id)
+        with self._locks[index]:
+            tenant_buckets = self._tenant(self._shards[index], tenant_id)
+            buckets = [(self._bucket(tenant_buckets, charge), charge.amount) for charge in charges]
+            for bucket, amount in buckets:
+                if not bucket.check(amount):
+                    return False
+            for bucket, amount in buckets:
+                bucket.increment(amount)
+            return True
+
+    async def get_usage(self, tenant_id: str, charge: QuotaCharge) -> QuotaUsage:
+        index = self._shard(tenant_id)
+        with self._locks[index]:
+            buckets = self._tenant(self._shards[index], tenant_id)
+            return self._bucket(buckets, charge).get_usage()
+
+    async def reset(self, tenant_id: str) -> None:
+        index = self._shard(tenant_id)
+        with self._locks[index]:
+            self._shards[index].pop(tenant_id, None)
+
+
+class RedisQuotaBackend(QuotaBackend):
+    """
+    Quota counters in Redis, shared by every worker process.
+
+    Works with any client exposing the redis.asyncio API (get, mget,
+    pipeline, scan_iter, delete) and only uses plain commands, so a
+    local Redis-protocol stand-in is enough. Counters are per-window
+    keys that expire on their own; a batch is applied optimistically
+    with INCRBY and rolled back with DECRBY if any counter went over.
+    Each tenant's keys share a hash tag so they land on one cluster shard.
+
+    Only FIXED_WINDOW and SLIDING_WINDOW are supported: the log and
+    token-bucket algorithms need server-side scripting to stay atomic.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        algorithm: QuotaAlgorithm = QuotaAlgorithm.SLIDING_WINDOW,
+        key_prefix: str = "jdev:quota:"
+    ):
+        if algorithm not in (QuotaAlgorithm.FIXED_WINDOW, QuotaAlgorithm.SLIDING_WINDOW):
+            raise ValueError(f"{algorithm.value} is not supported by RedisQuotaBackend")
+        self._redis = client
+        self._sliding = algorithm == QuotaAlgorithm.SLIDING_WINDOW
+        self._prefix = key_prefix
+
+    @classmethod
+    def from_url(cls, url: str, **kwargs: Any) -> 'RedisQuotaBackend':
+        """Create a backend with a redis.asyncio client for url."""
+        try:
+            import redis.asyncio as aioredis
+        except ImportError:
+            raise RuntimeError("redis package not installed. Install with: pip install redis")
+        return cls(aioredis.from_url(url), **kwargs)
+
+    def _keys(self, tenant_id: str, charge: QuotaCharge, now: float) -> Tuple[str, str, float]:
+        """Current and previous window keys, and the elapsed share of the window."""
+        window, offset = divmod(now, charge.period)
+        base = f"{self._prefix}{{{tenant_id}}}:{charge.key}:"
+        return f"{base}{int(window)}", f"{base}{int(window) - 1}", offset / charge.period
+
+    def _estimate(self, current: Any, previous: Any, elapsed: float) -> float:
+        used = float(current or 0)
+        if self._sliding:
+            used += float(previous or 0) * (1 - elapsed)
+        return used
+
+    async def check(self, tenant_id: str, charge: QuotaCharge) -> bool:
+        current_key, previous_key, elapsed = self._keys(tenant_id, charge, time.time())
+        current, previous = await self._redis.mget(current_key, previous_key)
+        return self._estimate(current, previous, elapsed) + charge.amount <= charge.limit
+
+    async def increment(self, tenant_id: str, charges: Sequence[QuotaCharge]) -> bool:
+        now = time.time()
+        keys = [self._keys(tenant_id, charge, now) for charge in charges]
+
+        pipe = self._redis.pipeline()
+        for charge, (current_key, previous_key, _) in zip(charges, keys):
+            pipe.incrby(current_key, charge.amount)
+            pipe.expire(current_key, math.ceil(charge.period * 2))
+            pipe.get(previous_key)
+        results = await pipe.execute()
+
+        within = all(
+            self._estimate(results[i * 3], results[i * 3 + 2], elapsed) <= charge.limit
+            for i, (charge, (_, _, elapsed)) in enumerate(zip(charges, keys))
+        )
+        if not within:
+            pipe = self._redis.pipeline()
+            for charge, (current_key, _, _) in zip(charges, keys):
+                pipe.decrby(current_key, charge.amount)
+            await pipe.execute()
+        return within
+
+    async def get_usage(self, tenant_id: str, charge: QuotaCharge) -> QuotaUsage:
+        now = time.time()
+        current_key, previous_key, elapsed = self._keys(tenant_id, charge, now)
+        current, previous = await self._redis.mget(current_key, previous_key)
+        used = math.ceil(self._estimate(current, previous, elapsed))
+        window_start = now - elapsed * charge.period
+        return QuotaUsage(
+            quota_name="",
+            limit=charge.limit,
+            used=used,
+            remaining=max(0, charge.limit - used),
+            period_start=now - charge.period if self._sliding else window_start,
+            period_end=window_start + charge.period
+        )
+
+    async def reset(self, tenant_id: str) -> None:
+        keys = [key async for key in self._redis.scan_iter(
+            match=f"{self._prefix}{{{tenant_id}}}:*"
+        )]
+        if keys:
+            await self._redis.delete(*keys)
+
+
+_LIMIT_FIELDS = {
+    ("requests", "minute"): "requests_per_minute",
+    ("requests", "hour"): "requests_per_hour",
+    ("requests", "day"): "requests_per_day",
+    ("tokens", "month"): "monthly_token_quota",
+    ("requests", "month"): "monthly_request_quota",
+}
+
+_PERIOD_SECONDS = {
+    "minute": QuotaPeriod.MINUTE.value,
+    "hour": QuotaPeriod.HOUR.value,
+    "day": QuotaPeriod.DAY.value,
+    "month": QuotaPeriod.MONTH.value,
+}
+
+QuotaSpec = Union[Tuple[str, str], Tuple[str, str, int]]
+
+
 class QuotaManager:
     """
     Manages quotas and rate limits for tenants.
@@ -143,22 +541,40 @@ class QuotaManager:
         if await manager.check_quota(tenant, "requests", "minute"):
             # Perform operation
             await manager.increment_quota(tenant, "requests", "minute")
+
+        # Charge several quotas at once, all or nothing
+        await manager.increment_quotas(
+            tenant, [("requests", "minute"), ("requests", "day")]
+        )
     """
 
-    def __init__(self):
-        self._tenant_quotas: Dict[str, Dict[str, QuotaBucket]] = {}
-        self._lock = asyncio.Lock()
+    def __init__(
+        self,
+        algorithm: QuotaAlgorithm = QuotaAlgorithm.SLIDING_WINDOW,
+        backend: Optional[QuotaBackend] = None,
+        max_tenants: int = 10000
+    ):
+        """
+        Initialize quota manager.
+
+        Args:
+            algorithm: Counting algorithm for the default in-memory backend
+            backend: Counter storage (default: InMemoryQuotaBackend)
+            max_tenants: Tenants kept by the default backend before LRU eviction
+        """
+        if backend is None:
+            backend = InMemoryQuotaBackend(algorithm, max_tenants=max_tenants)
+        self._backend = backend
+
+    @property
+    def backend(self) -> QuotaBackend:
+        """Get the counter backend."""
+        return self._backend
 
     def _get_bucket_key(self, quota_name: str, period: str) -> str:
         """Get bucket key for a quota and period."""
         return f"{quota_name}:{period}"
 
-    def _get_tenant_buckets(self, tenant_id: str) -> Dict[str, QuotaBucket]:
-        """Get or create quota buckets for a tenant."""
-        if tenant_id not in self._tenant_quotas:
-            self._tenant_quotas[tenant_id] = {}
-        return self._tenant_quotas[tenant_id]
-
     def _get_limit(
         self,
         config: TenantConfig,
@@ -166,24 +582,34 @@ class QuotaManager:
         period: str
     ) -> int:
         """Get limit from tenant config."""
-        limits = {
-            ("requests", "minute"): config.requests_per_minute,
-            ("requests", "hour"): config.requests_per_hour,
-            ("requests", "day"): config.requests_per_day,
-            ("tokens", "month"): config.monthly_token_quota,
-            ("requests", "month"): config.monthly_request_quota,
-        }
-        return limits.get((quota_name, period), 0)
+        limit_field = _LIMIT_FIELDS.get((quota_name, period))
+        return getattr(config, limit_field) if limit_field else 0
 
     def _get_period_seconds(self, period: str) -> float:
         """Get period duration in seconds."""
-        periods = {
-            "minute": QuotaPeriod.MINUTE.value,
-            "hour": QuotaPeriod.HOUR.value,
-            "day": QuotaPeriod.DAY.value,
-            "month": QuotaPeriod.MONTH.value,
-        }
-        return periods.get(period, 60)
+        return _PERIOD_SECONDS.get(period, 60)
+
+    def _resolve_tenant(self, tenant: Optional[Tenant]) -> Optional[Tenant]:
+        """Fall back to the current tenant context."""
+        if tenant is None:
+            ctx = get_current_tenant()
+            if ctx is not None:
+                tenant = ctx.tenant
+        return tenant
+
+    def _charge(
+        self,
+        config: TenantConfig,
+        quota_name: str,
+        period: str,
+        amount: int = 1
+    ) -> QuotaCharge:
+        return QuotaCharge(
+            key=self._get_bucket_key(quota_name, period),
+            limit=self._get_limit(config, quota_name, period),
+            period=self._get_period_seconds(period),
+            amount=amount,
+        )
 
     async def check_quota(
         self,
@@ -202,22 +628,13 @@ class QuotaManager:
         Returns:
             True if within quota
         """
+        tenant = self._resolve_tenant(tenant)
         if tenant is None:
-            ctx = get_current_tenant()
-            if ctx is None:
-                return True  # No tenant context, allow
-            tenant = ctx.tenant
-
-        async with self._lock:
-            buckets = self._get_tenant_buckets(tenant.id)
-            key = self._get_bucket_key(quota_name, period)
+            return True  # No tenant context, allow
 
-            if key not in buckets:
-                limit = self._get_limit(tenant.config, quota_name, period)
-                period_seconds = self._get_period_seconds(period)
-                buckets[key] = QuotaBucket(limit=limit, period=period_seconds)
-
-            return buckets[key].check()
+        return await self._backend.check(
+            tenant.id, self._charge(tenant.config, quota_name, period)
+        )
 
     async def increment_quota(
         self,
@@ -238,22 +655,35 @@ class QuotaManager:
         Returns:
             True if increment succeeded (within quota)
         """
-        if tenant is None:
-            ctx = get_current_tenant()
-            if ctx is None:
-                return True
-            tenant = ctx.tenant
+        return await self.increment_quotas(tenant, [(quota_name, period)], amount)
+
+    async def increment_quotas(
+        self,
+        tenant: Optional[Tenant] = None,
+        quotas: Sequence[QuotaSpec] = (("requests", "minute"),),
+        amount: int = 1
+    ) -> bool:
+        """
+        Increment several quotas in one backend call, all or nothing.
 
-        async with self._lock:
-            buckets = self._get_tenant_buckets(tenant.id)
-            key = self._get_bucket_key(quota_name, period)
+        Args:
+            tenant: Tenant to increment (uses current if not provided)
+            quotas: (quota_name, period) or (quota_name, period, amount) tuples
+            amount: Amount for entries that do not give their own
 
-            if key not in buckets:
-                limit = self._get_limit(tenant.config, quota_name, period)
-                period_seconds = self._get_period_seconds(period)
-                buckets[key] = QuotaBucket(limit=limit, period=period_seconds)
+        Returns:
+            True if every quota had room and was incremented; False if
+            any was exceeded, in which case none are incremented
+        """
+        tenant = self._resolve_tenant(tenant)
+        if tenant is None:
+            return True
 
-            return buckets[key].increment(amount)
+        charges = [
+            self._charge(tenant.config, spec[0], spec[1], spec[2] if len(spec) > 2 else amount)
+            for spec in quotas
+        ]
+        return await self._backend.increment(tenant.id, charges)
 
     async def require_quota(
         self,
@@ -268,11 +698,6 @@ class QuotaManager:
             QuotaExceededError: If quota is exceeded
         """
         if not await self.check_quota(tenant, quota_name, period):
-            if tenant is None:
-                ctx = get_current_tenant()
-                if ctx:
-                    tenant = ctx.tenant
-
             usage = await self.get_usage(tenant, quota_name, period)
             raise QuotaExceededError(
                 f"Quota exceeded for {quota_name}/{period}",
@@ -294,31 +719,22 @@ class QuotaManager:
         Returns:
             QuotaUsage with current stats
         """
+        tenant = self._resolve_tenant(tenant)
         if tenant is None:
-            ctx = get_current_tenant()
-            if ctx is None:
-                return QuotaUsage(
-                    quota_name=f"{quota_name}/{period}",
-                    limit=0,
-                    used=0,
-                    remaining=0,
-                    period_start=time.time(),
-                    period_end=time.time()
-                )
-            tenant = ctx.tenant
-
-        async with self._lock:
-            buckets = self._get_tenant_buckets(tenant.id)
-            key = self._get_bucket_key(quota_name, period)
-
-            if key not in buckets:
-                limit = self._get_limit(tenant.config, quota_name, period)
-                period_seconds = self._get_period_seconds(period)
-                buckets[key] = QuotaBucket(limit=limit, period=period_seconds)
-
-            usage = buckets[key].get_usage()
-            usage.quota_name = f"{quota_name}/{period}"
-            return usage
+            return QuotaUsage(
+                quota_name=f"{quota_name}/{period}",
+                limit=0,
+                used=0,
+                remaining=0,
+                period_start=time.time(),
+                period_end=time.time()
+            )
+
+        usage = await self._backend.get_usage(
+            tenant.id, self._charge(tenant.config, quota_name, period)
+        )
+        usage.quota_name = f"{quota_name}/{period}"
+        return usage
 
     async def get_all_usage(
         self,
@@ -330,26 +746,21 @@ class QuotaManager:
         Returns:
             List of QuotaUsage for all quotas
         """
+        tenant = self._resolve_tenant(tenant)
         if tenant is None:
-            ctx = get_current_tenant()
-            if ctx is None:
-                return []
-            tenant = ctx.tenant
+            return []
 
         usages = []
         for quota_name in ["requests", "tokens"]:
             for period in ["minute", "hour", "day", "month"]:
-                usage = await self.get_usage(tenant, quota_name, period)
-                if usage.limit > 0:
-                    usages.append(usage)
+                if self._get_limit(tenant.config, quota_name, period) > 0:
+                    usages.append(await self.get_usage(tenant, quota_name, period))
 
         return usages
 
     async def reset_quotas(self, tenant_id: str) -> None:
         """Reset all quotas for a tenant."""
-        async with self._lock:
-            if tenant_id in self._tenant_quotas:
-                del self._tenant_quotas[tenant_id]
+        await self._backend.reset(tenant_id)
 
 
 # Global quota manager
@@ -370,5 +781,9 @@ __all__ = [
     'QuotaUsage',
     'QuotaExceededError',
     'QuotaPeriod',
+    'QuotaAlgorithm',
+    'QuotaBackend',
+    'InMemoryQuotaBackend',
+    'RedisQuotaBackend',
     'get_quota_manager',
 ]
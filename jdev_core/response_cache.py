@@ -0,0 +1,268 @@
+"""Response cache for deterministic LLM re-asks.
+
+Planner prompts, world-model simulations and reviewer passes on
+unchanged files often send the exact same request again. ResponseCache
+answers those without calling the provider:
+- Entries are keyed on everything that shapes the answer (provider,
+  model, messages, temperature, ...), expire after a TTL and are bounded
+  by entry count and total characters (LRU eviction)
+- Cached responses are replayed chunk by chunk through the streaming
+  interface, optionally paced (replay_delay) so UIs render them like a
+  live stream
+- Concurrent identical requests share one provider stream: followers
+  receive the chunks as the leader's stream produces them
+
+Opt-in: pass a ResponseCache to LLMClient or GeminiClient.
+"""
+
+import asyncio
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from contextlib import aclosing
+from dataclasses import dataclass
+from typing import Any, AsyncGenerator, AsyncIterator, Callable, Dict, List, Optional, Sequence
+
+DEFAULT_TTL = 3600.0
+DEFAULT_MAX_ENTRIES = 512
+DEFAULT_MAX_CHARS = 4_000_000
+
+
+@dataclass
+class ResponseCacheStats:
+    """Response cache counters."""
+
+    hits: int = 0
+    misses: int = 0
+    coalesced: int = 0  # Joined an identical in-flight request
+    evictions: int = 0
+    saved_tokens: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of requests answered without a provider call of their own."""
+        served = self.hits + self.coalesced
+        total = served + self.misses
+        return served / total if total > 0 else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "evictions": self.evictions,
+            "saved_tokens": self.saved_tokens,
+            "hit_rate": f"{self.hit_rate * 100:.1f}%",
+        }
+
+
+@dataclass
+class _Entry:
+    chunks: Sequence[str]
+    tokens: int
+    chars: int
+    expires_at: float
+
+
+class _SharedStream:
+    """One provider stream fanned out to every identical request.
+
+    The provider is read by a task so followers keep receiving chunks
+    whichever subscriber is slowest; the task is cancelled once every
+    subscriber has gone.
+    """
+
+    def __init__(
+        self,
+        source: AsyncIterator[str],
+        on_done: Callable[['_SharedStream'], None],
+    ):
+        self.chunks: List[str] = []
+        self.done = False
+        self.cancelled = False
+        self.error: Optional[BaseException] = None
+        self.subscribers = 0
+        self._changed = asyncio.Event()
+        self.task = asyncio.create_task(self._pump(source, on_done))
+
+    @property
+    def complete(self) -> bool:
+        return self.done and self.error is None and not self.cancelled
+
+    async def _pump(
+        self,
+        source: AsyncIterator[str],
+        on_done: Callable[['_SharedStream'], None],
+    ) -> None:
+        try:
+            async with aclosing(source):
+                async for chunk in source:
+                    self.chunks.append(chunk)
+                    self._notify()
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        except Exception as e:
+            self.error = e
+        finally:
+            self.done = True
+            on_done(self)  # Before followers wake, so the result is cached
+            self._notify()
+
+    def _notify(self) -> None:
+        changed, self._changed = self._changed, asyncio.Event()
+        changed.set()
+
+    async def follow(self) -> AsyncGenerator[str, None]:
+        self.subscribers += 1
+        try:
+            index = 0
+            while True:
+                if index < len(self.chunks):
+                    yield self.chunks[index]
+                    index += 1
+                elif self.done:
+                    if self.error is not None:
+                        raise self.error
+                    if self.cancelled:
+                        raise RuntimeError("Shared response stream was cancelled")
+                    return
+                else:
+                    await self._changed.wait()
+        finally:
+            self.subscribers -= 1
+            if not self.subscribers and not self.done:
+                self.task.cancel()
+
+
+class ResponseCache:
+    """TTL + LRU cache of LLM responses with in-flight deduplication.
+
+    Example:
+        cache = ResponseCache(ttl=600, replay_delay=0.01)
+        client = LLMClient(response_cache=cache)
+    """
+
+    def __init__(
+        self,
+        ttl: float = DEFAULT_TTL,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_chars: int = DEFAULT_MAX_CHARS,
+        replay_delay: float = 0.0,
+    ):
+        """
+        Args:
+            ttl: Seconds a response stays valid
+            max_entries: Max cached responses
+            max_chars: Max total characters across cached responses
+            replay_delay: Default seconds between replayed chunks (0 = instant)
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_chars = max_chars
+        self.replay_delay = replay_delay
+        self.stats = ResponseCacheStats()
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._chars = 0
+        self._inflight: Dict[str, _SharedStream] = {}
+
+    @staticmethod
+    def make_key(**parts: Any) -> str:
+        """Key for a request; pass everything that shapes the response."""
+        data = json.dumps(parts, sort_keys=True, default=repr)
+        return hashlib.sha256(data.encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Cached response text, or None. Does not count as a hit."""
+        entry = self._lookup(key)
+        return None if entry is None else "".join(entry.chunks)
+
+    async def stream(
+        self,
+        key: str,
+        produce: Callable[[], AsyncIterator[str]],
+        replay_delay: Optional[float] = None,
+        count_tokens: Callable[[Sequence[str]], int] = len,
+    ) -> AsyncGenerator[str, None]:
+        """Stream the response for key: replayed, shared, or produced.
+
+        Args:
+            key: Request key (see make_key)
+            produce: Starts the provider stream on a miss
+            replay_delay: Seconds between replayed chunks (default: cache's)
+            count_tokens: Token count of a response, for saved_tokens
+                (default: one token per chunk)
+        """
+        entry = self._lookup(key)
+        if entry is not None:
+            self.stats.hits += 1
+            self.stats.saved_tokens += entry.tokens
+            delay = self.replay_delay if replay_delay is None else replay_delay
+            for index, chunk in enumerate(entry.chunks):
+                if index and delay > 0:
+                    await asyncio.sleep(delay)
+                yield chunk
+            return
+
+        shared = self._inflight.get(key)
+        leader = shared is None
+        if leader:
+            self.stats.misses += 1
+            shared = self._inflight[key] = _SharedStream(
+                produce(), lambda done: self._finish(key, done, count_tokens)
+            )
+        else:
+            self.stats.coalesced += 1
+
+        async with aclosing(shared.follow()) as chunks:
+            async for chunk in chunks:
+                yield chunk
+
+        if not leader:
+            self.stats.saved_tokens += count_tokens(shared.chunks)
+
+    def _lookup(self, key: str) -> Optional[_Entry]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= time.monotonic():
+            self._remove(key)
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def _finish(
+        self,
+        key: str,
+        shared: _SharedStream,
+        count_tokens: Callable[[Sequence[str]], int],
+    ) -> None:
+        if self._inflight.get(key) is shared:
+            del self._inflight[key]
+        if shared.complete:
+            self._store(key, shared.chunks, count_tokens(shared.chunks))
+
+    def _store(self, key: str, chunks: Sequence[str], tokens: int) -> None:
+        chars = sum(len(chunk) for chunk in chunks)
+        if chars > self.max_chars or self.max_entries <= 0:
+            return
+        if key in self._entries:
+            self._remove(key)
+
+        self._entries[key] = _Entry(tuple(chunks), tokens, chars, time.monotonic() + self.ttl)
+        self._chars += chars
+        while len(self._entries) > self.max_entries or self._chars > self.max_chars:
+            self._remove(next(iter(self._entries)))
+            self.stats.evictions += 1
+
+    def _remove(self, key: str) -> None:
+        self._chars -= self._entries.pop(key).chars
+
+    def clear(self) -> None:
+        """Drop all cached responses (in-flight requests are unaffected)."""
+        self._entries.clear()
+        self._chars = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
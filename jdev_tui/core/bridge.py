@@ -501,7 +501,7 @@ NOW CREATE ALL THE FILES using write_file tool. Start with mkdir for the directo
 
         for iteration in range(self.MAX_TOOL_ITERATIONS):
             # Stream from LLM with context
-            response_chunks = []
+            # The filter also parses tool calls incrementally as chunks arrive
             stream_filter = StreamFilter()
 
             async for chunk in client.stream(
@@ -510,8 +510,6 @@ NOW CREATE ALL THE FILES using write_file tool. Start with mkdir for the directo
                 context=self.history.get_context(),
                 tools=self.tools.get_schemas_for_llm()
             ):
-                response_chunks.append(chunk)
-
                 # Filter chunk to prevent raw JSON leakage
                 filtered_chunk = stream_filter.process_chunk(chunk)
 
@@ -525,10 +523,11 @@ NOW CREATE ALL THE FILES using write_file tool. Start with mkdir for the directo
                 yield remaining
 
             # Accumulate response
-            accumulated = "".join(response_chunks)
+            stream_filter.parser.finish()
+            accumulated = stream_filter.parser.text
 
             # Check for tool calls
-            tool_calls = ToolCallParser.extract(accumulated)
+            tool_calls = stream_filter.tool_calls
 
             if not tool_calls:
                 # No tool calls - we're done
@@ -20,7 +20,8 @@ from __future__ import annotations
 import json
 import logging
 import re
-from typing import Any, Dict, List, Set, Tuple
+from bisect import bisect_right
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -103,6 +104,52 @@ LEGACY_JSON_PATTERN = re.compile(
 )
 
 
+# Pattern for fenced code blocks (searched for Python-style calls)
+CODE_BLOCK_PATTERN = re.compile(r'```(?:\w+)?\n?(.*?)```', re.DOTALL)
+
+# JSON-shaped formats: (pattern, known tools only, label for debug logs)
+_JSON_FORMATS: Tuple[Tuple[re.Pattern, bool, str], ...] = (
+    (MARKER_PATTERN, False, "marker"),
+    (ANTHROPIC_PATTERN, True, "Anthropic"),
+    (JSON_FUNC_PATTERN, True, "JSON func"),
+    (GEMINI_FC_PATTERN, True, "Gemini FC"),
+    (LEGACY_JSON_PATTERN, True, "legacy JSON"),
+)
+
+
+def _call_key(name: str, args: Dict[str, Any]) -> str:
+    """Deduplication key for a tool call."""
+    try:
+        args_hash = json.dumps(args, sort_keys=True)
+    except (TypeError, ValueError):
+        args_hash = str(args)
+    return f"{name}:{args_hash}"
+
+
+def _json_calls(
+    text: str, pattern: re.Pattern, known_only: bool, label: str
+) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """Tool calls of one JSON-shaped format found in text."""
+    for name, args_str in pattern.findall(text):
+        if known_only and name not in KNOWN_TOOLS:
+            continue
+        try:
+            yield name, json.loads(args_str)
+        except json.JSONDecodeError as e:
+            logger.debug(f"Failed to parse {label} args: {e}")
+
+
+def _python_calls(text: str) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """Python-style calls of known tools found in text."""
+    for match in FUNC_PATTERN.finditer(text):
+        func_name = match.group(1)
+        # Only process known tools
+        if func_name in KNOWN_TOOLS:
+            args = ToolCallParser._parse_python_args(match.group(2))
+            if args:  # Only add if we got valid args
+                yield func_name, args
+
+
 # =============================================================================
 # TOOL CALL PARSER
 # =============================================================================
@@ -215,82 +262,25 @@ class ToolCallParser:
 
         def _add_result(name: str, args: Dict[str, Any]) -> None:
             """Add result avoiding duplicates."""
-            try:
-                args_hash = json.dumps(args, sort_keys=True)
-            except (TypeError, ValueError):
-                args_hash = str(args)
-            key = f"{name}:{args_hash}"
+            key = _call_key(name, args)
             if key not in seen:
                 seen.add(key)
                 results.append((name, args))
 
-        # 1. Check for explicit markers first (highest priority)
-        marker_matches = MARKER_PATTERN.findall(text)
-        for name, args_str in marker_matches:
-            try:
-                args = json.loads(args_str)
+        # 1-4. Markers (highest priority), Anthropic, JSON func, Gemini FC
+        for json_format in _JSON_FORMATS[:4]:
+            for name, args in _json_calls(text, *json_format):
                 _add_result(name, args)
-            except json.JSONDecodeError as e:
-                logger.debug(f"Failed to parse marker args: {e}")
-                continue
-
-        # 2. Check for Anthropic-style tool_use blocks
-        anthropic_matches = ANTHROPIC_PATTERN.findall(text)
-        for name, args_str in anthropic_matches:
-            if name in KNOWN_TOOLS:
-                try:
-                    args = json.loads(args_str)
-                    _add_result(name, args)
-                except json.JSONDecodeError as e:
-                    logger.debug(f"Failed to parse Anthropic args: {e}")
-                    continue
-
-        # 3. Check for JSON function call format
-        json_func_matches = JSON_FUNC_PATTERN.findall(text)
-        for name, args_str in json_func_matches:
-            if name in KNOWN_TOOLS:
-                try:
-                    args = json.loads(args_str)
-                    _add_result(name, args)
-                except json.JSONDecodeError as e:
-                    logger.debug(f"Failed to parse JSON func args: {e}")
-                    continue
-
-        # 4. Check for Gemini native function_call format
-        for match in GEMINI_FC_PATTERN.finditer(text):
-            name, args_str = match.groups()
-            if name in KNOWN_TOOLS:
-                try:
-                    args = json.loads(args_str)
-                    _add_result(name, args)
-                except json.JSONDecodeError as e:
-                    logger.debug(f"Failed to parse Gemini FC args: {e}")
-                    continue
 
         # 5. Check for Python-style function calls (in code blocks)
-        code_blocks = re.findall(r'```(?:\w+)?\n?(.*?)```', text, re.DOTALL)
+        code_blocks = CODE_BLOCK_PATTERN.findall(text)
         search_text = '\n'.join(code_blocks) if code_blocks else text
-
-        for match in FUNC_PATTERN.finditer(search_text):
-            func_name = match.group(1)
-            args_str = match.group(2)
-
-            # Only process known tools
-            if func_name in KNOWN_TOOLS:
-                args = ToolCallParser._parse_python_args(args_str)
-                if args:  # Only add if we got valid args
-                    _add_result(func_name, args)
+        for name, args in _python_calls(search_text):
+            _add_result(name, args)
 
         # 6. Check for legacy JSON format ({"tool": "name", "args": {...}})
-        legacy_matches = ToolCallParser.LEGACY_JSON_PATTERN.findall(text)
-        for name, args_str in legacy_matches:
-            if name in KNOWN_TOOLS:
-                try:
-                    args = json.loads(args_str)
-                    _add_result(name, args)
-                except json.JSONDecodeError as e:
-                    logger.debug(f"Failed to parse legacy JSON args: {e}")
-                    continue
+        for name, args in _json_calls(text, *_JSON_FORMATS[4]):
+            _add_result(name, args)
 
         return results
 
@@ -428,16 +418,282 @@ class ToolCallParser:
         logger.debug(f"Registered tool: {name}")
 
 
+# =============================================================================
+# INCREMENTAL (STREAMING) PARSING
+# =============================================================================
+
+# Characters that change JSON nesting state, outside / inside a string
+_STRUCTURE_CHARS = re.compile(r'[{}"`]')
+_STRING_CHARS = re.compile(r'["\\`]')
+
+FENCE = '```'
+
+
+class BraceScanner:
+    """
+    Tracks JSON object nesting across chunks.
+
+    Braces inside JSON strings (including escaped quotes) are ignored, so
+    a tool call whose content contains code closes where the JSON does.
+    Each character is looked at once; text between structural characters
+    is skipped by the regex engine.
+    """
+
+    def __init__(self) -> None:
+        self.depth = 0
+        self.in_string = False
+        self._escape = False
+
+    def feed(self, text: str, start: int = 0) -> int:
+        """
+        Scan text[start:] until the outermost open object closes.
+
+        Args:
+            text: Next piece of the stream
+            start: Index in text to start scanning from
+
+        Returns:
+            Index just past the closing brace, or -1 if still open
+        """
+        pos = start
+        if self._escape and pos < len(text):
+            self._escape = False
+            pos += 1
+        while True:
+            pattern = _STRING_CHARS if self.in_string else _STRUCTURE_CHARS
+            match = pattern.search(text, pos)
+            if match is None:
+                return -1
+            char, pos = match.group(), match.end()
+            if self.in_string:
+                if char == '\\':
+                    if pos == len(text):
+                        self._escape = True
+                        return -1
+                    pos += 1
+                elif char == '"':
+                    self.in_string = False
+            elif char == '"':
+                self.in_string = self.depth > 0
+            elif char == '{':
+                self.depth += 1
+            elif char == '}' and self.depth:
+                self.depth -= 1
+                if not self.depth:
+                    return pos
+
+
+class IncrementalToolCallParser:
+    """
+    Streaming counterpart of ToolCallParser.extract.
+
+    Consumes chunks as they arrive and reports each tool call as soon as
+    it is complete, instead of re-running every format regex over the
+    whole response once the stream ends:
+    - JSON-shaped formats (markers, Anthropic, JSON func, Gemini FC,
+      legacy) are matched on the text up to each top-level JSON object
+      that just closed, so every character is regex-scanned once
+    - Python-style calls are matched on each code block when its closing
+      fence arrives; without any code block, on the whole text at finish().
+      Like extract(), every fence counts, including one inside a JSON string
+    - Nesting is tracked with string/escape awareness; a fence outside a
+      string or at the start of a line ends any open object, so a stray
+      quote cannot swallow the rest of the response
+
+    Finds the same calls as extract(), ordered by position in the text
+    rather than grouped by format.
+
+    Usage:
+        parser = IncrementalToolCallParser()
+        async for chunk in stream:
+            for name, args in parser.feed(chunk):
+                ...  # Call is complete
+        parser.finish()
+        calls = parser.calls
+    """
+
+    def __init__(self) -> None:
+        self._chunks: List[str] = []
+        self._starts: List[int] = []  # Offset of each chunk in the text
+        self._length = 0
+        self._joined: Optional[str] = None
+        self._calls: List[Tuple[str, Dict[str, Any]]] = []
+        self._seen: Set[str] = set()
+
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._carry = ""  # Trailing backticks that may start a fence
+        self._prev_char = "\n"  # Char before the text being scanned
+        self._segment_start = 0  # Text before this is JSON-scanned
+        self._close_at = -1  # Top-level object closed here; ']' may follow
+        self._block_start = -1  # Opening fence of the current code block
+        self._code_blocks = 0
+        self._finished = False
+
+    @property
+    def text(self) -> str:
+        """Full text fed so far."""
+        if self._joined is None:
+            self._joined = "".join(self._chunks)
+        return self._joined
+
+    @property
+    def calls(self) -> List[Tuple[str, Dict[str, Any]]]:
+        """All tool calls found so far, deduplicated, in text order."""
+        return list(self._calls)
+
+    def feed(self, chunk: str) -> List[Tuple[str, Dict[str, Any]]]:
+        """
+        Consume the next chunk of the response.
+
+        Args:
+            chunk: Text chunk
+
+        Returns:
+            Tool calls completed by this chunk
+        """
+        if not chunk or self._finished:
+            return []
+        self._starts.append(self._length)
+        self._chunks.append(chunk)
+        self._length += len(chunk)
+        self._joined = None
+
+        found: List[Tuple[str, Dict[str, Any]]] = []
+        text = self._carry + chunk
+        base = self._length - len(text)
+        self._carry = ""
+
+        pos = 0
+        if self._close_at >= 0:
+            self._end_segment(self._close_at + (text[0] == ']'), found)
+            self._close_at = -1
+        if self._escape:
+            self._escape = False
+            pos = 0 if text[0] == '`' else 1
+
+        while True:
+            pattern = _STRING_CHARS if self._in_string else _STRUCTURE_CHARS
+            match = pattern.search(text, pos)
+            if match is None:
+                break
+            char, index, pos = match.group(), match.start(), match.end()
+
+            if char == '`':
+                if not text.startswith(FENCE, index):
+                    if FENCE.startswith(text[index:]):
+                        self._carry = text[index:]  # Fence split across chunks
+                        break
+                    continue
+                pos = index + len(FENCE)
+                # Paired like extract() does, even inside a JSON string
+                self._toggle_code_block(base + index, found)
+                before = text[index - 1] if index else self._prev_char
+                if not self._in_string or before == '\n':
+                    # A fence ends any JSON object left open (it was not JSON)
+                    self._depth = 0
+                    self._in_string = False
+            elif self._in_string:
+                if char == '\\':
+                    if pos == len(text):
+                        self._escape = True
+                        break
+                    # An escaped backtick may still start a fence
+                    if text[pos] != '`':
+                        pos += 1
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = self._depth > 0
+            elif char == '{':
+                self._depth += 1
+            elif char == '}' and self._depth:
+                self._depth -= 1
+                if not self._depth:
+                    if pos < len(text):
+                        self._end_segment(base + pos + (text[pos] == ']'), found)
+                    else:
+                        self._close_at = base + pos
+
+        scanned = text[:len(text) - len(self._carry)]
+        if scanned:
+            self._prev_char = scanned[-1]
+        return found
+
+    def finish(self) -> List[Tuple[str, Dict[str, Any]]]:
+        """
+        Mark the end of the stream.
+
+        Returns:
+            Tool calls only complete now (trailing text, Python-style
+            calls outside code blocks)
+        """
+        if self._finished:
+            return []
+        self._finished = True
+        found: List[Tuple[str, Dict[str, Any]]] = []
+        self._end_segment(self._length, found)
+        if not self._code_blocks:
+            for name, args in _python_calls(self.text):
+                self._add(name, args, found)
+        return found
+
+    def _slice(self, start: int, end: int) -> str:
+        """Text[start:end] without joining the whole stream."""
+        first = bisect_right(self._starts, start) - 1
+        parts: List[str] = []
+        for i in range(first, len(self._chunks)):
+            offset = self._starts[i]
+            if offset >= end:
+                break
+            parts.append(self._chunks[i][max(start - offset, 0):end - offset])
+        return "".join(parts)
+
+    def _end_segment(self, end: int, found: List[Tuple[str, Dict[str, Any]]]) -> None:
+        """Match the JSON-shaped formats on text not yet scanned, up to end."""
+        if end <= self._segment_start:
+            return
+        segment = self._slice(self._segment_start, end)
+        self._segment_start = end
+        for json_format in _JSON_FORMATS:
+            for name, args in _json_calls(segment, *json_format):
+                self._add(name, args, found)
+
+    def _toggle_code_block(self, fence_at: int, found: List[Tuple[str, Dict[str, Any]]]) -> None:
+        if self._block_start < 0:
+            self._block_start = fence_at
+            return
+        match = CODE_BLOCK_PATTERN.match(self._slice(self._block_start, fence_at + len(FENCE)))
+        self._block_start = -1
+        if match:
+            self._code_blocks += 1
+            for name, args in _python_calls(match.group(1)):
+                self._add(name, args, found)
+
+    def _add(
+        self, name: str, args: Dict[str, Any], found: List[Tuple[str, Dict[str, Any]]]
+    ) -> None:
+        key = _call_key(name, args)
+        if key not in self._seen:
+            self._seen.add(key)
+            self._calls.append((name, args))
+            found.append((name, args))
+
+
 # =============================================================================
 # EXPORTS
 # =============================================================================
 
 __all__ = [
     "ToolCallParser",
+    "IncrementalToolCallParser",
+    "BraceScanner",
     "KNOWN_TOOLS",
     "MARKER_PATTERN",
     "ANTHROPIC_PATTERN",
     "JSON_FUNC_PATTERN",
     "GEMINI_FC_PATTERN",
     "FUNC_PATTERN",
+    "CODE_BLOCK_PATTERN",
 ]
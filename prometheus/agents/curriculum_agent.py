@@ -16,6 +16,7 @@ from dataclasses import dataclass, field
 from typing import List, Dict, Optional, Any
 from enum import Enum
 from datetime import datetime
+import asyncio
 import hashlib
 import json
 import re
@@ -178,16 +179,32 @@ class CurriculumAgent:
         batch_size: int = 5,
         domains: Optional[List[TaskDomain]] = None,
     ) -> List[EvolutionTask]:
-        """Generate a batch of tasks across different domains."""
-        domains = domains or list(TaskDomain)
-        tasks = []
-
-        for i in range(batch_size):
-            domain = domains[i % len(domains)]
-            task = await self.generate_task(executor_stats, domain)
-            tasks.append(task)
+        """
+        Generate a batch of tasks across different domains.
 
-        return tasks
+        Difficulty and skills are picked up front, then the LLM calls run
+        concurrently; tasks enter the history in batch order.
+        """
+        domains = domains or list(TaskDomain)
+        targets = [
+            (
+                self._select_difficulty(executor_stats),
+                domains[i % len(domains)],
+                self._select_target_skills(executor_stats),
+            )
+            for i in range(batch_size)
+        ]
+
+        tasks = await asyncio.gather(*(
+            self._generate_task_with_llm(difficulty, domain, skills, executor_stats)
+            for difficulty, domain, skills in targets
+        ))
+
+        for task in tasks:
+            self.task_history.append(task)
+            self._update_stats(task)
+
+        return list(tasks)
 
     async def _generate_task_with_llm(
         self,
@@ -13,8 +13,9 @@ The Executor Agent is responsible for:
 """
 
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Any, Tuple
+from typing import List, Dict, Optional, Any, AsyncIterator, Tuple
 from datetime import datetime
+import asyncio
 import json
 import re
 
@@ -46,6 +47,107 @@ class ExecutionResult:
         }
 
 
+@dataclass
+class TestCaseResult:
+    """Outcome of one test case in a batched run."""
+    index: int
+    passed: bool
+    result: Optional[str] = None  # repr() of the returned value
+    expected: Any = None
+    error: Optional[str] = None
+    stdout: str = ""
+    time_taken: float = 0.0  # seconds
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary."""
+        return {
+            "index": self.index,
+            "passed": self.passed,
+            "result": self.result,
+            "expected": self.expected,
+            "error": self.error,
+            "stdout": self.stdout,
+            "time_taken": self.time_taken,
+        }
+
+
+# Batched test runner: the harness is appended to the solution source (so
+# sandbox validation still sees it and line numbers are kept), the
+# solution loads once, and every case runs in the same process with its
+# own alarm-based timeout. Each case reports one __TEST_CASE__ line (when
+# the sandbox runs a fresh process, results printed before a crash are
+# kept). Harness names start with "_" and are never
+# picked as the solution function.
+TEST_CASE_MARKER = "__TEST_CASE__:"
+
+_TEST_HARNESS = """
+import io as __io, json as __json, signal as __signal, sys as __sys, time as __time
+__stdout = __sys.stdout
+__cases = {cases!r}
+__case_timeout = {timeout!r}
+__has_alarm = hasattr(__signal, "setitimer")
+
+
+class __CaseTimeout(BaseException):
+    pass
+
+
+def __on_alarm(signum, frame):
+    raise __CaseTimeout()
+
+
+def __call_solution(arg):
+    main = globals().get("main")
+    if callable(main):
+        result = main(arg)
+        if result is not None:
+            return result
+    error = None
+    for name, obj in list(globals().items()):
+        if name.startswith("_") or not callable(obj):
+            continue
+        try:
+            return obj(arg)
+        except Exception as e:
+            error = e
+    if error is not None:
+        raise error
+    return None
+
+
+if __has_alarm:
+    __previous_handler = __signal.signal(__signal.SIGALRM, __on_alarm)
+
+for __index, (__input, __expected) in enumerate(__cases):
+    __report = {{"index": __index, "passed": False}}
+    __out = __io.StringIO()
+    __sys.stdout = __out
+    __start = __time.perf_counter()
+    try:
+        if __has_alarm:
+            __signal.setitimer(__signal.ITIMER_REAL, __case_timeout)
+        try:
+            __result = __call_solution(__input)
+        finally:
+            if __has_alarm:
+                __signal.setitimer(__signal.ITIMER_REAL, 0)
+        __report["result"] = repr(__result)[:200]
+        __report["passed"] = bool(__result == __expected)
+    except __CaseTimeout:
+        __report["error"] = f"Timed out after {{__case_timeout}}s"
+    except BaseException as __error:
+        __report["error"] = f"{{type(__error).__name__}}: {{__error}}"[:200]
+    finally:
+        __sys.stdout = __stdout
+    __report["stdout"] = __out.getvalue()[:200]
+    __report["time_taken"] = __time.perf_counter() - __start
+    print("__TEST_CASE__:" + __json.dumps(__report), flush=True)
+
+if __has_alarm:
+    __signal.signal(__signal.SIGALRM, __previous_handler)
+"""
+
+
 @dataclass
 class SkillProfile:
     """Profile of a learned skill."""
@@ -84,6 +186,8 @@ class ExecutorAgent:
         memory_system,
         reflection_engine,
         sandbox_executor,
+        batch_test_cases: bool = True,
+        test_case_timeout: float = 10.0,
     ):
         self.llm = llm_client
         self.tools = tool_factory
@@ -91,6 +195,10 @@ class ExecutorAgent:
         self.reflection = reflection_engine
         self.sandbox = sandbox_executor
 
+        # Run all test cases of a task in one sandbox process
+        self.batch_test_cases = batch_test_cases
+        self.test_case_timeout = test_case_timeout
+
         self.skills: Dict[str, SkillProfile] = {}
         self.execution_history: List[ExecutionResult] = []
 
@@ -113,10 +221,58 @@ class ExecutorAgent:
         3. Evaluate result
         4. Learn from experience
         """
+        result = await self._solve(task, use_hints, max_retries)
+        lessons = await self._reflect(result)
+        self._record(result, lessons)
+        return result
+
+    async def attempt_tasks(
+        self,
+        tasks: List[EvolutionTask],
+        use_hints: bool = False,
+        max_retries: int = 2,
+        max_concurrency: int = 4,
+    ) -> AsyncIterator[ExecutionResult]:
+        """
+        Attempt several tasks concurrently.
+
+        Up to max_concurrency tasks are solved (and reflected on) at once;
+        learning is applied and results are yielded in task order, so the
+        resulting state does not depend on which attempt finishes first.
+        All tasks see the memory context from before the batch.
+        """
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        # Taken before any result is recorded, not when a slot frees up
+        contexts = [self.memory.get_context_for_task(task.description) for task in tasks]
+
+        async def run(task: EvolutionTask, context: dict) -> Tuple[ExecutionResult, List[str]]:
+            async with semaphore:
+                result = await self._solve(task, use_hints, max_retries, context)
+                return result, await self._reflect(result)
+
+        pending = [asyncio.ensure_future(run(*args)) for args in zip(tasks, contexts)]
+        try:
+            for future in pending:
+                result, lessons = await future
+                self._record(result, lessons)
+                yield result
+        finally:
+            for future in pending:
+                future.cancel()
+
+    async def _solve(
+        self,
+        task: EvolutionTask,
+        use_hints: bool,
+        max_retries: int,
+        context: Optional[dict] = None,
+    ) -> ExecutionResult:
+        """Solve and evaluate a task without touching learned state."""
         start_time = datetime.now()
 
         # Get relevant context from memory
-        context = self.memory.get_context_for_task(task.description)
+        if context is None:
+            context = self.memory.get_context_for_task(task.description)
 
         # Add hints if requested and available
         hints_section = ""
@@ -144,8 +300,7 @@ class ExecutorAgent:
         # Identify skills demonstrated
         skills_demonstrated = self._identify_skills(solution, task)
 
-        # Create result
-        result = ExecutionResult(
+        return ExecutionResult(
             task=task,
             solution=solution,
             success=score >= 0.7,
@@ -155,17 +310,15 @@ class ExecutorAgent:
             errors_made=errors,
         )
 
-        # Learn from the attempt
-        await self._learn_from_result(result)
+    def _record(self, result: ExecutionResult, lessons: List[str]):
+        """Learn from an attempt and store it in history."""
+        self._learn_from_result(result, lessons)
 
-        # Store in history
         self.execution_history.append(result)
         self._total_attempts += 1
         if result.success:
             self._total_successes += 1
 
-        return result
-
     async def _generate_solution(
         self,
         task: EvolutionTask,
@@ -277,6 +430,87 @@ Evaluate each criterion and provide scores in JSON:
         if not code:
             return 0.0, ["No code found in solution"]
 
+        if not self.batch_test_cases:
+            return await self._run_test_cases_isolated(task, code)
+
+        results = await self.run_test_cases(code, task.test_cases)
+        errors = []
+        for case in results:
+            if case.passed:
+                continue
+            if case.error:
+                errors.append(f"Test {case.index + 1} failed: {case.error[:100]}")
+            else:
+                errors.append(
+                    f"Test {case.index + 1} failed: got {case.result}, expected {case.expected!r}"
+                )
+
+        passed = sum(1 for case in results if case.passed)
+        return passed / len(results), errors
+
+    async def run_test_cases(
+        self,
+        code: str,
+        test_cases: List[Dict[str, Any]],
+    ) -> List[TestCaseResult]:
+        """
+        Run all test cases against code in a single sandbox process.
+
+        The code is loaded once; each case gets test_case_timeout seconds
+        and its exception (if any) is captured. Cases that produced no
+        report (load error, crash, overall timeout) fail with the
+        sandbox error.
+        """
+        cases = [
+            (test.get("input", ""), test.get("expected_output", test.get("expected", "")))
+            for test in test_cases
+        ]
+        script = code + "\n" + _TEST_HARNESS.format(cases=cases, timeout=self.test_case_timeout)
+        run = await self.sandbox.execute(
+            script,
+            timeout=self.test_case_timeout * len(cases) + 10,
+            capture_return=False,
+        )
+
+        reports = {}
+        for line in run.stdout.splitlines():
+            if line.startswith(TEST_CASE_MARKER):
+                try:
+                    report = json.loads(line[len(TEST_CASE_MARKER):])
+                except json.JSONDecodeError:
+                    continue
+                reports[report["index"]] = report
+
+        sandbox_error = (run.stderr or run.error_message or "No result reported").strip()
+        results = []
+        for index, (_, expected) in enumerate(cases):
+            report = reports.get(index)
+            if report is None:
+                results.append(TestCaseResult(
+                    index=index,
+                    passed=False,
+                    expected=expected,
+                    error=sandbox_error.splitlines()[-1] if sandbox_error else None,
+                ))
+                continue
+            results.append(TestCaseResult(
+                index=index,
+                passed=report["passed"],
+                result=report.get("result"),
+                expected=expected,
+                error=report.get("error"),
+                stdout=report.get("stdout", ""),
+                time_taken=report.get("time_taken", 0.0),
+            ))
+
+        return results
+
+    async def _run_test_cases_isolated(
+        self,
+        task: EvolutionTask,
+        code: str,
+    ) -> Tuple[float, List[str]]:
+        """Run each test case in its own sandbox process."""
         passed = 0
         errors = []
 
@@ -380,7 +614,21 @@ IMPROVED SOLUTION:"""
 
         return list(demonstrated)
 
-    async def _learn_from_result(self, result: ExecutionResult):
+    async def _reflect(self, result: ExecutionResult) -> List[str]:
+        """Reflect on a failed attempt; returns lessons learned."""
+        if result.success or not result.errors_made:
+            return []
+
+        reflection_result = await self.reflection.critique_action(
+            action=f"Attempted task: {result.task.description[:100]}",
+            result=f"Failed with score {result.score:.2f}. Errors: {result.errors_made}",
+            context={"solution": result.solution[:500]},
+        )
+        result.reflection = reflection_result.critique
+        result.improvement_notes = reflection_result.improvements
+        return reflection_result.lessons_learned
+
+    def _learn_from_result(self, result: ExecutionResult, lessons: List[str]):
         """Learn from task execution result."""
         # Update skill profiles
         for skill in result.skills_demonstrated:
@@ -401,22 +649,12 @@ IMPROVED SOLUTION:"""
             importance=result.score if result.success else 1 - result.score,
         )
 
-        # If failed, do deeper reflection
-        if not result.success and result.errors_made:
-            reflection_result = await self.reflection.critique_action(
-                action=f"Attempted task: {result.task.description[:100]}",
-                result=f"Failed with score {result.score:.2f}. Errors: {result.errors_made}",
-                context={"solution": result.solution[:500]},
+        # Learn procedure from reflection on failures
+        if lessons:
+            self.memory.learn_procedure(
+                skill_name=f"avoid_error_{result.task.domain.value}",
+                steps=lessons,
             )
-            result.reflection = reflection_result.critique
-            result.improvement_notes = reflection_result.improvements
-
-            # Learn procedure from reflection
-            if reflection_result.lessons_learned:
-                self.memory.learn_procedure(
-                    skill_name=f"avoid_error_{result.task.domain.value}",
-                    steps=reflection_result.lessons_learned,
-                )
 
     def _extract_code(self, text: str) -> str:
         """Extract code from solution text."""
@@ -12,6 +12,7 @@ The co-evolution loop enables the agent to:
 3. Improve continuously without external data
 """
 
+from contextlib import aclosing
 from dataclasses import dataclass, field
 from typing import List, Dict, Optional, Any, AsyncIterator
 import asyncio
@@ -106,6 +107,8 @@ class CoEvolutionLoop:
         self,
         num_iterations: int = 10,
         domain: TaskDomain = TaskDomain.GENERAL,
+        batch_size: int = 1,
+        max_concurrency: int = 4,
     ) -> EvolutionStats:
         """
         Run the evolution loop.
@@ -115,8 +118,12 @@ class CoEvolutionLoop:
         2. Executor attempts to solve
         3. Curriculum adjusts based on result
         4. Executor learns from experience
+
+        See evolve_with_progress() for batch_size/max_concurrency.
         """
-        async for _ in self.evolve_with_progress(num_iterations, domain):
+        async for _ in self.evolve_with_progress(
+            num_iterations, domain, batch_size, max_concurrency
+        ):
             pass
         return self.stats
 
@@ -124,71 +131,111 @@ class CoEvolutionLoop:
         self,
         num_iterations: int = 10,
         domain: TaskDomain = TaskDomain.GENERAL,
+        batch_size: int = 1,
+        max_concurrency: int = 4,
     ) -> AsyncIterator[Dict[str, Any]]:
         """
         Run evolution loop with progress updates.
 
         Yields progress dict after each iteration.
+
+        With batch_size > 1, tasks are generated batch_size at a time
+        from the same executor stats and attempted with up to
+        max_concurrency in flight. Results are applied (executor
+        learning, curriculum update, stats) in task order, so a run is
+        reproducible regardless of which attempt finishes first.
         """
         self._is_evolving = True
 
         try:
-            for i in range(num_iterations):
-                # Get current stats
-                stats_before = self.executor.get_stats()
+            if batch_size <= 1:
+                for i in range(num_iterations):
+                    # Get current stats
+                    stats_before = self.executor.get_stats()
 
-                # Generate task at frontier
-                task = await self.curriculum.generate_task(stats_before, domain)
+                    # Generate task at frontier
+                    task = await self.curriculum.generate_task(stats_before, domain)
 
-                # Executor attempts task
-                result = await self.executor.attempt_task(task)
+                    # Executor attempts task
+                    result = await self.executor.attempt_task(task)
 
-                # Curriculum updates based on result
-                self.curriculum.update_curriculum(task, {
-                    "success": result.success,
-                    "score": result.score,
-                    "skills_demonstrated": result.skills_demonstrated,
-                })
+                    yield self._complete_iteration(i + 1, num_iterations, result, stats_before)
 
-                # Get updated stats
-                stats_after = self.executor.get_stats()
+                    # Small delay between iterations
+                    await asyncio.sleep(0.1)
+                return
 
-                # Calculate improvement
-                improvement = (
-                    stats_after.get("success_rate", 0) -
-                    stats_before.get("success_rate", 0)
+            done = 0
+            while done < num_iterations:
+                stats_before = self.executor.get_stats()
+                tasks = await self.curriculum.generate_task_batch(
+                    stats_before,
+                    batch_size=min(batch_size, num_iterations - done),
+                    domains=[domain],
                 )
 
-                # Store iteration
-                iteration = EvolutionIteration(
-                    iteration=i + 1,
-                    task=task,
-                    result=result,
-                    executor_stats_before=stats_before,
-                    executor_stats_after=stats_after,
-                    improvement=improvement,
-                )
-                self.evolution_history.append(iteration)
+                attempts = self.executor.attempt_tasks(tasks, max_concurrency=max_concurrency)
+                async with aclosing(attempts):
+                    async for result in attempts:
+                        done += 1
+                        progress = self._complete_iteration(
+                            done, num_iterations, result, stats_before
+                        )
+                        stats_before = self.evolution_history[-1].executor_stats_after
+                        yield progress
 
-                # Update overall stats
-                self._update_stats(result, stats_after)
+        finally:
+            self._is_evolving = False
 
-                # Yield progress
-                yield {
-                    "iteration": i + 1,
-                    "total": num_iterations,
-                    "task_difficulty": task.difficulty.name,
-                    "success": result.success,
-                    "score": result.score,
-                    "current_success_rate": self.stats.success_rate,
-                    "frontier": self.stats.current_frontier.name,
-                }
+    def _complete_iteration(
+        self,
+        number: int,
+        total: int,
+        result: ExecutionResult,
+        stats_before: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """Apply an attempted task to curriculum and stats; returns progress."""
+        task = result.task
+
+        # Curriculum updates based on result
+        self.curriculum.update_curriculum(task, {
+            "success": result.success,
+            "score": result.score,
+            "skills_demonstrated": result.skills_demonstrated,
+        })
+
+        # Get updated stats
+        stats_after = self.executor.get_stats()
+
+        # Calculate improvement
+        improvement = (
+            stats_after.get("success_rate", 0) -
+            stats_before.get("success_rate", 0)
+        )
 
-                # Small delay between iterations
-                await asyncio.sleep(0.1)
+        # Store iteration
+        iteration = EvolutionIteration(
+            iteration=number,
+            task=task,
+            result=result,
+            executor_stats_before=stats_before,
+            executor_stats_after=stats_after,
+            improvement=improvement,
+        )
+        self.evolution_history.append(iteration)
 
-        finally:
-            self._is_evolving = False
+        # Update overall stats
+        self._update_stats(result, stats_after)
+
+        return {
+            "iteration": number,
+            "total": total,
+            "task_difficulty": task.difficulty.name,
+            "success": result.success,
+            "score": result.score,
+            "current_success_rate": self.stats.success_rate,
+            "frontier": self.stats.current_frontier.name,
+        }
 
     async def evolve_targeted(
         self,
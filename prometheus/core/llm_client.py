@@ -16,6 +16,8 @@ from typing import AsyncIterator, Optional, List, Dict
 from datetime import datetime
 import httpx
 
+from jdev_core.response_cache import ResponseCache
+
 
 @dataclass
 class GenerationConfig:
@@ -57,8 +59,16 @@ class GeminiClient:
         model: str = "flash",
         api_key: Optional[str] = None,
         config: Optional[GenerationConfig] = None,
+        response_cache: Optional[ResponseCache] = None,
     ):
+        """
+        Args:
+            response_cache: Opt-in cache; identical requests (same model and
+                payload, including history and generation config) are
+                answered from it or share an identical in-flight request
+        """
         self.model_name = self.MODELS.get(model, model)
+        self.response_cache = response_cache
         self.api_key = api_key or os.environ.get("GOOGLE_API_KEY") or os.environ.get("GEMINI_API_KEY")
         self.config = config or GenerationConfig()
         self._client: Optional[httpx.AsyncClient] = None
@@ -149,11 +159,35 @@ class GeminiClient:
         Returns:
             Generated text
         """
-        await self._ensure_client()
-
         url = self._build_url("generateContent")
         payload = self._build_payload(prompt, system_prompt, include_history)
 
+        if self.response_cache is None:
+            text = await self._post_with_retries(url, payload, retry_count)
+        else:
+            async def produce() -> AsyncIterator[str]:
+                yield await self._post_with_retries(url, payload, retry_count)
+
+            text = "".join([
+                chunk async for chunk in self.response_cache.stream(
+                    self._response_key(payload), produce,
+                    replay_delay=0.0, count_tokens=_estimate_tokens,
+                )
+            ])
+
+        # Store in history
+        self.conversation_history.append(Message(role="user", content=prompt))
+        self.conversation_history.append(Message(role="model", content=text))
+
+        return text
+
+    def _response_key(self, payload: dict) -> str:
+        return ResponseCache.make_key(provider="gemini", model=self.model_name, payload=payload)
+
+    async def _post_with_retries(self, url: str, payload: dict, retry_count: int) -> str:
+        """POST generateContent, retrying empty responses, 429s and errors."""
+        await self._ensure_client()
+
         last_error = None
         for attempt in range(retry_count):
             try:
@@ -169,10 +203,6 @@ class GeminiClient:
                         await asyncio.sleep(2 ** attempt)  # Exponential backoff
                         continue
 
-                    # Store in history
-                    self.conversation_history.append(Message(role="user", content=prompt))
-                    self.conversation_history.append(Message(role="model", content=text))
-
                     return text
 
                 elif response.status_code == 429:
@@ -206,12 +236,30 @@ class GeminiClient:
 
         Yields text chunks as they are generated.
         """
-        await self._ensure_client()
-
         url = self._build_url("streamGenerateContent")
         payload = self._build_payload(prompt, system_prompt, include_history)
 
+        if self.response_cache is None:
+            stream = self._stream_sse(url, payload)
+        else:
+            stream = self.response_cache.stream(
+                self._response_key(payload), lambda: self._stream_sse(url, payload),
+                count_tokens=_estimate_tokens,
+            )
+
         full_response = []
+        async for text in stream:
+            full_response.append(text)
+            yield text
+
+        # Store complete response in history
+        complete_text = "".join(full_response)
+        self.conversation_history.append(Message(role="user", content=prompt))
+        self.conversation_history.append(Message(role="model", content=complete_text))
+
+    async def _stream_sse(self, url: str, payload: dict) -> AsyncIterator[str]:
+        """POST streamGenerateContent and yield text from its SSE events."""
+        await self._ensure_client()
 
         async with self._client.stream("POST", url, json=payload) as response:
             if response.status_code != 200:
@@ -232,16 +280,10 @@ class GeminiClient:
                             data = json.loads(line[6:])
                             text = self._extract_text(data)
                             if text:
-                                full_response.append(text)
                                 yield text
                         except json.JSONDecodeError:
                             continue
 
-        # Store complete response in history
-        complete_text = "".join(full_response)
-        self.conversation_history.append(Message(role="user", content=prompt))
-        self.conversation_history.append(Message(role="model", content=complete_text))
-
     async def generate_with_thinking(
         self,
         prompt: str,
@@ -331,6 +373,11 @@ class GeminiClient:
         return len(text) // 4  # Fallback estimate
 
 
+def _estimate_tokens(chunks) -> int:
+    """Rough token count of a response (1 token ~ 4 chars)."""
+    return sum(len(chunk) for chunk in chunks) // 4
+
+
 # Convenience function
 async def quick_generate(prompt: str, model: str = "flash") -> str:
     """Quick one-shot generation."""
@@ -12,11 +12,18 @@ The World Model enables the agent to:
 4. Learn from simulations (not just real executions)
 """
 
-from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Any, Tuple
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Callable, List, Dict, Optional, Any, Tuple, Union
 from enum import Enum
+import asyncio
 import json
+import os
 import re
+import time
+
+from ..memory.storage import MemoryStorage, SQLiteMemoryStorage
 
 
 class ActionType(Enum):
@@ -105,6 +112,7 @@ class SimulationResult:
     total_estimated_time: float
     critical_risks: List[str]
     plan_summary: str = ""
+    pruned: bool = False  # Abandoned early: could not beat a better plan
 
     def to_dict(self) -> dict:
         """Convert to dictionary."""
@@ -114,6 +122,141 @@ class SimulationResult:
             "estimated_tokens": self.total_estimated_tokens,
             "critical_risks": self.critical_risks,
             "summary": self.plan_summary,
+            "pruned": self.pruned,
+        }
+
+
+def _simulation_to_record(simulated: SimulatedAction) -> dict:
+    record = asdict(simulated)
+    record["action_type"] = simulated.action_type.value
+    return record
+
+
+def _simulation_from_record(record: dict) -> SimulatedAction:
+    return SimulatedAction(**{**record, "action_type": ActionType(record["action_type"])})
+
+
+class SimulationCache:
+    """
+    Bounded LRU cache of simulated actions with a time-to-live.
+
+    Values are (SimulatedAction, state_changes) pairs. With a storage
+    backend every entry is also written through, and a miss in RAM falls
+    back to storage, so simulations survive restarts (TTL still applies).
+    """
+
+    STORAGE_KIND = "simulation"
+
+    def __init__(
+        self,
+        max_size: int = 512,
+        ttl_seconds: Optional[float] = 3600.0,
+        storage: Optional[Union[MemoryStorage, str, Path]] = None,
+    ):
+        """
+        Args:
+            max_size: Entries kept in RAM (least recently used evicted first)
+            ttl_seconds: Entry lifetime; None never expires
+            storage: Optional persistent backend, or a path for a
+                SQLiteMemoryStorage database
+        """
+        if isinstance(storage, (str, Path)):
+            storage = SQLiteMemoryStorage(storage)
+        self.storage: Optional[MemoryStorage] = storage
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+
+        # key -> (cached_at, simulated, state_changes), least recent first
+        self._entries: "OrderedDict[str, Tuple[float, SimulatedAction, dict]]" = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _expired(self, cached_at: float) -> bool:
+        return self.ttl_seconds is not None and time.time() - cached_at > self.ttl_seconds
+
+    def _expire(self, key: str):
+        self.expirations += 1
+        if self.storage is not None:
+            self.storage.delete(self.STORAGE_KIND, key)
+
+    def _insert(self, key: str, item: Tuple[float, SimulatedAction, dict]):
+        self._entries[key] = item
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def _load(self, key: str) -> Optional[Tuple[float, SimulatedAction, dict]]:
+        """Load an entry from storage into RAM."""
+        record = self.storage.get(self.STORAGE_KIND, key)
+        if record is None:
+            return None
+        if self._expired(record["cached_at"]):
+            self._expire(key)
+            return None
+
+        item = (
+            record["cached_at"],
+            _simulation_from_record(record["simulation"]),
+            record.get("state_changes", {}),
+        )
+        self._insert(key, item)
+        return item
+
+    def get(self, key: str) -> Optional[Tuple[SimulatedAction, dict]]:
+        """Get (simulated, state_changes) for a key, or None."""
+        item = self._entries.get(key)
+        if item is not None and self._expired(item[0]):
+            del self._entries[key]
+            self._expire(key)
+            item = None
+
+        if item is None and self.storage is not None:
+            item = self._load(key)
+
+        if item is None:
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return item[1], item[2]
+
+    def put(self, key: str, simulated: SimulatedAction, state_changes: Optional[dict] = None):
+        """Cache a simulation."""
+        item = (time.time(), simulated, state_changes or {})
+        self._insert(key, item)
+        if self.storage is not None:
+            self.storage.put(self.STORAGE_KIND, key, {
+                "cached_at": item[0],
+                "simulation": _simulation_to_record(simulated),
+                "state_changes": item[2],
+            })
+
+    def clear(self):
+        """Drop all entries (including persisted ones)."""
+        self._entries.clear()
+        if self.storage is not None:
+            self.storage.clear(self.STORAGE_KIND)
+
+    def get_stats(self) -> dict:
+        """Hit/miss metrics."""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
         }
 
 
@@ -153,11 +296,66 @@ class WorldModel:
         ActionType.USE_TOOL: 3.0,
     }
 
-    def __init__(self, llm_client):
+    # Parameters holding file system paths (canonicalized in cache keys).
+    # Ambiguous names such as "source"/"target" may carry code or text, so
+    # they are left as-is.
+    PATH_PARAMETERS = frozenset({
+        "path", "paths", "file", "files", "file_path", "filepath", "filename",
+        "directory", "dir", "cwd",
+    })
+
+    # Expected JSON shape of one action prediction
+    PREDICTION_FORMAT = """{
+    "predicted_outcome": "description of what will happen",
+    "success_probability": 0.85,
+    "side_effects": ["effect1", "effect2"],
+    "risks": ["risk1", "risk2"],
+    "state_changes": {
+        "files_modified": ["path1"],
+        "variables_changed": {"var": "value"},
+        "errors_possible": ["error1"]
+    }
+}"""
+
+    def __init__(
+        self,
+        llm_client,
+        cache_size: int = 512,
+        cache_ttl: Optional[float] = 3600.0,
+        cache_storage: Optional[Union[MemoryStorage, str, Path]] = None,
+    ):
+        """
+        Args:
+            llm_client: Client used for predictions
+            cache_size: Simulations kept in RAM
+            cache_ttl: Seconds a simulation stays valid (None = forever)
+            cache_storage: Optional backend/path to persist simulations
+        """
         self.llm = llm_client
         self.state_history: List[WorldState] = []
         self.learned_patterns: Dict[str, float] = {}  # pattern -> success_rate
-        self.simulation_cache: Dict[str, SimulatedAction] = {}
+        self.simulation_cache = SimulationCache(cache_size, cache_ttl, cache_storage)
+
+        # Single-flight: cache key -> future of the simulation in progress
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._coalesced = 0
+
+    def _normalize_parameter(self, key: str, value: Any) -> Any:
+        """Canonical form of a parameter value for cache keys."""
+        if isinstance(value, dict):
+            return {k: self._normalize_parameter(k, v) for k, v in value.items()}
+        if isinstance(value, (list, tuple)):
+            return [self._normalize_parameter(key, v) for v in value]
+        if isinstance(value, str) and key.lower() in self.PATH_PARAMETERS:
+            # Only paths: whitespace and slashes are significant in code/text
+            value = value.strip()
+            if value:
+                value = os.path.normpath(value)
+        return value
+
+    def _cache_key(self, action: ActionType, parameters: dict) -> str:
+        normalized = self._normalize_parameter("", parameters)
+        return f"{action.value}:{json.dumps(normalized, sort_keys=True, default=str)}"
 
     async def simulate_action(
         self,
@@ -174,22 +372,65 @@ class WorldModel:
         3. Side effects
         4. Potential risks
         """
-        # Check cache
-        cache_key = f"{action.value}:{json.dumps(parameters, sort_keys=True)}"
-        if cache_key in self.simulation_cache:
-            cached = self.simulation_cache[cache_key]
-            new_state = self._apply_simulated_action(current_state, cached)
-            return cached, new_state
+        cache_key = self._cache_key(action, parameters)
+
+        while True:
+            cached = self.simulation_cache.get(cache_key)
+            if cached is not None:
+                simulated, state_changes = cached
+                new_state = self._apply_simulated_action(current_state, simulated, state_changes)
+                return simulated, new_state
+
+            # Same simulation already running: wait for it instead of
+            # sending a duplicate LLM request
+            pending = self._inflight.get(cache_key)
+            if pending is None:
+                break
+            self._coalesced += 1
+            try:
+                simulated, state_changes = await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                if pending.cancelled():
+                    continue  # The running simulation was abandoned; retry
+                raise
+            return simulated, self._apply_simulated_action(current_state, simulated, state_changes)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[cache_key] = future
+        try:
+            simulated, state_changes, reliable = await self._predict_action(
+                action, parameters, current_state
+            )
+        except BaseException:
+            future.cancel()
+            raise
+        else:
+            # Fallback predictions (LLM errors) are shared but not cached
+            if reliable:
+                self.simulation_cache.put(cache_key, simulated, state_changes)
+            future.set_result((simulated, state_changes))
+        finally:
+            del self._inflight[cache_key]
+
+        new_state = self._apply_simulated_action(current_state, simulated, state_changes)
+        return simulated, new_state
 
+    async def _predict_action(
+        self,
+        action: ActionType,
+        parameters: dict,
+        current_state: WorldState,
+    ) -> Tuple[SimulatedAction, dict, bool]:
+        """
+        Ask the LLM to predict an action's outcome.
+
+        Returns (simulated action, state changes, whether the prediction
+        came from the LLM rather than the conservative fallback).
+        """
         # Build simulation prompt
         simulation_prompt = f"""You are a world model simulator. Given an action and current state, predict the outcome.
 
-CURRENT STATE:
-- Files known: {list(current_state.files.keys())[:10]}
-- Variables: {dict(list(current_state.variables.items())[:5])}
-- Previous actions: {current_state.executed_actions[-5:]}
-- Errors so far: {current_state.errors_encountered[-3:]}
-- Current success probability: {current_state.success_probability:.2f}
+{self._describe_state(current_state)}
 
 ACTION TO SIMULATE:
 - Type: {action.value}
@@ -202,22 +443,14 @@ Based on the action type and parameters, predict:
 4. Potential risks
 
 Respond in JSON format:
-{{
-    "predicted_outcome": "description of what will happen",
-    "success_probability": 0.85,
-    "side_effects": ["effect1", "effect2"],
-    "risks": ["risk1", "risk2"],
-    "state_changes": {{
-        "files_modified": ["path1"],
-        "variables_changed": {{"var": "value"}},
-        "errors_possible": ["error1"]
-    }}
-}}"""
+{self.PREDICTION_FORMAT}"""
 
+        reliable = True
         try:
             response = await self.llm.generate(simulation_prompt)
             prediction = self._parse_json_response(response)
         except Exception as e:
+            reliable = False
             # Fallback to conservative prediction
             prediction = {
                 "predicted_outcome": f"Execute {action.value} with uncertain outcome",
@@ -227,8 +460,14 @@ Respond in JSON format:
                 "state_changes": {}
             }
 
-        # Create simulated action
-        simulated = SimulatedAction(
+        simulated = self._build_simulated(action, parameters, prediction)
+        return simulated, prediction.get("state_changes", {}), reliable
+
+    def _build_simulated(
+        self, action: ActionType, parameters: dict, prediction: dict
+    ) -> SimulatedAction:
+        """Create a simulated action from an LLM prediction."""
+        return SimulatedAction(
             action_type=action,
             parameters=parameters,
             predicted_outcome=prediction.get("predicted_outcome", "Unknown"),
@@ -239,22 +478,89 @@ Respond in JSON format:
             estimated_time=self.TIME_ESTIMATES.get(action, 1.0),
         )
 
-        # Cache the simulation
-        self.simulation_cache[cache_key] = simulated
+    def _describe_state(self, state: WorldState) -> str:
+        """State summary for simulation prompts."""
+        return f"""CURRENT STATE:
+- Files known: {list(state.files.keys())[:10]}
+- Variables: {dict(list(state.variables.items())[:5])}
+- Previous actions: {state.executed_actions[-5:]}
+- Errors so far: {state.errors_encountered[-3:]}
+- Current success probability: {state.success_probability:.2f}"""
 
-        # Apply state changes
-        new_state = self._apply_simulated_action(current_state, simulated, prediction.get("state_changes", {}))
+    async def _predict_plan_batch(
+        self,
+        plan: List[Tuple[ActionType, dict]],
+        current_state: WorldState,
+    ) -> List[Optional[Tuple[SimulatedAction, dict]]]:
+        """
+        Predict every uncached step of a plan with a single LLM call.
 
-        return simulated, new_state
+        Returns one (simulated, state_changes) per step; None where the
+        batch answer was unusable (the caller simulates those one by one).
+        """
+        keys = [self._cache_key(action, params) for action, params in plan]
+        steps: List[Optional[Tuple[SimulatedAction, dict]]] = [
+            self.simulation_cache.get(key) for key in keys
+        ]
+        missing = [i for i, step in enumerate(steps) if step is None]
+        if not missing:
+            return steps
+
+        action_lines = "\n".join(
+            f"{n}. {plan[i][0].value} {json.dumps(plan[i][1])}"
+            for n, i in enumerate(missing, 1)
+        )
+        answer_format = (
+            f"Respond with a JSON array of exactly {len(missing)} objects, "
+            "one per action in the same order, each in this format:"
+        )
+        batch_prompt = f"""You are a world model simulator. Given a sequence of actions and the current state, predict the outcome of each action, assuming the actions before it were executed.
+
+{self._describe_state(current_state)}
+
+ACTIONS TO SIMULATE (in order):
+{action_lines}
+
+{answer_format}
+{self.PREDICTION_FORMAT}"""
+
+        try:
+            response = await self.llm.generate(batch_prompt)
+            predictions = self._parse_json_array(response)
+        except Exception:
+            predictions = []
+
+        if len(predictions) != len(missing) or not all(isinstance(p, dict) for p in predictions):
+            return steps
+
+        for i, prediction in zip(missing, predictions):
+            action, params = plan[i]
+            simulated = self._build_simulated(action, params, prediction)
+            state_changes = prediction.get("state_changes", {})
+            self.simulation_cache.put(keys[i], simulated, state_changes)
+            steps[i] = (simulated, state_changes)
+
+        return steps
 
     async def simulate_plan(
         self,
         plan: List[Tuple[ActionType, dict]],
         initial_state: Optional[WorldState] = None,
+        batch: bool = False,
+        prune_below: Optional[Callable[[], float]] = None,
     ) -> SimulationResult:
         """
         Simulate a complete plan of actions.
 
+        Args:
+            plan: (action, parameters) steps
+            initial_state: Starting state (default: empty)
+            batch: Predict all uncached steps with one LLM call instead
+                of one call per step
+            prune_below: Returns the success probability to beat; since
+                it only decreases step by step, the plan is abandoned
+                (result.pruned) as soon as it drops below
+
         Returns comprehensive result with probabilities and risks.
         """
         if initial_state is None:
@@ -265,11 +571,18 @@ Respond in JSON format:
         critical_risks = []
         total_tokens = 0
         total_time = 0.0
+        pruned = False
 
-        for action_type, params in plan:
-            simulated, new_state = await self.simulate_action(
-                action_type, params, current_state
-            )
+        batched = await self._predict_plan_batch(plan, current_state) if batch else None
+
+        for i, (action_type, params) in enumerate(plan):
+            if batched and batched[i] is not None:
+                simulated, state_changes = batched[i]
+                new_state = self._apply_simulated_action(current_state, simulated, state_changes)
+            else:
+                simulated, new_state = await self.simulate_action(
+                    action_type, params, current_state
+                )
             actions_taken.append(simulated)
             total_tokens += simulated.estimated_tokens
             total_time += simulated.estimated_time
@@ -285,6 +598,10 @@ Respond in JSON format:
             if current_state.success_probability < 0.1:
                 break
 
+            if prune_below is not None and current_state.success_probability < prune_below():
+                pruned = True
+                break
+
         # Generate plan summary
         summary = self._generate_plan_summary(actions_taken)
 
@@ -297,6 +614,7 @@ Respond in JSON format:
             total_estimated_time=total_time,
             critical_risks=critical_risks,
             plan_summary=summary,
+            pruned=pruned,
         )
 
     async def find_best_plan(
@@ -306,12 +624,20 @@ Respond in JSON format:
         initial_state: Optional[WorldState] = None,
         max_steps: int = 10,
         num_candidates: int = 3,
+        max_concurrency: int = 4,
+        prune: bool = True,
+        batch: bool = False,
     ) -> List[SimulationResult]:
         """
         Use Tree of Thoughts to find best plans.
 
         Generates multiple candidate plans and simulates each.
         Returns top plans sorted by success probability.
+
+        Args:
+            max_concurrency: Candidate plans simulated at the same time
+            prune: Abandon a plan once it falls below the best finished one
+            batch: Predict each plan's steps with a single LLM call
         """
         if available_actions is None:
             available_actions = list(ActionType)
@@ -353,12 +679,28 @@ Each plan should be a valid sequence to achieve the goal."""
                 [(ActionType.THINK, {"goal": goal})]
             ]
 
-        # Simulate each plan
-        results = []
-        for plan in candidate_plans[:num_candidates]:
-            if plan:  # Skip empty plans
-                result = await self.simulate_plan(plan, initial_state)
-                results.append(result)
+        # Simulate candidate plans concurrently
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        best = 0.0  # Success probability of the best finished plan
+
+        async def simulate_candidate(plan: List[Tuple[ActionType, dict]]) -> SimulationResult:
+            nonlocal best
+            async with semaphore:
+                result = await self.simulate_plan(
+                    plan,
+                    initial_state,
+                    batch=batch,
+                    prune_below=(lambda: best) if prune else None,
+                )
+            if not result.pruned:
+                best = max(best, result.overall_success_probability)
+            return result
+
+        results = list(await asyncio.gather(*(
+            simulate_candidate(plan)
+            for plan in candidate_plans[:num_candidates]
+            if plan  # Skip empty plans
+        )))
 
         # Sort by success probability
         results.sort(key=lambda r: r.overall_success_probability, reverse=True)
@@ -476,6 +818,34 @@ Each plan should be a valid sequence to achieve the goal."""
 
         return {}
 
+    def _parse_json_array(self, text: str) -> list:
+        """Extract a JSON array from LLM response."""
+        try:
+            parsed = json.loads(text.strip())
+            if isinstance(parsed, list):
+                return parsed
+        except json.JSONDecodeError:
+            pass
+
+        code_match = re.search(r'```(?:json)?\s*(\[[\s\S]*\])\s*```', text)
+        if code_match:
+            try:
+                return json.loads(code_match.group(1))
+            except json.JSONDecodeError:
+                pass
+
+        start = text.find('[')
+        end = text.rfind(']')
+        if start != -1 and end > start:
+            try:
+                parsed = json.loads(text[start:end + 1])
+                if isinstance(parsed, list):
+                    return parsed
+            except json.JSONDecodeError:
+                pass
+
+        return []
+
     def _parse_plans(
         self,
         response: str,
@@ -552,7 +922,7 @@ Each plan should be a valid sequence to achieve the goal."""
 
     def clear_cache(self):
         """Clear simulation cache."""
-        self.simulation_cache = {}
+        self.simulation_cache.clear()
 
     def get_stats(self) -> dict:
         """Get world model statistics."""
@@ -560,4 +930,9 @@ Each plan should be a valid sequence to achieve the goal."""
             "cached_simulations": len(self.simulation_cache),
             "learned_patterns": len(self.learned_patterns),
             "state_history_size": len(self.state_history),
+            "cache": {
+                **self.simulation_cache.get_stats(),
+                "coalesced": self._coalesced,
+                "in_flight": len(self._inflight),
+            },
         }
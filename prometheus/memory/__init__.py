@@ -18,6 +18,7 @@ from .memory_system import (
     SemanticMemory,
     ProceduralMemory,
 )
+from .storage import MemoryStorage, SQLiteMemoryStorage
 
 __all__ = [
     "MemorySystem",
@@ -26,4 +27,6 @@ __all__ = [
     "EpisodicMemory",
     "SemanticMemory",
     "ProceduralMemory",
+    "MemoryStorage",
+    "SQLiteMemoryStorage",
 ]
@@ -13,13 +13,20 @@ Memory Types:
 6. Knowledge Vault: Long-term consolidated knowledge
 """
 
+from collections import Counter, defaultdict
+from contextlib import nullcontext
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Optional, Any, Tuple
+from pathlib import Path
+from typing import Dict, List, Optional, Any, Tuple, Union
 from enum import Enum
 import hashlib
+import heapq
+import itertools
 import math
 
+from .storage import MemoryStorage, SQLiteMemoryStorage, tokenize
+
 
 class MemoryType(Enum):
     """Types of memory in the MIRIX system."""
@@ -58,6 +65,20 @@ class MemoryEntry:
             "tags": self.tags,
         }
 
+    @classmethod
+    def from_dict(cls, data: dict) -> "MemoryEntry":
+        """Rebuild an entry from to_dict() output."""
+        return cls(
+            id=data["id"],
+            type=MemoryType(data["type"]),
+            content=data["content"],
+            metadata=data.get("metadata", {}),
+            created_at=datetime.fromisoformat(data["created_at"]),
+            accessed_at=datetime.fromisoformat(data.get("accessed_at", data["created_at"])),
+            importance=data.get("importance", 0.5),
+            tags=data.get("tags", []),
+        )
+
     def update_access(self):
         """Update access time and count."""
         self.accessed_at = datetime.now()
@@ -82,12 +103,49 @@ class EpisodicMemory:
     Enables learning from previous successes and failures.
 
     Reference: +47% adaptation to new situations (arXiv:2502.06975)
+
+    Recall uses an inverted index (token -> entry id -> term frequency)
+    maintained on store/prune, so a query only touches entries sharing
+    at least one token with it.
+
+    Entries are kept in an insertion-ordered dict (oldest first by
+    created_at), giving O(1) lookup by id and O(k) recent recall. When
+    the store exceeds max_entries, the prune_batch lowest-relevance
+    entries are evicted together, amortizing the relevance scan.
     """
 
-    def __init__(self, max_entries: int = 1000):
-        self.entries: List[MemoryEntry] = []
+    SCORING_METHODS = ("jaccard", "bm25")
+
+    # BM25 parameters (standard Okapi defaults)
+    BM25_K1 = 1.2
+    BM25_B = 0.75
+
+    def __init__(
+        self,
+        max_entries: int = 1000,
+        scoring: str = "jaccard",
+        prune_batch: Optional[int] = None,
+    ):
+        """
+        Args:
+            max_entries: Hard cap on stored experiences
+            scoring: Default recall scoring ("jaccard" or "bm25")
+            prune_batch: Entries evicted per prune once the cap is hit
+                (default 5% of max_entries; 1 evicts one at a time)
+        """
+        if scoring not in self.SCORING_METHODS:
+            raise ValueError(f"Unknown scoring '{scoring}', expected one of {self.SCORING_METHODS}")
+
         self.max_entries = max_entries
-        self._index: Dict[str, int] = {}  # id -> index
+        self.scoring = scoring
+        self.prune_batch = max(1, prune_batch or max_entries // 20)
+        self._entries: Dict[str, MemoryEntry] = {}  # id -> entry, oldest first
+
+        # Inverted index for recall_similar
+        self._postings: Dict[str, Dict[str, int]] = {}  # token -> {id: term frequency}
+        self._doc_terms: Dict[str, Tuple[str, ...]] = {}  # id -> unique tokens
+        self._doc_lengths: Dict[str, int] = {}  # id -> token count
+        self._total_length = 0
 
     def store(
         self,
@@ -126,65 +184,153 @@ class EpisodicMemory:
             tags=tags or [],
         )
 
-        self.entries.append(entry)
-        self._index[entry_id] = len(self.entries) - 1
+        self._entries.pop(entry_id, None)
+        self._entries[entry_id] = entry
+        self._index_terms(entry)
         self._prune_if_needed()
 
         return entry
 
+    @property
+    def entries(self) -> List[MemoryEntry]:
+        """All stored entries, oldest first."""
+        return list(self._entries.values())
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
     def recall_similar(
         self,
         query: str,
         top_k: int = 5,
         min_relevance: float = 0.0,
+        scoring: Optional[str] = None,
     ) -> List[MemoryEntry]:
         """
         Retrieve similar experiences.
 
+        Args:
+            query: Situation to match against
+            top_k: Maximum results
+            min_relevance: Minimum combined score
+            scoring: "jaccard" (token overlap) or "bm25"; defaults to
+                the memory's configured scoring
+
         Uses keyword matching (can be upgraded to embeddings).
         """
+        return [entry for _, entry in self.score_similar(query, top_k, min_relevance, scoring)]
+
+    def score_similar(
+        self,
+        query: str,
+        top_k: int = 5,
+        min_relevance: float = 0.0,
+        scoring: Optional[str] = None,
+    ) -> List[Tuple[float, MemoryEntry]]:
+        """Like recall_similar, but returns (combined score, entry) pairs."""
+        scoring = scoring or self.scoring
         query_words = set(self._tokenize(query))
+        if not query_words:
+            return []
+
+        if scoring == "bm25":
+            similarities = self._bm25_scores(query_words)
+        elif scoring == "jaccard":
+            similarities = self._jaccard_scores(query_words)
+        else:
+            raise ValueError(f"Unknown scoring '{scoring}', expected one of {self.SCORING_METHODS}")
+
         scored_entries = []
+        for entry_id, similarity in similarities.items():
+            entry = self._entries[entry_id]
+            relevance = entry.compute_relevance()
+            combined_score = 0.6 * similarity + 0.4 * relevance
 
-        for entry in self.entries:
-            entry_words = set(self._tokenize(entry.content))
-            overlap = len(query_words & entry_words)
+            if combined_score >= min_relevance:
+                scored_entries.append((combined_score, entry))
+                entry.update_access()
 
-            if overlap > 0:
-                # Jaccard similarity + relevance
-                similarity = overlap / len(query_words | entry_words)
-                relevance = entry.compute_relevance()
-                combined_score = 0.6 * similarity + 0.4 * relevance
+        return heapq.nlargest(top_k, scored_entries, key=lambda x: x[0])
+
+    def _jaccard_scores(self, query_words: set) -> Dict[str, float]:
+        """Jaccard similarity for every entry sharing a token with the query."""
+        overlaps: Dict[str, int] = defaultdict(int)
+        for word in query_words:
+            for entry_id in self._postings.get(word, ()):
+                overlaps[entry_id] += 1
 
-                if combined_score >= min_relevance:
-                    scored_entries.append((combined_score, entry))
-                    entry.update_access()
+        query_size = len(query_words)
+        return {
+            entry_id: overlap / (query_size + len(self._doc_terms[entry_id]) - overlap)
+            for entry_id, overlap in overlaps.items()
+        }
 
-        scored_entries.sort(key=lambda x: x[0], reverse=True)
-        return [entry for _, entry in scored_entries[:top_k]]
+    def _bm25_scores(self, query_words: set) -> Dict[str, float]:
+        """BM25 scores normalized to 0-1 (best match = 1)."""
+        doc_count = len(self._doc_lengths)
+        if not doc_count:
+            return {}
+
+        avg_length = self._total_length / doc_count or 1.0
+        k1, b = self.BM25_K1, self.BM25_B
+        scores: Dict[str, float] = defaultdict(float)
+
+        for word in query_words:
+            posting = self._postings.get(word)
+            if not posting:
+                continue
+            idf = math.log(1 + (doc_count - len(posting) + 0.5) / (len(posting) + 0.5))
+            for entry_id, tf in posting.items():
+                norm = k1 * (1 - b + b * self._doc_lengths[entry_id] / avg_length)
+                scores[entry_id] += idf * tf * (k1 + 1) / (tf + norm)
+
+        best = max(scores.values(), default=0.0)
+        if best <= 0:
+            return {}
+        return {entry_id: score / best for entry_id, score in scores.items()}
+
+    def _index_terms(self, entry: MemoryEntry):
+        """Add an entry's tokens to the inverted index."""
+        self._unindex_terms(entry.id)
+
+        tokens = self._tokenize(entry.content)
+        frequencies = Counter(tokens)
+        for token, count in frequencies.items():
+            self._postings.setdefault(token, {})[entry.id] = count
+
+        self._doc_terms[entry.id] = tuple(frequencies)
+        self._doc_lengths[entry.id] = len(tokens)
+        self._total_length += len(tokens)
+
+    def _unindex_terms(self, entry_id: str):
+        """Remove an entry from the inverted index."""
+        terms = self._doc_terms.pop(entry_id, None)
+        if terms is None:
+            return
+
+        for token in terms:
+            posting = self._postings.get(token)
+            if posting is not None:
+                posting.pop(entry_id, None)
+                if not posting:
+                    del self._postings[token]
+
+        self._total_length -= self._doc_lengths.pop(entry_id, 0)
 
     def recall_by_outcome(self, outcome_type: str) -> List[MemoryEntry]:
         """Retrieve experiences by outcome type (success/failure)."""
         return [
-            e for e in self.entries
+            e for e in self._entries.values()
             if e.metadata.get("outcome_type") == outcome_type
         ]
 
     def recall_recent(self, n: int = 10) -> List[MemoryEntry]:
         """Retrieve most recent experiences."""
-        sorted_entries = sorted(
-            self.entries,
-            key=lambda e: e.created_at,
-            reverse=True
-        )
-        return sorted_entries[:n]
+        return list(itertools.islice(reversed(self._entries.values()), max(n, 0)))
 
     def get_by_id(self, entry_id: str) -> Optional[MemoryEntry]:
         """Get entry by ID."""
-        idx = self._index.get(entry_id)
-        if idx is not None and idx < len(self.entries):
-            return self.entries[idx]
-        return None
+        return self._entries.get(entry_id)
 
     def _generate_id(self, content: str) -> str:
         """Generate unique ID for entry."""
@@ -205,24 +351,34 @@ class EpisodicMemory:
 
     def _tokenize(self, text: str) -> List[str]:
         """Simple tokenization."""
-        import re
-        return re.findall(r'\b\w+\b', text.lower())
+        return tokenize(text)
 
     def _prune_if_needed(self):
         """Remove low-relevance entries if exceeding limit."""
-        if len(self.entries) > self.max_entries:
-            # Sort by relevance, keep top entries
-            self.entries.sort(key=lambda e: e.compute_relevance(), reverse=True)
-            self.entries = self.entries[:self.max_entries]
-            # Rebuild index
-            self._index = {e.id: i for i, e in enumerate(self.entries)}
+        excess = len(self._entries) - self.max_entries
+        if excess <= 0:
+            return
+
+        # Lowest relevance first; among ties the newest entry goes first
+        count = min(len(self._entries), max(excess, self.prune_batch))
+        evicted = heapq.nsmallest(
+            count,
+            reversed(self._entries.values()),
+            key=lambda e: e.compute_relevance(),
+        )
+        for entry in evicted:
+            del self._entries[entry.id]
+            self._unindex_terms(entry.id)
 
     def export(self) -> List[dict]:
         """Export all entries."""
-        return [e.to_dict() for e in self.entries]
+        return [e.to_dict() for e in self._entries.values()]
 
     def import_entries(self, data: List[dict]):
         """Import entries from export."""
+        newest = next(reversed(self._entries.values())).created_at if self._entries else None
+        in_order = True
+
         for item in data:
             entry = MemoryEntry(
                 id=item["id"],
@@ -233,8 +389,19 @@ class EpisodicMemory:
                 importance=item.get("importance", 0.5),
                 tags=item.get("tags", []),
             )
-            self.entries.append(entry)
-            self._index[entry.id] = len(self.entries) - 1
+            self._entries.pop(entry.id, None)
+            self._entries[entry.id] = entry
+            self._index_terms(entry)
+
+            if newest is not None and entry.created_at < newest:
+                in_order = False
+            newest = entry.created_at if newest is None else max(newest, entry.created_at)
+
+        if not in_order:
+            # Keep oldest-first order so recall_recent stays O(k)
+            self._entries = dict(sorted(self._entries.items(), key=lambda kv: kv[1].created_at))
+
+        self._prune_if_needed()
 
 
 class SemanticMemory:
@@ -289,6 +456,12 @@ class SemanticMemory:
 
         return entry
 
+    def load_entry(self, entry: MemoryEntry):
+        """Insert a previously stored fact (e.g. loaded from storage)."""
+        topic = entry.metadata["topic"]
+        self.facts[topic] = entry
+        self._update_topic_index(topic, entry.content)
+
     def query(self, topic: str) -> Optional[MemoryEntry]:
         """Query knowledge by exact topic."""
         entry = self.facts.get(topic)
@@ -426,6 +599,12 @@ class ProceduralMemory:
 
         return entry
 
+    def load_entry(self, entry: MemoryEntry):
+        """Insert a previously stored procedure (e.g. loaded from storage)."""
+        skill_name = entry.metadata["skill_name"]
+        self.procedures[skill_name] = entry
+        self._update_skill_index(skill_name, entry.metadata.get("steps", []))
+
     def get_procedure(self, skill_name: str) -> Optional[MemoryEntry]:
         """Get procedure by skill name."""
         entry = self.procedures.get(skill_name)
@@ -526,13 +705,31 @@ class MemorySystem:
     Unified Memory System (MIRIX-inspired).
 
     Combines all 6 memory types into a unified interface.
+
+    With a storage backend, every change is written through incrementally
+    and RAM only holds a hot subset: episodic memory keeps its max_episodic
+    cap (evicted entries stay in storage), while facts, procedures and
+    vault entries are loaded on first lookup or search hit. Startup only
+    reads core memory and stats, so it does not grow with the store.
     """
 
     def __init__(
         self,
         agent_name: str = "Prometheus",
         max_episodic: int = 1000,
+        storage: Optional[Union[MemoryStorage, str, Path]] = None,
     ):
+        """
+        Args:
+            agent_name: Name stored in core memory
+            max_episodic: Episodic entries kept in RAM
+            storage: Optional persistent backend, or a path for a
+                SQLiteMemoryStorage database
+        """
+        if isinstance(storage, (str, Path)):
+            storage = SQLiteMemoryStorage(storage)
+        self.storage: Optional[MemoryStorage] = storage
+
         # Initialize all memory subsystems
         self.episodic = EpisodicMemory(max_entries=max_episodic)
         self.semantic = SemanticMemory()
@@ -561,6 +758,94 @@ class MemorySystem:
             "consolidations": 0,
         }
 
+        if self.storage is not None:
+            meta = self.storage.get("meta", "state")
+            if meta is None:
+                self._save_meta()
+            else:
+                self.core.update(meta.get("core", {}))
+                self._stats.update(meta.get("stats", {}))
+                self.semantic.relations = meta.get("relations", {})
+
+    # === Storage ===
+
+    def _batch(self):
+        """Commit the enclosed storage writes together."""
+        return self.storage.batch() if self.storage is not None else nullcontext()
+
+    def _save_meta(self):
+        """Persist core memory, stats and concept relations."""
+        if self.storage is not None:
+            self.storage.put("meta", "state", {
+                "core": self.core,
+                "stats": self._stats,
+                "relations": self.semantic.relations,
+            })
+
+    def _save_episode(self, entry: MemoryEntry):
+        if self.storage is not None:
+            self.storage.put(
+                "episodic", entry.id, entry.to_dict(),
+                text=entry.content,
+                tag=entry.metadata.get("outcome_type"),
+                score=entry.importance,
+            )
+
+    def _save_fact(self, entry: MemoryEntry):
+        if self.storage is not None:
+            topic = entry.metadata["topic"]
+            self.storage.put(
+                "semantic", topic, entry.to_dict(),
+                text=f"{topic} {entry.content}",
+                score=entry.importance,
+            )
+
+    def _save_procedure(self, entry: MemoryEntry):
+        if self.storage is not None:
+            skill_name = entry.metadata["skill_name"]
+            self.storage.put(
+                "procedural", skill_name, entry.to_dict(),
+                text=f"{skill_name} {' '.join(entry.metadata.get('steps', []))}",
+                score=entry.metadata.get("success_rate", 0),
+            )
+
+    def _load_fact(self, topic: str) -> Optional[MemoryEntry]:
+        """Hot fact, or load it from storage."""
+        entry = self.semantic.facts.get(topic)
+        if entry is None and self.storage is not None:
+            data = self.storage.get("semantic", topic)
+            if data is not None:
+                entry = MemoryEntry.from_dict(data)
+                self.semantic.load_entry(entry)
+        return entry
+
+    def _load_procedure(self, skill_name: str) -> Optional[MemoryEntry]:
+        """Hot procedure, or load it from storage."""
+        entry = self.procedural.procedures.get(skill_name)
+        if entry is None and self.storage is not None:
+            data = self.storage.get("procedural", skill_name)
+            if data is not None:
+                entry = MemoryEntry.from_dict(data)
+                self.procedural.load_entry(entry)
+        return entry
+
+    def _search_cold(self, kind: str, query: str, limit: int, exclude) -> List[MemoryEntry]:
+        """Entries matching query that are in storage but not in RAM."""
+        if self.storage is None or limit <= 0:
+            return []
+        hits = self.storage.search(kind, tokenize(query), limit=limit, exclude=exclude)
+        entries = []
+        for key, _ in hits:
+            data = self.storage.get(kind, key)
+            if data is not None:
+                entries.append(MemoryEntry.from_dict(data))
+        return entries
+
+    def close(self):
+        """Close the storage backend (if any)."""
+        if self.storage is not None:
+            self.storage.close()
+
     # === Core Memory ===
 
     def get_identity(self) -> Dict[str, Any]:
@@ -570,6 +855,7 @@ class MemorySystem:
     def update_core(self, key: str, value: Any):
         """Update core memory value."""
         self.core[key] = value
+        self._save_meta()
 
     # === Episodic Memory Interface ===
 
@@ -592,6 +878,9 @@ class MemorySystem:
             importance=importance,
         )
         self._stats["total_experiences"] += 1
+        with self._batch():
+            self._save_episode(entry)
+            self._save_meta()
         return entry.id
 
     def recall_experiences(
@@ -600,17 +889,33 @@ class MemorySystem:
         top_k: int = 5,
     ) -> List[dict]:
         """Recall relevant past experiences."""
-        entries = self.episodic.recall_similar(situation, top_k)
-        return [e.to_dict() for e in entries]
+        if self.storage is None:
+            entries = self.episodic.recall_similar(situation, top_k)
+            return [e.to_dict() for e in entries]
+
+        scored = self.episodic.score_similar(situation, top_k)
+
+        # Entries evicted from RAM are scored by token overlap from storage
+        query_words = set(tokenize(situation))
+        for entry in self._search_cold("episodic", situation, top_k, self.episodic._entries):
+            entry_words = set(tokenize(entry.content))
+            similarity = len(query_words & entry_words) / len(query_words | entry_words)
+            scored.append((0.6 * similarity + 0.4 * entry.compute_relevance(), entry))
+
+        return [e.to_dict() for _, e in heapq.nlargest(top_k, scored, key=lambda x: x[0])]
 
     def recall_successes(self, top_k: int = 5) -> List[dict]:
         """Recall successful experiences."""
+        if self.storage is not None:
+            return self.storage.top("episodic", top_k, tag="success", order="score")
         entries = self.episodic.recall_by_outcome("success")
         entries.sort(key=lambda e: e.importance, reverse=True)
         return [e.to_dict() for e in entries[:top_k]]
 
     def recall_failures(self, top_k: int = 5) -> List[dict]:
         """Recall failure experiences (for learning)."""
+        if self.storage is not None:
+            return self.storage.top("episodic", top_k, tag="failure", order="created")
         entries = self.episodic.recall_by_outcome("failure")
         entries.sort(key=lambda e: e.created_at, reverse=True)
         return [e.to_dict() for e in entries[:top_k]]
@@ -625,17 +930,25 @@ class MemorySystem:
         confidence: float = 0.8,
     ):
         """Learn a new fact."""
-        self.semantic.store_fact(topic, fact, source, confidence)
+        entry = self.semantic.store_fact(topic, fact, source, confidence)
         self._stats["total_facts"] += 1
+        with self._batch():
+            self._save_fact(entry)
+            self._save_meta()
 
     def query_knowledge(self, topic: str) -> Optional[str]:
         """Query knowledge about a topic."""
+        self._load_fact(topic)
         entry = self.semantic.query(topic)
         return entry.content if entry else None
 
     def search_knowledge(self, query: str, top_k: int = 5) -> List[dict]:
         """Search knowledge base."""
         results = self.semantic.search(query, top_k)
+        cold = self._search_cold("semantic", query, top_k - len(results), self.semantic.facts)
+        for entry in cold:
+            self.semantic.load_entry(entry)
+            results.append((entry.metadata["topic"], entry))
         return [{"topic": t, "content": e.content} for t, e in results]
 
     # === Procedural Memory Interface ===
@@ -647,20 +960,33 @@ class MemorySystem:
         preconditions: Optional[List[str]] = None,
     ):
         """Learn a new procedure."""
-        self.procedural.store_procedure(
+        entry = self.procedural.store_procedure(
             skill_name=skill_name,
             steps=steps,
             preconditions=preconditions,
         )
         self._stats["total_procedures"] += 1
+        with self._batch():
+            self._save_procedure(entry)
+            self._save_meta()
 
     def get_procedure(self, skill_name: str) -> Optional[List[str]]:
         """Get steps for a procedure."""
+        self._load_procedure(skill_name)
         return self.procedural.get_steps(skill_name)
 
     def find_procedures(self, query: str, top_k: int = 5) -> List[dict]:
         """Find relevant procedures."""
         entries = self.procedural.search_procedures(query, top_k)
+        cold = self._search_cold("procedural", query, top_k, self.procedural.procedures)
+        if cold:
+            for entry in cold:
+                self.procedural.load_entry(entry)
+            entries = sorted(
+                entries + cold,
+                key=lambda e: e.metadata.get("success_rate", 0),
+                reverse=True,
+            )[:top_k]
         return [
             {
                 "skill": e.metadata["skill_name"],
@@ -672,7 +998,10 @@ class MemorySystem:
 
     def record_procedure_outcome(self, skill_name: str, success: bool):
         """Record outcome of procedure execution."""
+        entry = self._load_procedure(skill_name)
         self.procedural.update_success_rate(skill_name, success)
+        if entry is not None:
+            self._save_procedure(entry)
 
     # === Resource Cache ===
 
@@ -696,6 +1025,20 @@ class MemorySystem:
 
     # === Knowledge Vault ===
 
+    def _add_to_vault(self, vault_entry: MemoryEntry) -> bool:
+        """Add a vault entry unless it is already there."""
+        if any(v.id == vault_entry.id for v in self.knowledge_vault):
+            return False
+        if self.storage is not None:
+            if self.storage.get("vault", vault_entry.id) is not None:
+                return False
+            self.storage.put(
+                "vault", vault_entry.id, vault_entry.to_dict(),
+                text=vault_entry.content,
+            )
+        self.knowledge_vault.append(vault_entry)
+        return True
+
     def consolidate_to_vault(self):
         """
         Consolidate important knowledge to vault.
@@ -703,6 +1046,10 @@ class MemorySystem:
         Moves high-value procedural knowledge and
         frequent patterns to long-term storage.
         """
+        with self._batch():
+            return self._consolidate_to_vault()
+
+    def _consolidate_to_vault(self) -> int:
         consolidated = 0
 
         # Consolidate high-success procedures
@@ -720,8 +1067,7 @@ class MemorySystem:
                 )
 
                 # Avoid duplicates
-                if not any(v.id == vault_entry.id for v in self.knowledge_vault):
-                    self.knowledge_vault.append(vault_entry)
+                if self._add_to_vault(vault_entry):
                     consolidated += 1
 
         # Consolidate high-confidence facts
@@ -738,11 +1084,11 @@ class MemorySystem:
                     importance=1.0,
                 )
 
-                if not any(v.id == vault_entry.id for v in self.knowledge_vault):
-                    self.knowledge_vault.append(vault_entry)
+                if self._add_to_vault(vault_entry):
                     consolidated += 1
 
         self._stats["consolidations"] += 1
+        self._save_meta()
         return consolidated
 
     def query_vault(self, query: str, top_k: int = 5) -> List[dict]:
@@ -757,7 +1103,14 @@ class MemorySystem:
                 results.append((overlap, entry))
 
         results.sort(key=lambda x: x[0], reverse=True)
-        return [e.to_dict() for _, e in results[:top_k]]
+        entries = [e for _, e in results[:top_k]]
+
+        hot_ids = {e.id for e in self.knowledge_vault}
+        for entry in self._search_cold("vault", query, top_k - len(entries), hot_ids):
+            self.knowledge_vault.append(entry)
+            entries.append(entry)
+
+        return [e.to_dict() for e in entries]
 
     # === Context Generation ===
 
@@ -794,6 +1147,26 @@ class MemorySystem:
 
     def export_state(self) -> dict:
         """Export complete memory state for persistence."""
+        if self.storage is not None:
+            # Storage holds everything, including entries not loaded in RAM
+            return {
+                "core": self.core,
+                "episodic": list(self.storage.records("episodic")),
+                "semantic": {
+                    "facts": {
+                        data["metadata"]["topic"]: data
+                        for data in self.storage.records("semantic")
+                    },
+                    "relations": self.semantic.relations,
+                },
+                "procedural": {
+                    data["metadata"]["skill_name"]: data
+                    for data in self.storage.records("procedural")
+                },
+                "knowledge_vault": list(self.storage.records("vault")),
+                "stats": self._stats,
+            }
+
         return {
             "core": self.core,
             "episodic": self.episodic.export(),
@@ -805,46 +1178,62 @@ class MemorySystem:
 
     def import_state(self, state: dict):
         """Import memory state from export."""
+        with self._batch():
+            self._import_state(state)
+
+    def _import_state(self, state: dict):
         if "core" in state:
             self.core.update(state["core"])
 
         if "episodic" in state:
             self.episodic.import_entries(state["episodic"])
+            for item in state["episodic"]:
+                self._save_episode(MemoryEntry.from_dict(item))
 
         if "semantic" in state:
             for topic, entry_data in state["semantic"].get("facts", {}).items():
-                self.semantic.store_fact(
+                entry = self.semantic.store_fact(
                     topic=topic,
                     fact=entry_data["content"],
                     confidence=entry_data.get("metadata", {}).get("confidence", 0.8),
                 )
+                self._save_fact(entry)
             self.semantic.relations = state["semantic"].get("relations", {})
 
         if "procedural" in state:
             for skill, entry_data in state["procedural"].items():
-                self.procedural.store_procedure(
+                entry = self.procedural.store_procedure(
                     skill_name=skill,
                     steps=entry_data.get("metadata", {}).get("steps", []),
                     success_rate=entry_data.get("metadata", {}).get("success_rate", 0),
                 )
+                self._save_procedure(entry)
 
         if "stats" in state:
             self._stats.update(state["stats"])
 
+        self._save_meta()
+
     def get_stats(self) -> dict:
         """Get memory system statistics."""
-        return {
+        stats = {
             **self._stats,
-            "episodic_entries": len(self.episodic.entries),
+            "episodic_entries": len(self.episodic),
             "semantic_facts": len(self.semantic.facts),
             "procedural_skills": len(self.procedural.procedures),
             "vault_entries": len(self.knowledge_vault),
             "cache_entries": len(self.resource_cache),
         }
+        if self.storage is not None:
+            stats["stored_entries"] = {
+                kind: self.storage.count(kind)
+                for kind in ("episodic", "semantic", "procedural", "vault")
+            }
+        return stats
 
     def clear_all(self):
         """Clear all memories (use with caution)."""
-        self.episodic = EpisodicMemory()
+        self.episodic = EpisodicMemory(max_entries=self.episodic.max_entries)
         self.semantic = SemanticMemory()
         self.procedural = ProceduralMemory()
         self.resource_cache = {}
@@ -855,3 +1244,8 @@ class MemorySystem:
             "total_procedures": 0,
             "consolidations": 0,
         }
+        if self.storage is not None:
+            with self._batch():
+                for kind in ("episodic", "semantic", "procedural", "vault"):
+                    self.storage.clear(kind)
+                self._save_meta()
@@ -0,0 +1,325 @@
+"""
+Persistent storage backends for the PROMETHEUS MemorySystem.
+
+MemorySystem keeps a bounded hot set in RAM; a storage backend holds
+every record durably and answers lookups for the cold remainder:
+- records are written incrementally (one small transaction per change)
+- nothing is loaded at startup beyond what is asked for
+- keyword lookups go through a stored term index, so recall over cold
+  memories never scans or loads the whole store
+
+Backends:
+- SQLiteMemoryStorage: SQLite in WAL mode (crash-safe, single file)
+"""
+
+import json
+import re
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+
+_TOKEN_RE = re.compile(r'\b\w+\b')
+
+
+def tokenize(text: str) -> List[str]:
+    """Tokenizer shared by the term index and its queries."""
+    return _TOKEN_RE.findall(text.lower())
+
+
+class MemoryStorage(ABC):
+    """
+    Storage backend interface.
+
+    Records are JSON-serializable dicts addressed by (kind, key). Kinds
+    used by MemorySystem: episodic, semantic, procedural, vault, meta.
+    """
+
+    @abstractmethod
+    def put(
+        self,
+        kind: str,
+        key: str,
+        record: Dict[str, Any],
+        text: str = "",
+        tag: Optional[str] = None,
+        score: float = 0.0,
+    ) -> None:
+        """
+        Insert or replace a record.
+
+        Args:
+            kind: Record namespace
+            key: Unique key within the kind
+            record: JSON-serializable payload
+            text: Text to index for keyword search
+            tag: Optional label to filter on (e.g. outcome type)
+            score: Sort key for top() (e.g. importance)
+        """
+
+    @abstractmethod
+    def get(self, kind: str, key: str) -> Optional[Dict[str, Any]]:
+        """Get one record, or None."""
+
+    @abstractmethod
+    def delete(self, kind: str, key: str) -> None:
+        """Delete one record (no-op if missing)."""
+
+    @abstractmethod
+    def search(
+        self,
+        kind: str,
+        terms: Iterable[str],
+        limit: int = 20,
+        exclude: Iterable[str] = (),
+    ) -> List[Tuple[str, float]]:
+        """
+        Keyword lookup over indexed text.
+
+        Returns (key, jaccard similarity) pairs, best first.
+        """
+
+    @abstractmethod
+    def top(
+        self,
+        kind: str,
+        limit: int,
+        tag: Optional[str] = None,
+        order: str = "score",
+    ) -> List[Dict[str, Any]]:
+        """Records by score (highest first) or write order (newest first)."""
+
+    @abstractmethod
+    def records(self, kind: str) -> Iterator[Dict[str, Any]]:
+        """Iterate every record of a kind (oldest first)."""
+
+    @abstractmethod
+    def count(self, kind: str) -> int:
+        """Number of records of a kind."""
+
+    @abstractmethod
+    def clear(self, kind: Optional[str] = None) -> None:
+        """Delete every record of a kind (or everything)."""
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Group several writes so they are committed together."""
+        yield
+
+    def compact(self) -> None:
+        """Reclaim space from deleted/overwritten records."""
+
+    def close(self) -> None:
+        """Release resources."""
+
+
+class SQLiteMemoryStorage(MemoryStorage):
+    """
+    SQLite (WAL) storage backend.
+
+    Every put/delete (or batch of them) is its own transaction, so a crash
+    loses at most the write in flight; WAL replay on the next open
+    restores a consistent state. The connection is shared across threads
+    behind a lock.
+    """
+
+    SCHEMA_VERSION = 1
+    ORDERS = {"score": "score DESC, seq", "created": "seq DESC"}
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.RLock()
+        self._depth = 0  # batch() nesting
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._init_schema()
+
+    def _init_schema(self) -> None:
+        self._conn.executescript(f"""
+            CREATE TABLE IF NOT EXISTS records (
+                seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                kind TEXT NOT NULL,
+                key TEXT NOT NULL,
+                data TEXT NOT NULL,
+                tag TEXT,
+                score REAL NOT NULL DEFAULT 0,
+                n_terms INTEGER NOT NULL DEFAULT 0,
+                updated_at REAL NOT NULL,
+                UNIQUE (kind, key)
+            );
+            CREATE INDEX IF NOT EXISTS idx_records_tag ON records(kind, tag, score);
+            CREATE TABLE IF NOT EXISTS terms (
+                term TEXT NOT NULL,
+                seq INTEGER NOT NULL,
+                PRIMARY KEY (term, seq)
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS idx_terms_seq ON terms(seq);
+            PRAGMA user_version = {self.SCHEMA_VERSION};
+        """)
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        with self._lock:
+            self._depth += 1
+            try:
+                yield
+            except BaseException:
+                if self._depth == 1:
+                    self._conn.rollback()
+                raise
+            else:
+                if self._depth == 1:
+                    self._conn.commit()
+            finally:
+                self._depth -= 1
+
+    def _delete_locked(self, kind: str, key: str) -> None:
+        row = self._conn.execute(
+            "SELECT seq FROM records WHERE kind = ? AND key = ?", (kind, key)
+        ).fetchone()
+        if row:
+            self._conn.execute("DELETE FROM terms WHERE seq = ?", row)
+            self._conn.execute("DELETE FROM records WHERE seq = ?", row)
+
+    def put(
+        self,
+        kind: str,
+        key: str,
+        record: Dict[str, Any],
+        text: str = "",
+        tag: Optional[str] = None,
+        score: float = 0.0,
+    ) -> None:
+        data = json.dumps(record, default=str)
+        terms = Counter(tokenize(text))
+
+        with self.batch():
+            # Replace = delete + insert so seq tracks last write order
+            self._delete_locked(kind, key)
+            cursor = self._conn.execute(
+                "INSERT INTO records (kind, key, data, tag, score, n_terms, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (kind, key, data, tag, score, len(terms), time.time())
+            )
+            self._conn.executemany(
+                "INSERT INTO terms (term, seq) VALUES (?, ?)",
+                [(term, cursor.lastrowid) for term in terms]
+            )
+
+    def get(self, kind: str, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM records WHERE kind = ? AND key = ?", (kind, key)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def delete(self, kind: str, key: str) -> None:
+        with self.batch():
+            self._delete_locked(kind, key)
+
+    def search(
+        self,
+        kind: str,
+        terms: Iterable[str],
+        limit: int = 20,
+        exclude: Iterable[str] = (),
+    ) -> List[Tuple[str, float]]:
+        query_terms = sorted(set(terms))
+        if not query_terms:
+            return []
+
+        placeholders = ",".join("?" * len(query_terms))
+        with self._lock:
+            # CROSS JOIN pins the join order: walk the postings of the
+            # query terms, not every record of the kind
+            rows = self._conn.execute(
+                f"""
+                SELECT r.key, COUNT(*) AS overlap, r.n_terms
+                FROM terms t CROSS JOIN records r ON r.seq = t.seq
+                WHERE t.term IN ({placeholders}) AND r.kind = ?
+                GROUP BY t.seq
+                """,
+                (*query_terms, kind)
+            ).fetchall()
+
+        skip = set(exclude)
+        size = len(query_terms)
+        scored = [
+            (key, overlap / (size + n_terms - overlap))
+            for key, overlap, n_terms in rows
+            if key not in skip
+        ]
+        scored.sort(key=lambda item: item[1], reverse=True)
+        return scored[:limit]
+
+    def top(
+        self,
+        kind: str,
+        limit: int,
+        tag: Optional[str] = None,
+        order: str = "score",
+    ) -> List[Dict[str, Any]]:
+        if order not in self.ORDERS:
+            raise ValueError(f"Unknown order '{order}', expected one of {tuple(self.ORDERS)}")
+
+        where, params = "kind = ?", [kind]
+        if tag is not None:
+            where += " AND tag = ?"
+            params.append(tag)
+
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT data FROM records WHERE {where} "
+                f"ORDER BY {self.ORDERS[order]} LIMIT ?",
+                (*params, limit)
+            ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def records(self, kind: str) -> Iterator[Dict[str, Any]]:
+        last_seq = 0
+        while True:
+            with self._lock:
+                rows = self._conn.execute(
+                    "SELECT seq, data FROM records WHERE kind = ? AND seq > ? "
+                    "ORDER BY seq LIMIT 500",
+                    (kind, last_seq)
+                ).fetchall()
+            if not rows:
+                return
+            for last_seq, data in rows:
+                yield json.loads(data)
+
+    def count(self, kind: str) -> int:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM records WHERE kind = ?", (kind,)
+            ).fetchone()[0]
+
+    def clear(self, kind: Optional[str] = None) -> None:
+        with self.batch():
+            if kind is None:
+                self._conn.execute("DELETE FROM terms")
+                self._conn.execute("DELETE FROM records")
+            else:
+                self._conn.execute(
+                    "DELETE FROM terms WHERE seq IN (SELECT seq FROM records WHERE kind = ?)",
+                    (kind,)
+                )
+                self._conn.execute("DELETE FROM records WHERE kind = ?", (kind,))
+
+    def compact(self) -> None:
+        with self._lock:
+            self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            self._conn.execute("VACUUM")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
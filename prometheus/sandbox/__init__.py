@@ -9,8 +9,10 @@ Secure code execution environment inspired by E2B (e2b.dev):
 """
 
 from .executor import SandboxExecutor, SandboxResult
+from .pool import SandboxWorkerPool
 
 __all__ = [
     "SandboxExecutor",
     "SandboxResult",
+    "SandboxWorkerPool",
 ]
@@ -2,7 +2,7 @@
 Sandbox Executor for PROMETHEUS.
 
 Secure Python code execution environment inspired by E2B (e2b.dev):
-- Isolated execution using subprocess
+- Isolated execution in subprocesses (warm worker pool by default)
 - Timeout protection
 - Resource limits
 - Output capture (stdout, stderr)
@@ -18,6 +18,8 @@ from typing import Optional, Dict, Any, List
 from datetime import datetime
 import json
 
+from .pool import SandboxWorkerPool
+
 
 @dataclass
 class SandboxResult:
@@ -48,6 +50,8 @@ class SandboxConfig:
     timeout: float = 30.0  # seconds
     max_memory_mb: int = 512
     max_output_size: int = 100000  # characters
+    pool_size: int = 4  # warm worker processes (0 = new process per run)
+    max_runs_per_worker: int = 100  # recycle a worker after this many runs
     allowed_imports: List[str] = field(default_factory=lambda: [
         "json", "re", "math", "random", "datetime", "collections",
         "itertools", "functools", "operator", "string", "textwrap",
@@ -74,6 +78,25 @@ class SandboxExecutor:
     def __init__(self, config: Optional[SandboxConfig] = None):
         self.config = config or SandboxConfig()
         self.execution_history: List[SandboxResult] = []
+        self._pool: Optional[SandboxWorkerPool] = None
+
+    @property
+    def pool(self) -> Optional[SandboxWorkerPool]:
+        """Warm worker pool (started on first use; None if disabled)."""
+        if self._pool is None and self.config.pool_size > 0:
+            self._pool = SandboxWorkerPool(
+                size=self.config.pool_size,
+                max_runs=self.config.max_runs_per_worker,
+                max_memory_mb=self.config.max_memory_mb,
+            )
+            self._pool.start()
+        return self._pool
+
+    def close(self):
+        """Stop pooled worker processes."""
+        if self._pool is not None:
+            self._pool.close()
+            self._pool = None
 
     async def execute(
         self,
@@ -110,6 +133,17 @@ class SandboxExecutor:
         if capture_return:
             code = self._wrap_code_for_return(code)
 
+        pool = self.pool
+        if pool is not None:
+            try:
+                stdout, stderr, returncode = await pool.run(code, timeout)
+                result = self._build_result(stdout, stderr, returncode, capture_return, start_time)
+            except asyncio.TimeoutError:
+                result = self._timeout_result(timeout)
+
+            self.execution_history.append(result)
+            return result
+
         # Create temporary file
         with tempfile.NamedTemporaryFile(
             mode='w',
@@ -134,51 +168,19 @@ class SandboxExecutor:
                     timeout=timeout
                 )
 
-                stdout = stdout_bytes.decode('utf-8', errors='replace')
-                stderr = stderr_bytes.decode('utf-8', errors='replace')
-
-                # Truncate if too long
-                if len(stdout) > self.config.max_output_size:
-                    stdout = stdout[:self.config.max_output_size] + "\n...[truncated]"
-                if len(stderr) > self.config.max_output_size:
-                    stderr = stderr[:self.config.max_output_size] + "\n...[truncated]"
-
-                # Extract return value if present
-                return_value = None
-                if capture_return and "__SANDBOX_RETURN__:" in stdout:
-                    try:
-                        return_line = [l for l in stdout.split('\n') if "__SANDBOX_RETURN__:" in l][-1]
-                        return_json = return_line.split("__SANDBOX_RETURN__:")[1].strip()
-                        return_value = json.loads(return_json)
-                        # Remove return line from stdout
-                        stdout = stdout.replace(return_line, "").strip()
-                    except (json.JSONDecodeError, IndexError):
-                        pass
-
-                execution_time = (datetime.now() - start_time).total_seconds()
-
-                result = SandboxResult(
-                    success=process.returncode == 0,
-                    stdout=stdout,
-                    stderr=stderr,
-                    return_value=return_value,
-                    execution_time=execution_time,
-                    error_type="RuntimeError" if process.returncode != 0 else None,
-                    error_message=stderr if process.returncode != 0 else None,
+                result = self._build_result(
+                    stdout_bytes.decode('utf-8', errors='replace'),
+                    stderr_bytes.decode('utf-8', errors='replace'),
+                    process.returncode,
+                    capture_return,
+                    start_time,
                 )
 
             except asyncio.TimeoutError:
                 process.kill()
                 await process.wait()
 
-                result = SandboxResult(
-                    success=False,
-                    stdout="",
-                    stderr=f"Execution timed out after {timeout} seconds",
-                    execution_time=timeout,
-                    error_type="TimeoutError",
-                    error_message=f"Code execution exceeded {timeout}s limit",
-                )
+                result = self._timeout_result(timeout)
 
         finally:
             # Clean up temp file
@@ -190,6 +192,55 @@ class SandboxExecutor:
         self.execution_history.append(result)
         return result
 
+    def _build_result(
+        self,
+        stdout: str,
+        stderr: str,
+        returncode: int,
+        capture_return: bool,
+        start_time: datetime,
+    ) -> SandboxResult:
+        """Build a SandboxResult from captured output and exit code."""
+        # Truncate if too long
+        if len(stdout) > self.config.max_output_size:
+            stdout = stdout[:self.config.max_output_size] + "\n...[truncated]"
+        if len(stderr) > self.config.max_output_size:
+            stderr = stderr[:self.config.max_output_size] + "\n...[truncated]"
+
+        # Extract return value if present
+        return_value = None
+        if capture_return and "__SANDBOX_RETURN__:" in stdout:
+            try:
+                return_line = [l for l in stdout.split('\n') if "__SANDBOX_RETURN__:" in l][-1]
+                return_json = return_line.split("__SANDBOX_RETURN__:")[1].strip()
+                return_value = json.loads(return_json)
+                # Remove return line from stdout
+                stdout = stdout.replace(return_line, "").strip()
+            except (json.JSONDecodeError, IndexError):
+                pass
+
+        execution_time = (datetime.now() - start_time).total_seconds()
+
+        return SandboxResult(
+            success=returncode == 0,
+            stdout=stdout,
+            stderr=stderr,
+            return_value=return_value,
+            execution_time=execution_time,
+            error_type="RuntimeError" if returncode != 0 else None,
+            error_message=stderr if returncode != 0 else None,
+        )
+
+    def _timeout_result(self, timeout: float) -> SandboxResult:
+        return SandboxResult(
+            success=False,
+            stdout="",
+            stderr=f"Execution timed out after {timeout} seconds",
+            execution_time=timeout,
+            error_type="TimeoutError",
+            error_message=f"Code execution exceeded {timeout}s limit",
+        )
+
     async def execute_function(
         self,
         func_code: str,
@@ -0,0 +1,203 @@
+"""
+Warm worker pool for SandboxExecutor.
+
+Spawning a fresh interpreter per snippet costs tens of milliseconds.
+The pool keeps pre-started worker processes (see worker.py) that take
+code over a pipe, so a run only pays for the code itself:
+- workers start ahead of time and are reused
+- each worker is recycled after max_runs executions, or right away
+  when a run leaves global state behind (see worker.py)
+- a worker that times out or dies is killed and replaced
+- every worker runs under the configured memory limit
+
+Pipe I/O runs in a thread, so the pool works with any event loop.
+"""
+
+import asyncio
+import json
+import subprocess
+import sys
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+
+WORKER_SCRIPT = str(Path(__file__).with_name("worker.py"))
+
+
+class WorkerCrashed(RuntimeError):
+    """Worker exited before replying."""
+
+    def __init__(self, returncode: Optional[int]):
+        super().__init__(f"Sandbox worker exited with code {returncode}")
+        self.returncode = returncode
+
+
+class _Worker:
+    """One worker process."""
+
+    def __init__(self, max_memory_mb: int):
+        self.process = subprocess.Popen(
+            [sys.executable, WORKER_SCRIPT, str(max_memory_mb)],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            cwd=tempfile.gettempdir(),
+            text=True,
+            encoding="utf-8",
+        )
+        self.runs = 0
+        self.dirty = False
+
+    @property
+    def alive(self) -> bool:
+        return self.process.poll() is None
+
+    def run(self, code: str) -> Dict[str, Any]:
+        """Send code and block until the reply (runs in a thread)."""
+        try:
+            self.process.stdin.write(json.dumps({"code": code}) + "\n")
+            self.process.stdin.flush()
+            line = self.process.stdout.readline()
+        except (OSError, ValueError):
+            line = ""
+
+        if not line:
+            self.close()
+            raise WorkerCrashed(self.process.wait())
+
+        self.runs += 1
+        reply = json.loads(line)
+        self.dirty = reply["dirty"]
+        return reply
+
+    def kill(self):
+        """Kill the process (safe while another thread is reading)."""
+        if self.alive:
+            self.process.kill()
+        self.process.wait()
+
+    def close(self):
+        """Kill the process and close its pipes."""
+        self.kill()
+        for stream in (self.process.stdin, self.process.stdout):
+            try:
+                stream.close()
+            except (OSError, ValueError):
+                pass
+
+
+class SandboxWorkerPool:
+    """
+    Pool of warm sandbox worker processes.
+
+    Keeps up to `size` idle workers. If all are busy, an extra worker
+    is started for the run, so concurrency is never capped by the pool.
+    """
+
+    def __init__(self, size: int = 4, max_runs: int = 100, max_memory_mb: int = 512):
+        """
+        Args:
+            size: Idle workers kept warm
+            max_runs: Executions before a worker is replaced
+            max_memory_mb: Address space limit per worker (0 = none)
+        """
+        self.size = size
+        self.max_runs = max_runs
+        self.max_memory_mb = max_memory_mb
+
+        self._idle: List[_Worker] = []
+        self._lock = threading.Lock()
+        self._closed = False
+
+        self.spawned = 0
+        self.recycled = 0
+        self.timeouts = 0
+        self.crashes = 0
+
+    def _spawn(self) -> _Worker:
+        self.spawned += 1
+        return _Worker(self.max_memory_mb)
+
+    def start(self):
+        """Pre-start workers up to the pool size."""
+        while True:
+            with self._lock:
+                if self._closed or len(self._idle) >= self.size:
+                    return
+            worker = self._spawn()
+            with self._lock:
+                self._idle.append(worker)
+
+    def _acquire(self) -> _Worker:
+        while True:
+            with self._lock:
+                worker = self._idle.pop() if self._idle else None
+            if worker is None:
+                return self._spawn()
+            if worker.alive:
+                return worker
+            worker.close()
+
+    def _release(self, worker: _Worker):
+        if worker.runs < self.max_runs and not worker.dirty and worker.alive:
+            with self._lock:
+                if not self._closed and len(self._idle) < self.size:
+                    self._idle.append(worker)
+                    return
+            worker.close()
+            return
+
+        self.recycled += 1
+        worker.close()
+        self.start()
+
+    async def run(self, code: str, timeout: float) -> Tuple[str, str, int]:
+        """
+        Run code in a worker.
+
+        Returns (stdout, stderr, exit code).
+        Raises asyncio.TimeoutError if the run exceeds timeout.
+        """
+        if self._closed:
+            raise RuntimeError("SandboxWorkerPool is closed")
+
+        worker = self._acquire()
+        try:
+            reply = await asyncio.wait_for(asyncio.to_thread(worker.run, code), timeout)
+        except asyncio.TimeoutError:
+            # The reading thread sees EOF and exits once the process is gone
+            self.timeouts += 1
+            worker.kill()
+            self.start()
+            raise
+        except WorkerCrashed as e:
+            self.crashes += 1
+            self.start()
+            return "", str(e), e.returncode or 1
+        except BaseException:
+            worker.kill()
+            raise
+
+        self._release(worker)
+        return reply["stdout"], reply["stderr"], reply["exit_code"]
+
+    def close(self):
+        """Stop all idle workers."""
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        for worker in idle:
+            worker.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Pool statistics."""
+        return {
+            "size": self.size,
+            "idle": len(self._idle),
+            "spawned": self.spawned,
+            "recycled": self.recycled,
+            "timeouts": self.timeouts,
+            "crashes": self.crashes,
+        }
@@ -0,0 +1,213 @@
+"""
+Sandbox worker process (started by SandboxWorkerPool).
+
+Runs as a plain script and must not import the prometheus package.
+Protocol: one JSON request per line on stdin ({"code": ...}), one JSON
+reply per line ({"stdout", "stderr", "exit_code", "dirty"}) on the
+original stdout. Between runs fds 0/1/2 point at /dev/null so user code
+can neither read requests nor corrupt replies; during a run fds 1/2 are
+per-run temp files, so output from os.write() or child processes is
+captured like in a fresh interpreter.
+
+Each snippet runs in fresh globals as __main__; modules it imported,
+cwd, environment and sys.path are restored afterwards. State that cannot
+be scoped to a run (rebound attributes of preloaded modules, including
+builtins, threads, signal handlers, interpreter settings) is checked
+after every run: module attributes are put back so the reply can be
+sent, and the reply is marked dirty so the pool retires the worker.
+"""
+
+import builtins
+import gc
+import json
+import linecache
+import os
+import signal
+import sys
+import tempfile
+import threading
+import traceback
+from operator import is_
+
+FILENAME = "<sandbox>"
+
+_MISSING = object()
+
+
+def limit_memory(max_memory_mb: int):
+    """Cap the address space (best effort, POSIX only)."""
+    if max_memory_mb <= 0:
+        return
+    try:
+        import resource
+
+        limit = max_memory_mb * 1024 * 1024
+        _, hard = resource.getrlimit(resource.RLIMIT_AS)
+        if hard != resource.RLIM_INFINITY:
+            limit = min(limit, hard)
+        resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+    except (ImportError, ValueError, OSError):
+        pass
+
+
+def exit_code_of(exc: SystemExit) -> int:
+    """Process exit status for a SystemExit, as the interpreter computes it."""
+    if exc.code is None:
+        return 0
+    if isinstance(exc.code, int):
+        return exc.code
+    print(exc.code, file=sys.stderr)
+    return 1
+
+
+def thread_count() -> int:
+    """OS threads in this process (threading only sees its own)."""
+    try:
+        return len(os.listdir("/proc/self/task"))
+    except OSError:
+        return threading.active_count()
+
+
+def interpreter_settings() -> tuple:
+    return (
+        sys.getrecursionlimit(),
+        sys.gettrace(),
+        sys.getprofile(),
+        gc.isenabled(),
+        [signal.getsignal(s) for s in sorted(signal.valid_signals())],
+    )
+
+
+class Snapshot:
+    """Process state taken before the first run and checked after each one."""
+
+    def __init__(self):
+        self.modules = {
+            name: (module, dict(vars(module)))
+            for name, module in sys.modules.items()
+            if hasattr(module, "__dict__")
+        }
+        self.cwd = os.getcwd()
+        self.environ = dict(os.environ)
+        self.path = list(sys.path)
+        self.threads = thread_count()
+        self.settings = interpreter_settings()
+
+    def restore(self) -> bool:
+        """Put back what a run changed; False if the worker must be retired."""
+        clean = True
+
+        for name in set(sys.modules) - self.modules.keys():
+            del sys.modules[name]
+
+        for name, (module, attrs) in self.modules.items():
+            if sys.modules.get(name) is not module:
+                sys.modules[name] = module
+                clean = False
+            current = vars(module)
+            if len(current) == len(attrs) and all(map(is_, current.values(), attrs.values())):
+                continue
+            for key in current.keys() - attrs.keys():
+                del current[key]
+                clean = False
+            for key, value in attrs.items():
+                if current.get(key, _MISSING) is not value:
+                    current[key] = value
+                    clean = False
+
+        os.chdir(self.cwd)
+        if os.environ != self.environ:
+            os.environ.clear()
+            os.environ.update(self.environ)
+        sys.path[:] = self.path
+
+        if thread_count() != self.threads or interpreter_settings() != self.settings:
+            clean = False
+        return clean
+
+
+def read_all(fd: int) -> str:
+    os.lseek(fd, 0, os.SEEK_SET)
+    chunks = []
+    while True:
+        chunk = os.read(fd, 65536)
+        if not chunk:
+            return b"".join(chunks).decode("utf-8", errors="replace")
+        chunks.append(chunk)
+
+
+def run(code: str, out_fd: int, err_fd: int, devnull: int) -> dict:
+    for fd in (out_fd, err_fd):
+        os.ftruncate(fd, 0)
+        os.lseek(fd, 0, os.SEEK_SET)  # read_all() left the offset at the old end
+    os.dup2(out_fd, 1)
+    os.dup2(err_fd, 2)
+
+    # Buffered like a fresh interpreter writing to a pipe
+    stdout = open(1, "w", encoding="utf-8", closefd=False)
+    stderr = open(2, "w", buffering=1, encoding="utf-8", errors="backslashreplace",
+                  closefd=False)
+    sys.stdout, sys.stderr = stdout, stderr
+    linecache.cache[FILENAME] = (len(code), None, code.splitlines(True), FILENAME)
+    namespace = {"__name__": "__main__", "__builtins__": builtins}
+
+    exit_code = 0
+    try:
+        exec(compile(code, FILENAME, "exec"), namespace)
+    except SystemExit as e:
+        exit_code = exit_code_of(e)
+    except BaseException as e:
+        # Skip this frame so the traceback starts in the snippet
+        traceback.print_exception(type(e), e, e.__traceback__.tb_next)
+        exit_code = 1
+    finally:
+        for stream in (stdout, stderr):
+            try:
+                stream.flush()
+            except (OSError, ValueError):
+                pass
+        sys.stdout, sys.stderr = sys.__stdout__, sys.__stderr__
+        linecache.cache.pop(FILENAME, None)
+        os.dup2(devnull, 1)
+        os.dup2(devnull, 2)
+
+    return {"stdout": read_all(out_fd), "stderr": read_all(err_fd), "exit_code": exit_code}
+
+
+def main():
+    limit_memory(int(sys.argv[1]) if len(sys.argv) > 1 else 0)
+
+    # Keep the protocol on private fds; user code sees /dev/null
+    requests = os.fdopen(os.dup(0), "r", encoding="utf-8")
+    replies = os.fdopen(os.dup(1), "w", encoding="utf-8")
+    devnull = os.open(os.devnull, os.O_RDWR)
+    for fd in (0, 1, 2):
+        os.dup2(devnull, fd)
+
+    # Unlinked files that collect fd-level output of a run
+    out_file, err_file = tempfile.TemporaryFile(), tempfile.TemporaryFile()
+    out_fd, err_fd = out_file.fileno(), err_file.fileno()
+
+    # Imports resolve like a script in the working directory
+    sys.path[0] = os.getcwd()
+
+    # Bound once: snippets may monkeypatch the json module
+    dumps, loads = json.dumps, json.loads
+
+    snapshot = Snapshot()
+
+    for line in requests:
+        try:
+            reply = run(loads(line)["code"], out_fd, err_fd, devnull)
+        finally:
+            clean = snapshot.restore()
+
+        reply["dirty"] = not clean
+        replies.write(dumps(reply) + "\n")
+        replies.flush()
+        if not clean:
+            break
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+"""
+Tests for the pooled async HTTP client.
+
+Runs against a minimal HTTP/1.1 keep-alive server on localhost.
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from jdev_core.async_utils import (
+    HttpClient,
+    close_clients,
+    get,
+    get_client,
+    post,
+)
+
+
+class StubServer:
+    """Keep-alive HTTP/1.1 server that records what it was sent."""
+
+    def __init__(self):
+        self.connections = 0
+        self.requests = []
+        self.active = 0
+        self.max_active = 0
+        self._server = None
+
+    async def __aenter__(self) -> 'StubServer':
+        self._server = await asyncio.start_server(self._serve, '127.0.0.1', 0)
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        self._server.close()
+        await self._server.wait_closed()
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.sockets[0].getsockname()[:2]
+        return f"http://{host}:{port}"
+
+    async def _serve(self, reader, writer) -> None:
+        self.connections += 1
+        try:
+            while True:
+                head = await reader.readuntil(b'\r\n\r\n')
+                lines = head.decode().split('\r\n')
+                method, path, _ = lines[0].split(' ')
+                headers = {
+                    name.lower(): value
+                    for name, value in (line.split(': ', 1) for line in lines[1:] if line)
+                }
+                body = await reader.readexactly(int(headers.get('content-length', 0)))
+                self.requests.append((method, path, headers, body))
+
+                self.active += 1
+                self.max_active = max(self.max_active, self.active)
+                try:
+                    status, extra, payload = await self._respond(path, headers)
+                finally:
+                    self.active -= 1
+
+                extra = {'Content-Length': str(len(payload)), **extra}
+                writer.write(
+                    f"HTTP/1.1 {status}\r\n".encode()
+                    + b''.join(f"{k}: {v}\r\n".encode() for k, v in extra.items())
+                    + b'\r\n' + payload
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def _respond(self, path, headers):
+        if path.startswith('/slow'):
+            await asyncio.sleep(0.05)
+            return '200 OK', {}, b'slow'
+        if path == '/etag':
+            if headers.get('if-none-match') == '"v1"':
+                return '304 Not Modified', {'ETag': '"v1"'}, b''
+            return '200 OK', {'ETag': '"v1"'}, b'{"version": 1}'
+        if path == '/big':
+            return '200 OK', {}, b'x' * 1_000_000
+        return '200 OK', {}, path.encode()
+
+
+@pytest.fixture
+async def server():
+    async with StubServer() as stub:
+        yield stub
+
+
+class TestHttpClient:
+
+    async def test_connections_reused(self, server):
+        async with HttpClient(base_url=server.url) as client:
+            for i in range(10):
+                response = await client.get(f'/item/{i}')
+                assert response.text == f'/item/{i}'
+
+        assert server.connections == 1
+
+    async def test_lazy_init_without_context_manager(self, server):
+        client = HttpClient(base_url=server.url)
+
+        response = await client.post('/echo', json={'a': 1})
+
+        assert response.ok
+        assert json.loads(server.requests[0][3]) == {'a': 1}
+        await client.close()
+
+    async def test_concurrent_gets_deduplicated(self, server):
+        async with HttpClient(base_url=server.url) as client:
+            responses = await asyncio.gather(*(client.get('/slow') for _ in range(10)))
+            other = await client.get('/slow', params={'page': '2'})
+
+        assert {r.text for r in responses} == {'slow'}
+        assert other.text == 'slow'
+        assert len(server.requests) == 2
+
+    async def test_dedupe_can_be_disabled(self, server):
+        async with HttpClient(base_url=server.url, dedupe_gets=False) as client:
+            await asyncio.gather(*(client.get('/slow') for _ in range(3)))
+
+        assert len(server.requests) == 3
+
+    async def test_per_host_limit(self, server):
+        async with HttpClient(base_url=server.url, max_connections_per_host=2) as client:
+            await asyncio.gather(*(client.post('/slow') for _ in range(6)))
+
+        assert server.max_active == 2
+
+    async def test_conditional_request_cache(self, server):
+        async with HttpClient(base_url=server.url) as client:
+            first = await client.get('/etag')
+            second = await client.get('/etag')
+
+        assert not first.from_cache
+        assert second.from_cache
+        assert second.status_code == 200
+        assert second.json() == {'version': 1}
+        assert server.requests[1][2]['if-none-match'] == '"v1"'
+
+    async def test_streamed_body(self, server):
+        async with HttpClient(base_url=server.url) as client:
+            async with client.stream('GET', '/big') as response:
+                assert response.ok
+                sizes = [len(chunk) async for chunk in response.aiter_bytes(65536)]
+
+        assert sum(sizes) == 1_000_000
+        assert max(sizes) <= 65536
+        assert len(sizes) > 1
+
+
+class TestSharedClients:
+
+    async def test_module_helpers_share_one_pool(self, server):
+        for i in range(5):
+            assert (await get(f"{server.url}/g/{i}")).ok
+        assert (await post(f"{server.url}/p", json=[1])).ok
+
+        assert server.connections == 1
+        assert get_client() is get_client()
+        assert get_client(server.url) is not get_client()
+        await close_clients()
@@ -4,16 +4,35 @@ Tests for async process operations.
 SCALE & SUSTAIN Phase 3.1 validation.
 """
 
+import asyncio
+import time
+
 import pytest
 
+from jdev_core.async_utils import process
 from jdev_core.async_utils import (
     run_command,
     run_shell,
     run_many,
+    stream_command,
     ProcessResult,
+    ProcessStream,
 )
 
 
+async def _collect(proc):
+    return [line async for line in proc]
+
+
+def is_running(pid):
+    """True if pid exists and is not a zombie awaiting its reaper."""
+    try:
+        with open(f"/proc/{pid}/stat") as stat:
+            return stat.read().rsplit(")", 1)[1].split()[0] != "Z"
+    except FileNotFoundError:
+        return False
+
+
 class TestProcessResult:
     """Test ProcessResult dataclass."""
 
@@ -179,3 +198,136 @@ class TestRunMany:
         results = await run_many(commands)
 
         assert all(r.success for r in results)
+
+
+class TestStreaming:
+    """Test streamed output and process-group cleanup."""
+
+    @pytest.mark.asyncio
+    async def test_stream_lines_as_they_arrive(self):
+        """Test lines from both streams are yielded in arrival order."""
+        script = "echo one; sleep 0.05; echo two >&2; sleep 0.05; echo three"
+
+        async with stream_command(script, shell=True) as proc:
+            lines = [(line.stream, line.text) async for line in proc]
+            result = await proc.wait()
+
+        assert lines == [("stdout", "one"), ("stderr", "two"), ("stdout", "three")]
+        assert result.stdout == "one\nthree"
+        assert result.stderr == "two"
+
+    @pytest.mark.asyncio
+    async def test_iterating_uncaptured_output_yields_nothing(self):
+        """Test iteration ends at once when output is not captured."""
+        async with ProcessStream("true", capture_output=False) as proc:
+            lines = await asyncio.wait_for(_collect(proc), timeout=5)
+            result = await proc.wait()
+
+        assert lines == []
+        assert result.success
+
+    @pytest.mark.asyncio
+    async def test_ring_buffer_keeps_tail(self):
+        """Test only the last lines are retained."""
+        result = await run_command("seq 1 5000", max_output_lines=3)
+
+        assert result.stdout == "4998\n4999\n5000"
+        assert result.dropped_lines == 4997
+
+    @pytest.mark.asyncio
+    async def test_on_output_callback(self):
+        """Test run_command reports each line to on_output."""
+        seen = []
+
+        async def record(line):
+            seen.append(line.text)
+
+        result = await run_command(["printf", "a\\nb\\nc"], on_output=record)
+
+        assert seen == ["a", "b", "c"]
+        assert result.stdout == "a\nb\nc"
+
+    @pytest.mark.asyncio
+    async def test_timeout_kills_process_group(self):
+        """Test a timeout does not wait for grandchildren holding the pipe."""
+        start = time.monotonic()
+
+        result = await run_shell("sleep 5 | cat", timeout=0.2)
+
+        assert time.monotonic() - start < 2
+        assert result.returncode == -1
+        assert "timed out" in result.stderr
+
+    @pytest.mark.asyncio
+    async def test_cancel_kills_process_group(self):
+        """Test cancelling a run kills the child and its children."""
+        pids = []
+
+        task = asyncio.create_task(run_command(
+            "sh -c 'sleep 30 & echo $!; wait'",
+            on_output=lambda line: pids.append(int(line.text))
+        ))
+        while not pids:
+            await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        await asyncio.sleep(0.05)
+        assert not is_running(pids[0])
+
+
+class TestRunManyScheduling:
+    """Test run_many concurrency and priorities."""
+
+    @pytest.mark.asyncio
+    async def test_priority_order(self, tmp_path):
+        """Test higher-priority commands start first."""
+        log = tmp_path / "order"
+        commands = [f"echo {name} >> {log}" for name in "abcd"]
+
+        results = await run_many(
+            [["sh", "-c", c] for c in commands],
+            max_concurrency=1,
+            priorities=[0, 5, 1, 5],
+        )
+
+        assert all(r.success for r in results)
+        assert log.read_text().split() == ["b", "d", "c", "a"]
+
+    @pytest.mark.asyncio
+    async def test_concurrency_limit(self):
+        """Test no more than max_concurrency commands overlap."""
+        start = time.monotonic()
+
+        await run_many(["sleep 0.1"] * 4, max_concurrency=2)
+
+        assert 0.2 <= time.monotonic() - start < 0.35
+
+    @pytest.mark.asyncio
+    async def test_fail_fast_runs_sequentially_by_default(self, tmp_path, monkeypatch):
+        """Test fail_fast never starts a command after the failure by default."""
+        monkeypatch.setattr(process, "cpu_count", lambda: 4)
+        log = tmp_path / "ran"
+
+        results = await run_many(
+            ["sh -c 'sleep 0.05; exit 1'"] + [f"sh -c 'echo {n} >> {log}'" for n in range(3)],
+            fail_fast=True,
+        )
+
+        assert [r.returncode for r in results] == [1]
+        assert not log.exists()
+
+    @pytest.mark.asyncio
+    async def test_fail_fast_kills_later_commands(self):
+        """Test fail_fast stops commands after the failure when running concurrently."""
+        start = time.monotonic()
+
+        results = await run_many(
+            ["echo first", "sh -c 'sleep 0.05; exit 3'", "sleep 5", "echo never"],
+            fail_fast=True,
+            max_concurrency=3,
+        )
+
+        assert time.monotonic() - start < 2
+        assert [r.returncode for r in results] == [0, 3]
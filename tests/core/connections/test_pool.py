@@ -4,6 +4,8 @@ Tests for connection pool.
 SCALE & SUSTAIN Phase 3.2 validation.
 """
 
+import asyncio
+
 import pytest
 
 from jdev_core.connections import (
@@ -234,3 +236,187 @@ class TestConnectionPool:
         await pool.close()
 
         assert len(closures) == 3
+
+
+class TestPoolConcurrency:
+    """Test acquire fast path, waiter ordering and pre-warming."""
+
+    def make_pool(self, config, **kwargs):
+        counter = {"count": 0}
+
+        def factory():
+            counter["count"] += 1
+            return MockConnection(counter["count"])
+
+        return ConnectionPool(factory=factory, config=config, **kwargs), counter
+
+    @pytest.mark.asyncio
+    async def test_slow_connect_does_not_block_reuse(self):
+        """Test an idle connection is handed out while another connect is slow."""
+        gate = asyncio.Event()
+        counter = {"count": 0}
+
+        async def factory():
+            counter["count"] += 1
+            if counter["count"] > 1:
+                await gate.wait()
+            return MockConnection(counter["count"])
+
+        pool = ConnectionPool(factory=factory, config=PoolConfig(min_size=1, max_size=3))
+        await pool.initialize()
+        first = await pool.acquire()
+
+        slow = asyncio.create_task(pool.acquire())
+        await asyncio.sleep(0.01)
+        await pool.release(first.connection)
+        reused = await asyncio.wait_for(pool.acquire(), 0.1)
+        assert reused.connection is first.connection
+
+        gate.set()
+        assert (await slow).connection.id == 2
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_lifo_reuse(self):
+        """Test the most recently released connection is reused first."""
+        pool, _ = self.make_pool(PoolConfig(min_size=0, max_size=3))
+        conns = [await pool.acquire() for _ in range(3)]
+        for pooled in conns:
+            await pool.release(pooled.connection)
+
+        again = await pool.acquire()
+        assert again.connection is conns[-1].connection
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_waiters_served_fifo(self):
+        """Test released connections go to waiters in arrival order."""
+        pool, _ = self.make_pool(PoolConfig(min_size=1, max_size=1))
+        await pool.initialize()
+        held = await pool.acquire()
+
+        order = []
+
+        async def worker(name):
+            async with await pool.acquire():
+                order.append(name)
+                await asyncio.sleep(0)
+
+        tasks = []
+        for name in "abc":
+            tasks.append(asyncio.create_task(worker(name)))
+            await asyncio.sleep(0)
+        assert pool.stats.waiting_acquirers == 3
+
+        await pool.release(held.connection)
+        await asyncio.gather(*tasks)
+
+        assert order == ["a", "b", "c"]
+        assert pool.stats.total_waits == 3
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_per_waiter_deadline(self):
+        """Test each waiter times out on its own deadline."""
+        pool, _ = self.make_pool(PoolConfig(min_size=1, max_size=1, acquire_timeout=5))
+        await pool.initialize()
+        held = await pool.acquire()
+
+        short = asyncio.create_task(pool.acquire(timeout=0.02))
+        long = asyncio.create_task(pool.acquire())
+        with pytest.raises(PoolExhaustedError):
+            await short
+
+        await pool.release(held.connection)
+        assert (await long).connection is held.connection
+        assert pool.stats.total_timeouts == 1
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_passes_connection_on(self):
+        """Test a connection handed to a cancelled waiter reaches the next one."""
+        pool, _ = self.make_pool(PoolConfig(min_size=1, max_size=1))
+        await pool.initialize()
+        held = await pool.acquire()
+
+        first = asyncio.create_task(pool.acquire())
+        second = asyncio.create_task(pool.acquire())
+        await asyncio.sleep(0)
+
+        await pool.release(held.connection)
+        first.cancel()
+
+        assert (await second).connection is held.connection
+        assert first.cancelled()
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_invalid_connection_frees_slot_for_waiter(self):
+        """Test a waiter gets a fresh connection when the released one is bad."""
+        pool, counter = self.make_pool(
+            PoolConfig(min_size=1, max_size=1, validate_on_release=True),
+            validator=lambda conn: conn.id != 1,
+        )
+        await pool.initialize()
+        held = await pool.acquire()
+
+        waiter = asyncio.create_task(pool.acquire())
+        await asyncio.sleep(0)
+        await pool.release(held.connection)
+
+        assert (await waiter).connection.id == 2
+        assert counter["count"] == 2
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_stale_connections_rewarmed(self):
+        """Test evicted idle connections are replaced up to min_size."""
+        closures = []
+        pool, counter = self.make_pool(
+            PoolConfig(min_size=2, max_size=4, max_idle_time=0.01),
+            closer=lambda conn: closures.append(conn.id),
+        )
+        await pool.initialize()
+        await asyncio.sleep(0.02)
+
+        pooled = await pool.acquire()
+        assert pooled.connection.id == 3
+        await asyncio.sleep(0.05)
+
+        assert sorted(closures) == [1, 2]
+        assert pool.stats.total_connections == 2
+        assert counter["count"] == 4
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_acquire_percentiles(self):
+        """Test acquire latency percentiles are reported."""
+        pool, _ = self.make_pool(PoolConfig(min_size=1, max_size=2))
+        await pool.initialize()
+        for _ in range(20):
+            async with await pool.acquire():
+                pass
+
+        stats = pool.stats
+        assert len(stats.acquire_samples_ms) == 20
+        assert (
+            0 <= stats.p50_acquire_time_ms
+            <= stats.p95_acquire_time_ms
+            <= stats.p99_acquire_time_ms
+        )
+        assert stats.p99_acquire_time_ms == max(stats.acquire_samples_ms)
+        await pool.close()
+
+    def test_percentile_empty_and_window(self):
+        """Test percentiles over the bounded sample window."""
+        stats = PoolStats()
+        assert stats.p95_acquire_time_ms == 0.0
+
+        for ms in range(1, 101):
+            stats.record_acquire(float(ms))
+
+        assert stats.total_acquires == 100
+        assert stats.avg_acquire_time_ms == pytest.approx(50.5)
+        assert stats.p50_acquire_time_ms == 51.0
+        assert stats.p95_acquire_time_ms == 96.0
+        assert stats.p99_acquire_time_ms == 100.0
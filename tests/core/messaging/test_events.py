@@ -217,6 +217,63 @@ class TestEventBus:
         await asyncio.sleep(0.1)
         assert len(processed) == 1
 
+    @pytest.mark.asyncio
+    async def test_emit_no_wait_is_bounded(self):
+        """Test fire-and-forget emit waits once max_pending calls are in flight."""
+        bus = EventBus(max_pending=2)
+        gate = asyncio.Event()
+
+        @bus.on(Event)
+        async def blocked_handler(event):
+            await gate.wait()
+
+        await bus.emit(Event(), wait=False)
+        await bus.emit(Event(), wait=False)
+        third = asyncio.create_task(bus.emit(Event(), wait=False))
+        await asyncio.sleep(0.01)
+
+        assert bus.pending_count == 2
+        assert not third.done()
+
+        gate.set()
+        await asyncio.wait_for(third, timeout=1)
+        await bus.drain()
+        assert bus.pending_count == 0
+
+    @pytest.mark.asyncio
+    async def test_emit_no_wait_from_handlers_does_not_deadlock(self):
+        """Test handlers holding every slot can still emit without waiting."""
+        bus = EventBus(max_pending=2)
+        children = []
+
+        class ChildEvent(Event):
+            pass
+
+        @bus.on(Event)
+        async def parent_handler(event):
+            for n in range(2):
+                await bus.emit(ChildEvent(data={"n": n}), wait=False)
+
+        bus.subscribe(ChildEvent, lambda event: children.append(event.data["n"]))
+
+        await bus.emit(Event(), wait=False)
+        await bus.emit(Event(), wait=False)
+        await asyncio.wait_for(bus.drain(), timeout=1)
+
+        assert sorted(children) == [0, 0, 1, 1]
+        assert not bus._capacity.locked()
+
+    @pytest.mark.asyncio
+    async def test_history_bounded(self):
+        """Test history keeps only the most recent max_history events."""
+        bus = EventBus(max_history=3)
+        events = [Event(data={"n": n}) for n in range(5)]
+        for event in events:
+            await bus.emit(event)
+
+        assert bus.get_history() == events[2:]
+        assert bus.get_history(limit=1) == events[4:]
+
     def test_handler_count(self):
         """Test handler_count property."""
         bus = EventBus()
@@ -13,7 +13,9 @@ from jdev_core.messaging import (
     QueueConfig,
     InMemoryQueue,
     InMemoryBroker,
+    OverflowPolicy,
 )
+from jdev_core.messaging import memory
 
 
 class TestMessage:
@@ -183,6 +185,96 @@ class TestInMemoryQueue:
         messages = await queue.consume(count=1, timeout=0.5)
         assert len(messages) == 1
 
+    @pytest.mark.asyncio
+    async def test_delayed_message_reaches_waiting_consumer(self, queue):
+        """Test delayed messages are promoted while a consumer waits."""
+        await queue.publish(Message(payload="later"), delay=0.05)
+
+        messages = await queue.consume(count=1, timeout=0.5)
+
+        assert [m.payload for m in messages] == ["later"]
+
+    @pytest.mark.asyncio
+    async def test_delayed_messages_in_visibility_order(self, queue):
+        """Test delayed messages become visible by time, FIFO on ties."""
+        for payload, delay in [("c", 0.06), ("a", 0.02), ("b1", 0.04), ("b2", 0.04)]:
+            await queue.publish(Message(payload=payload), delay=delay)
+
+        await asyncio.sleep(0.1)
+        messages = await queue.consume_batch(max_count=10)
+
+        assert [m.payload for m in messages] == ["a", "b1", "b2", "c"]
+        assert await queue.size() == 0
+
+    @pytest.mark.asyncio
+    async def test_nack_requeues_after_retry_delay(self):
+        """Test nacked messages come back after retry_delay."""
+        queue = InMemoryQueue(QueueConfig(name="retry", retry_delay=0.05))
+        await queue.publish(Message(payload="flaky"))
+        [message] = await queue.consume()
+
+        await queue.nack(message.id)
+        assert await queue.consume() == []
+
+        [retried] = await queue.consume(timeout=0.5)
+        assert retried.id == message.id
+        assert retried.retry_count == 1
+
+    @pytest.mark.asyncio
+    async def test_full_queue_holds_due_messages(self):
+        """Test due messages wait in the delay heap until there is room."""
+        queue = InMemoryQueue(QueueConfig(name="small", max_size=1))
+        await queue.publish(Message(payload="ready"))
+        await queue.publish(Message(payload="delayed"), delay=0.01)
+        await asyncio.sleep(0.05)
+
+        assert [m.payload for m in await queue.consume()] == ["ready"]
+        assert [m.payload for m in await queue.consume()] == ["delayed"]
+
+    @pytest.mark.asyncio
+    async def test_publish_batch(self, queue):
+        """Test bulk publish, including all-or-nothing on overflow."""
+        ids = await queue.publish_batch([Message(payload=i) for i in range(60)])
+        assert len(ids) == 60
+
+        with pytest.raises(Exception, match="full"):
+            await queue.publish_batch([Message(payload=i) for i in range(41)])
+        assert await queue.size() == 60
+
+        await queue.publish_batch([Message(payload="d")], delay=0.01)
+        assert await queue.size() == 61
+
+    @pytest.mark.asyncio
+    async def test_consume_batch_and_ack_many(self, queue):
+        """Test bulk consume and acknowledgement."""
+        await queue.publish_batch([Message(payload=i) for i in range(5)])
+
+        messages = await queue.consume_batch(max_count=3)
+        assert [m.payload for m in messages] == [0, 1, 2]
+
+        acked = await queue.ack_many([m.id for m in messages] + ["unknown"])
+        assert acked == 3
+        assert all(m.status == MessageStatus.COMPLETED for m in messages)
+
+    @pytest.mark.asyncio
+    async def test_consume_batch_waits_for_first_message(self, queue):
+        """Test consume_batch returns once something arrives."""
+        await queue.publish_batch([Message(payload=i) for i in range(3)], delay=0.05)
+
+        messages = await queue.consume_batch(max_count=10, timeout=0.5)
+        assert [m.payload for m in messages] == [0, 1, 2]
+
+        assert await queue.consume_batch(max_count=10, timeout=0.01) == []
+
+    @pytest.mark.asyncio
+    async def test_purge_drops_delayed(self, queue):
+        """Test purge clears delayed messages and their timer."""
+        await queue.publish(Message(payload="x"), delay=0.01)
+
+        assert await queue.purge() == 1
+        await asyncio.sleep(0.03)
+        assert await queue.size() == 0
+
 
 class TestInMemoryBroker:
     """Test InMemoryBroker class."""
@@ -268,3 +360,222 @@ class TestInMemoryBroker:
         await broker.close()
 
         assert await broker.list_queues() == []
+
+
+class TestBrokerDispatch:
+    """Test mailboxes, topic matching and metrics of InMemoryBroker."""
+
+    @pytest.fixture
+    async def broker(self):
+        broker = InMemoryBroker()
+        yield broker
+        await broker.close()
+
+    async def test_slow_subscriber_does_not_stall_others(self, broker):
+        """Test each subscription is drained by its own workers."""
+        fast = []
+        release = asyncio.Event()
+
+        async def slow_handler(msg):
+            await release.wait()
+
+        await broker.subscribe("jobs", slow_handler)
+        await broker.subscribe("jobs", fast.append)
+        for i in range(5):
+            await broker.publish("jobs", i)
+        await asyncio.sleep(0.01)
+
+        assert [m.payload for m in fast] == [0, 1, 2, 3, 4]
+        release.set()
+
+    async def test_topic_wildcards(self, broker):
+        """Test '*'/'+' match one segment and '#' the remainder."""
+        received = {}
+        for pattern in ["a.*", "a.+.c", "a.#", "a.b*", "b.c"]:
+            await broker.subscribe(
+                pattern, lambda m, p=pattern: received.setdefault(p, []).append(m.topic)
+            )
+
+        for topic in ["a", "a.b", "a.x.c", "a.b.c.d", "b.c"]:
+            await broker.publish(topic, None)
+        await asyncio.sleep(0.01)
+
+        assert received["a.*"] == ["a.b"]
+        assert received["a.+.c"] == ["a.x.c"]
+        assert received["a.#"] == ["a", "a.b", "a.x.c", "a.b.c.d"]
+        assert received["a.b*"] == ["a.b"]
+        assert received["b.c"] == ["b.c"]
+
+        with pytest.raises(ValueError):
+            await broker.subscribe("a.#.c", print)
+
+    async def test_priority_order(self, broker):
+        """Test higher priority messages are handled first."""
+        received = []
+        gate = asyncio.Event()
+
+        async def handler(msg):
+            await gate.wait()
+            received.append(msg.payload)
+
+        await broker.subscribe("t", handler)
+        await broker.publish("t", "first")
+        await asyncio.sleep(0)  # Worker picks up "first" and blocks
+        for payload, priority in [("low", 0), ("high", 5), ("mid", 1), ("high2", 5)]:
+            await broker.publish("t", payload, priority=priority)
+
+        gate.set()
+        await asyncio.sleep(0.01)
+        assert received == ["first", "high", "high2", "mid", "low"]
+
+    async def test_block_applies_backpressure(self, broker):
+        """Test publish waits while a BLOCK mailbox is full."""
+        gate = asyncio.Event()
+
+        async def handler(msg):
+            await gate.wait()
+
+        sub_id = await broker.subscribe("t", handler, max_pending=2)
+        for i in range(3):
+            await broker.publish("t", i)  # One in the handler, two queued
+
+        blocked = asyncio.create_task(broker.publish("t", 3))
+        await asyncio.sleep(0.01)
+        assert not blocked.done()
+        assert broker.pending(sub_id) == 2
+
+        gate.set()
+        await asyncio.wait_for(blocked, timeout=1)
+
+    async def test_block_does_not_wait_on_own_mailbox(self, broker):
+        """Test a handler publishing to its own full BLOCK mailbox does not deadlock."""
+        received = []
+        done = asyncio.Event()
+
+        async def handler(msg):
+            received.append(msg.payload)
+            if msg.payload < 3:
+                for _ in range(2):
+                    await broker.publish("t", msg.payload + 1)
+            if len(received) == 15:
+                done.set()
+
+        await broker.subscribe("t", handler, max_pending=1)
+        await broker.publish("t", 0)
+
+        await asyncio.wait_for(done.wait(), timeout=1)
+        assert sorted(received) == [0] + [1] * 2 + [2] * 4 + [3] * 8
+
+    async def test_drop_oldest(self, broker):
+        """Test DROP_OLDEST discards the oldest queued message."""
+        received = []
+        gate = asyncio.Event()
+
+        async def handler(msg):
+            await gate.wait()
+            received.append(msg.payload)
+
+        await broker.subscribe(
+            "t", handler, max_pending=2, overflow=OverflowPolicy.DROP_OLDEST
+        )
+        await broker.publish("t", 0)
+        await asyncio.sleep(0)  # Worker takes 0 and blocks
+        for i in range(1, 5):
+            await broker.publish("t", i)
+
+        gate.set()
+        await asyncio.sleep(0.01)
+        assert received == [0, 3, 4]
+        assert broker.get_metrics("t")["t"].dropped == 2
+
+    async def test_dead_letter_on_overflow_and_failure(self, broker):
+        """Test DEAD_LETTER routes overflow and failed messages to a queue."""
+        gate = asyncio.Event()
+
+        async def handler(msg):
+            await gate.wait()
+            if msg.payload == 0:
+                raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            await broker.subscribe("t", handler, overflow=OverflowPolicy.DEAD_LETTER)
+
+        await broker.subscribe(
+            "t", handler, max_pending=1,
+            overflow=OverflowPolicy.DEAD_LETTER, dead_letter_queue="dlq",
+        )
+        await broker.publish("t", 0)
+        await asyncio.sleep(0)  # Worker takes 0 and blocks
+        for i in range(1, 4):
+            await broker.publish("t", i)
+        gate.set()
+        await asyncio.sleep(0.01)
+
+        dlq = await broker.get_queue("dlq")
+        dead = await dlq.consume_batch(max_count=10)
+        assert sorted(m.payload for m in dead) == [0, 2, 3]
+        assert broker.get_metrics("t")["t"].dead_lettered == 3
+
+    async def test_concurrent_workers(self, broker):
+        """Test concurrency runs several handler calls at once."""
+        active = 0
+        peak = 0
+
+        async def handler(msg):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+        await broker.subscribe("t", handler, concurrency=4)
+        for i in range(8):
+            await broker.publish("t", i)
+        await asyncio.sleep(0.05)
+
+        assert peak == 4
+        assert broker.get_metrics()["t"].delivered == 8
+
+    async def test_queue_subscription_acks_and_retries(self, broker):
+        """Test queue-backed subscriptions ack successes and nack failures."""
+        await broker.create_queue(QueueConfig(name="work", retry_delay=0.01))
+        attempts = []
+
+        def handler(msg):
+            attempts.append(msg.payload)
+            if len(attempts) == 1:
+                raise RuntimeError("flaky")
+
+        await broker.subscribe("jobs.*", handler, queue_name="work")
+        await broker.publish("jobs.build", "x")
+        await asyncio.sleep(0.1)
+
+        assert attempts == ["x", "x"]
+        metrics = broker.get_metrics("jobs.build")["jobs.build"]
+        assert (metrics.published, metrics.delivered, metrics.failed) == (1, 1, 1)
+        assert metrics.max_latency_ms >= metrics.avg_latency_ms > 0
+
+    async def test_queue_subscription_dead_letters_after_retries(self, broker):
+        """Test queue-backed subscriptions dead-letter once retries run out."""
+        await broker.create_queue(QueueConfig(name="work", max_retries=2, retry_delay=0.01))
+
+        def handler(msg):
+            raise RuntimeError("always")
+
+        await broker.subscribe("jobs", handler, queue_name="work", dead_letter_queue="dlq")
+        await broker.publish("jobs", "x")
+        await asyncio.sleep(0.1)
+
+        dlq = await broker.get_queue("dlq")
+        assert [m.payload for m in await dlq.consume_batch(max_count=10)] == ["x"]
+        metrics = broker.get_metrics("jobs")["jobs"]
+        assert (metrics.failed, metrics.dead_lettered) == (2, 1)
+
+    async def test_metrics_keep_recent_topics_only(self, broker, monkeypatch):
+        """Test per-topic metrics are bounded for dynamic topic names."""
+        monkeypatch.setattr(memory, "METRICS_TOPIC_LIMIT", 3)
+        for topic in ["user.1", "user.2", "user.3", "user.1", "user.4"]:
+            await broker.publish(topic, None)
+
+        assert set(broker.get_metrics()) == {"user.1", "user.3", "user.4"}
+        assert broker.get_metrics("user.1")["user.1"].published == 2
@@ -4,6 +4,9 @@ Tests for quota management.
 SCALE & SUSTAIN Phase 3.4 validation.
 """
 
+import fnmatch
+import time
+
 import pytest
 
 from jdev_core.multitenancy import (
@@ -13,8 +16,17 @@ from jdev_core.multitenancy import (
     QuotaManager,
     QuotaUsage,
     QuotaExceededError,
+    QuotaAlgorithm,
+    InMemoryQuotaBackend,
+    RedisQuotaBackend,
     tenant_context,
 )
+from jdev_core.multitenancy.quotas import (
+    QuotaBucket,
+    SlidingLogBucket,
+    SlidingWindowBucket,
+    TokenBucket,
+)
 
 
 class TestQuotaUsage:
@@ -219,3 +231,210 @@ class TestQuotaManager:
         assert minute_usage.used == 5
         assert hour_usage.used == 100
         assert day_usage.used == 500
+
+
+class TestQuotaAlgorithms:
+    """Test the bucket algorithms."""
+
+    def test_fixed_window_allows_edge_burst(self):
+        """Test the fixed window resets fully at the boundary."""
+        bucket = QuotaBucket(limit=10, period=60, window_start=time.time() - 59.9)
+        assert bucket.increment(10)
+
+        bucket.window_start -= 0.2
+        assert bucket.increment(10)
+
+    def test_sliding_window_blocks_edge_burst(self):
+        """Test the previous window still counts just after the boundary."""
+        bucket = SlidingWindowBucket(limit=10, period=60, window_start=time.time() - 59.9)
+        assert bucket.increment(10)
+
+        bucket.window_start -= 0.2
+        assert not bucket.check()
+        assert bucket.get_usage().used == 10
+
+        bucket.window_start -= 30  # Halfway through the next window
+        assert bucket.increment(5)
+        assert not bucket.increment(1)
+
+        bucket.window_start -= 120  # Both windows long gone
+        assert bucket.get_usage().used == 0
+
+    def test_sliding_log_is_exact(self):
+        """Test the log frees each increment exactly one period later."""
+        bucket = SlidingLogBucket(limit=3, period=60)
+        now = time.time()
+        bucket.log.extend([(now - 61, 1), (now - 30, 2)])
+        bucket.total = 3
+
+        assert bucket.increment(1)
+        assert not bucket.check()
+        usage = bucket.get_usage()
+        assert usage.used == 3
+        assert usage.period_end == pytest.approx(now + 30, abs=1)
+
+    def test_token_bucket_refills(self):
+        """Test tokens refill at limit/period per second."""
+        bucket = TokenBucket(limit=10, period=10)
+        assert bucket.increment(10)
+        assert not bucket.check()
+
+        bucket.updated_at -= 3
+        assert bucket.increment(3)
+        assert not bucket.increment(1)
+
+        bucket.updated_at -= 100
+        assert bucket.get_usage().used == 0
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("algorithm", list(QuotaAlgorithm))
+    async def test_manager_enforces_limit(self, algorithm):
+        """Test every algorithm enforces the per-minute limit."""
+        manager = QuotaManager(algorithm=algorithm)
+        tenant = Tenant(name="Algo", config=TenantConfig(requests_per_minute=3))
+
+        results = [await manager.increment_quota(tenant) for _ in range(4)]
+
+        assert results == [True, True, True, False]
+        assert (await manager.get_usage(tenant)).used == 3
+
+
+class TestQuotaBatching:
+    """Test batched increments and tenant eviction."""
+
+    @pytest.mark.asyncio
+    async def test_increment_quotas_all_or_nothing(self):
+        """Test a batch applies only if every quota has room."""
+        manager = QuotaManager()
+        tenant = Tenant(name="Batch", config=TenantConfig(
+            requests_per_minute=10, requests_per_hour=12, monthly_token_quota=100
+        ))
+        quotas = [("requests", "minute"), ("requests", "hour"), ("tokens", "month", 40)]
+
+        assert await manager.increment_quotas(tenant, quotas)
+        assert await manager.increment_quotas(tenant, quotas)
+        assert not await manager.increment_quotas(tenant, quotas)  # tokens: 120 > 100
+
+        assert (await manager.get_usage(tenant, "requests", "minute")).used == 2
+        assert (await manager.get_usage(tenant, "tokens", "month")).used == 80
+
+    @pytest.mark.asyncio
+    async def test_idle_tenants_evicted(self):
+        """Test the least recently used tenants are dropped past max_tenants."""
+        backend = InMemoryQuotaBackend(max_tenants=4, shards=1)
+        manager = QuotaManager(backend=backend)
+        tenants = [Tenant(name=f"T{i}") for i in range(6)]
+
+        for tenant in tenants[:4]:
+            await manager.increment_quota(tenant)
+        await manager.increment_quota(tenants[0])  # Keep T0 hot
+        for tenant in tenants[4:]:
+            await manager.increment_quota(tenant)
+
+        assert len(backend) == 4
+        assert (await manager.get_usage(tenants[0])).used == 2
+        assert (await manager.get_usage(tenants[1])).used == 0
+
+
+class FakeRedis:
+    """Dict-backed stand-in for the redis.asyncio commands the backend uses."""
+
+    def __init__(self):
+        self.data = {}
+
+    async def mget(self, *keys):
+        return [self.data.get(key) for key in keys]
+
+    def pipeline(self):
+        return FakePipeline(self)
+
+    async def scan_iter(self, match):
+        for key in list(self.data):
+            if fnmatch.fnmatchcase(key, match):
+                yield key
+
+    async def delete(self, *keys):
+        for key in keys:
+            self.data.pop(key, None)
+
+
+class FakePipeline:
+
+    def __init__(self, redis):
+        self._data = redis.data
+        self._commands = []
+
+    def incrby(self, key, amount):
+        self._commands.append(lambda: self._incr(key, amount))
+
+    def decrby(self, key, amount):
+        self.incrby(key, -amount)
+
+    def expire(self, key, seconds):
+        self._commands.append(lambda: True)
+
+    def get(self, key):
+        self._commands.append(lambda: self._data.get(key))
+
+    def _incr(self, key, amount):
+        value = int(self._data.get(key, 0)) + amount
+        self._data[key] = str(value)
+        return value
+
+    async def execute(self):
+        return [command() for command in self._commands]
+
+
+class TestRedisQuotaBackend:
+    """Test counters shared through a Redis-protocol client."""
+
+    @pytest.mark.asyncio
+    async def test_counters_shared_between_managers(self):
+        """Test two managers (processes) draw from the same counters."""
+        redis = FakeRedis()
+        workers = [QuotaManager(backend=RedisQuotaBackend(redis)) for _ in range(2)]
+        tenant = Tenant(name="Shared", config=TenantConfig(requests_per_minute=3))
+
+        results = [await workers[i % 2].increment_quota(tenant) for i in range(4)]
+
+        assert results == [True, True, True, False]
+        assert (await workers[1].get_usage(tenant)).used == 3
+        assert not await workers[0].check_quota(tenant)
+
+    @pytest.mark.asyncio
+    async def test_rejected_batch_rolls_back(self):
+        """Test a batch over any limit leaves every counter unchanged."""
+        manager = QuotaManager(backend=RedisQuotaBackend(FakeRedis()))
+        config = TenantConfig(requests_per_minute=5, requests_per_hour=1)
+        tenant = Tenant(name="Roll", config=config)
+        quotas = [("requests", "minute"), ("requests", "hour")]
+
+        assert await manager.increment_quotas(tenant, quotas)
+        assert not await manager.increment_quotas(tenant, quotas)
+
+        assert (await manager.get_usage(tenant, "requests", "minute")).used == 1
+
+    @pytest.mark.asyncio
+    async def test_reset_and_sliding_previous_window(self):
+        """Test reset drops a tenant's keys and the previous window is weighted."""
+        redis = FakeRedis()
+        backend = RedisQuotaBackend(redis)
+        manager = QuotaManager(backend=backend)
+        tenant = Tenant(name="Slide", config=TenantConfig(requests_per_minute=100))
+        other = Tenant(name="Other")
+
+        window = int(time.time() // 60)
+        redis.data[f"jdev:quota:{{{tenant.id}}}:requests:minute:{window - 1}"] = "100"
+        await manager.increment_quota(other)
+
+        usage = await manager.get_usage(tenant)
+        assert 0 < usage.used <= 100
+
+        await manager.reset_quotas(tenant.id)
+        assert (await manager.get_usage(tenant)).used == 0
+        assert (await manager.get_usage(other)).used == 1
+
+    def test_unsupported_algorithm(self):
+        """Test algorithms that need server-side scripting are rejected."""
+        with pytest.raises(ValueError):
+            RedisQuotaBackend(FakeRedis(), algorithm=QuotaAlgorithm.TOKEN_BUCKET)
@@ -0,0 +1,280 @@
+"""
+Tests for SemanticIndexer parsing and indexing.
+"""
+
+import pytest
+from pathlib import Path
+
+from jdev_cli.intelligence.indexer import SemanticIndexer
+
+
+SAMPLE_MODULE = '''
+import os
+from pathlib import Path
+
+
+def top_level(a, b):
+    """Top-level function."""
+    def inner():
+        pass
+    return inner
+
+
+class Outer:
+    """Outer class."""
+
+    def method(self, x):
+        def helper():
+            pass
+        return helper
+
+    class Inner:
+        def inner_method(self):
+            pass
+
+
+async def not_indexed():
+    pass
+'''
+
+
+@pytest.fixture
+def project(tmp_path):
+    """Create a small project with a few modules."""
+    (tmp_path / "sample.py").write_text(SAMPLE_MODULE)
+    pkg = tmp_path / "pkg"
+    pkg.mkdir()
+    (pkg / "__init__.py").write_text("")
+    for i in range(5):
+        (pkg / f"mod_{i}.py").write_text(
+            f"import sample\n\nclass Widget{i}:\n    def run(self):\n        pass\n"
+        )
+    return tmp_path
+
+
+@pytest.fixture
+def indexer(project, tmp_path_factory):
+    cache_dir = tmp_path_factory.mktemp("cache")
+    return SemanticIndexer(root_path=str(project), cache_dir=str(cache_dir))
+
+
+class TestParseFile:
+    """Single-pass visitor extraction."""
+
+    def test_extracts_symbols_and_imports(self, indexer, project):
+        file_idx = indexer.parse_file(project / "sample.py")
+
+        assert file_idx is not None
+        assert file_idx.path == "sample.py"
+        assert file_idx.imports == ["os", "pathlib"]
+
+        by_name = {s.name: s for s in file_idx.symbols}
+        assert by_name["top_level"].type == "function"
+        assert by_name["top_level"].signature == "top_level(a, b)"
+        assert by_name["top_level"].docstring == "Top-level function."
+        assert by_name["inner"].type == "function"
+        assert "not_indexed" not in by_name
+
+    def test_methods_get_enclosing_class(self, indexer, project):
+        file_idx = indexer.parse_file(project / "sample.py")
+        by_name = {s.name: s for s in file_idx.symbols}
+
+        assert by_name["method"].type == "method"
+        assert by_name["method"].parent == "Outer"
+        # Functions nested in a method still belong to the class
+        assert by_name["helper"].parent == "Outer"
+        # Nested classes attribute methods to the nearest class
+        assert by_name["inner_method"].parent == "Inner"
+
+    def test_unparseable_file_returns_none(self, indexer, project):
+        bad = project / "broken.py"
+        bad.write_text("def oops(:\n")
+
+        assert indexer.parse_file(bad) is None
+
+
+class TestIndexCodebase:
+    """Serial and process-pool indexing."""
+
+    def test_parallel_matches_serial(self, project, tmp_path_factory, monkeypatch):
+        serial = SemanticIndexer(str(project), cache_dir=str(tmp_path_factory.mktemp("a")))
+        parallel = SemanticIndexer(str(project), cache_dir=str(tmp_path_factory.mktemp("b")))
+        monkeypatch.setattr(SemanticIndexer, "PARALLEL_MIN_FILES", 1)
+
+        assert serial.index_codebase() == parallel.index_codebase(workers=2) == 7
+
+        def snapshot(idx):
+            return {
+                name: sorted((s.file_path, s.line_number, s.type) for s in syms)
+                for name, syms in idx.symbol_index.items()
+            }
+
+        assert snapshot(serial) == snapshot(parallel)
+        assert dict(serial.import_graph) == dict(parallel.import_graph)
+
+    def test_reindex_skips_unchanged_files(self, indexer):
+        assert indexer.index_codebase() == 7
+        assert indexer.index_codebase() == 0
+
+    def test_reindex_replaces_changed_symbols(self, indexer, project):
+        indexer.index_codebase()
+        assert len(indexer.find_symbol("run")) == 5
+
+        (project / "pkg" / "mod_0.py").write_text("def renamed():\n    pass\n")
+        assert indexer.index_codebase() == 1
+
+        assert len(indexer.find_symbol("run")) == 4
+        assert indexer.find_symbol("Widget0") == []
+        assert indexer.find_symbol("renamed")[0].file_path == str(Path("pkg") / "mod_0.py")
+        assert indexer.import_graph.get(str(Path("pkg") / "mod_0.py")) is None
+
+
+class TestIndexCache:
+    """Stat-gated change detection and the SQLite cache."""
+
+    def test_unchanged_stat_skips_hashing(self, indexer, monkeypatch):
+        indexer.index_codebase()
+
+        def fail(path):
+            raise AssertionError(f"hashed {path}")
+
+        monkeypatch.setattr(indexer, "compute_file_hash", fail)
+        assert indexer.index_codebase() == 0
+
+    def test_touched_file_with_same_content_is_not_reparsed(self, indexer, project):
+        indexer.index_codebase()
+        target = project / "sample.py"
+        target.write_text(target.read_text())
+
+        assert indexer.index_codebase() == 0
+
+    def test_removed_file_is_dropped(self, indexer, project):
+        indexer.index_codebase()
+        (project / "sample.py").unlink()
+
+        indexer.index_codebase()
+        assert "sample.py" not in indexer.file_index
+        assert indexer.find_symbol("Outer") == []
+
+    def test_cache_round_trip(self, indexer, project):
+        indexer.index_codebase()
+        expected = indexer.get_stats()
+        indexer.close()
+
+        warm = SemanticIndexer(str(project), cache_dir=str(indexer.cache_dir))
+        assert warm.load_cache()
+        assert warm.get_stats() == expected
+        assert warm.find_symbol("method")[0].parent == "Outer"
+        assert warm.index_codebase() == 0
+
+    def test_lazy_load_hydrates_on_lookup(self, indexer, project):
+        indexer.index_codebase()
+        indexer.close()
+
+        warm = SemanticIndexer(str(project), cache_dir=str(indexer.cache_dir))
+        assert warm.load_cache(lazy=True)
+        assert len(warm.file_index) == 7
+        assert dict(warm.symbol_index) == {}
+
+        assert [s.name for s in warm.find_symbol("Outer")] == ["Outer"]
+        assert "Outer" in {s.name for s in warm.get_file_symbols("sample.py")}
+        assert len(warm.find_symbol("run")) == 5
+        assert warm.get_stats()["files_indexed"] == 7
+
+    def test_incremental_write_persists_change(self, indexer, project):
+        indexer.index_codebase()
+        (project / "pkg" / "mod_1.py").write_text("class Fresh:\n    pass\n")
+        indexer.index_codebase()
+        indexer.close()
+
+        warm = SemanticIndexer(str(project), cache_dir=str(indexer.cache_dir))
+        warm.load_cache(lazy=True)
+        assert warm.find_symbol("Widget1") == []
+        assert len(warm.find_symbol("Fresh")) == 1
+
+    def test_migrates_legacy_json_cache(self, project, tmp_path_factory):
+        import json
+
+        cache_dir = tmp_path_factory.mktemp("legacy")
+        (cache_dir / "index.json").write_text(json.dumps({"file_index": {
+            "sample.py": {
+                "path": "sample.py", "hash": "x", "imports": ["os"], "last_modified": 0.0,
+                "symbols": [{"name": "Outer", "type": "class", "file_path": "sample.py",
+                             "line_number": 1, "docstring": None, "signature": None,
+                             "parent": None}],
+            }
+        }}))
+
+        indexer = SemanticIndexer(str(project), cache_dir=str(cache_dir))
+        assert indexer.load_cache()
+        assert len(indexer.find_symbol("Outer")) == 1
+        assert not (cache_dir / "index.json").exists()
+
+
+class TestSearchSymbols:
+    """search_symbols backed by the symbol search index."""
+
+    def test_ranking_and_limit(self, indexer):
+        indexer.index_codebase()
+
+        results = indexer.search_symbols("inner", limit=10)
+        assert [s.name for s in results] == ["Inner", "inner", "inner_method"]
+        assert len(indexer.search_symbols("widget", limit=3)) == 3
+
+    def test_camel_case_initials(self, indexer, project):
+        (project / "extra.py").write_text("class SemanticIndexer:\n    pass\n")
+        indexer.index_codebase()
+
+        assert [s.name for s in indexer.search_symbols("si")] == ["SemanticIndexer"]
+
+    def test_search_tracks_reindexing(self, indexer, project):
+        indexer.index_codebase()
+        (project / "sample.py").write_text("def brand_new():\n    pass\n")
+        indexer.index_codebase()
+
+        assert indexer.search_symbols("Outer") == []
+        assert [s.name for s in indexer.search_symbols("brand")] == ["brand_new"]
+
+    def test_lazy_cache_search(self, indexer, project):
+        indexer.index_codebase()
+        indexer.close()
+
+        warm = SemanticIndexer(str(project), cache_dir=str(indexer.cache_dir))
+        warm.load_cache(lazy=True)
+
+        results = warm.search_symbols("widget")
+        assert len(results) == 5
+        assert len(warm._unhydrated) == 2  # only pkg/__init__ and sample untouched
+
+    def test_lazy_load_defers_name_index(self, indexer, project):
+        indexer.index_codebase()
+        indexer.close()
+
+        warm = SemanticIndexer(str(project), cache_dir=str(indexer.cache_dir))
+        warm.load_cache(lazy=True)
+        assert len(warm.search_index) == 0
+
+        assert [s.name for s in warm.search_symbols("Outer")] == ["Outer"]
+        assert "Widget1" in warm.search_index
+
+    def test_removed_unhydrated_file_leaves_search(self, indexer, project):
+        (project / "twin.py").write_text("def shared_name():\n    pass\n")
+        (project / "other.py").write_text("def shared_name():\n    pass\n")
+        indexer.index_codebase()
+        indexer.close()
+
+        warm = SemanticIndexer(str(project), cache_dir=str(indexer.cache_dir))
+        warm.load_cache(lazy=True)
+        warm.search_symbols("zzz")  # builds the name index, hydrates nothing
+        warm.get_file_symbols("twin.py")
+
+        (project / "sample.py").unlink()
+        (project / "twin.py").unlink()
+        warm.index_codebase()
+
+        assert "Outer" not in warm.search_index
+        assert [s.file_path for s in warm.search_symbols("shared_name")] == ["other.py"]
+
+        (project / "other.py").unlink()
+        warm.index_codebase()
+        assert "shared_name" not in warm.search_index
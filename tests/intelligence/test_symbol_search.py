@@ -0,0 +1,88 @@
+"""
+Tests for SymbolSearchIndex (search_symbols lookup structure).
+"""
+
+import pytest
+
+from jdev_cli.intelligence.symbol_search import SymbolSearchIndex, name_initials
+
+
+NAMES = [
+    "SemanticIndexer", "search_symbols", "SymbolSearchIndex", "index_codebase",
+    "find_symbol", "Symbol", "symbol", "parse_file", "FileIndex", "HTTPServer",
+]
+
+
+@pytest.fixture
+def index():
+    idx = SymbolSearchIndex()
+    idx.build(NAMES)
+    return idx
+
+
+def test_name_initials():
+    assert name_initials("SemanticIndexer") == "si"
+    assert name_initials("search_symbols") == "ss"
+    assert name_initials("HTTPServer") == "hs"
+    assert name_initials("parse_v2_file") == "pvf"
+
+
+def test_tiers_are_ranked(index):
+    results = list(index.search("symbol"))
+
+    # exact (both spellings), then prefix, then substring
+    assert results[:2] == ["Symbol", "symbol"]
+    assert results[2] == "SymbolSearchIndex"
+    assert set(results[3:]) == {"find_symbol", "search_symbols"}
+    assert results[3:] == sorted(results[3:], key=str.lower)
+
+
+def test_substring_matches_case_insensitively(index):
+    assert set(index.search("INDEX")) == {
+        "index_codebase", "SemanticIndexer", "SymbolSearchIndex", "FileIndex"
+    }
+
+
+def test_short_queries(index):
+    assert list(index.search("pa")) == ["parse_file"]
+    assert "HTTPServer" in list(index.search("tp"))
+
+
+def test_initials_match_camel_and_snake_case(index):
+    assert list(index.search("si")) == ["SemanticIndexer"]
+    assert "search_symbols" in list(index.search("ss"))
+    assert list(index.search("hs")) == ["HTTPServer"]
+
+
+def test_incremental_add_and_remove(index):
+    index.add("symbolic_link")
+    assert "symbolic_link" in list(index.search("symbol"))
+
+    index.remove("symbolic_link")
+    index.remove("SemanticIndexer")
+    assert "symbolic_link" not in list(index.search("symbol"))
+    assert list(index.search("si")) == []
+    assert "SemanticIndexer" not in index
+
+
+def test_remove_keeps_other_spellings(index):
+    index.remove("symbol")
+    assert "Symbol" in list(index.search("symbol"))
+
+
+def test_readd_after_remove_is_not_duplicated(index):
+    list(index.search("x"))  # merge pending names
+    index.remove("parse_file")
+    index.add("parse_file")
+
+    assert list(index.search("parse")) == ["parse_file"]
+
+
+def test_compaction_preserves_results():
+    idx = SymbolSearchIndex()
+    idx.build(f"handler_{i}" for i in range(100))
+    for i in range(80):
+        idx.remove(f"handler_{i}")
+
+    assert len(idx) == 20
+    assert sorted(idx.search("ndler_9")) == [f"handler_{i}" for i in range(90, 100)]
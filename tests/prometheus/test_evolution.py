@@ -0,0 +1,173 @@
+"""
+Tests for the PROMETHEUS co-evolution loop batch mode.
+"""
+
+import asyncio
+import json
+import random
+import re
+from types import SimpleNamespace
+
+from prometheus.core.evolution import CoEvolutionLoop
+
+
+class StubLLM:
+    """
+    Answers curriculum, solution and evaluation prompts.
+
+    Tasks are numbered in generation order; every third one fails.
+    Latency varies per prompt so concurrent attempts finish out of order.
+    """
+
+    def __init__(self, delay: float = 0.005):
+        self.delay = delay
+        self.generated = 0
+        self.active = 0
+        self.max_active = 0
+
+    async def generate(self, prompt: str) -> str:
+        if prompt.startswith("Generate"):
+            self.generated += 1
+            number = self.generated
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(self.delay * (1 + len(prompt) % 4))
+        finally:
+            self.active -= 1
+
+        if prompt.startswith("Generate"):
+            return json.dumps({"description": f"task {number}", "expected_skills": ["planning"]})
+        number = int(re.search(r"TASK: task (\d+)", prompt).group(1))
+        if prompt.startswith("Evaluate"):
+            score = 0.2 if number % 3 == 0 else 0.9
+            return json.dumps({"overall_score": score, "errors": [] if score > 0.5 else ["wrong"]})
+        return f"Solution for task {number}: first plan, then solve."
+
+
+class StubMemory:
+
+    def __init__(self):
+        self.experiences = []
+        self.procedures = []
+
+    def get_context_for_task(self, description):
+        return {}
+
+    def remember_experience(self, experience, outcome, context, importance):
+        self.experiences.append(experience)
+
+    def learn_procedure(self, skill_name, steps):
+        self.procedures.append((skill_name, steps))
+
+
+class StubReflection:
+
+    async def critique_action(self, action, result, context):
+        await asyncio.sleep(0.001)
+        return SimpleNamespace(
+            critique="missed a case", improvements=["check"], lessons_learned=[action]
+        )
+
+
+def make_loop(llm=None) -> CoEvolutionLoop:
+    return CoEvolutionLoop(
+        llm or StubLLM(),
+        SimpleNamespace(list_tools=lambda: []),
+        StubMemory(),
+        StubReflection(),
+        sandbox_executor=None,
+    )
+
+
+async def run(loop: CoEvolutionLoop, **kwargs) -> list:
+    random.seed(7)
+    return [progress async for progress in loop.evolve_with_progress(**kwargs)]
+
+
+class TestBatchEvolution:
+
+    async def test_results_do_not_depend_on_completion_order(self):
+        concurrent, sequential = make_loop(), make_loop()
+
+        options = dict(num_iterations=8, batch_size=4)
+        concurrent_progress = await run(concurrent, max_concurrency=4, **options)
+        sequential_progress = await run(sequential, max_concurrency=1, **options)
+
+        assert concurrent_progress == sequential_progress
+        assert [it.task.description for it in concurrent.evolution_history] == [
+            f"task {i}" for i in range(1, 9)
+        ]
+        assert concurrent.executor.memory.experiences == sequential.executor.memory.experiences
+        assert concurrent.executor.memory.procedures == sequential.executor.memory.procedures
+        assert (
+            concurrent.curriculum.difficulty_distribution
+            == sequential.curriculum.difficulty_distribution
+        )
+        assert concurrent.stats.to_dict() == sequential.stats.to_dict()
+
+    async def test_progress_streams_every_iteration(self):
+        loop = make_loop()
+
+        progress = await run(loop, num_iterations=7, batch_size=3)
+
+        assert [p["iteration"] for p in progress] == list(range(1, 8))
+        assert {p["total"] for p in progress} == {7}
+        assert loop.stats.total_tasks == 7
+        assert loop.stats.tasks_solved == 5
+        assert loop.curriculum.stats.total_tasks == 7
+        assert not loop.is_evolving
+
+    async def test_attempts_are_bounded(self):
+        llm = StubLLM()
+        loop = make_loop(llm)
+        tasks = await loop.curriculum.generate_task_batch({}, batch_size=6)
+        llm.max_active = 0
+
+        results = [r async for r in loop.executor.attempt_tasks(tasks, max_concurrency=2)]
+
+        assert llm.max_active == 2
+        assert [r.task for r in results] == tasks
+        assert loop.executor.get_stats()["total_attempts"] == 6
+
+    async def test_tasks_see_context_from_before_the_batch(self):
+        loop = make_loop()
+        executor = loop.executor
+        tasks = await loop.curriculum.generate_task_batch({}, batch_size=3)
+        executor.memory.get_context_for_task = lambda description: {
+            "recorded": len(executor.memory.experiences)
+        }
+        seen = {}
+        generate = executor._generate_solution
+
+        async def spy(task, context, hints_section=""):
+            seen[task.description] = context["recorded"]
+            return await generate(task, context, hints_section)
+
+        executor._generate_solution = spy
+
+        results = [r async for r in executor.attempt_tasks(tasks, max_concurrency=1)]
+
+        assert seen == {task.description: 0 for task in tasks}
+        assert len(executor.memory.experiences) == len(results) == 3
+
+    async def test_stopping_early_cancels_pending_attempts(self):
+        llm = StubLLM()
+        loop = make_loop(llm)
+
+        progress = loop.evolve_with_progress(num_iterations=6, batch_size=6)
+        await progress.__anext__()
+        await progress.aclose()
+        await asyncio.sleep(0.05)
+
+        assert llm.active == 0
+        assert loop.stats.total_tasks == 1
+        assert not loop.is_evolving
+
+    async def test_sequential_mode_unchanged(self):
+        loop = make_loop()
+
+        progress = await run(loop, num_iterations=2)
+
+        assert [p["iteration"] for p in progress] == [1, 2]
+        assert loop.curriculum.stats.total_tasks == 2
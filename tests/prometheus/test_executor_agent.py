@@ -0,0 +1,123 @@
+"""
+Tests for the ExecutorAgent batched test-case runner.
+"""
+
+import pytest
+
+from prometheus.agents.curriculum_agent import EvolutionTask, TaskDifficulty, TaskDomain
+from prometheus.agents.executor_agent import ExecutorAgent
+from prometheus.sandbox import SandboxExecutor
+from prometheus.sandbox.executor import SandboxConfig
+
+
+SOLUTION = '''
+def double(x):
+    print("called", x)
+    if x == 3:
+        raise ValueError("three")
+    if x == 4:
+        while True:
+            pass
+    return x * 2
+'''
+
+CASES = [
+    {"input": 1, "expected_output": 2},
+    {"input": 2, "expected_output": 5},
+    {"input": 3, "expected_output": 6},
+    {"input": 4, "expected_output": 8},
+    {"input": 5, "expected": 10},
+]
+
+
+@pytest.fixture
+def sandbox():
+    executor = SandboxExecutor(SandboxConfig(pool_size=1))
+    yield executor
+    executor.close()
+
+
+def make_agent(sandbox, **kwargs) -> ExecutorAgent:
+    return ExecutorAgent(None, None, None, None, sandbox, test_case_timeout=0.3, **kwargs)
+
+
+def make_task(test_cases) -> EvolutionTask:
+    return EvolutionTask(
+        id="t1",
+        description="double a number",
+        difficulty=TaskDifficulty.EASY,
+        domain=TaskDomain.CODE,
+        expected_skills=[],
+        success_criteria=[],
+        test_cases=test_cases,
+    )
+
+
+class TestBatchedTestCases:
+
+    async def test_structured_results_from_one_process(self, sandbox):
+        agent = make_agent(sandbox)
+
+        results = await agent.run_test_cases(SOLUTION, CASES)
+
+        assert [r.passed for r in results] == [True, False, False, False, True]
+        assert results[1].result == "4"
+        assert results[2].error == "ValueError: three"
+        assert results[3].error == "Timed out after 0.3s"
+        assert [r.stdout for r in results] == [f"called {i}\n" for i in range(1, 6)]
+        assert len(sandbox.execution_history) == 1
+
+    async def test_score_and_errors(self, sandbox):
+        agent = make_agent(sandbox)
+
+        score, errors = await agent._run_test_cases(make_task(CASES), f"```python\n{SOLUTION}```")
+
+        assert score == pytest.approx(0.4)
+        assert errors == [
+            "Test 2 failed: got 4, expected 5",
+            "Test 3 failed: ValueError: three",
+            "Test 4 failed: Timed out after 0.3s",
+        ]
+
+    async def test_main_is_preferred(self, sandbox):
+        code = "def helper(x):\n    return -1\n\ndef main(x):\n    return x + 1\n"
+
+        results = await make_agent(sandbox).run_test_cases(code, [{"input": 1, "expected": 2}])
+
+        assert results[0].passed
+
+    async def test_load_errors_fail_every_case(self, sandbox):
+        agent = make_agent(sandbox)
+
+        results = await agent.run_test_cases("raise RuntimeError('boom')", CASES[:2])
+
+        assert [r.passed for r in results] == [False, False]
+        assert results[0].error == "RuntimeError: boom"
+
+    @pytest.mark.parametrize("pool_size", [0, 1])
+    async def test_crash_fails_remaining_cases(self, pool_size):
+        sandbox = SandboxExecutor(SandboxConfig(pool_size=pool_size))
+        code = "import os\n\ndef f(x):\n    if x == 2:\n        os._exit(3)\n    return x * 2\n"
+
+        results = await make_agent(sandbox).run_test_cases(code, CASES[:3])
+        sandbox.close()
+
+        assert [r.passed for r in results[1:]] == [False, False]
+        if pool_size == 0:
+            assert results[0].passed  # printed before the process died
+
+    async def test_blocked_imports_are_still_rejected(self, sandbox):
+        code = "import subprocess\n\ndef f(x):\n    return x * 2\n"
+
+        results = await make_agent(sandbox).run_test_cases(code, CASES[:1])
+
+        assert results[0].error == "Blocked import: subprocess"
+
+    async def test_isolated_mode_matches(self, sandbox):
+        code = "def double(x):\n    return x * 2\n"
+        task = make_task(CASES)
+
+        batched = await make_agent(sandbox)._run_test_cases(task, code)
+        isolated = await make_agent(sandbox, batch_test_cases=False)._run_test_cases(task, code)
+
+        assert batched[0] == isolated[0] == pytest.approx(0.8)
@@ -0,0 +1,258 @@
+"""
+Tests for persistent MemorySystem storage.
+"""
+
+import os
+import signal
+import sqlite3
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+from prometheus.memory import MemorySystem, SQLiteMemoryStorage
+
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return tmp_path / "memory.db"
+
+
+@pytest.fixture
+def storage(db_path):
+    store = SQLiteMemoryStorage(db_path)
+    yield store
+    store.close()
+
+
+class TestSQLiteMemoryStorage:
+
+    def test_put_get_replace(self, storage):
+        storage.put("semantic", "python", {"content": "v1"}, text="python v1")
+        storage.put("semantic", "python", {"content": "v2"}, text="python v2")
+
+        assert storage.get("semantic", "python") == {"content": "v2"}
+        assert storage.get("semantic", "missing") is None
+        assert storage.count("semantic") == 1
+
+    def test_search_ranks_by_jaccard(self, storage):
+        storage.put("episodic", "a", {}, text="parser crash on empty input")
+        storage.put("episodic", "b", {}, text="parser crash")
+        storage.put("episodic", "c", {}, text="tokenizer refactor")
+
+        hits = storage.search("episodic", ["parser", "crash"])
+        assert [key for key, _ in hits] == ["b", "a"]
+        assert hits[0][1] == pytest.approx(1.0)
+        assert storage.search("episodic", ["parser"], exclude=["a", "b"]) == []
+
+    def test_search_is_scoped_by_kind(self, storage):
+        storage.put("episodic", "a", {}, text="parser crash")
+        storage.put("semantic", "a", {}, text="parser facts")
+
+        assert [key for key, _ in storage.search("semantic", ["crash"])] == []
+
+    def test_replaced_text_is_reindexed(self, storage):
+        storage.put("semantic", "t", {}, text="old words")
+        storage.put("semantic", "t", {}, text="new words")
+
+        assert storage.search("semantic", ["old"]) == []
+        assert [key for key, _ in storage.search("semantic", ["new"])] == ["t"]
+
+    def test_delete_removes_terms(self, storage):
+        storage.put("vault", "v", {}, text="skill")
+        storage.delete("vault", "v")
+
+        assert storage.get("vault", "v") is None
+        assert storage.search("vault", ["skill"]) == []
+
+    def test_top_orders_and_filters(self, storage):
+        storage.put("episodic", "a", {"id": "a"}, tag="success", score=0.2)
+        storage.put("episodic", "b", {"id": "b"}, tag="failure", score=0.9)
+        storage.put("episodic", "c", {"id": "c"}, tag="success", score=0.7)
+
+        assert [r["id"] for r in storage.top("episodic", 5, tag="success")] == ["c", "a"]
+        assert [r["id"] for r in storage.top("episodic", 2, order="created")] == ["c", "b"]
+        with pytest.raises(ValueError):
+            storage.top("episodic", 5, order="random")
+
+    def test_batch_rolls_back_on_error(self, storage):
+        with pytest.raises(RuntimeError):
+            with storage.batch():
+                storage.put("semantic", "a", {}, text="alpha")
+                with storage.batch():
+                    storage.put("semantic", "b", {}, text="beta")
+                raise RuntimeError("boom")
+
+        assert storage.count("semantic") == 0
+        assert storage.search("semantic", ["alpha", "beta"]) == []
+
+    def test_records_iterates_in_write_order(self, storage):
+        for i in range(1200):
+            storage.put("episodic", str(i), {"i": i})
+
+        assert [r["i"] for r in storage.records("episodic")] == list(range(1200))
+
+
+class TestPersistentMemorySystem:
+
+    def test_state_survives_reopen(self, db_path):
+        memory = MemorySystem(agent_name="Atlas", storage=db_path)
+        memory.remember_experience("Fixed parser crash", "success: tests passed")
+        memory.learn_fact("python", "Python uses indentation for blocks")
+        memory.learn_procedure("deploy", ["build image", "push image"])
+        memory.update_core("mission", "ship it")
+        memory.close()
+
+        reopened = MemorySystem(storage=db_path)
+        assert reopened.core["name"] == "Atlas"
+        assert reopened.core["mission"] == "ship it"
+        assert reopened.get_stats()["total_experiences"] == 1
+        assert reopened.recall_experiences("parser crash")[0]["content"].startswith(
+            "Experience: Fixed parser crash"
+        )
+        assert reopened.query_knowledge("python") == "Python uses indentation for blocks"
+        assert reopened.get_procedure("deploy") == ["build image", "push image"]
+        reopened.close()
+
+    def test_startup_loads_nothing(self, db_path):
+        memory = MemorySystem(storage=db_path)
+        for i in range(50):
+            memory.remember_experience(f"task {i}", "completed")
+            memory.learn_fact(f"topic {i}", f"fact {i}")
+        memory.close()
+
+        reopened = MemorySystem(storage=db_path)
+        assert len(reopened.episodic) == 0
+        assert reopened.semantic.facts == {}
+        assert reopened.get_stats()["stored_entries"]["episodic"] == 50
+        reopened.close()
+
+    def test_evicted_episodes_are_recalled_from_storage(self, db_path):
+        memory = MemorySystem(max_episodic=5, storage=db_path)
+        memory.remember_experience("Migrated the billing database", "success")
+        for i in range(20):
+            memory.remember_experience(f"routine chore {i}", "completed")
+
+        assert len(memory.episodic) <= 5
+        recalled = memory.recall_experiences("billing database migration")
+        assert recalled[0]["metadata"]["experience_raw"] == "Migrated the billing database"
+        memory.close()
+
+    def test_outcome_recall_covers_storage(self, db_path):
+        memory = MemorySystem(max_episodic=2, storage=db_path)
+        memory.remember_experience("first fix", "success", importance=0.9)
+        for i in range(5):
+            memory.remember_experience(f"attempt {i}", "failed with error", importance=0.1)
+
+        assert memory.recall_successes()[0]["metadata"]["experience_raw"] == "first fix"
+        failures = memory.recall_failures(top_k=2)
+        assert [f["metadata"]["experience_raw"] for f in failures] == ["attempt 4", "attempt 3"]
+        memory.close()
+
+    def test_cold_search_loads_matches(self, db_path):
+        memory = MemorySystem(storage=db_path)
+        memory.learn_fact("asyncio", "asyncio runs coroutines on an event loop")
+        memory.learn_procedure("release", ["tag version", "publish wheel"])
+        memory.close()
+
+        reopened = MemorySystem(storage=db_path)
+        assert reopened.search_knowledge("event loop") == [
+            {"topic": "asyncio", "content": "asyncio runs coroutines on an event loop"}
+        ]
+        assert "asyncio" in reopened.semantic.facts
+        assert reopened.find_procedures("publish wheel")[0]["skill"] == "release"
+        reopened.close()
+
+    def test_procedure_outcome_on_cold_skill_is_persisted(self, db_path):
+        memory = MemorySystem(storage=db_path)
+        memory.learn_procedure("release", ["tag", "publish"])
+        memory.close()
+
+        reopened = MemorySystem(storage=db_path)
+        reopened.record_procedure_outcome("release", success=True)
+        reopened.close()
+
+        final = MemorySystem(storage=db_path)
+        assert final.find_procedures("release")[0]["success_rate"] == pytest.approx(0.5)
+        final.close()
+
+    def test_vault_survives_reopen_without_duplicates(self, db_path):
+        memory = MemorySystem(storage=db_path)
+        memory.learn_fact("gravity", "objects fall", confidence=0.95)
+        assert memory.consolidate_to_vault() == 1
+        memory.close()
+
+        reopened = MemorySystem(storage=db_path)
+        reopened.query_knowledge("gravity")
+        assert reopened.consolidate_to_vault() == 0
+        assert reopened.query_vault("gravity")[0]["content"] == "FACT [gravity]: objects fall"
+        reopened.close()
+
+    def test_export_includes_cold_entries(self, db_path):
+        memory = MemorySystem(max_episodic=3, storage=db_path)
+        for i in range(10):
+            memory.remember_experience(f"task {i}", "completed")
+
+        assert len(memory.export_state()["episodic"]) == 10
+        memory.close()
+
+    def test_clear_all_clears_storage(self, db_path):
+        memory = MemorySystem(storage=db_path)
+        memory.remember_experience("task", "completed")
+        memory.clear_all()
+        memory.close()
+
+        reopened = MemorySystem(storage=db_path)
+        assert reopened.get_stats()["stored_entries"]["episodic"] == 0
+        assert reopened.get_stats()["total_experiences"] == 0
+        reopened.close()
+
+
+class TestCrashRecovery:
+
+    @pytest.mark.skipif(not hasattr(signal, "SIGKILL"), reason="needs SIGKILL")
+    def test_committed_writes_survive_sigkill(self, db_path):
+        # Writer reports each committed experience, then is killed mid-stream
+        script = textwrap.dedent(f"""
+            import sys
+            from prometheus.memory import MemorySystem
+
+            memory = MemorySystem(storage={str(db_path)!r})
+            i = 0
+            while True:
+                memory.remember_experience(f"crash test task {{i}}", "completed")
+                print(i, flush=True)
+                i += 1
+        """)
+        proc = subprocess.Popen(
+            [sys.executable, "-c", script],
+            cwd=REPO_ROOT,
+            stdout=subprocess.PIPE,
+            text=True,
+        )
+        try:
+            for line in proc.stdout:
+                committed = int(line)
+                if committed >= 200:
+                    break
+            os.kill(proc.pid, signal.SIGKILL)
+        finally:
+            proc.wait(timeout=10)
+            proc.stdout.close()
+
+        assert proc.returncode == -signal.SIGKILL
+
+        conn = sqlite3.connect(db_path)
+        assert conn.execute("PRAGMA integrity_check").fetchone()[0] == "ok"
+        conn.close()
+
+        memory = MemorySystem(storage=db_path)
+        stored = memory.get_stats()["stored_entries"]["episodic"]
+        assert stored >= committed + 1
+        assert memory.recall_experiences(f"crash test task {committed}", top_k=1)
+        memory.close()
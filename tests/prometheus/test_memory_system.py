@@ -0,0 +1,153 @@
+"""
+Tests for the PROMETHEUS memory system.
+"""
+
+import re
+
+import pytest
+
+from prometheus.memory import EpisodicMemory, MemorySystem
+
+
+def legacy_jaccard(memory, query):
+    """Scores as computed by the original full-scan recall."""
+    tokenize = lambda text: set(re.findall(r'\b\w+\b', text.lower()))  # noqa: E731
+    query_words = tokenize(query)
+    scores = {}
+    for entry in memory.entries:
+        entry_words = tokenize(entry.content)
+        overlap = len(query_words & entry_words)
+        if overlap:
+            scores[entry.id] = overlap / len(query_words | entry_words)
+    return scores
+
+
+@pytest.fixture
+def memory():
+    mem = EpisodicMemory(max_entries=100)
+    mem.store("Fixed parser crash on empty input", "success: tests passed", {})
+    mem.store("Refactored the tokenizer module", "completed", {})
+    mem.store("Parser timeout on large files", "failed with timeout", {})
+    mem.store("Wrote docs for the CLI", "neutral", {})
+    return mem
+
+
+class TestEpisodicRecall:
+
+    def test_index_matches_full_scan_scores(self, memory):
+        query = "parser crash timeout"
+        assert memory._jaccard_scores(set(memory._tokenize(query))) == pytest.approx(
+            legacy_jaccard(memory, query)
+        )
+
+    def test_recall_ranks_best_overlap_first(self, memory):
+        results = memory.recall_similar("parser crash on empty input", top_k=2)
+
+        assert len(results) == 2
+        assert "crash" in results[0].content
+        assert "Parser timeout" in results[1].content
+
+    def test_recall_ignores_unrelated_entries(self, memory):
+        assert memory.recall_similar("kubernetes helm") == []
+        assert memory.recall_similar("") == []
+
+    def test_min_relevance_filters(self, memory):
+        assert memory.recall_similar("parser", min_relevance=0.99) == []
+
+    def test_bm25_scoring(self, memory):
+        results = memory.recall_similar("tokenizer module", scoring="bm25")
+
+        assert "tokenizer" in results[0].content
+        assert memory._bm25_scores({"tokenizer"})[results[0].id] == pytest.approx(1.0)
+
+    def test_bm25_as_default_scoring(self):
+        mem = EpisodicMemory(scoring="bm25")
+        entry = mem.store("cache invalidation bug", "solved", {})
+        assert mem.recall_similar("cache") == [entry]
+
+    def test_unknown_scoring_rejected(self, memory):
+        with pytest.raises(ValueError):
+            EpisodicMemory(scoring="cosine")
+        with pytest.raises(ValueError):
+            memory.recall_similar("parser", scoring="cosine")
+
+    def test_pruned_entries_leave_the_index(self):
+        mem = EpisodicMemory(max_entries=3)
+        for i in range(6):
+            mem.store(f"task number{i}", "success", {}, importance=i / 10)
+
+        assert len(mem.entries) == 3
+        assert set(mem._doc_terms) == {e.id for e in mem.entries}
+        assert mem.recall_similar("number0") == []
+        assert len(mem.recall_similar("task", top_k=10)) == 3
+        assert mem._total_length == sum(mem._doc_lengths.values())
+
+    def test_imported_entries_are_searchable(self, memory):
+        restored = EpisodicMemory()
+        restored.import_entries(memory.export())
+
+        assert [e.id for e in restored.recall_similar("tokenizer")] == [
+            e.id for e in memory.recall_similar("tokenizer")
+        ]
+
+
+class TestEpisodicStorage:
+
+    def test_batch_prune_evicts_lowest_relevance(self):
+        mem = EpisodicMemory(max_entries=10, prune_batch=4)
+        for i in range(11):
+            mem.store(f"task {i}", "success", {}, importance=i / 10)
+
+        assert len(mem) == 7
+        assert {e.metadata["experience_raw"] for e in mem.entries} == {
+            f"task {i}" for i in range(4, 11)
+        }
+
+    def test_prune_ties_evict_newest_first(self):
+        mem = EpisodicMemory(max_entries=3, prune_batch=1)
+        ids = [mem.store(f"task {i}", "success", {}).id for i in range(4)]
+
+        assert [e.id for e in mem.entries] == ids[:3]
+
+    def test_recall_recent_is_newest_first(self, memory):
+        recent = memory.recall_recent(2)
+        assert [e.metadata["experience_raw"] for e in recent] == [
+            "Wrote docs for the CLI", "Parser timeout on large files"
+        ]
+        assert memory.recall_recent(0) == []
+
+    def test_get_by_id_survives_pruning(self):
+        mem = EpisodicMemory(max_entries=5, prune_batch=2)
+        kept = mem.store("important", "success", {}, importance=1.0)
+        for i in range(10):
+            mem.store(f"noise {i}", "neutral", {}, importance=0.0)
+
+        assert mem.get_by_id(kept.id) is kept
+        assert len(mem) <= 5
+
+    def test_import_keeps_created_order(self, memory):
+        older = EpisodicMemory()
+        older.import_entries(memory.export()[:2])
+        latest = older.store("brand new", "success", {})
+        older.import_entries(memory.export()[2:])
+
+        assert older.recall_recent(1) == [latest]
+        created = [e.created_at for e in older.entries]
+        assert created == sorted(created)
+
+
+class TestMemorySystem:
+
+    def test_stats_count_episodes(self):
+        system = MemorySystem(max_episodic=5)
+        for i in range(3):
+            system.remember_experience(f"step {i}", "success")
+
+        assert system.get_stats()["episodic_entries"] == 3
+
+    def test_recall_experiences(self):
+        system = MemorySystem()
+        system.remember_experience("Deployed the API", "success")
+
+        recalled = system.recall_experiences("deploy the API")
+        assert recalled and recalled[0]["content"].startswith("Experience: Deployed the API")
@@ -0,0 +1,158 @@
+"""
+Tests for the PROMETHEUS sandbox executor and its warm worker pool.
+"""
+
+import asyncio
+
+import pytest
+
+from prometheus.sandbox import SandboxExecutor, SandboxWorkerPool
+from prometheus.sandbox.executor import SandboxConfig
+
+
+SNIPPETS = [
+    "print('hi')\n1 + 2",
+    "x = [1, 2]\nx",
+    "raise ValueError('boom')",
+    "print('out')\nimport sys\nprint('err', file=sys.stderr)\nsys.exit('bye')",
+    "import sys\nsys.exit(0)",
+    "import os\nos.system('echo from-shell')\nprint('py')",
+    "import os, sys\nprint('first')\nos.write(2, b'raw\\n')\nraise SystemExit(3)",
+]
+
+
+@pytest.fixture
+def executor():
+    sandbox = SandboxExecutor(SandboxConfig(pool_size=2, max_runs_per_worker=3))
+    yield sandbox
+    sandbox.close()
+
+
+class TestPooledExecution:
+
+    @pytest.mark.parametrize("code", SNIPPETS)
+    async def test_matches_fresh_process(self, executor, code):
+        legacy = SandboxExecutor(SandboxConfig(pool_size=0))
+
+        pooled_result = await executor.execute(code)
+        legacy_result = await legacy.execute(code)
+
+        assert pooled_result.success == legacy_result.success
+        assert pooled_result.stdout == legacy_result.stdout
+        assert pooled_result.return_value == legacy_result.return_value
+        assert pooled_result.error_type == legacy_result.error_type
+        assert pooled_result.stderr.splitlines()[-1:] == legacy_result.stderr.splitlines()[-1:]
+
+    async def test_state_is_reset_between_runs(self, executor):
+        await executor.execute(
+            "import os, sys, statistics\n"
+            "leaked = 1\n"
+            "os.environ['SANDBOX_LEAK'] = '1'\n"
+            "sys.path.append('/nowhere')\n"
+            "os.chdir('/')"
+        )
+        result = await executor.execute(
+            "import os, sys\n"
+            "['leaked' in globals(), 'statistics' in sys.modules,"
+            " 'SANDBOX_LEAK' in os.environ, '/nowhere' in sys.path, os.getcwd() == '/']"
+        )
+
+        assert result.return_value == [False, False, False, False, False]
+
+    @pytest.mark.parametrize("patch", [
+        "import builtins\nbuiltins.len = lambda x: 42",
+        "import json\njson.dumps = lambda *a, **k: 'patched'",
+        "import threading, time\n"
+        "threading.Thread(target=time.sleep, args=(60,), daemon=True).start()",
+        "import signal\nsignal.signal(signal.SIGUSR1, signal.SIG_IGN)",
+        "import sys\nsys.setrecursionlimit(50)",
+    ])
+    async def test_global_state_does_not_leak(self, patch):
+        sandbox = SandboxExecutor(SandboxConfig(pool_size=1))
+        try:
+            await sandbox.execute(patch)
+            result = await sandbox.execute(
+                "import json, signal, sys, threading\n"
+                "print(len([1, 2]))\n"
+                "[json.dumps(1), threading.active_count(), sys.getrecursionlimit() > 50,"
+                " signal.getsignal(signal.SIGUSR1) == signal.SIG_DFL]"
+            )
+
+            assert result.stdout == "2"
+            assert result.return_value == ["1", 1, True, True]
+            assert sandbox.pool.get_stats()["recycled"] == 1
+        finally:
+            sandbox.close()
+
+    async def test_reused_worker_output_is_exact(self):
+        sandbox = SandboxExecutor(SandboxConfig(pool_size=1))
+        runs = [
+            ("import sys\nprint('first run, longer output')\nprint('e1', file=sys.stderr)",
+             "first run, longer output\n", "e1\n"),
+            ("import sys\nprint('second')\nprint('e2', file=sys.stderr)", "second\n", "e2\n"),
+            ("import sys\nprint('third')\nprint('e3', file=sys.stderr)", "third\n", "e3\n"),
+        ]
+        try:
+            for code, stdout, stderr in runs:
+                result = await sandbox.execute(code, capture_return=False)
+                assert (result.stdout, result.stderr) == (stdout, stderr)
+            assert sandbox.pool.get_stats()["spawned"] == 1
+        finally:
+            sandbox.close()
+
+    async def test_clean_runs_keep_the_worker(self, executor):
+        await executor.execute("import statistics, collections\nstatistics.mean([1, 2])")
+        await executor.execute("1")
+
+        assert executor.pool.get_stats()["recycled"] == 0
+
+    async def test_workers_are_reused_then_recycled(self, executor):
+        for _ in range(7):
+            assert (await executor.execute("1")).success
+
+        stats = executor.pool.get_stats()
+        assert stats["recycled"] == 2
+        assert stats["spawned"] == 2 + 2
+
+    async def test_timeout_replaces_worker(self, executor):
+        result = await executor.execute("while True: pass", timeout=0.5)
+
+        assert result.error_type == "TimeoutError"
+        assert executor.pool.get_stats()["timeouts"] == 1
+        assert (await executor.execute("2 * 21")).return_value == 42
+
+    async def test_hard_exit_is_reported(self, executor):
+        result = await executor.execute("import os\nos._exit(7)")
+
+        assert not result.success
+        assert "exited with code 7" in result.stderr
+        assert (await executor.execute("1")).success
+
+    async def test_concurrent_runs(self, executor):
+        results = await asyncio.gather(*(executor.execute(f"{i} * 2") for i in range(6)))
+
+        assert [r.return_value for r in results] == [i * 2 for i in range(6)]
+        assert executor.pool.get_stats()["idle"] <= 2
+
+    async def test_user_code_cannot_touch_protocol(self, executor):
+        result = await executor.execute("import os\nos.write(1, b'garbage\\n')\ninput()")
+
+        assert result.error_type == "RuntimeError"
+        assert "EOFError" in result.stderr
+        assert (await executor.execute("'still fine'")).return_value == "still fine"
+
+    async def test_memory_limit(self):
+        sandbox = SandboxExecutor(SandboxConfig(pool_size=1, max_memory_mb=256))
+        try:
+            result = await sandbox.execute("b = bytearray(1024 ** 3)")
+            assert "MemoryError" in result.stderr
+            assert (await sandbox.execute("1")).success
+        finally:
+            sandbox.close()
+
+    async def test_closed_pool_rejects_runs(self):
+        pool = SandboxWorkerPool(size=1)
+        pool.close()
+
+        with pytest.raises(RuntimeError):
+            await pool.run("1", timeout=1)
@@ -0,0 +1,310 @@
+"""
+Tests for the PROMETHEUS world model simulation cache.
+"""
+
+import asyncio
+import json
+import re
+
+import pytest
+
+from prometheus.core.world_model import ActionType, WorldModel, WorldState
+
+
+PREDICTION = {
+    "predicted_outcome": "file is read",
+    "success_probability": 0.9,
+    "side_effects": [],
+    "risks": ["slow disk"],
+    "state_changes": {"files_modified": ["out.txt"]},
+}
+
+
+class FakeLLM:
+    """Counts generate() calls; optionally blocks until released."""
+
+    def __init__(self, fail: bool = False):
+        self.calls = 0
+        self.fail = fail
+        self.release = asyncio.Event()
+        self.release.set()
+
+    async def generate(self, prompt: str) -> str:
+        self.calls += 1
+        await self.release.wait()
+        if self.fail:
+            raise RuntimeError("LLM unavailable")
+        return json.dumps(PREDICTION)
+
+
+@pytest.fixture
+def llm():
+    return FakeLLM()
+
+
+class TestSimulationCache:
+
+    async def test_repeat_simulation_hits_cache(self, llm):
+        model = WorldModel(llm)
+        state = WorldState()
+
+        params = {"path": "a.py"}
+        first, first_state = await model.simulate_action(ActionType.READ_FILE, params, state)
+        second, second_state = await model.simulate_action(ActionType.READ_FILE, params, state)
+
+        assert llm.calls == 1
+        assert second is first
+        # Cached hits replay the predicted state changes too
+        assert second_state.files == first_state.files == {"out.txt": "[MODIFIED]"}
+        stats = model.get_stats()["cache"]
+        assert (stats["hits"], stats["misses"]) == (1, 1)
+        assert stats["hit_rate"] == pytest.approx(0.5)
+
+    async def test_paths_are_canonicalized(self, llm):
+        model = WorldModel(llm)
+        state = WorldState()
+
+        await model.simulate_action(ActionType.READ_FILE, {"path": "src/a.py"}, state)
+        await model.simulate_action(ActionType.READ_FILE, {"path": " ./src/../src//a.py "}, state)
+        await model.simulate_action(ActionType.READ_FILE, {"content": "./src/a.py"}, state)
+
+        assert llm.calls == 2
+
+    async def test_non_path_values_are_kept_verbatim(self, llm):
+        model = WorldModel(llm)
+        state = WorldState()
+
+        for source in ["a//b", "a/b", "  return 1", "return 1"]:
+            await model.simulate_action(ActionType.EXECUTE_CODE, {"source": source}, state)
+
+        assert llm.calls == 4
+
+    async def test_lru_eviction(self, llm):
+        model = WorldModel(llm, cache_size=2)
+        state = WorldState()
+
+        for name in ("a", "b", "a", "c"):
+            await model.simulate_action(ActionType.READ_FILE, {"path": name}, state)
+        await model.simulate_action(ActionType.READ_FILE, {"path": "a"}, state)
+        assert llm.calls == 3
+
+        await model.simulate_action(ActionType.READ_FILE, {"path": "b"}, state)
+        assert llm.calls == 4
+        assert model.get_stats()["cache"]["evictions"] == 2
+
+    async def test_ttl_expiry(self, llm):
+        model = WorldModel(llm, cache_ttl=0.05)
+        state = WorldState()
+
+        await model.simulate_action(ActionType.SEARCH, {"query": "x"}, state)
+        await asyncio.sleep(0.1)
+        await model.simulate_action(ActionType.SEARCH, {"query": "x"}, state)
+
+        assert llm.calls == 2
+        assert model.get_stats()["cache"]["expirations"] == 1
+
+    async def test_concurrent_simulations_are_coalesced(self, llm):
+        model = WorldModel(llm)
+        llm.release.clear()
+
+        tasks = [
+            asyncio.create_task(
+                model.simulate_action(ActionType.EXECUTE_CODE, {"code": "print(1)"}, WorldState())
+            )
+            for _ in range(5)
+        ]
+        await asyncio.sleep(0)
+        llm.release.set()
+        results = await asyncio.gather(*tasks)
+
+        assert llm.calls == 1
+        assert len({id(simulated) for simulated, _ in results}) == 1
+        assert model.get_stats()["cache"]["coalesced"] == 4
+        assert model.get_stats()["cache"]["in_flight"] == 0
+
+    async def test_cancelled_leader_hands_over(self, llm):
+        model = WorldModel(llm)
+        llm.release.clear()
+
+        leader = asyncio.create_task(model.simulate_action(ActionType.THINK, {}, WorldState()))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(model.simulate_action(ActionType.THINK, {}, WorldState()))
+        await asyncio.sleep(0)
+
+        leader.cancel()
+        await asyncio.sleep(0)
+        llm.release.set()
+
+        simulated, _ = await follower
+        assert simulated.predicted_outcome == "file is read"
+        assert llm.calls == 2  # follower re-ran the simulation itself
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+
+    async def test_fallback_predictions_are_not_cached(self):
+        llm = FakeLLM(fail=True)
+        model = WorldModel(llm)
+
+        first, _ = await model.simulate_action(ActionType.API_CALL, {"url": "x"}, WorldState())
+        await model.simulate_action(ActionType.API_CALL, {"url": "x"}, WorldState())
+
+        assert first.success_probability == 0.5
+        assert llm.calls == 2
+        assert len(model.simulation_cache) == 0
+
+    async def test_persisted_simulations_survive_restart(self, llm, tmp_path):
+        db_path = tmp_path / "simulations.db"
+        model = WorldModel(llm, cache_storage=db_path)
+        await model.simulate_action(ActionType.READ_FILE, {"path": "a.py"}, WorldState())
+        model.simulation_cache.storage.close()
+
+        restarted = WorldModel(llm, cache_storage=db_path)
+        simulated, state = await restarted.simulate_action(
+            ActionType.READ_FILE, {"path": "./a.py"}, WorldState()
+        )
+
+        assert llm.calls == 1
+        assert simulated.action_type is ActionType.READ_FILE
+        assert simulated.risks == ["slow disk"]
+        assert state.files == {"out.txt": "[MODIFIED]"}
+        restarted.simulation_cache.storage.close()
+
+    async def test_clear_cache(self, llm, tmp_path):
+        model = WorldModel(llm, cache_storage=tmp_path / "simulations.db")
+        await model.simulate_action(ActionType.READ_FILE, {"path": "a.py"}, WorldState())
+        model.clear_cache()
+        await model.simulate_action(ActionType.READ_FILE, {"path": "a.py"}, WorldState())
+
+        assert llm.calls == 2
+        model.simulation_cache.storage.close()
+
+
+class ScriptedLLM:
+    """
+    Answers planning, single and batch prompts.
+
+    Each plan step carries its success probability in params["p"].
+    """
+
+    def __init__(self, plans, delay: float = 0.0, batch_reply: str = None):
+        self.plans = plans
+        self.delay = delay
+        self.batch_reply = batch_reply
+        self.calls = 0
+        self.active = 0
+        self.max_active = 0
+
+    @staticmethod
+    def _prediction(p: float) -> dict:
+        return {**PREDICTION, "success_probability": p, "state_changes": {}}
+
+    async def generate(self, prompt: str) -> str:
+        self.calls += 1
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.active -= 1
+
+        if prompt.startswith("Generate"):
+            return "\n\n".join(json.dumps(plan) for plan in self.plans)
+        if "ACTIONS TO SIMULATE" in prompt:
+            if self.batch_reply is not None:
+                return self.batch_reply
+            steps = prompt.split("ACTIONS TO SIMULATE")[1]
+            probabilities = re.findall(r'"p": ([\d.]+)', steps)
+            return json.dumps([self._prediction(float(p)) for p in probabilities])
+        step = prompt.split("ACTION TO SIMULATE")[1]
+        return json.dumps(self._prediction(float(re.search(r'"p": ([\d.]+)', step).group(1))))
+
+
+def make_plan(name: str, probabilities) -> list:
+    return [
+        {"action": "think", "params": {"plan": name, "step": i, "p": p}}
+        for i, p in enumerate(probabilities)
+    ]
+
+
+class TestPlanSimulation:
+
+    async def test_candidates_run_concurrently(self):
+        plans = [make_plan(name, [0.9, 0.9]) for name in "abcd"]
+        llm = ScriptedLLM(plans, delay=0.01)
+        model = WorldModel(llm)
+
+        results = await model.find_best_plan(
+            "goal", num_candidates=4, max_concurrency=2, prune=False
+        )
+
+        assert len(results) == 4
+        assert llm.max_active == 2
+        assert llm.calls == 1 + 4 * 2
+
+    async def test_sequential_when_concurrency_is_one(self):
+        plans = [make_plan(name, [0.9]) for name in "abc"]
+        llm = ScriptedLLM(plans, delay=0.005)
+        model = WorldModel(llm)
+
+        await model.find_best_plan("goal", max_concurrency=1, prune=False)
+
+        assert llm.max_active == 1
+
+    async def test_worse_plans_are_pruned(self):
+        plans = [
+            make_plan("good", [0.9, 0.9, 0.9]),
+            make_plan("bad", [0.3, 0.9, 0.9]),
+        ]
+        llm = ScriptedLLM(plans)
+        model = WorldModel(llm)
+
+        results = await model.find_best_plan("goal", num_candidates=2, max_concurrency=1)
+
+        assert [r.pruned for r in results] == [False, True]
+        assert len(results[1].actions_taken) == 1
+        assert llm.calls == 1 + 3 + 1
+        assert results[0].overall_success_probability == pytest.approx(0.9 ** 3)
+
+    async def test_pruning_does_not_change_ranking(self):
+        plans = [
+            make_plan("a", [0.5, 0.9]), make_plan("b", [0.95, 0.9]), make_plan("c", [0.2, 0.9])
+        ]
+
+        pruned = await WorldModel(ScriptedLLM(plans)).find_best_plan("goal", max_concurrency=1)
+        full = await WorldModel(ScriptedLLM(plans)).find_best_plan(
+            "goal", max_concurrency=1, prune=False
+        )
+
+        assert pruned[0].plan_summary == full[0].plan_summary
+        assert pruned[0].overall_success_probability == full[0].overall_success_probability
+
+    async def test_batch_mode_uses_one_call_per_plan(self):
+        plans = [make_plan("a", [0.9, 0.8, 0.7]), make_plan("b", [0.6, 0.6, 0.6])]
+        llm = ScriptedLLM(plans)
+        model = WorldModel(llm)
+
+        results = await model.find_best_plan("goal", num_candidates=2, batch=True, prune=False)
+
+        assert llm.calls == 1 + 2
+        assert results[0].overall_success_probability == pytest.approx(0.9 * 0.8 * 0.7)
+        assert len(model.simulation_cache) == 6
+
+    async def test_batch_skips_cached_steps(self):
+        model = WorldModel(ScriptedLLM([]))
+        plan = [(ActionType.THINK, {"p": 0.9}), (ActionType.THINK, {"p": 0.8})]
+
+        await model.simulate_action(ActionType.THINK, {"p": 0.9}, WorldState())
+        result = await model.simulate_plan(plan, batch=True)
+
+        assert model.llm.calls == 2
+        assert result.overall_success_probability == pytest.approx(0.72)
+
+    async def test_malformed_batch_falls_back_to_single_calls(self):
+        llm = ScriptedLLM([], batch_reply="[not json")
+        model = WorldModel(llm)
+        plan = [(ActionType.THINK, {"p": 0.9}), (ActionType.THINK, {"p": 0.5})]
+
+        result = await model.simulate_plan(plan, batch=True)
+
+        assert llm.calls == 1 + 2
+        assert result.overall_success_probability == pytest.approx(0.45)
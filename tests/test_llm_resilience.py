@@ -8,8 +8,12 @@ Tests all resilience patterns:
 - Telemetry and observability (Codex strategy)
 """
 
+import asyncio
+import threading
 import pytest
 import time
+from types import SimpleNamespace
+
 from jdev_cli.core.llm import (
     LLMClient,
     CircuitBreaker,
@@ -17,6 +21,7 @@ from jdev_cli.core.llm import (
     RateLimiter,
     RequestMetrics
 )
+from jdev_cli.core.thread_bridge import iterate_in_thread
 
 
 class TestCircuitBreaker:
@@ -299,5 +304,245 @@ class TestLLMClientFailover:
         providers = client._get_failover_providers()
         assert len(providers) >= 1
 
+
+class FakeSyncStream:
+    """Blocking chunk stream, like huggingface_hub's stream=True result."""
+
+    def __init__(self, chunks, delay=0.02, fail_at=None):
+        self.chunks = chunks
+        self.delay = delay
+        self.fail_at = fail_at
+        self.produced = 0
+        self.closed = threading.Event()
+
+    def __iter__(self):
+        for i, text in enumerate(self.chunks):
+            time.sleep(self.delay)  # Blocking network read
+            if i == self.fail_at:
+                raise ConnectionError("stream reset")
+            self.produced += 1
+            yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=text))])
+
+    def close(self):
+        self.closed.set()
+
+
+class TestSyncStreamBridge:
+    """Test sync SDK streams do not block the event loop."""
+
+    async def test_hf_stream_keeps_loop_responsive(self):
+        """Other coroutines keep running while HuggingFace streams."""
+        stream = FakeSyncStream(["a", "b", "c", "d", "e"], delay=0.04)
+        client = LLMClient()
+        client._hf_client = SimpleNamespace(chat_completion=lambda **kwargs: stream)
+
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.005)
+                ticks += 1
+
+        ticking = asyncio.create_task(ticker())
+        chunks = [chunk async for chunk in client._stream_hf([], 10, 0.5)]
+        ticking.cancel()
+
+        assert chunks == ["a", "b", "c", "d", "e"]
+        # 0.2s of blocking reads; a blocked loop would tick ~0 times
+        assert ticks >= 10
+
+    async def test_cancel_closes_stream(self):
+        """Stopping the consumer stops the producer and closes the stream."""
+        stream = FakeSyncStream([str(i) for i in range(100)], delay=0.005)
+
+        async def consume():
+            async for _ in iterate_in_thread(lambda: stream):
+                await asyncio.sleep(1)
+
+        task = asyncio.create_task(consume())
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert await asyncio.to_thread(stream.closed.wait, 1)
+        await asyncio.sleep(0.02)  # A read already in progress may finish
+        produced = stream.produced
+        await asyncio.sleep(0.05)
+        assert stream.produced == produced < 100
+
+    async def test_read_ahead_is_bounded(self):
+        """The producer waits once max_buffered items are unconsumed."""
+        stream = FakeSyncStream([str(i) for i in range(100)], delay=0)
+        agen = iterate_in_thread(lambda: stream, max_buffered=4)
+
+        await agen.__anext__()
+        await asyncio.sleep(0.05)
+        assert stream.produced <= 6
+        await agen.aclose()
+
+    async def test_errors_reach_consumer(self):
+        """Exceptions raised by the sync stream are re-raised in the consumer."""
+        stream = FakeSyncStream(["a", "b", "c"], delay=0, fail_at=1)
+
+        received = []
+        with pytest.raises(ConnectionError, match="stream reset"):
+            async for chunk in iterate_in_thread(lambda: stream):
+                received.append(chunk.choices[0].delta.content)
+
+        assert received == ["a"]
+        assert stream.closed.is_set()
+
+
+class FakeProvider:
+    """Async provider with controlled time-to-first-token and token pace."""
+
+    def __init__(self, ttft, token_delay=0.0, tokens=("a", "b", "c"), fail=False):
+        self.ttft = ttft
+        self.token_delay = token_delay
+        self.tokens = tokens
+        self.fail = fail
+        self.started = 0
+        self.completed = 0
+        self.active = 0
+        self.max_active = 0
+
+    async def stream_chat(self, messages, max_tokens, temperature, **kwargs):
+        self.started += 1
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(self.ttft)
+            if self.fail:
+                raise RuntimeError("provider down")
+            for token in self.tokens:
+                yield token
+                await asyncio.sleep(self.token_delay)
+            self.completed += 1
+        finally:
+            self.active -= 1
+
+    def chat_completion(self, **kwargs):
+        """huggingface_hub-style blocking stream."""
+        self.started += 1
+        time.sleep(self.ttft)
+        if self.fail:
+            raise RuntimeError("provider down")
+        for token in self.tokens:
+            yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=token))])
+            time.sleep(self.token_delay)
+        self.completed += 1
+
+
+def routed_client(**providers) -> LLMClient:
+    """LLMClient whose four providers are fakes (unset ones always fail)."""
+    client = LLMClient(enable_rate_limiting=False, enable_circuit_breaker=False,
+                       **providers.pop("options", {}))
+    for name in ("gemini", "nebius", "hf", "ollama"):
+        setattr(client, f"_{name}_client", providers.get(name) or FakeProvider(0, fail=True))
+    return client
+
+
+async def collect(client, **kwargs) -> str:
+    return "".join([chunk async for chunk in client.stream_chat("hi", **kwargs)])
+
+
+class TestLatencyRouting:
+    """Test TTFT/throughput-driven routing, hedging and concurrency limits."""
+
+    async def test_routing_by_ttft_and_throughput(self):
+        """Measured providers are ordered by expected response time."""
+        client = routed_client(
+            gemini=FakeProvider(0.06),
+            nebius=FakeProvider(0.01),
+            ollama=FakeProvider(0.005, token_delay=0.02),  # Fast start, slow stream
+        )
+        # Unmeasured providers are explored first, in preference order
+        assert client._get_failover_providers() == ["gemini", "nebius", "hf", "ollama"]
+
+        for provider in ("gemini", "nebius", "ollama"):
+            assert await collect(client, provider=provider, enable_failover=False) == "abc"
+        with pytest.raises(RuntimeError):
+            await collect(client, provider="hf", enable_failover=False)
+
+        assert client._get_failover_providers() == ["nebius", "gemini", "ollama", "hf"]
+
+    async def test_failing_provider_ranked_last(self):
+        """A provider that only ever failed goes behind measured and unmeasured ones."""
+        client = routed_client(nebius=FakeProvider(0.01), hf=FakeProvider(0.01),
+                               ollama=FakeProvider(0.01))
+        with pytest.raises(RuntimeError):
+            await collect(client, provider="gemini", enable_failover=False)
+        await collect(client, provider="nebius", enable_failover=False)
+
+        assert client._get_failover_providers() == ["hf", "ollama", "nebius", "gemini"]
+
+    async def test_hedge_starts_backup_and_cancels_loser(self):
+        """A primary with no token within the hedge delay loses to the backup."""
+        slow, fast = FakeProvider(1.0), FakeProvider(0.01)
+        client = routed_client(gemini=slow, nebius=fast,
+                               options={"enable_hedging": True, "hedge_delay": 0.05})
+
+        start = time.monotonic()
+        assert await collect(client, provider="gemini") == "abc"
+
+        assert time.monotonic() - start < 0.5
+        assert (slow.started, slow.completed, slow.active) == (1, 0, 0)
+        assert fast.completed == 1
+        stats = client.get_metrics()
+        assert (stats["hedged_requests"], stats["hedges_won"]) == (1, 1)
+
+    async def test_no_hedge_when_primary_is_fast(self):
+        """The backup never starts if the primary answers within the delay."""
+        primary, backup = FakeProvider(0.01), FakeProvider(0.01)
+        client = routed_client(gemini=primary, nebius=backup,
+                               options={"enable_hedging": True, "hedge_delay": 0.2})
+
+        assert await collect(client, provider="gemini") == "abc"
+        assert backup.started == 0
+        assert client.get_metrics()["hedged_requests"] == 0
+
+    async def test_primary_failure_starts_backup_at_once(self):
+        """A failing primary hands over without waiting for the hedge delay."""
+        client = routed_client(gemini=FakeProvider(0, fail=True), nebius=FakeProvider(0.01),
+                               options={"enable_hedging": True, "hedge_delay": 5.0})
+
+        assert await asyncio.wait_for(collect(client, provider="gemini"), 1) == "abc"
+        assert client.get_metrics()["hedged_requests"] == 0
+
+    def test_hedge_delay_follows_p95_ttft(self):
+        """With enough samples the hedge delay is the provider's p95 TTFT."""
+        client = LLMClient(hedge_delay=2.0)
+        assert client._hedge_delay("gemini") == 2.0
+
+        for ttft in [0.1] * 37 + [0.5, 0.5, 0.9]:
+            client.metrics.record_first_token("gemini", ttft)
+        assert client._hedge_delay("gemini") == 0.5
+
+    async def test_per_provider_concurrency_limit(self):
+        """Concurrent streams to one provider are capped."""
+        provider = FakeProvider(0.02)
+        client = routed_client(nebius=provider,
+                               options={"provider_concurrency": {"nebius": 2}})
+
+        results = await asyncio.gather(*(
+            collect(client, provider="nebius", enable_failover=False) for _ in range(5)
+        ))
+
+        assert results == ["abc"] * 5
+        assert provider.max_active == 2
+
+    async def test_latency_in_metrics(self):
+        """get_metrics() reports rolling TTFT and tokens/sec per provider."""
+        client = routed_client(nebius=FakeProvider(0.02, token_delay=0.01))
+        await collect(client, provider="nebius", enable_failover=False)
+
+        latency = client.get_metrics()["latency"]["nebius"]
+        assert latency["samples"] == 1
+        assert latency["ttft_p50_ms"] >= 20
+        assert latency["tokens_per_sec_p50"] > 0
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "--tb=short"])
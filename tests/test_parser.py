@@ -9,7 +9,7 @@ Tests all parsing strategies + new features:
 
 import pytest
 import json
-from jdev_cli.core.parser import ResponseParser, ParseStrategy
+from jdev_cli.core.parser import ResponseParser, ParseStrategy, classify_response
 
 
 @pytest.fixture
@@ -398,5 +398,61 @@ class TestStatistics:
         assert stats_after["total"] == 0
 
 
+class TestFastPath:
+    """Test pre-classification, retry avoidance and latency counters."""
+
+    def test_classify_response(self):
+        """Classification keeps only strategies that can match."""
+        assert classify_response('{"tool": "ls", "args": {}}') == (
+            ParseStrategy.STRICT_JSON, ParseStrategy.REGEX_EXTRACTION
+        )
+        assert classify_response('Sure:\n```json\n[{"tool": "ls"}]\n```') == (
+            ParseStrategy.MARKDOWN_JSON, ParseStrategy.REGEX_EXTRACTION, ParseStrategy.PARTIAL_JSON
+        )
+        assert classify_response("Plain answer, see [1].") == ()
+
+    def test_dispatch_skips_impossible_strategies(self, parser):
+        """Prose runs no strategy; fenced JSON goes straight to markdown."""
+        parser.parse("I understand. Let me explain the design [1].")
+        parser.parse('```json\n{"tool": "pwd", "args": {}}\n```')
+
+        latency = parser.get_statistics()["latency"]
+        assert latency["strict_json"]["attempts"] == 0
+        assert latency["markdown_json"]["attempts"] == 1
+        assert latency["regex_extraction"]["attempts"] == 0
+        assert latency["partial_json"]["attempts"] == 0
+        assert latency["markdown_json"]["total_ms"] >= 0
+
+    def test_prose_does_not_trigger_retry(self):
+        """Plain prose is a text answer, not a failed tool call."""
+        parser_with_retry = ResponseParser(enable_retry=True, max_retries=2, enable_logging=False)
+        calls = []
+        parser_with_retry.set_retry_callback(
+            lambda response, error: calls.append(response) or response
+        )
+
+        result = parser_with_retry.parse("The function returns the cached value.")
+
+        assert result.strategy == ParseStrategy.PLAIN_TEXT
+        assert calls == []
+        stats = parser_with_retry.get_statistics()
+        assert stats["retries"] == 0
+        assert stats["retries_avoided"] == 1
+
+    def test_trailing_bracket_stays_text(self, parser):
+        """A trailing '[]' no longer turns prose into an empty tool call list."""
+        result = parser.parse("No matches were found: []")
+
+        assert result.strategy == ParseStrategy.PLAIN_TEXT
+        assert result.text_response == "No matches were found: []"
+
+    def test_reset_clears_latency(self, parser):
+        """reset_statistics also clears latency counters."""
+        parser.parse('{"tool": "ls", "args": {}}')
+        parser.reset_statistics()
+
+        latency = parser.get_statistics()["latency"]
+        assert all(entry["attempts"] == 0 for entry in latency.values())
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "--tb=short"])
@@ -54,6 +54,14 @@ class TestLRUCache:
         assert cache.get("b") is None
         assert cache.get("c") == 3
 
+    def test_set_existing_key_updates_value(self):
+        cache = LRUCache(maxsize=2)
+
+        cache.set("a", 1)
+        cache.set("a", 2)
+
+        assert cache.get("a") == 2
+
 
 class TestDiskCache:
     """Test disk cache."""
@@ -77,6 +85,75 @@ class TestDiskCache:
             time.sleep(0.2)
             assert cache.get("key1") is None
 
+    def test_persists_across_reopen(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = DiskCache(f"{tmpdir}/test.db")
+            cache.set("key1", [1, 2.5, "x", None])
+            cache.delete("key1")
+            cache.set("key2", {"nested": {"a": [1, "b"]}})
+            cache.close()
+
+            reopened = DiskCache(f"{tmpdir}/test.db")
+            assert reopened.get("key1") is None
+            assert reopened.get("key2") == {"nested": {"a": [1, "b"]}}
+            reopened.close()
+
+    def test_writes_are_batched(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = DiskCache(f"{tmpdir}/test.db", batch_size=3, flush_interval=60)
+
+            cache.set("a", 1)
+            cache.set("b", 2)
+            assert cache._pending and cache.get("a") == 1  # read-your-writes
+
+            cache.set("c", 3)  # batch full -> group commit
+            assert not cache._pending
+            assert cache._conn.execute("SELECT COUNT(*) FROM cache").fetchone()[0] == 3
+            cache.close()
+
+    def test_timer_flushes_pending_writes(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = DiskCache(f"{tmpdir}/test.db", flush_interval=0.01)
+
+            cache.set("a", 1)
+            time.sleep(0.2)
+
+            assert not cache._pending
+            assert cache._conn.execute("SELECT COUNT(*) FROM cache").fetchone()[0] == 1
+            cache.close()
+
+    def test_sweep_and_size_eviction(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = DiskCache(f"{tmpdir}/test.db", max_size_mb=10 / 1024)
+
+            cache.set("expired", "x", ttl=-1)
+            for i in range(20):
+                cache.set(f"k{i}", "v" * 1000, ttl=100 + i)
+            cache.clear_expired()
+
+            keys = {row[0] for row in cache._conn.execute("SELECT key FROM cache")}
+            assert "expired" not in keys
+            assert keys == {f"k{i}" for i in range(11, 20)}  # soonest-to-expire evicted
+            cache.close()
+
+    def test_old_schema_is_replaced(self):
+        import sqlite3
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            conn = sqlite3.connect(f"{tmpdir}/test.db")
+            conn.execute(
+                "CREATE TABLE cache (key TEXT PRIMARY KEY, value TEXT, timestamp REAL, ttl INTEGER)"
+            )
+            conn.execute("INSERT INTO cache VALUES ('key1', '\"old\"', 0, 3600)")
+            conn.commit()
+            conn.close()
+
+            cache = DiskCache(f"{tmpdir}/test.db")
+            assert cache.get("key1") is None
+            cache.set("key1", "new")
+            assert cache.get("key1") == "new"
+            cache.close()
+
 
 class TestPerformanceCache:
     """Test 3-tier cache."""
@@ -109,6 +186,51 @@ class TestPerformanceCache:
             assert result == 1
             assert cache.stats.disk_hits == 1
 
+    def test_get_stats(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = PerformanceCache(disk_path=f"{tmpdir}/test.db")
+
+            cache.set("a", 1)
+            cache.get("a")
+            cache.get("missing")
+
+            stats = cache.get_stats()
+            assert (stats["hits"], stats["misses"], stats["size"]) == (1, 1, 1)
+            cache.close()
+
+    def test_json_compatible_values_reach_disk(self):
+        from collections import OrderedDict, defaultdict
+        from enum import Enum
+
+        class Color(str, Enum):
+            RED = "red"
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = PerformanceCache(disk_path=f"{tmpdir}/test.db")
+
+            cache.set("ordered", OrderedDict(a=1))
+            cache.set("default", defaultdict(list, b=[2]))
+            cache.set("enum", Color.RED)
+            cache._memory.clear()
+
+            assert cache.get("ordered") == {"a": 1}
+            assert cache.get("default") == {"b": [2]}
+            assert cache.get("enum") == "red"
+            cache.close()
+
+    def test_unserializable_value_stays_in_memory(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = PerformanceCache(disk_path=f"{tmpdir}/test.db")
+            value = object()
+
+            cache.set("key1", "old")
+            cache.set("key1", value)
+            assert cache.get("key1") is value
+
+            cache._memory.clear()
+            assert cache.get("key1") is None  # older disk value is gone too
+            cache.close()
+
     def test_cache_key_generation(self):
         key1 = cache_key("arg1", "arg2", param="value")
         key2 = cache_key("arg1", "arg2", param="value")
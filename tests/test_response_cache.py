@@ -0,0 +1,216 @@
+"""Tests for the LLM response cache.
+
+Covers TTL/size bounds, replay pacing, in-flight deduplication and the
+LLMClient / GeminiClient integration.
+"""
+
+import asyncio
+import time
+
+from jdev_cli.core.llm import LLMClient
+from jdev_core.response_cache import ResponseCache
+from prometheus.core.llm_client import GeminiClient
+
+
+class CountingProvider:
+    """Async provider that counts calls and streams fixed chunks."""
+
+    model_name = "fake-model"
+
+    def __init__(self, chunks=("Hel", "lo", "!"), delay=0.0, fail=False):
+        self.chunks = chunks
+        self.delay = delay
+        self.fail = fail
+        self.calls = 0
+
+    async def stream_chat(self, messages, max_tokens, temperature, **kwargs):
+        self.calls += 1
+        for chunk in self.chunks:
+            await asyncio.sleep(self.delay)
+            if self.fail:
+                raise ValueError("bad request")
+            yield chunk
+
+
+async def produce_from(provider):
+    async for chunk in provider.stream_chat([], 0, 0):
+        yield chunk
+
+
+async def collect(stream) -> list:
+    return [chunk async for chunk in stream]
+
+
+class TestResponseCache:
+    """Test ResponseCache on its own."""
+
+    async def test_hit_replays_chunks(self):
+        cache = ResponseCache()
+        provider = CountingProvider()
+
+        first = await collect(cache.stream("k", lambda: produce_from(provider)))
+        second = await collect(cache.stream("k", lambda: produce_from(provider)))
+
+        assert first == second == ["Hel", "lo", "!"]
+        assert provider.calls == 1
+        assert cache.get("k") == "Hello!"
+        assert (cache.stats.hits, cache.stats.misses, cache.stats.saved_tokens) == (1, 1, 3)
+        assert cache.stats.hit_rate == 0.5
+
+    async def test_replay_delay(self):
+        cache = ResponseCache(replay_delay=0.02)
+        provider = CountingProvider()
+        await collect(cache.stream("k", lambda: produce_from(provider)))
+
+        start = time.monotonic()
+        await collect(cache.stream("k", lambda: produce_from(provider)))
+        paced = time.monotonic() - start
+
+        start = time.monotonic()
+        await collect(cache.stream("k", lambda: produce_from(provider), replay_delay=0))
+        instant = time.monotonic() - start
+
+        assert paced >= 0.04  # Two gaps between three chunks
+        assert instant < 0.02
+
+    async def test_ttl_expiry(self):
+        cache = ResponseCache(ttl=0.02)
+        provider = CountingProvider()
+
+        await collect(cache.stream("k", lambda: produce_from(provider)))
+        await asyncio.sleep(0.03)
+        await collect(cache.stream("k", lambda: produce_from(provider)))
+
+        assert provider.calls == 2
+        assert cache.stats.hits == 0
+
+    async def test_size_bounds(self):
+        cache = ResponseCache(max_entries=2, max_chars=10)
+        provider = CountingProvider()  # 6 chars per response
+
+        for key in ("a", "b", "c"):
+            await collect(cache.stream(key, lambda: produce_from(provider)))
+
+        # max_chars allows only one 6-char response
+        assert len(cache) == 1
+        assert cache.get("c") == "Hello!"
+        assert cache.stats.evictions == 2
+
+        big = CountingProvider(chunks=("x" * 11,))
+        await collect(cache.stream("big", lambda: produce_from(big)))
+        assert cache.get("big") is None
+
+    async def test_concurrent_identical_requests_share_one_call(self):
+        cache = ResponseCache()
+        provider = CountingProvider(delay=0.01)
+
+        results = await asyncio.gather(*(
+            collect(cache.stream("k", lambda: produce_from(provider))) for _ in range(5)
+        ))
+
+        assert results == [["Hel", "lo", "!"]] * 5
+        assert provider.calls == 1
+        assert (cache.stats.misses, cache.stats.coalesced) == (1, 4)
+        assert cache.stats.saved_tokens == 12
+
+    async def test_errors_are_shared_and_not_cached(self):
+        cache = ResponseCache()
+        provider = CountingProvider(delay=0.01, fail=True)
+
+        results = await asyncio.gather(
+            *(collect(cache.stream("k", lambda: produce_from(provider))) for _ in range(3)),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(r, ValueError) for r in results)
+        assert provider.calls == 1
+        assert len(cache) == 0
+
+    async def test_abandoned_stream_is_cancelled_and_not_cached(self):
+        cache = ResponseCache()
+        provider = CountingProvider(chunks=tuple("abcdef"), delay=0.01)
+
+        stream = cache.stream("k", lambda: produce_from(provider))
+        assert await stream.__anext__() == "a"
+        await stream.aclose()
+        await asyncio.sleep(0.02)
+
+        assert len(cache) == 0
+        assert await collect(cache.stream("k", lambda: produce_from(provider))) == list("abcdef")
+        assert provider.calls == 2
+
+
+class TestLLMClientCache:
+    """Test the opt-in cache in LLMClient."""
+
+    def make_client(self, provider, **kwargs) -> LLMClient:
+        client = LLMClient(enable_rate_limiting=False, enable_circuit_breaker=False, **kwargs)
+        client._gemini_client = provider
+        return client
+
+    async def test_generate_uses_cache(self):
+        provider = CountingProvider()
+        client = self.make_client(provider, response_cache=ResponseCache(replay_delay=1.0))
+
+        assert await client.generate("plan it", provider="gemini") == "Hello!"
+        assert await client.generate("plan it", provider="gemini") == "Hello!"
+        assert await client.generate("plan it", provider="gemini", temperature=0.2) == "Hello!"
+
+        assert provider.calls == 2  # Different temperature is a different request
+        cache_stats = client.get_metrics()["response_cache"]
+        assert cache_stats["hits"] == 1
+        assert cache_stats["saved_tokens"] == 3
+
+    async def test_stream_chat_bypass_and_default_off(self):
+        provider = CountingProvider()
+        client = self.make_client(provider, response_cache=ResponseCache())
+
+        chunks = [c async for c in client.stream_chat("hi", provider="gemini")]
+        again = [c async for c in client.stream_chat("hi", provider="gemini", use_cache=False)]
+        assert chunks == again == ["Hel", "lo", "!"]
+        assert provider.calls == 2
+
+        uncached = self.make_client(CountingProvider())
+        await uncached.generate("hi", provider="gemini")
+        await uncached.generate("hi", provider="gemini")
+        assert uncached._gemini_client.calls == 2
+        assert "response_cache" not in uncached.get_metrics()
+
+
+class FakeResponse:
+    status_code = 200
+
+    def __init__(self, text):
+        self._text = text
+
+    def json(self):
+        return {"candidates": [{"content": {"parts": [{"text": self._text}]}}]}
+
+
+class FakeHttp:
+    def __init__(self):
+        self.posts = 0
+
+    async def post(self, url, json):
+        self.posts += 1
+        await asyncio.sleep(0.01)
+        return FakeResponse(f"answer to {json['contents'][-1]['parts'][0]['text']}")
+
+
+class TestGeminiClientCache:
+    """Test the opt-in cache in prometheus' GeminiClient."""
+
+    async def test_generate_cached_and_deduplicated(self):
+        client = GeminiClient(api_key="test", response_cache=ResponseCache())
+        client._client = http = FakeHttp()
+
+        results = await asyncio.gather(*(client.generate("simulate") for _ in range(3)))
+        again = await client.generate("simulate")
+        other = await client.generate("review")
+
+        assert results == ["answer to simulate"] * 3
+        assert again == "answer to simulate"
+        assert other == "answer to review"
+        assert http.posts == 2
+        assert len(client.conversation_history) == 10  # History still recorded per call
+        assert client.response_cache.stats.saved_tokens == 3 * (len("answer to simulate") // 4)
@@ -20,6 +20,8 @@ from rich.console import Console
 # Import components to test
 from jdev_tui.core.bridge import ToolCallParser
 from jdev_tui.core.output_formatter import OutputFormatter
+from jdev_tui.core.parsing.stream_filter import StreamFilter
+from jdev_tui.core.parsing.tool_call_parser import IncrementalToolCallParser
 
 
 # =============================================================================
@@ -99,6 +101,110 @@ class TestToolCallParser:
         assert calls[0][1] == original_args
 
 
+# =============================================================================
+# Streaming Parser Tests
+# =============================================================================
+
+def feed_in_pieces(target, text, size):
+    """Feed text to a parser or filter in fixed-size chunks."""
+    feed = getattr(target, "process_chunk", None) or target.feed
+    return [feed(text[i:i + size]) for i in range(0, len(text), size)]
+
+
+MIXED_RESPONSE = (
+    'Reading first. [TOOL_CALL:read_file:{"path":"a.py"}]\n'
+    '{"type": "tool_use", "name": "grep", "input": {"pattern": "x"}}\n'
+    'Then:\n```python\nwrite_file(path="b.py", content="d = {")\n```\n'
+    '[TOOL_CALL:write_file:{"path":"c.txt","content":"} ] \\" {"}]\n'
+    'outside a block: bash(command="ignored")'
+)
+
+
+class TestIncrementalToolCallParser:
+    """Tests for IncrementalToolCallParser - tool calls from a stream."""
+
+    @pytest.mark.parametrize("size", [1, 3, 7, 1000])
+    def test_same_calls_as_extract(self, size):
+        """Chunking does not change what is found."""
+        parser = IncrementalToolCallParser()
+        feed_in_pieces(parser, MIXED_RESPONSE, size)
+        parser.finish()
+
+        expected = ToolCallParser.extract(MIXED_RESPONSE)
+        assert sorted(map(repr, parser.calls)) == sorted(map(repr, expected))
+        assert len(parser.calls) == 4
+        assert parser.text == MIXED_RESPONSE
+
+    def test_calls_emitted_when_they_close(self):
+        """A call is reported by the chunk that completes it."""
+        parser = IncrementalToolCallParser()
+
+        assert parser.feed('Sure. [TOOL_CALL:read_file:{"path":') == []
+        assert parser.feed('"a.py"}') == []  # ']' may still follow
+        assert parser.feed('] more text') == [("read_file", {"path": "a.py"})]
+        assert parser.feed('```\nls(path=".")\n``') == []
+        assert parser.feed('`\n') == [("ls", {"path": "."})]
+        assert parser.finish() == []
+
+    def test_braces_in_strings_ignored(self):
+        """Braces and escaped quotes inside JSON strings don't close the call."""
+        parser = IncrementalToolCallParser()
+        found = feed_in_pieces(parser, '[TOOL_CALL:bash:{"command":"echo \\"}\\" {"}]', 4)
+
+        assert [call for calls in found for call in calls] == [
+            ("bash", {"command": 'echo "}" {'})
+        ]
+
+    @pytest.mark.parametrize("text", [
+        '[TOOL_CALL:write_file:{"path":"a.md","content":"```py\\nx = 1\\n```"}]\n'
+        "Next I could call read_file(path='e.txt').",
+        '{"name": "grep", "arguments": {"pattern": "\\```"}}\n```\nls(path=".")\n```\n'
+        "read_file(path='e.txt') was mentioned in prose.",
+    ])
+    @pytest.mark.parametrize("size", [1, 4, 1000])
+    def test_fences_in_json_strings_count_like_extract(self, text, size):
+        """A fence inside a JSON string also limits Python-style calls to code blocks."""
+        parser = IncrementalToolCallParser()
+        feed_in_pieces(parser, text, size)
+        parser.finish()
+
+        assert sorted(map(repr, parser.calls)) == sorted(map(repr, ToolCallParser.extract(text)))
+        assert "read_file" not in [name for name, _ in parser.calls]
+
+    def test_python_calls_without_code_blocks_at_finish(self):
+        """Without code blocks, Python-style calls are searched in the whole text."""
+        parser = IncrementalToolCallParser()
+        parser.feed('I will run read_file(path="x.py") now')
+
+        assert parser.calls == []
+        assert parser.finish() == [("read_file", {"path": "x.py"})]
+
+
+class TestStreamFilter:
+    """Tests for StreamFilter - hiding tool calls from the displayed stream."""
+
+    @pytest.mark.parametrize("size", [1, 5, 1000])
+    def test_markers_and_tool_json_suppressed(self, size):
+        """Markers and tool JSON vanish; the text around them is kept."""
+        text = (
+            'Before [TOOL_CALL:write_file:{"path":"a","content":"x} {y"}] middle '
+            '{"tool": "read_file", "args": {"path": "b"}} after {not: json}'
+        )
+        stream_filter = StreamFilter()
+
+        shown = "".join(feed_in_pieces(stream_filter, text, size)) + stream_filter.flush()
+
+        assert shown == "Before  middle  after {not: json}"
+        assert [name for name, _ in stream_filter.tool_calls] == ["write_file", "read_file"]
+
+    def test_flush_releases_unterminated_json(self):
+        """An unterminated block is released at the end rather than lost."""
+        stream_filter = StreamFilter()
+
+        assert stream_filter.process_chunk('ok {"path": "a", "x": ') == "ok "
+        assert stream_filter.flush() == '{"path": "a", "x": '
+
+
 # =============================================================================
 # OutputFormatter Tests
 # =============================================================================
@@ -0,0 +1,244 @@
+"""
+Tests for the @cached single-flight memoization decorator.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from jdev_cli.core.cache import PerformanceCache, cached, path_tag
+from jdev_cli.core.file_watcher import FileWatcher
+
+
+@pytest.fixture
+def cache(tmp_path):
+    performance_cache = PerformanceCache(disk_path=str(tmp_path / "cache.db"))
+    yield performance_cache
+    performance_cache.close()
+
+
+class TestCachedAsync:
+
+    async def test_repeat_calls_hit_cache(self, cache):
+        calls = []
+
+        @cached(ttl=60, cache=cache)
+        async def read(path):
+            calls.append(path)
+            return f"contents of {path}"
+
+        assert await read("a.py") == "contents of a.py"
+        assert await read("a.py") == "contents of a.py"
+        assert await read("b.py") == "contents of b.py"
+
+        assert calls == ["a.py", "b.py"]
+        assert (cache.stats.hits, cache.stats.misses) == (1, 2)
+
+    async def test_concurrent_misses_are_coalesced(self, cache):
+        calls = 0
+        release = asyncio.Event()
+
+        @cached(cache=cache)
+        async def search(query):
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return [query]
+
+        tasks = [asyncio.create_task(search("x")) for _ in range(5)]
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await asyncio.gather(*tasks) == [["x"]] * 5
+        assert calls == 1
+        assert cache.stats.coalesced == 4
+        assert cache.stats.misses == 1
+
+    async def test_errors_reach_all_waiters_and_are_not_cached(self, cache):
+        calls = 0
+        release = asyncio.Event()
+
+        @cached(cache=cache)
+        async def flaky():
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            raise OSError("disk gone")
+
+        tasks = [asyncio.create_task(flaky()) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        assert all(isinstance(r, OSError) for r in results)
+        with pytest.raises(OSError):
+            await flaky()
+        assert calls == 2
+
+    async def test_cancelled_leader_hands_over(self, cache):
+        calls = 0
+        release = asyncio.Event()
+
+        @cached(cache=cache)
+        async def slow():
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return calls
+
+        leader = asyncio.create_task(slow())
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(slow())
+        await asyncio.sleep(0)
+        leader.cancel()
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await follower == 2
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+
+    async def test_negative_caching(self, cache):
+        calls = 0
+
+        @cached(negative_ttl=60, cache=cache)
+        async def lookup(name):
+            nonlocal calls
+            calls += 1
+            return None
+
+        @cached(cache=cache)
+        async def lookup_uncached(name):
+            nonlocal calls
+            calls += 1
+            return None
+
+        assert await lookup("missing") is None
+        assert await lookup("missing") is None
+        assert calls == 1
+
+        await lookup_uncached("missing")
+        await lookup_uncached("missing")
+        assert calls == 3
+
+    async def test_stale_while_revalidate(self, cache):
+        version = 0
+
+        @cached(ttl=0.05, stale_ttl=60, cache=cache)
+        async def config():
+            nonlocal version
+            version += 1
+            return version
+
+        assert await config() == 1
+        await asyncio.sleep(0.1)
+
+        assert await config() == 1  # stale value, refresh started
+        assert await config() == 1  # refresh still running, not started twice
+        await asyncio.sleep(0.01)
+        assert await config() == 2
+        assert version == 2
+        assert cache.stats.stale_hits == 2
+
+    async def test_results_survive_memory_loss(self, cache):
+        @cached(cache=cache)
+        async def compute(n):
+            return {"squares": [i * i for i in range(n)]}
+
+        await compute(4)
+        cache._memory.clear()
+
+        assert await compute(4) == {"squares": [0, 1, 4, 9]}
+        assert cache.stats.disk_hits == 1
+
+
+class TestCachedSync:
+
+    def test_sync_functions(self, cache):
+        calls = []
+
+        @cached(key=lambda path, **_: path, cache=cache)
+        def read(path, encoding="utf-8"):
+            calls.append(path)
+            return path.upper()
+
+        assert read("a") == "A"
+        assert read("a", encoding="latin-1") == "A"  # custom key ignores encoding
+        assert calls == ["a"]
+
+    def test_threads_are_coalesced(self, cache):
+        calls = 0
+        started = threading.Event()
+
+        @cached(cache=cache)
+        def slow():
+            nonlocal calls
+            calls += 1
+            started.set()
+            time.sleep(0.1)
+            return "done"
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(slow())) for _ in range(4)]
+        threads[0].start()
+        started.wait()
+        for thread in threads[1:]:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results == ["done"] * 4
+        assert calls == 1
+        assert cache.stats.coalesced == 3
+
+    def test_unserializable_results_stay_in_memory(self, cache):
+        class Result:
+            pass
+
+        @cached(cache=cache)
+        def build():
+            return Result()
+
+        assert build() is build()
+
+
+class TestTagInvalidation:
+
+    def test_invalidate_tag(self, cache):
+        calls = 0
+
+        @cached(tags=lambda name: [f"user:{name}"], cache=cache)
+        def profile(name):
+            nonlocal calls
+            calls += 1
+            return name
+
+        profile("ana")
+        profile("bo")
+        assert cache.invalidate_tag("user:ana") == 1
+
+        profile("ana")
+        profile("bo")
+        assert calls == 3
+
+    def test_file_watcher_invalidates_paths(self, cache, tmp_path):
+        source = tmp_path / "a.py"
+        source.write_text("a = 1\n")
+        watcher = FileWatcher(str(tmp_path), backend="polling")
+        watcher.start()
+        cache.watch(watcher)
+
+        @cached(tags=lambda path: [path_tag(path)], cache=cache)
+        def read(path):
+            with open(path) as f:
+                return f.read()
+
+        assert read(str(source)) == "a = 1\n"
+        source.write_text("a = 22\n")
+        assert read(str(source)) == "a = 1\n"
+
+        watcher.check_updates()
+        assert read(str(source)) == "a = 22\n"
+        watcher.stop()
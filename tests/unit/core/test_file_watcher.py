@@ -0,0 +1,193 @@
+"""
+Tests for FileWatcher backends (inotify + stat polling).
+"""
+
+import errno
+import hashlib
+import os
+import select
+import sys
+import time
+
+import pytest
+
+from jdev_cli.core.file_watcher import FileWatcher, _InotifyBackend
+
+
+BACKENDS = ['polling']
+if _InotifyBackend.available():
+    BACKENDS.append('inotify')
+
+
+def drain(watcher, timeout=2.0):
+    """Collect events, waiting on the inotify fd when there is one."""
+    fd = watcher.fileno()
+    if fd is not None:
+        select.select([fd], [], [], timeout)
+        time.sleep(0.05)  # let the rest of the burst arrive
+    before = len(watcher.recent_events)
+    watcher.check_updates()
+    return watcher.recent_events[before:]
+
+
+@pytest.fixture(params=BACKENDS)
+def watched(request, tmp_path):
+    (tmp_path / "a.py").write_text("a = 1\n")
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "b.py").write_text("b = 1\n")
+    (tmp_path / "notes.txt").write_text("ignored\n")
+    (tmp_path / ".hidden").mkdir()
+    (tmp_path / ".hidden" / "c.py").write_text("c = 1\n")
+
+    watcher = FileWatcher(str(tmp_path), backend=request.param)
+    watcher.start()
+    yield tmp_path, watcher
+    watcher.stop()
+
+
+class TestFileWatcher:
+
+    def test_initial_scan(self, watched):
+        _, watcher = watched
+        assert watcher.tracked_files == 2
+        assert watcher.get_stats()['backend'] == watcher.backend
+
+    def test_created_modified_deleted(self, watched):
+        root, watcher = watched
+
+        (root / "new.py").write_text("x = 1\n")
+        events = drain(watcher)
+        assert [(e.event_type, os.path.basename(e.path)) for e in events] == [('created', 'new.py')]
+
+        time.sleep(0.01)
+        (root / "a.py").write_text("a = 2\n")
+        events = drain(watcher)
+        assert [(e.event_type, os.path.basename(e.path)) for e in events] == [('modified', 'a.py')]
+
+        (root / "pkg" / "b.py").unlink()
+        events = drain(watcher)
+        assert [(e.event_type, os.path.basename(e.path)) for e in events] == [('deleted', 'b.py')]
+        assert watcher.tracked_files == 2
+
+    def test_detects_change_beyond_first_8kb(self, watched):
+        root, watcher = watched
+        target = root / "a.py"
+        target.write_text("#" * 10000 + "\n")
+        drain(watcher)
+
+        time.sleep(0.01)
+        target.write_text("#" * 10000 + "\nchanged = True\n")
+        events = drain(watcher)
+        assert [e.event_type for e in events] == ['modified']
+
+    def test_burst_is_coalesced(self, watched):
+        root, watcher = watched
+        target = root / "a.py"
+        for i in range(20):
+            target.write_text(f"a = {i}\n")
+
+        events = drain(watcher)
+        assert [e.event_type for e in events] == ['modified']
+
+    def test_create_then_delete_emits_nothing(self, watched):
+        root, watcher = watched
+        temp = root / "tmp.py"
+        temp.write_text("x = 1\n")
+        temp.unlink()
+
+        assert drain(watcher, timeout=0.2) == []
+
+    def test_new_directory_is_watched(self, watched):
+        root, watcher = watched
+        sub = root / "fresh" / "deep"
+        sub.mkdir(parents=True)
+        (sub / "mod.py").write_text("m = 1\n")
+        drain(watcher)
+
+        (sub / "mod2.py").write_text("m = 2\n")
+        events = drain(watcher)
+        assert ('created', 'mod2.py') in [(e.event_type, os.path.basename(e.path)) for e in events]
+        assert watcher.tracked_files == 4
+
+    def test_ignores_excluded_paths(self, watched):
+        root, watcher = watched
+        (root / "notes.txt").write_text("changed\n")
+        (root / ".hidden" / "c.py").write_text("c = 2\n")
+
+        assert drain(watcher, timeout=0.2) == []
+
+    def test_callbacks_receive_events(self, watched):
+        root, watcher = watched
+        seen = []
+        watcher.add_callback(seen.append)
+
+        (root / "cb.py").write_text("x = 1\n")
+        drain(watcher)
+
+        assert [e.event_type for e in seen] == ['created']
+        assert watcher.get_stats()['event_count'] == 1
+
+
+def test_unknown_backend_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        FileWatcher(str(tmp_path), backend='fsevents')
+
+
+@pytest.mark.skipif(not sys.platform.startswith('linux'), reason="inotify is Linux-only")
+def test_auto_prefers_inotify(tmp_path):
+    watcher = FileWatcher(str(tmp_path))
+    watcher.start()
+    try:
+        assert watcher.backend == ('inotify' if _InotifyBackend.available() else 'polling')
+    finally:
+        watcher.stop()
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_relative_root_paths_and_hashes(backend, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "sub").mkdir()
+    watcher = FileWatcher(".", backend=backend)
+    watcher.start()
+    try:
+        (tmp_path / "b.py").write_text("b = 1\n")
+        (tmp_path / "sub" / "a.py").write_text("a = 1\n")
+        events = drain(watcher)
+        assert sorted((e.path, e.event_type, e.file_hash) for e in events) == [
+            ('b.py', 'created', hashlib.md5(b"b = 1\n").hexdigest()),
+            (os.path.join('sub', 'a.py'), 'created', hashlib.md5(b"a = 1\n").hexdigest()),
+        ]
+
+        (tmp_path / "b.py").unlink()
+        events = drain(watcher)
+        assert [(e.path, e.event_type, e.file_hash) for e in events] == [('b.py', 'deleted', None)]
+    finally:
+        watcher.stop()
+
+
+@pytest.mark.skipif(not _InotifyBackend.available(), reason="inotify not available")
+def test_watch_limit_at_runtime_falls_back_to_polling(tmp_path, monkeypatch):
+    (tmp_path / "a.py").write_text("a = 1\n")
+    (tmp_path / "gone.py").write_text("g = 1\n")
+    watcher = FileWatcher(str(tmp_path), backend='inotify')
+    watcher.start()
+    try:
+        def add_watch(self, directory):
+            raise OSError(errno.ENOSPC, "inotify watch limit reached")
+
+        monkeypatch.setattr(_InotifyBackend, '_add_watch', add_watch)
+        (tmp_path / "pkg").mkdir()
+        (tmp_path / "pkg" / "b.py").write_text("b = 1\n")
+        (tmp_path / "gone.py").unlink()
+
+        events = drain(watcher)
+        assert watcher.backend == 'polling'
+        assert sorted((os.path.basename(e.path), e.event_type) for e in events) == [
+            ('a.py', 'modified'), ('b.py', 'created'), ('gone.py', 'deleted'),
+        ]
+
+        (tmp_path / "pkg" / "c.py").write_text("c = 1\n")
+        events = drain(watcher)
+        assert [(os.path.basename(e.path), e.event_type) for e in events] == [('c.py', 'created')]
+    finally:
+        watcher.stop()